@@ -2,19 +2,68 @@
 Games API Router
 
 Exposes game registry to external clients via REST API.
+
+The catalog never changes at runtime: responses are pre-serialized bytes
+(games/catalog.py) with an ETag, and If-None-Match gets a 304.
 """
-from fastapi import APIRouter
-from typing import List, Dict, Any
+from fastapi import APIRouter, HTTPException, Request, Response
+from pydantic import BaseModel
+from typing import Any, Dict, List, Optional
 from games.registry import game_registry
+from games.pool import game_pool
+from games.batch_eval import evaluate_many
+from games.mastery.difficulty import DifficultyAdapter
+import asyncio
+import os
 
 router = APIRouter(prefix="/games", tags=["games"])
 
+CATALOG_CACHE_CONTROL = "public, max-age=300"
+EVALUATE_BATCH_MAX_ANSWERS = int(os.getenv("GAMES_EVALUATE_BATCH_MAX_ANSWERS", "200"))
+
+
+class StudentAnswer(BaseModel):
+    studentId: str
+    answer: str
+    streak: int = 0  # Current win streak (points multiplier)
+
+
+class BatchEvaluationRequest(BaseModel):
+    roundData: Dict[str, Any]
+    answers: List[StudentAnswer]
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def _catalog_response(request: Request, body: bytes, etag: str) -> Response:
+    headers = {"ETag": etag, "Cache-Control": CATALOG_CACHE_CONTROL}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 
 @router.get("")
-async def list_games() -> Dict[str, Any]:
+async def list_games(
+    request: Request,
+    max_duration: Optional[int] = None,
+    min_duration: Optional[int] = None,
+    requires_content: Optional[bool] = None,
+    game_intent: Optional[str] = None,
+    difficulty_min: Optional[int] = None,
+    difficulty_max: Optional[int] = None,
+) -> Response:
     """
     Get catalog of all available games.
     
+    Optional query filters: max_duration, min_duration, requires_content,
+    game_intent, difficulty_min, difficulty_max.
+    
     Returns:
         {
             "games": [
@@ -31,25 +80,73 @@ async def list_games() -> Dict[str, Any]:
             "total": 15
         }
     """
-    # Ensure games are discovered
-    game_registry.discover_games()
-    
-    # Get all games metadata
-    games = game_registry.list_games()
-    
-    return {
-        "games": games,
-        "total": len(games)
+    filters = {
+        name: value
+        for name, value in (
+            ("max_duration", max_duration),
+            ("min_duration", min_duration),
+            ("requires_content", requires_content),
+            ("game_intent", game_intent),
+            ("difficulty_min", difficulty_min),
+            ("difficulty_max", difficulty_max),
+        )
+        if value is not None
     }
+    body, etag = game_registry.catalog.query_body(filters)
+    return _catalog_response(request, body, etag)
 
 
 @router.get("/{game_id}")
-async def get_game(game_id: str) -> Dict[str, Any]:
+async def get_game(game_id: str, request: Request) -> Response:
     """Get specific game metadata by ID"""
-    game_registry.discover_games()
+    item = game_registry.catalog.item_body(game_id)
+    if item is None:
+        raise HTTPException(status_code=404, detail=f"Unknown game mode: {game_id}")
+    body, etag = item
+    return _catalog_response(request, body, etag)
+
+
+@router.get("/difficulty/{user_id}")
+async def get_difficulties(user_id: str) -> Dict[str, Any]:
+    """
+    Current difficulty (1-5) of every game mode for a learner, in one call.
     
-    # Get game class
-    game_class = game_registry.get_game(game_id)
+    Levels adapt to the learner's recent accuracy per mode
+    (games/mastery/difficulty.py); modes not played yet get the default.
+    """
+    difficulties = await asyncio.to_thread(DifficultyAdapter(user_id).get_difficulties)
+    return {"userId": user_id, "difficulties": difficulties}
+
+
+@router.post("/{game_id}/evaluate:batch")
+async def evaluate_batch(game_id: str, batch: BatchEvaluationRequest) -> Dict[str, Any]:
+    """
+    Evaluate a class's answers to the same round (teacher submission).
     
-    # Return metadata
-    return game_class().get_metadata()
+    POST /games/{game_id}/evaluate:batch
+    {"roundData": {...}, "answers": [{"studentId": "s1", "answer": "..."}]}
+    
+    Identical answers are evaluated once and answers that need the LLM share
+    batched calls (games/batch_eval.py). Results keep the request order.
+    """
+    if len(batch.answers) > EVALUATE_BATCH_MAX_ANSWERS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch too large: {len(batch.answers)} answers (max {EVALUATE_BATCH_MAX_ANSWERS})"
+        )
+    if game_id not in game_registry.catalog:
+        raise HTTPException(status_code=404, detail=f"Unknown game mode: {game_id}")
+    
+    game = game_pool.get(game_id)
+    evaluations = await evaluate_many(
+        game, batch.roundData, [a.answer for a in batch.answers], streaks=[a.streak for a in batch.answers]
+    )
+    
+    return {
+        "gameId": game_id,
+        "results": [
+            {"studentId": a.studentId, "evaluation": evaluation}
+            for a, evaluation in zip(batch.answers, evaluations)
+        ],
+        "total": len(evaluations),
+    }
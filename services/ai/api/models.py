@@ -61,6 +61,15 @@ class TurnRequest(BaseModel):
     promptMessage: PromptMessage
 
 
+class BatchTurnRequest(BaseModel):
+    """
+    Many turns in one request (e.g. a whole class answering at once).
+    Turns sharing a threadId run in order; others run concurrently.
+    """
+    turns: List[TurnRequest] = Field(..., min_length=1)
+    maxConcurrency: Optional[int] = Field(None, ge=1, description="Override server default concurrency")
+
+
 class TokenUsage(BaseModel):
     """Standardized token usage metrics"""
     prompt_tokens: int
@@ -101,3 +110,34 @@ class HealthResponse(BaseModel):
     timestamp: str
     llm_available: bool
     nestjs_connected: bool
+
+
+class ContextInvalidationRequest(BaseModel):
+    """Sent by NestJS when learner profile, vocabulary or content changes"""
+    userId: Optional[str] = Field(None, description="Invalidate profile and vocab for this user")
+    contentId: Optional[str] = Field(None, description="Invalidate metadata for this content")
+    fields: Optional[List[str]] = Field(
+        None,
+        description="Restrict to fields (profile, vocab, content). Defaults to all fields for the given ids"
+    )
+
+
+class ContextInvalidationResponse(BaseModel):
+    """Context cache invalidation result"""
+    invalidated: int
+
+
+class BatchTurnItem(BaseModel):
+    """Result of one turn in a batch (same order as the request)"""
+    index: int
+    threadId: str
+    status: int  # HTTP-equivalent status for this item
+    response: Optional[TurnResponse] = None
+    error: Optional[str] = None
+
+
+class BatchTurnResponse(BaseModel):
+    """Per-item results of /educator/turns:batch"""
+    results: List[BatchTurnItem]
+    succeeded: int
+    failed: int
@@ -7,12 +7,23 @@ Centralized configuration, no hardcoded routes.
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import JSONResponse
 from utils.token_tracker import TokenUsageTracker
-from .models import TurnRequest, TurnResponse, HealthResponse
-from educator.agent import educator_graph
+from utils.tracing import span, current_trace, LLMTracingCallback
+from .models import (
+    TurnRequest, TurnResponse, HealthResponse, PromptMessage,
+    BatchTurnRequest, BatchTurnResponse, BatchTurnItem,
+    ContextInvalidationRequest, ContextInvalidationResponse
+)
+from educator.agent import aget_educator_graph
+from educator.nodes.game_phase import build_ped_state
+from games.mastery.difficulty import DifficultyAdapter
+from games.pregen import round_pregen
 from utils.context_builder import context_builder
+from utils.context_cache import context_cache, FIELD_PROFILE, FIELD_VOCAB, FIELD_CONTENT
 from llm_factory import llm_factory
 from utils.nestjs_client import nestjs_client
 from datetime import datetime
+from typing import Dict, List, Optional
+import asyncio
 import logging
 import os
 
@@ -22,6 +33,10 @@ logger = logging.getLogger(__name__)
 API_PREFIX = os.getenv("API_PREFIX", "/educator")
 educator_router = APIRouter(prefix=API_PREFIX, tags=["educator"])
 
+# /turns:batch limits
+BATCH_MAX_TURNS = int(os.getenv("EDUCATOR_BATCH_MAX_TURNS", "200"))
+BATCH_CONCURRENCY = int(os.getenv("EDUCATOR_BATCH_CONCURRENCY", "16"))
+
 @educator_router.post("/turn", response_model=TurnResponse)
 async def process_turn(turn_request: TurnRequest, request: Request):
     """
@@ -29,70 +44,9 @@ async def process_turn(turn_request: TurnRequest, request: Request):
     ...
     """
     request_id = request.headers.get("X-Request-ID", "unknown")
-    pm = turn_request.promptMessage
-    
-    logger.info(
-        f"[{request_id}] Processing turn for session {pm.readingSessionId}, "
-        f"thread {pm.threadId}, role {pm.actorRole}"
-    )
     
     try:
-        # 1. Build context pack
-        logger.debug(f"[{request_id}] Building context pack")
-        context = await context_builder.build(pm.dict())
-        
-        # 2. Prepare initial state
-        initial_state = {
-            "prompt_message": pm.dict(),
-            "context": context,
-            "current_phase": context['session']['phase'],
-            "user_text": pm.text,
-            "parsed_events": [],  # Will be populated by parser in nodes if needed
-            "next_prompt": "",
-            "quick_replies": [],
-            "events_to_write": [],
-            "hil_request": None
-        }
-        
-        # 3. Invoke LangGraph with Token Tracking
-        logger.debug(f"[{request_id}] Invoking educator graph")
-        
-        if not educator_graph:
-            raise HTTPException(
-                status_code=500,
-                detail="Educator graph not initialized. Check logs."
-            )
-        
-        # Initialize Tracker
-        token_tracker = TokenUsageTracker()
-        
-        config = {
-            "configurable": {
-                "thread_id": pm.threadId
-            },
-            "callbacks": [token_tracker] # Inject callback here
-        }
-        
-        result = await educator_graph.ainvoke(initial_state, config=config)
-        
-        # 4. Build response
-        response = TurnResponse(
-            threadId=pm.threadId,
-            readingSessionId=pm.readingSessionId,
-            nextPrompt=result['next_prompt'],
-            quickReplies=result.get('quick_replies', []),
-            eventsToWrite=result.get('events_to_write', []),
-            hilRequest=result.get('hil_request'),
-            usage=token_tracker.get_stats() # Attach usage stats
-        )
-        
-        logger.info(
-            f"[{request_id}] Turn processed successfully: "
-            f"{len(response.nextPrompt)} chars, {token_tracker.total_tokens} tokens"
-        )
-        
-        return response
-        
+        return await _run_turn(turn_request.promptMessage, request_id)
     except HTTPException:
         raise
     except Exception as e:
@@ -103,6 +57,156 @@ async def process_turn(turn_request: TurnRequest, request: Request):
         )
 
 
+async def _warm_rounds(state: Dict) -> None:
+    """Warm the likely rounds at the levels START_GAME will ask for (the learner's adapted ones)"""
+    difficulties = None
+    learner_id = state["context"].get("learner", {}).get("id")
+    if learner_id:
+        game_modes = list(round_pregen.warm_targets())
+        difficulties = await asyncio.to_thread(DifficultyAdapter(learner_id).get_difficulties, game_modes)
+    round_pregen.warm(build_ped_state(state), difficulties=difficulties)
+
+
+async def _run_turn(pm: PromptMessage, request_id: str) -> TurnResponse:
+    """
+    Process one turn: build context, invoke the graph, build the response.
+    Shared by /turn and /turns:batch.
+    """
+    logger.info(
+        f"[{request_id}] Processing turn for session {pm.readingSessionId}, "
+        f"thread {pm.threadId}, role {pm.actorRole}"
+    )
+    
+    # 1. Build context pack
+    logger.debug(f"[{request_id}] Building context pack")
+    with span("context.build"):
+        context = await context_builder.build(pm.dict())
+    
+    # 2. Prepare initial state
+    initial_state = {
+        "prompt_message": pm.dict(),
+        "context": context,
+        "current_phase": context['session']['phase'],
+        "user_text": pm.text,
+        "parsed_events": [],  # Will be populated by parser in nodes if needed
+        "next_prompt": "",
+        "quick_replies": [],
+        "events_to_write": [],
+        "hil_request": None
+    }
+    
+    # Reading done: warm the rounds the POST triggers are likely to start
+    if initial_state["current_phase"] == "POST":
+        await _warm_rounds(initial_state)
+    
+    # 3. Invoke LangGraph with Token Tracking
+    logger.debug(f"[{request_id}] Invoking educator graph")
+    
+    educator_graph = await aget_educator_graph()
+    if not educator_graph:
+        raise HTTPException(
+            status_code=500,
+            detail="Educator graph not initialized. Check logs."
+        )
+    
+    # Initialize Tracker
+    token_tracker = TokenUsageTracker()
+    
+    config = {
+        "configurable": {
+            "thread_id": pm.threadId
+        },
+        "callbacks": [token_tracker, LLMTracingCallback(current_trace())] # Inject callback here
+    }
+    
+    with span("graph"):
+        result = await educator_graph.ainvoke(initial_state, config=config)
+    
+    # 4. Build response
+    response = TurnResponse(
+        threadId=pm.threadId,
+        readingSessionId=pm.readingSessionId,
+        nextPrompt=result['next_prompt'],
+        quickReplies=result.get('quick_replies', []),
+        eventsToWrite=result.get('events_to_write', []),
+        hilRequest=result.get('hil_request'),
+        usage=token_tracker.get_stats() # Attach usage stats
+    )
+    
+    logger.info(
+        f"[{request_id}] Turn processed successfully: "
+        f"{len(response.nextPrompt)} chars, {token_tracker.total_tokens} tokens"
+    )
+    
+    return response
+
+
+@educator_router.post("/turns:batch", response_model=BatchTurnResponse)
+async def process_turns_batch(batch: BatchTurnRequest, request: Request):
+    """
+    Process many turns in one request (classroom-scale traffic).
+    
+    POST /educator/turns:batch
+    
+    - One HMAC verification and HTTP round trip for the whole class
+    - Shared context fetches (same content/learner) are coalesced by the context cache
+    - Graph invocations run concurrently, bounded by EDUCATOR_BATCH_CONCURRENCY
+    - Turns on the same threadId run in request order (checkpoint consistency)
+    - A failing turn does not fail the batch: see per-item status/error
+    """
+    request_id = request.headers.get("X-Request-ID", "unknown")
+    
+    if len(batch.turns) > BATCH_MAX_TURNS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch too large: {len(batch.turns)} turns (max {BATCH_MAX_TURNS})"
+        )
+    
+    semaphore = asyncio.Semaphore(min(batch.maxConcurrency or BATCH_CONCURRENCY, BATCH_CONCURRENCY))
+    results: List[Optional[BatchTurnItem]] = [None] * len(batch.turns)
+    
+    # Group by thread, keeping request order inside each thread
+    threads: Dict[str, List[int]] = {}
+    for index, turn in enumerate(batch.turns):
+        threads.setdefault(turn.promptMessage.threadId, []).append(index)
+    
+    async def run_item(index: int) -> None:
+        pm = batch.turns[index].promptMessage
+        item_id = f"{request_id}#{index}"
+        try:
+            async with semaphore:
+                response = await _run_turn(pm, item_id)
+            results[index] = BatchTurnItem(
+                index=index, threadId=pm.threadId, status=200, response=response
+            )
+        except HTTPException as e:
+            results[index] = BatchTurnItem(
+                index=index, threadId=pm.threadId, status=e.status_code, error=str(e.detail)
+            )
+        except Exception as e:
+            logger.error(f"[{item_id}] Failed to process batched turn: {str(e)}", exc_info=True)
+            results[index] = BatchTurnItem(
+                index=index, threadId=pm.threadId, status=500, error=str(e)
+            )
+    
+    async def run_thread(indexes: List[int]) -> None:
+        for index in indexes:
+            await run_item(index)
+    
+    await asyncio.gather(*(run_thread(indexes) for indexes in threads.values()))
+    
+    succeeded = sum(1 for r in results if r.status == 200)
+    logger.info(
+        f"[{request_id}] Batch processed: {succeeded}/{len(results)} turns succeeded "
+        f"across {len(threads)} threads"
+    )
+    return BatchTurnResponse(
+        results=results,
+        succeeded=succeeded,
+        failed=len(results) - succeeded
+    )
+
+
 @educator_router.get("/health", response_model=HealthResponse)
 async def health_check():
     """
@@ -119,14 +223,8 @@ async def health_check():
     # Check LLM availability
     llm_available = llm_factory.is_available()
     
-    # Check NestJS connectivity (simple ping)
-    nestjs_connected = False
-    try:
-        # Try to fetch a health endpoint or just check base URL is accessible
-        # For now, just check if base URL is configured
-        nestjs_connected = bool(nestjs_client.base_url)
-    except:
-        pass
+    # Check NestJS connectivity over the shared connection pool
+    nestjs_connected = await nestjs_client.ping()
     
     return HealthResponse(
         status="healthy" if llm_available else "degraded",
@@ -137,5 +235,42 @@ async def health_check():
     )
 
 
+@educator_router.post("/context/invalidate", response_model=ContextInvalidationResponse)
+async def invalidate_context(request: ContextInvalidationRequest):
+    """
+    Invalidate cached ContextPack fields.
+    
+    POST /educator/context/invalidate
+    
+    Called by NestJS when a learner profile, vocabulary or content is updated,
+    so the next turn sees fresh data without waiting for the TTL.
+    """
+    if not request.userId and not request.contentId:
+        raise HTTPException(status_code=400, detail="userId or contentId is required")
+    
+    known = {FIELD_PROFILE, FIELD_VOCAB, FIELD_CONTENT}
+    fields = set(request.fields or known)
+    unknown = fields - known
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))} (expected {', '.join(sorted(known))})"
+        )
+    invalidated = 0
+    
+    if request.userId:
+        for field in fields & {FIELD_PROFILE, FIELD_VOCAB}:
+            invalidated += context_cache.invalidate(field, request.userId)
+    
+    if request.contentId and FIELD_CONTENT in fields:
+        invalidated += context_cache.invalidate_content(request.contentId)
+    
+    logger.info(
+        f"Context cache invalidation: user={request.userId} content={request.contentId} "
+        f"fields={sorted(fields)} removed={invalidated}"
+    )
+    return ContextInvalidationResponse(invalidated=invalidated)
+
+
 # Error handlers
 # Error handling moved to main.py (APIRouter does not support exception_handler decorator)
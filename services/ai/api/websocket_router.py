@@ -1,6 +1,6 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from realtime.room_manager import room_manager
-from games.registry import game_registry
+from games.pool import game_pool
 import logging
 import json
 
@@ -47,9 +47,8 @@ async def websocket_game_endpoint(websocket: WebSocket, game_mode: str, user_id:
         
         # If room is full, prepare game
         if room.is_full():
-            # Create game instance
-            game_class = game_registry.get_game(game_mode)
-            game_instance = game_class()
+            # Shared game instance
+            game_instance = game_pool.get(game_mode)
             
             # Generate round
             round_data = game_instance.create_round(
@@ -95,8 +94,7 @@ async def websocket_game_endpoint(websocket: WebSocket, game_mode: str, user_id:
                     })
                     
                     # Get game and evaluate
-                    game_class = game_registry.get_game(game_mode)
-                    game_instance = game_class()
+                    game_instance = game_pool.get(game_mode)
                     
                     evaluation = await game_instance.evaluate_answer(
                         room.game_state["round_data"],
@@ -18,6 +18,7 @@ from chains import (
     quiz_chain
 )
 from schemas.assets import GeneratedAsset, GlossaryEntry, Cue, Checkpoint, QuizQuestion
+from content_index import ContentIndex, content_indexes
 
 # Database connection
 DATABASE_URL = os.getenv('DATABASE_URL')
@@ -96,6 +97,10 @@ async def generate_asset(
     text = "\n\n".join([chunk['text'] for chunk in chunks])
     print(f"[1/7] Loaded {len(chunks)} chunks, {len(text)} characters")
     
+    # Shared per-content index (target words, game rounds, PRE phase proposals)
+    index = await asyncio.to_thread(content_indexes.build, content_id, text)
+    print(f"[1/7] Indexed {len(index)} sentences, {len(index.vocab)} distinct words")
+    
     # ========================================================================
     # STEP 2: Summarize for layer
     # ========================================================================
@@ -113,9 +118,11 @@ async def generate_asset(
     print("[3/7] Extracting target words...")
     words_result = await extract_words_chain.ainvoke({
         "education_level": education_level,
-        "text": summary
+        "text": summary,
+        "candidates": ", ".join(index.keywords[:20])
     })
-    target_words = words_result.get('words', [])
+    # Fall back to the top content keywords if the LLM returned none
+    target_words = words_result.get('words', []) or index.keywords[:8]
     print(f"[3/7] Extracted {len(target_words)} target words: {target_words}")
     
     # ========================================================================
@@ -201,8 +208,9 @@ def estimate_difficulty(text: str, layer: str) -> int:
     # Simple heuristic based on layer and text complexity
     base_difficulty = {'L1': 3, 'L2': 6, 'L3': 8}
     
-    # Adjust based on text length and sentence complexity
-    avg_sentence_length = len(text.split()) / max(text.count('.'), 1)
+    # Adjust based on sentence complexity. The summary is indexed once and
+    # not cached: it would only evict real content from content_indexes.
+    avg_sentence_length = ContentIndex.build(text).readability['avg_sentence_words']
     
     difficulty = base_difficulty.get(layer, 5)
     
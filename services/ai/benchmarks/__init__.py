@@ -0,0 +1,6 @@
+"""
+Benchmarks for the AI service hot paths.
+
+Run the educator turn benchmark (no NestJS, Redis or provider keys needed):
+    python -m benchmarks.turn_benchmark --turns 50 --concurrency 8
+"""
@@ -0,0 +1,76 @@
+"""
+Fake LLM service for benchmarks
+
+Implements the `predict_json(prompt, schema, temperature)` interface that game
+modes call on their `llm_service`, with a configurable latency distribution
+and token counts. Each call is recorded as an "llm" span, so it shows up in
+the per-stage breakdown like a real provider call would.
+"""
+import time
+from typing import Any, Dict, Optional
+
+from utils.tracing import record_span
+
+from .latency import LatencyModel
+
+
+def _sample_for_schema(schema: Dict[str, Any]) -> Any:
+    """Smallest plausible value matching a JSON schema"""
+    kind = schema.get("type")
+    if "enum" in schema:
+        return schema["enum"][-1]
+    if kind == "object":
+        return {
+            name: _sample_for_schema(prop)
+            for name, prop in schema.get("properties", {}).items()
+        }
+    if kind == "array":
+        return []
+    if kind == "number":
+        return float(schema.get("maximum", 100)) * 0.8
+    if kind == "integer":
+        return int(schema.get("maximum", 3))
+    if kind == "boolean":
+        return True
+    return "Resposta simulada pelo benchmark."
+
+
+class FakeLLMService:
+    """
+    Stand-in for a provider-backed LLM service.
+    
+    Args:
+        latency: Per-call latency distribution
+        completion_tokens: Tokens "generated" per call
+    """
+
+    def __init__(self, latency: Optional[LatencyModel] = None, completion_tokens: int = 150):
+        self.latency = latency or LatencyModel(0)
+        self.completion_tokens = completion_tokens
+        self.calls = 0
+        self.prompt_tokens = 0
+        self.total_completion_tokens = 0
+
+    async def predict_json(
+        self,
+        prompt: str,
+        schema: Optional[Dict[str, Any]] = None,
+        temperature: Optional[float] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        start = time.perf_counter()
+        await self.latency.sleep()
+
+        self.calls += 1
+        self.prompt_tokens += max(1, len(prompt) // 4)  # ~4 chars per token
+        self.total_completion_tokens += self.completion_tokens
+
+        record_span("llm", (time.perf_counter() - start) * 1000)
+        return _sample_for_schema(schema or {"type": "object"})
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "calls": self.calls,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.total_completion_tokens,
+        }
@@ -0,0 +1,97 @@
+"""
+Fake NestJS API for benchmarks
+
+Serves the endpoints the context builder reads, with configurable latency:
+    GET /reading-sessions/{id}
+    GET /reading-sessions/{id}/events
+    GET /profiles/{user_id}
+    GET /vocab
+    GET /contents/{content_id}
+
+Session IDs encode the phase: "rs-pre-1" → PRE, "rs-during-7" → DURING,
+anything else → POST. Mount it in-process through httpx.ASGITransport
+(see NestJSClient(transport=...)), so no port or network is involved.
+"""
+from collections import Counter
+from typing import Dict, Optional
+
+from fastapi import FastAPI, Request
+
+from .latency import LatencyModel
+
+
+def session_phase(session_id: str) -> str:
+    """Phase encoded in a benchmark session ID"""
+    parts = session_id.split("-")
+    phase = parts[1].upper() if len(parts) > 2 else "POST"
+    return phase if phase in ("PRE", "DURING", "POST") else "POST"
+
+
+def create_fake_nestjs_app(
+    latency: Optional[Dict[str, LatencyModel]] = None,
+    default_latency: Optional[LatencyModel] = None,
+) -> FastAPI:
+    """
+    Build the fake NestJS app.
+    
+    Args:
+        latency: Per-endpoint latency ("session", "session_events", "profile", "vocab", "content")
+        default_latency: Latency for endpoints not in `latency` (default: none)
+    
+    Request counts per endpoint are kept in app.state.calls.
+    """
+    latency = latency or {}
+    default_latency = default_latency or LatencyModel(0)
+    app = FastAPI(title="Fake NestJS")
+    app.state.calls = Counter()
+
+    async def serve(endpoint: str, payload):
+        app.state.calls[endpoint] += 1
+        await latency.get(endpoint, default_latency).sleep()
+        return payload
+
+    @app.get("/reading-sessions/{session_id}")
+    async def get_session(session_id: str):
+        return await serve("session", {
+            "id": session_id,
+            "userId": f"user-{session_id}",
+            "contentId": "content-bench",
+            "phase": session_phase(session_id),
+            "goalStatement": "Entender os conceitos principais",
+            "predictionText": "O texto trata de fotossíntese",
+            "targetWordsJson": ["clorofila", "glicose", "energia"],
+            "assetLayer": "L1",
+        })
+
+    @app.get("/reading-sessions/{session_id}/events")
+    async def get_session_events(session_id: str):
+        return await serve("session_events", [])
+
+    @app.get("/profiles/{user_id}")
+    async def get_profile(user_id: str):
+        return await serve("profile", {
+            "educationLevel": "MEDIO",
+            "age": 15,
+            "preferredLanguages": ["PT"],
+        })
+
+    @app.get("/vocab")
+    async def get_vocab(request: Request):
+        return await serve("vocab", {
+            "dueWords": [{"word": "clorofila"}, {"word": "estômato"}],
+            "totalDue": 2,
+        })
+
+    @app.get("/contents/{content_id}")
+    async def get_content(content_id: str):
+        return await serve("content", {
+            "title": "Fotossíntese",
+            "originalLanguage": "PT",
+            "difficulty": "medium",
+        })
+
+    @app.get("/")
+    async def root():
+        return {"status": "ok"}
+
+    return app
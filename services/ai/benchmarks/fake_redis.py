@@ -0,0 +1,260 @@
+"""
+Fake Redis for benchmarks and tests
+
+In-memory stand-in for the synchronous redis-py client (decode_responses=True)
+covering the commands the mastery store uses: strings, hashes, EXPIRE,
+SCAN/HSCAN, pipelines (MULTI/EXEC with WATCH) and scripts. Every network round
+trip - a direct command, one pipeline execute() or one script call - is
+counted in `round_trips` and can be given a latency, so layouts can be
+compared by round trips without a server.
+
+There is no Lua interpreter: a script runs the Python handler registered
+for its source in `scripts` ({lua source: handler(client, keys, args)}).
+"""
+import fnmatch
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from redis.exceptions import NoScriptError, WatchError
+
+from .latency import LatencyModel
+
+
+class FakeRedis:
+    """
+    Args:
+        latency: Latency of one round trip (default: none)
+        scripts: Python stand-ins for Lua scripts, by script source
+    """
+
+    def __init__(self, latency: Optional[LatencyModel] = None,
+                 scripts: Optional[Dict[str, Callable[..., Any]]] = None):
+        self.latency = latency or LatencyModel(0)
+        self.scripts = dict(scripts or {})
+        self.round_trips = 0
+        self.commands = 0
+        self._data: Dict[str, Any] = {}
+        self._ttl: Dict[str, int] = {}
+        self._versions: Counter = Counter()
+
+    def _round_trip(self) -> None:
+        self.round_trips += 1
+        ms = self.latency.sample_ms()
+        if ms > 0:
+            time.sleep(ms / 1000)
+
+    def _written(self, key: str) -> None:
+        self._versions[key] += 1
+
+    def __getattr__(self, name: str):
+        impl = getattr(type(self), f"_do_{name}", None)
+        if impl is None:
+            raise AttributeError(name)
+
+        def command(*args, **kwargs):
+            self._round_trip()
+            self.commands += 1
+            return impl(self, *args, **kwargs)
+        return command
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+    def register_script(self, script: str) -> "FakeScript":
+        return FakeScript(self, script)
+
+    def hscan_iter(self, name: str, match: Optional[str] = None, count: Optional[int] = None) -> Iterator[Tuple[str, str]]:
+        cursor = 0
+        while True:
+            cursor, fields = self.hscan(name, cursor=cursor, match=match, count=count)
+            yield from fields.items()
+            if cursor == 0:
+                return
+
+    def scan_iter(self, match: Optional[str] = None, count: Optional[int] = None) -> Iterator[str]:
+        cursor = 0
+        while True:
+            cursor, keys = self.scan(cursor=cursor, match=match, count=count)
+            yield from keys
+            if cursor == 0:
+                return
+
+    def reset_counters(self) -> None:
+        self.round_trips = 0
+        self.commands = 0
+
+    # --- Commands ---
+
+    def _do_ping(self) -> bool:
+        return True
+
+    def _do_get(self, key: str) -> Optional[str]:
+        value = self._data.get(key)
+        return value if isinstance(value, str) else None
+
+    def _do_mget(self, keys, *args) -> List[Optional[str]]:
+        names = ([keys] if isinstance(keys, str) else list(keys)) + list(args)
+        return [self._do_get(name) for name in names]
+
+    def _do_scan(self, cursor: int = 0, match: Optional[str] = None,
+                 count: Optional[int] = None) -> Tuple[int, List[str]]:
+        keys = sorted(self._data)
+        end = cursor + (count or 10)
+        page = [key for key in keys[cursor:end] if match is None or fnmatch.fnmatchcase(key, match)]
+        return (end if end < len(keys) else 0), page
+
+    def _do_set(self, key: str, value: Any) -> bool:
+        self._data[key] = str(value)
+        self._ttl.pop(key, None)
+        self._written(key)
+        return True
+
+    def _do_delete(self, *keys: str) -> int:
+        removed = 0
+        for key in keys:
+            if self._data.pop(key, None) is not None:
+                removed += 1
+                self._ttl.pop(key, None)
+                self._written(key)
+        return removed
+
+    def _do_expire(self, key: str, seconds: int) -> bool:
+        if key not in self._data:
+            return False
+        self._ttl[key] = int(seconds)
+        return True
+
+    def _do_ttl(self, key: str) -> int:
+        if key not in self._data:
+            return -2
+        return self._ttl.get(key, -1)
+
+    def _do_getrange(self, key: str, start: int, end: int) -> str:
+        value = self._data.get(key)
+        return value[start:end + 1] if isinstance(value, str) else ""
+
+    def _do_setrange(self, key: str, offset: int, value: str) -> int:
+        current = self._data.get(key)
+        current = current if isinstance(current, str) else ""
+        current = current.ljust(offset, "\0")
+        self._data[key] = current[:offset] + value + current[offset + len(value):]
+        self._written(key)
+        return len(self._data[key])
+
+    def _do_hget(self, name: str, key: str) -> Optional[str]:
+        return self._data.get(name, {}).get(key)
+
+    def _do_hmget(self, name: str, keys, *args) -> List[Optional[str]]:
+        fields = ([keys] if isinstance(keys, str) else list(keys)) + list(args)
+        data = self._data.get(name, {})
+        return [data.get(field) for field in fields]
+
+    def _do_hset(self, name: str, key: Optional[str] = None, value: Any = None,
+                 mapping: Optional[Dict[str, Any]] = None) -> int:
+        items = dict(mapping or {})
+        if key is not None:
+            items[key] = value
+        data = self._data.setdefault(name, {})
+        added = sum(1 for field in items if field not in data)
+        data.update({field: str(v) for field, v in items.items()})
+        self._written(name)
+        return added
+
+    def _do_hsetnx(self, name: str, key: str, value: Any) -> int:
+        data = self._data.setdefault(name, {})
+        if key in data:
+            return 0
+        data[key] = str(value)
+        self._written(name)
+        return 1
+
+    def _do_hdel(self, name: str, *keys: str) -> int:
+        data = self._data.get(name, {})
+        removed = sum(1 for key in keys if data.pop(key, None) is not None)
+        if removed:
+            self._written(name)
+        return removed
+
+    def _do_hgetall(self, name: str) -> Dict[str, str]:
+        return dict(self._data.get(name, {}))
+
+    def _do_hlen(self, name: str) -> int:
+        return len(self._data.get(name, {}))
+
+    def _do_hscan(self, name: str, cursor: int = 0, match: Optional[str] = None,
+                  count: Optional[int] = None) -> Tuple[int, Dict[str, str]]:
+        fields = sorted(self._data.get(name, {}).items())
+        end = cursor + (count or 10)
+        page = dict(fields[cursor:end])
+        return (end if end < len(fields) else 0), page
+
+
+class FakeScript:
+    """register_script() result: one round trip per call, runs the Python stand-in"""
+
+    def __init__(self, client: FakeRedis, script: str):
+        self._client = client
+        self.script = script
+
+    def __call__(self, keys=(), args=(), client: Optional[FakeRedis] = None) -> Any:
+        client = client or self._client
+        handler = client.scripts.get(self.script)
+        client._round_trip()
+        if handler is None:
+            raise NoScriptError("No matching script. Please use EVAL.")
+        client.commands += 1
+        return handler(client, list(keys), [str(a) for a in args])
+
+
+class FakePipeline:
+    """Queued commands sent in one round trip; WATCH aborts EXEC if a watched key changed"""
+
+    def __init__(self, client: FakeRedis):
+        self._client = client
+        self._queue: List[Tuple[Any, tuple, dict]] = []
+        self._watched: Dict[str, int] = {}
+        self._immediate = False
+
+    def __enter__(self) -> "FakePipeline":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.reset()
+
+    def __getattr__(self, name: str):
+        impl = getattr(FakeRedis, f"_do_{name}", None)
+        if impl is None:
+            raise AttributeError(name)
+        if self._immediate:
+            # Between WATCH and MULTI commands run right away
+            return getattr(self._client, name)
+
+        def queue(*args, **kwargs):
+            self._queue.append((impl, args, kwargs))
+            return self
+        return queue
+
+    def watch(self, *keys: str) -> None:
+        self._client._round_trip()
+        self._watched.update({key: self._client._versions[key] for key in keys})
+        self._immediate = True
+
+    def multi(self) -> None:
+        self._immediate = False
+
+    def execute(self) -> List[Any]:
+        client = self._client
+        client._round_trip()
+        try:
+            if any(client._versions[key] != version for key, version in self._watched.items()):
+                raise WatchError("Watched variable changed.")
+            client.commands += len(self._queue)
+            return [impl(client, *args, **kwargs) for impl, args, kwargs in self._queue]
+        finally:
+            self.reset()
+
+    def reset(self) -> None:
+        self._queue = []
+        self._watched = {}
+        self._immediate = False
@@ -0,0 +1,37 @@
+"""
+Latency model shared by the benchmark stand-ins
+"""
+import asyncio
+import math
+import random
+from typing import Optional
+
+
+class LatencyModel:
+    """
+    Log-normal latency (real network/LLM latencies are right-skewed).
+    
+    Args:
+        median_ms: Median latency
+        sigma: Spread of the log-normal (0 = constant latency)
+        seed: RNG seed, for repeatable runs
+    """
+
+    def __init__(self, median_ms: float = 0.0, sigma: float = 0.5, seed: Optional[int] = None):
+        self.median_ms = median_ms
+        self.sigma = sigma
+        self._rng = random.Random(seed)
+
+    def sample_ms(self) -> float:
+        if self.median_ms <= 0:
+            return 0.0
+        if self.sigma <= 0:
+            return self.median_ms
+        return self._rng.lognormvariate(math.log(self.median_ms), self.sigma)
+
+    async def sleep(self) -> float:
+        """Sleep for one sampled latency; returns the sampled milliseconds"""
+        ms = self.sample_ms()
+        if ms > 0:
+            await asyncio.sleep(ms / 1000)
+        return ms
@@ -0,0 +1,130 @@
+"""
+Mastery Store Benchmark
+
+Compares Redis round trips and wall time of recording game results in the
+mastery store:
+- keys: the previous layout, one string key per (user, word) with
+  GET + SET + EXPIRE per word and one GET per word for theme mastery
+- hash: MasteryTracker, one hash per user, update_many in one
+  WATCH/HMGET + MULTI/EXEC and theme mastery with one HMGET (migrated
+  store, so without the legacy-key fallback)
+
+Runs against benchmarks.fake_redis with a fixed round-trip latency by
+default, or a real server with --redis-url.
+
+Usage:
+    python -m benchmarks.mastery_benchmark --users 50 --words 10 --rtt-ms 0.5
+    python -m benchmarks.mastery_benchmark --redis-url redis://localhost:6379/15
+"""
+import argparse
+import random
+import sys
+import time
+from typing import Dict, List, Optional
+
+from games.mastery.tracker import MASTERY_TTL_SECONDS, MasteryTracker
+
+from .fake_redis import FakeRedis
+from .latency import LatencyModel
+
+VOCABULARY = [f"palavra{i}" for i in range(500)]
+
+
+def keys_update(client, user_id: str, words: List[str], scores: List[float]) -> None:
+    """Previous layout: GET, SET and EXPIRE per word"""
+    for word, score in zip(words, scores):
+        key = f"mastery:user:{user_id}:word:{word}"
+        current = client.get(key)
+        mastery = (float(current) if current else 50.0) * 0.7 + score * 0.3
+        client.set(key, mastery)
+        client.expire(key, MASTERY_TTL_SECONDS)
+
+
+def keys_theme(client, user_id: str, words: List[str]) -> float:
+    """Previous layout: one GET per word of the theme"""
+    values = [client.get(f"mastery:user:{user_id}:word:{word}") for word in words]
+    return sum(float(v) if v else 50.0 for v in values) / len(values)
+
+
+def _round_trips(client) -> Optional[int]:
+    return getattr(client, "round_trips", None)
+
+
+def run_benchmark(
+    users: int = 50,
+    words: int = 10,
+    games: int = 3,
+    rtt_ms: float = 0.5,
+    seed: int = 0,
+    redis_url: Optional[str] = None,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Each simulated user plays `games` games of `words` words; after each
+    game the results are recorded and the game's theme mastery refreshed.
+
+    Returns:
+        {"keys": {...}, "hash": {...}} with "round_trips_per_game" (None on
+        a real server), "ms_per_game" and "total_s"
+    """
+    rng = random.Random(seed)
+    plays = [
+        (f"bench-{seed}-{user}", rng.sample(VOCABULARY, words), [rng.uniform(0, 100) for _ in range(words)])
+        for user in range(users)
+        for _ in range(games)
+    ]
+
+    def make_client():
+        if redis_url:
+            import redis
+            client = redis.from_url(redis_url, decode_responses=True)
+            client.flushdb()
+            return client
+        return FakeRedis(LatencyModel(rtt_ms, sigma=0))
+
+    results = {}
+
+    client = make_client()
+    start = time.perf_counter()
+    for user_id, game_words, scores in plays:
+        keys_update(client, user_id, game_words, scores)
+        keys_theme(client, user_id, game_words)
+    results["keys"] = (time.perf_counter() - start, _round_trips(client))
+
+    client = make_client()
+    start = time.perf_counter()
+    for user_id, game_words, scores in plays:
+        tracker = MasteryTracker(user_id, redis_client=client, legacy_fallback=False)
+        tracker.update_many(game_words, scores)
+        tracker.update_theme_mastery("bench", game_words)
+    results["hash"] = (time.perf_counter() - start, _round_trips(client))
+
+    return {
+        layout: {
+            "round_trips_per_game": round(trips / len(plays), 2) if trips is not None else None,
+            "ms_per_game": round(elapsed / len(plays) * 1000, 3),
+            "total_s": round(elapsed, 3),
+        }
+        for layout, (elapsed, trips) in results.items()
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare mastery store layouts by Redis round trips")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--words", type=int, default=10)
+    parser.add_argument("--games", type=int, default=3)
+    parser.add_argument("--rtt-ms", type=float, default=0.5, help="Fake Redis round-trip latency")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--redis-url", default=None, help="Use a real Redis (the database is flushed)")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.users, args.words, args.games, args.rtt_ms, args.seed, args.redis_url)
+    print(f"{'layout':<8}{'round trips/game':>18}{'ms/game':>12}")
+    for layout, row in results.items():
+        trips = row["round_trips_per_game"]
+        print(f"{layout:<8}{trips if trips is not None else '-':>18}{row['ms_per_game']:>12.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+Game Pipeline Overhead Benchmark
+
+Measures the per-call cost GamePipeline adds on top of calling the handler
+directly, for the sync path (create_round) and the async path
+(evaluate_answer), with the default middleware stack.
+
+Usage:
+    python -m benchmarks.pipeline_benchmark --iterations 20000
+    python -m benchmarks.pipeline_benchmark --with-logging   # include log formatting cost
+"""
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from typing import Dict, List, Optional
+
+from games.middleware import (
+    CorrelationIdMiddleware,
+    EventEmitterMiddleware,
+    GamePipeline,
+    MetricsMiddleware,
+)
+
+
+def _context() -> Dict:
+    return {'metadata': {'gameMode': 'BENCH'}, 'correlation_id': 'bench'}
+
+
+def _handler(ctx):
+    return {'score': 1}
+
+
+async def _async_handler(ctx):
+    return {'score': 1}
+
+
+def _per_call_us(elapsed_s: float, iterations: int) -> float:
+    return elapsed_s / iterations * 1e6
+
+
+def run_benchmark(iterations: int = 20000) -> Dict[str, Dict[str, float]]:
+    """
+    Returns:
+        {"sync"|"async": {"direct_us", "empty_pipeline_us", "pipeline_us", "overhead_us"}}
+    """
+    empty = GamePipeline([])
+    pipeline = GamePipeline([
+        CorrelationIdMiddleware(),
+        MetricsMiddleware(),
+        EventEmitterMiddleware(),
+    ])
+
+    def time_sync(fn) -> float:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn(_context())
+        return _per_call_us(time.perf_counter() - start, iterations)
+
+    async def time_async(fn) -> float:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            await fn(_context())
+        return _per_call_us(time.perf_counter() - start, iterations)
+
+    sync = {
+        "direct_us": time_sync(_handler),
+        "empty_pipeline_us": time_sync(lambda ctx: empty.execute(ctx, _handler)),
+        "pipeline_us": time_sync(lambda ctx: pipeline.execute(ctx, _handler)),
+    }
+
+    async def run_async():
+        return {
+            "direct_us": await time_async(_async_handler),
+            "empty_pipeline_us": await time_async(lambda ctx: empty.execute_async(ctx, _async_handler)),
+            "pipeline_us": await time_async(lambda ctx: pipeline.execute_async(ctx, _async_handler)),
+        }
+
+    results = {"sync": sync, "async": asyncio.run(run_async())}
+    for stats in results.values():
+        stats["overhead_us"] = stats["pipeline_us"] - stats["direct_us"]
+        for key, value in stats.items():
+            stats[key] = round(value, 2)
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure GamePipeline per-call overhead")
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--with-logging", action="store_true", help="Keep middleware INFO logs enabled")
+    args = parser.parse_args(argv)
+
+    if not args.with_logging:
+        logging.disable(logging.INFO)
+
+    results = run_benchmark(args.iterations)
+    print(f"{'path':<8}{'direct':>10}{'empty':>10}{'pipeline':>10}{'overhead':>10}  (µs/call)")
+    for path, stats in results.items():
+        print(
+            f"{path:<8}{stats['direct_us']:>10.2f}{stats['empty_pipeline_us']:>10.2f}"
+            f"{stats['pipeline_us']:>10.2f}{stats['overhead_us']:>10.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""
+Trigger Engine Benchmark
+
+Measures how many game-trigger decisions per second the compiled
+triggers.yaml rule set sustains, one event at a time (decide) and as a
+batch (decide_batch), for a population of simulated users.
+
+Usage:
+    python -m benchmarks.trigger_benchmark --users 10000
+    python -m benchmarks.trigger_benchmark --users 10000 --rounds 5 --seed 7
+"""
+import argparse
+import random
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from games.config import config_loader
+from games.triggers import TriggerEngine, compile_triggers
+
+INTENTS = ("review", "challenge", "unknown")
+GAPS = ("conceptual", "misconception")
+
+
+def make_events(users: int, seed: int = 0) -> List[Tuple[str, Optional[str], Dict[str, Any]]]:
+    """One (trigger, key, facts) event per simulated user"""
+    rng = random.Random(seed)
+    events = []
+    for _ in range(users):
+        kind = rng.random()
+        if kind < 0.6:
+            trigger, key = "on_reading_complete", None
+        elif kind < 0.85:
+            trigger, key = "on_intent", rng.choice(INTENTS)
+        else:
+            trigger, key = "on_gap_detected", rng.choice(GAPS)
+        content_length = rng.randint(0, 3000)
+        events.append((trigger, key, {
+            "content_slice": content_length > 0,
+            "content_length": content_length,
+            "target_word_count": rng.randint(0, 6),
+            "user_mastery": rng.random(),
+            "phase": "POST",
+        }))
+    return events
+
+
+def run_benchmark(users: int = 10000, rounds: int = 3, seed: int = 0) -> Dict[str, float]:
+    """
+    Returns:
+        {"compile_ms", "single_decisions_per_s", "single_us", "batch_decisions_per_s",
+         "batch_us", "fired_ratio"}
+    """
+    config = config_loader.load_triggers() or {}
+
+    start = time.perf_counter()
+    compile_triggers(config)
+    compile_ms = (time.perf_counter() - start) * 1000
+
+    engine = TriggerEngine(config=config, rng=random.Random(seed))
+    events = make_events(users, seed)
+    decide = engine.decide
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for trigger, key, facts in events:
+            decide(trigger, facts, key)
+    single_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        decisions = engine.decide_batch(events)
+    batch_s = time.perf_counter() - start
+
+    total = users * rounds
+    return {
+        "compile_ms": round(compile_ms, 3),
+        "single_decisions_per_s": round(total / single_s),
+        "single_us": round(single_s / total * 1e6, 3),
+        "batch_decisions_per_s": round(total / batch_s),
+        "batch_us": round(batch_s / total * 1e6, 3),
+        "fired_ratio": round(sum(d is not None for d in decisions) / max(1, users), 3),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure trigger engine decisions/sec")
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.users, args.rounds, args.seed)
+    print(f"compile: {results['compile_ms']:.3f} ms")
+    print(f"{'path':<8}{'decisions/s':>14}{'µs/decision':>14}")
+    print(f"{'single':<8}{results['single_decisions_per_s']:>14,}{results['single_us']:>14.3f}")
+    print(f"{'batch':<8}{results['batch_decisions_per_s']:>14,}{results['batch_us']:>14.3f}")
+    print(f"events starting a game: {results['fired_ratio']:.1%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,373 @@
+"""
+Educator Turn Benchmark
+
+End-to-end load test of POST /educator/turn with local stand-ins:
+- NestJS: benchmarks.fake_nestjs, mounted in-process (configurable latency)
+- LLM: benchmarks.fake_llm.FakeLLMService, injected into game modes
+- Checkpoints: MemorySaver (default) or a real Redis (--checkpointer redis)
+
+Turns go through the real app (main.app) with httpx.ASGITransport, so
+middleware, context building, the graph and checkpointing are all exercised.
+The per-stage breakdown comes from the Server-Timing header (utils/tracing).
+
+Usage:
+    python -m benchmarks.turn_benchmark --turns 100 --concurrency 16
+    python -m benchmarks.turn_benchmark --output baseline.json
+    python -m benchmarks.turn_benchmark --baseline baseline.json --tolerance 0.2
+
+With --baseline, exits with status 1 if any phase's p95 regressed by more
+than the tolerance. Use the same --seed for repeatable latency samples.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import sys
+import tempfile
+import time
+import uuid
+from contextlib import ExitStack
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
+
+import httpx
+
+from .fake_llm import FakeLLMService
+from .fake_nestjs import create_fake_nestjs_app
+from .latency import LatencyModel
+
+PHASES = ("PRE", "DURING", "POST", "GAME")
+
+# What the learner "types" in each phase
+PHASE_TEXT = {
+    "PRE": "Confirmar",
+    "DURING": "continuar",
+    "POST": "A fotossíntese transforma luz em energia química para a planta.",
+}
+GAME_ANSWER = "A planta usa luz, CO2 e água para produzir glicose e liberar oxigênio."
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile (0 for an empty list)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def parse_server_timing(header: str) -> Dict[str, float]:
+    """'a;dur=1.5, b;dur=2' → {'a': 1.5, 'b': 2.0}"""
+    stages = {}
+    for part in filter(None, (p.strip() for p in header.split(","))):
+        name, _, params = part.partition(";")
+        if params.startswith("dur="):
+            stages[name] = float(params[4:])
+    return stages
+
+
+def _summarize(latencies: List[float]) -> Dict[str, float]:
+    return {
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "mean_ms": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+    }
+
+
+def _turn_body(thread_id: str, session_id: str, text: str, game_mode: Optional[str] = None) -> Dict:
+    metadata = {
+        "uiMode": "DURING",
+        "contentId": "content-bench",
+        "assetLayer": "L1",
+        "readingIntent": "analytical",
+    }
+    if game_mode:
+        metadata["gameMode"] = game_mode
+    return {
+        "promptMessage": {
+            "threadId": thread_id,
+            "readingSessionId": session_id,
+            "actorRole": "LEARNER",
+            "text": text,
+            "clientTs": "2024-01-01T10:00:00Z",
+            "metadata": metadata,
+        }
+    }
+
+
+def _build_scripts(turns: int, game_mode: str, tag: str) -> List[Dict[str, Any]]:
+    """
+    One script per thread: a list of (phase, body) turns run in order.
+    GAME threads are START_GAME followed by an answer (two GAME turns).
+    """
+    scripts = []
+    for phase in PHASES:
+        if phase == "GAME":
+            for i in range((turns + 1) // 2):
+                thread_id = f"bench-{tag}-game-{i}"
+                session_id = f"rs-post-{tag}{i}"
+                scripts.append([
+                    ("GAME", _turn_body(thread_id, session_id, "START_GAME", game_mode)),
+                    ("GAME", _turn_body(thread_id, session_id, GAME_ANSWER, game_mode)),
+                ])
+        else:
+            for i in range(turns):
+                thread_id = f"bench-{tag}-{phase.lower()}-{i}"
+                session_id = f"rs-{phase.lower()}-{tag}{i}"
+                scripts.append([(phase, _turn_body(thread_id, session_id, PHASE_TEXT[phase]))])
+    return scripts
+
+
+def _install_stand_ins(
+    stack: ExitStack,
+    nestjs_latency: LatencyModel,
+    llm: FakeLLMService,
+    checkpointer: str,
+):
+    """Point the app at the stand-ins; everything is restored when `stack` closes"""
+    os.environ.setdefault("AI_SERVICE_SECRET", "benchmark-secret-" + "x" * 32)
+
+    import main
+    from api import routes
+    from educator.agent import create_educator_graph
+    from games.pool import game_pool
+    from utils.context_builder import ContextPackBuilder
+    from utils.context_cache import ContextCache
+    from utils.dataset_collector import dataset_collector
+    from utils.nestjs_client import NestJSClient
+    from utils.service_container import services
+
+    fake_nestjs = create_fake_nestjs_app(default_latency=nestjs_latency)
+    client = NestJSClient(
+        base_url="http://fake-nestjs",
+        transport=httpx.ASGITransport(app=fake_nestjs),
+    )
+    stack.enter_context(patch("utils.context_builder.nestjs_client", client))
+    stack.enter_context(patch.object(routes, "context_builder", ContextPackBuilder(cache=ContextCache())))
+
+    if checkpointer == "memory":
+        from langgraph.checkpoint.memory import MemorySaver
+        services.register("educator_graph", lambda: create_educator_graph(checkpointer=MemorySaver()))
+    else:
+        services.register("educator_graph", create_educator_graph)
+    stack.callback(services.register, "educator_graph", create_educator_graph)
+
+    # Pooled games get the fake LLM instead of the provider-backed service
+    original_llm_service = game_pool.llm_service
+    game_pool.llm_service = llm
+    stack.callback(setattr, game_pool, "llm_service", original_llm_service)
+
+    tmpdir = stack.enter_context(tempfile.TemporaryDirectory())
+    stack.enter_context(patch.object(dataset_collector, "storage_dir", tmpdir))
+
+    return main.app, fake_nestjs, client
+
+
+async def run_benchmark(
+    turns: int = 50,
+    concurrency: int = 8,
+    nestjs_latency_ms: float = 15.0,
+    llm_latency_ms: float = 400.0,
+    latency_sigma: float = 0.5,
+    completion_tokens: int = 150,
+    checkpointer: str = "memory",
+    game_mode: str = "FREE_RECALL_SCORE",
+    seed: Optional[int] = 42,
+) -> Dict[str, Any]:
+    """
+    Run the benchmark and return a JSON-serializable report.
+
+    Args:
+        turns: Turns per phase (GAME: START_GAME + answer pairs, rounded up)
+        concurrency: Max in-flight requests
+        nestjs_latency_ms: Median latency of each fake NestJS call
+        llm_latency_ms: Median latency of each fake LLM call
+        latency_sigma: Log-normal spread for both (0 = constant)
+        completion_tokens: Tokens per fake LLM completion
+        checkpointer: "memory" or "redis" (uses REDIS_URL)
+        game_mode: Game played by GAME turns
+        seed: RNG seed for latency samples
+    """
+    llm = FakeLLMService(
+        latency=LatencyModel(llm_latency_ms, latency_sigma, seed=seed),
+        completion_tokens=completion_tokens,
+    )
+    nestjs_latency = LatencyModel(nestjs_latency_ms, latency_sigma, seed=None if seed is None else seed + 1)
+
+    with ExitStack() as stack:
+        app, fake_nestjs, client = _install_stand_ins(stack, nestjs_latency, llm, checkpointer)
+        transport = httpx.ASGITransport(app=app)
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as http:
+            semaphore = asyncio.Semaphore(concurrency)
+            samples: Dict[str, List[Dict[str, Any]]] = {phase: [] for phase in PHASES}
+
+            async def run_script(script, record: bool) -> None:
+                for phase, body in script:
+                    async with semaphore:
+                        start = time.perf_counter()
+                        response = await http.post(
+                            "/educator/turn",
+                            json=body,
+                            headers={"X-Correlation-ID": f"bench-{uuid.uuid4().hex[:12]}"},
+                        )
+                        elapsed_ms = (time.perf_counter() - start) * 1000
+                    if record:
+                        samples[phase].append({
+                            "latency_ms": elapsed_ms,
+                            "ok": response.status_code == 200,
+                            "stages": parse_server_timing(response.headers.get("Server-Timing", "")),
+                        })
+
+            # Warm-up: build the graph, discover games, fill connection pools
+            await asyncio.gather(*(run_script(s, record=False) for s in _build_scripts(1, game_mode, "warm")))
+            llm_warm = llm.get_stats()
+            nestjs_warm = dict(fake_nestjs.state.calls)
+
+            started = time.perf_counter()
+            await asyncio.gather(*(run_script(s, record=True) for s in _build_scripts(turns, game_mode, "run")))
+            duration_s = time.perf_counter() - started
+
+        await client.aclose()
+
+    all_latencies = [s["latency_ms"] for phase in PHASES for s in samples[phase]]
+    phases_report = {}
+    for phase in PHASES:
+        phase_samples = samples[phase]
+        stage_names = sorted({name for s in phase_samples for name in s["stages"] if name != "total"})
+        phases_report[phase] = {
+            "count": len(phase_samples),
+            "errors": sum(1 for s in phase_samples if not s["ok"]),
+            **_summarize([s["latency_ms"] for s in phase_samples]),
+            "stages": {
+                name: {
+                    "mean_ms": round(
+                        sum(s["stages"].get(name, 0.0) for s in phase_samples) / len(phase_samples), 2
+                    ),
+                    "p95_ms": round(percentile([s["stages"][name] for s in phase_samples if name in s["stages"]], 95), 2),
+                }
+                for name in stage_names
+            },
+        }
+
+    llm_stats = llm.get_stats()
+    return {
+        "config": {
+            "turns": turns,
+            "concurrency": concurrency,
+            "nestjs_latency_ms": nestjs_latency_ms,
+            "llm_latency_ms": llm_latency_ms,
+            "latency_sigma": latency_sigma,
+            "completion_tokens": completion_tokens,
+            "checkpointer": checkpointer,
+            "game_mode": game_mode,
+            "seed": seed,
+        },
+        "total": {
+            "requests": len(all_latencies),
+            "errors": sum(p["errors"] for p in phases_report.values()),
+            "duration_s": round(duration_s, 3),
+            "throughput_rps": round(len(all_latencies) / duration_s, 2) if duration_s > 0 else 0.0,
+            **_summarize(all_latencies),
+        },
+        "phases": phases_report,
+        "nestjs_calls": {
+            endpoint: count - nestjs_warm.get(endpoint, 0)
+            for endpoint, count in fake_nestjs.state.calls.items()
+        },
+        "llm": {key: llm_stats[key] - llm_warm[key] for key in llm_stats},
+    }
+
+
+def compare_reports(baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float = 0.2) -> List[str]:
+    """
+    List p95 regressions beyond `tolerance` (0.2 = 20% slower), overall and per phase.
+    New errors are always reported.
+    """
+    regressions = []
+    sections = [("total", baseline.get("total", {}), current["total"])]
+    sections += [
+        (phase, baseline.get("phases", {}).get(phase, {}), current["phases"][phase])
+        for phase in PHASES
+    ]
+    for name, before, after in sections:
+        if before.get("p95_ms") and after["p95_ms"] > before["p95_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: p95 {before['p95_ms']:.1f}ms → {after['p95_ms']:.1f}ms "
+                f"(+{(after['p95_ms'] / before['p95_ms'] - 1) * 100:.0f}%)"
+            )
+        if after.get("errors", 0) > before.get("errors", 0):
+            regressions.append(f"{name}: errors {before.get('errors', 0)} → {after['errors']}")
+    return regressions
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    total = report["total"]
+    lines = [
+        f"Requests: {total['requests']} in {total['duration_s']:.2f}s "
+        f"({total['throughput_rps']:.1f} req/s), errors: {total['errors']}",
+        f"{'phase':<8}{'count':>7}{'p50':>10}{'p95':>10}{'p99':>10}  stages (mean ms)",
+    ]
+    for phase, stats in report["phases"].items():
+        stages = ", ".join(f"{name}={s['mean_ms']:.1f}" for name, s in stats["stages"].items())
+        lines.append(
+            f"{phase:<8}{stats['count']:>7}{stats['p50_ms']:>10.1f}"
+            f"{stats['p95_ms']:>10.1f}{stats['p99_ms']:>10.1f}  {stages}"
+        )
+    lines.append(f"NestJS calls: {report['nestjs_calls']}")
+    lines.append(f"LLM: {report['llm']}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark POST /educator/turn with local stand-ins")
+    parser.add_argument("--turns", type=int, default=50, help="Turns per phase")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--nestjs-latency-ms", type=float, default=15.0)
+    parser.add_argument("--llm-latency-ms", type=float, default=400.0)
+    parser.add_argument("--latency-sigma", type=float, default=0.5)
+    parser.add_argument("--completion-tokens", type=int, default=150)
+    parser.add_argument("--checkpointer", choices=["memory", "redis"], default="memory")
+    parser.add_argument("--game-mode", default="FREE_RECALL_SCORE")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write the JSON report here")
+    parser.add_argument("--baseline", help="Compare against a previous JSON report")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed p95 regression (0.2 = 20%%)")
+    parser.add_argument("--verbose", action="store_true", help="Keep the app's INFO logs")
+    args = parser.parse_args(argv)
+
+    if not args.verbose:
+        # Per-request INFO logs would dominate the measurement
+        logging.disable(logging.INFO)
+
+    report = asyncio.run(run_benchmark(
+        turns=args.turns,
+        concurrency=args.concurrency,
+        nestjs_latency_ms=args.nestjs_latency_ms,
+        llm_latency_ms=args.llm_latency_ms,
+        latency_sigma=args.latency_sigma,
+        completion_tokens=args.completion_tokens,
+        checkpointer=args.checkpointer,
+        game_mode=args.game_mode,
+        seed=args.seed,
+    ))
+    print(format_report(report))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare_reports(json.load(f), report, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -46,8 +46,10 @@ EXTRACT_WORDS_TEMPLATE = """From the following text, extract 5-10 key vocabulary
 
 Education level: {education_level}
 Text: {text}
+Key terms of the full content (most relevant first): {candidates}
 
 Selection criteria:
+- Prefer the key terms above when they fit the criteria
 - Important for comprehension
 - Challenging but learnable for this level
 - Frequently used in similar contexts
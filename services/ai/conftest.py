@@ -38,3 +38,31 @@ def sample_game_metadata():
         'difficulty': 2,
         'step': 'initial',
     }
+
+
+class FakeClock:
+    """Manually advanced time source for components that take a `clock`"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def fake_clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def game_config_dir(tmp_path):
+    """GameConfigLoader reading from tmp_path, with its caches isolated"""
+    from unittest.mock import patch
+    from games.config import GameConfigLoader
+
+    with patch.object(GameConfigLoader, "CONFIG_DIR", tmp_path), \
+            patch.dict(GameConfigLoader._config_cache, clear=True), \
+            patch.dict(GameConfigLoader._mtimes, clear=True), \
+            patch.dict(GameConfigLoader._failed, clear=True):
+        yield tmp_path
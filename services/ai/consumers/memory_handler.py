@@ -11,15 +11,13 @@ import time
 import logging
 from typing import List, Dict, Any, Optional
 import redis
-from langchain_redis import RedisVectorStore
-from langchain_openai.embeddings import OpenAIEmbeddings
+from memory_store import vector_store_registry
 
 logger = logging.getLogger(__name__)
 
 # Redis connection (shared with cache_config)
 REDIS_URL = None
 _redis_client: Optional[redis.Redis] = None
-_embeddings: Optional[OpenAIEmbeddings] = None
 
 
 def _get_redis() -> redis.Redis:
@@ -32,37 +30,6 @@ def _get_redis() -> redis.Redis:
     return _redis_client
 
 
-def _get_embeddings() -> OpenAIEmbeddings:
-    """Get or create embeddings model (lazy, reusable)"""
-    global _embeddings
-    if _embeddings is None:
-        # Same model as semantic cache for consistency
-        _embeddings = OpenAIEmbeddings(model="text-embedding-3-small")
-    return _embeddings
-
-
-def _get_vector_store(tenant_id: str) -> RedisVectorStore:
-    """
-    Get vector store for tenant's pedagogical memories.
-    Index per tenant for isolation and scalability.
-    """
-    return RedisVectorStore(
-        redis_url=REDIS_URL or "redis://localhost:6379/0",
-        index_name=f"mem:index:{tenant_id}",
-        embedding=_get_embeddings(),
-        # Text field for searchable content
-        content_key="text",
-        # Metadata for filtering and context
-        metadata_schema=[
-            {"name": "tenant_id", "type": "tag"},
-            {"name": "user_id", "type": "tag"},
-            {"name": "content_id", "type": "tag"},
-            {"name": "kind", "type": "tag"},  # blocker|intervention|vocab
-            {"name": "timestamp", "type": "numeric"},
-        ]
-    )
-
-
 def mem_hash(text: str) -> str:
     """
     Generate short hash for deduplication.
@@ -276,8 +243,8 @@ def handle_session_finished(job: Dict[str, Any]) -> None:
         unique_memories = deduplicate_memories(tenant_id, memories)
         
         # 3. Store in vector DB (if any unique memories)
+        #    Backend chosen per tenant: in-process NumPy for small tenants, Redis above threshold
         if unique_memories:
-            vs = _get_vector_store(tenant_id)
             texts = [m["text"] for m in unique_memories]
             metas = []
             for m in unique_memories:
@@ -286,8 +253,11 @@ def handle_session_finished(job: Dict[str, Any]) -> None:
                 metas.append(meta)
             
             # Batch insert for efficiency
-            vs.add_texts(texts=texts, metadatas=metas)
-            logger.info(f"Stored {len(unique_memories)} memories in vector store")
+            vector_store_registry.add_texts(tenant_id, texts, metas)
+            logger.info(
+                f"Stored {len(unique_memories)} memories in vector store "
+                f"({vector_store_registry.backend_for(tenant_id)})"
+            )
         else:
             logger.info("No unique memories to store (all were duplicates)")
         
@@ -9,6 +9,7 @@ from typing import Dict, Any, List, Optional
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 from llm_factory import LLMFactory
+from utils.service_container import services
 
 logger = logging.getLogger(__name__)
 
@@ -248,5 +249,5 @@ class LessonGenerator:
             raise
 
 
-# Singleton
-lesson_generator = LessonGenerator()
+# Singleton (built on first use or by POST /warmup)
+lesson_generator = services.lazy("lesson_generator", LessonGenerator)
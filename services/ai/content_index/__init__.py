@@ -0,0 +1,14 @@
+"""Per-content vocabulary and sentence indexes shared by games and phases"""
+from .index import ContentIndex, is_keyword, lemma, segment_sentences, strip_accents, tokenize
+from .store import ContentIndexStore, content_indexes
+
+__all__ = [
+    'ContentIndex',
+    'ContentIndexStore',
+    'content_indexes',
+    'is_keyword',
+    'lemma',
+    'segment_sentences',
+    'strip_accents',
+    'tokenize',
+]
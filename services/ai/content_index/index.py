@@ -0,0 +1,307 @@
+"""
+Content Index - tokenized sentences, term statistics and readability of one text
+
+Built once per content (at asset/ingestion time) and shared by every
+consumer that used to re-derive it: the PRE phase target-word proposal,
+game round builders, target-word extraction and difficulty estimation.
+
+Everything is array-backed so a saved index can be memory-mapped:
+
+    text_bytes       uint8   UTF-8 of all sentences, back to back
+    sentence_bytes   int64   [n+1] byte offsets of each sentence
+    tokens           int32   term id of every word, in reading order
+    sentence_tokens  int64   [n+1] token offsets of each sentence
+    term_freq        int32   [V] occurrences per term
+    sentence_freq    int32   [V] sentences containing each term
+    first_seen       int32   [V] first sentence of each term
+    postings         int32   sentence ids grouped by term (word -> sentences)
+    postings_offsets int64   [V+1] offsets into postings
+
+The vocabulary (term ids are assigned in reading order) and readability
+stats go in manifest.json, written last so readers never see a partial index.
+"""
+import json
+import logging
+import math
+import os
+import re
+import unicodedata
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+ARRAYS = (
+    "text_bytes", "sentence_bytes", "tokens", "sentence_tokens",
+    "term_freq", "sentence_freq", "first_seen", "postings", "postings_offsets",
+)
+
+MIN_KEYWORD_LENGTH = 4
+# Words with at least this many syllables count as long (readability)
+LONG_WORD_SYLLABLES = 3
+
+_WORD = re.compile(r"[^\W\d_]+(?:-[^\W\d_]+)*", re.UNICODE)
+_SENTENCE_END = re.compile(r"(?<=[.!?…])\s+|\n{2,}")
+_VOWEL_GROUP = re.compile(r"[aeiouy]+")
+_ABBREVIATIONS = ("sr.", "sra.", "dr.", "dra.", "prof.", "etc.", "ex.", "p.", "pág.", "fig.")
+
+STOPWORDS = frozenset("""
+a à ao aos as às até com como da das de dela dele deles do dos e é ela elas ele eles em entre era
+essa essas esse esses esta está estão estas este estes eu foi foram há isso isto já la lhe lhes
+mais mas me mesmo meu minha muito na nas não nem no nos nós num numa o os ou para pela pelas pelo
+pelos por qual quando que quem se sem ser seu seus só sua suas são também te tem têm tu um uma umas
+uns você vocês sobre após antes depois onde porque pois então cada todo toda todos todas outro outra
+outros outras ainda assim aqui ali lá sua seu ter ser estar fazer pode podem deve devem sendo sido
+the of and to in is are was were for on with as by an be this that it from or at which
+""".split())
+
+
+def strip_accents(text: str) -> str:
+    return "".join(
+        c for c in unicodedata.normalize("NFD", text)
+        if unicodedata.category(c) != "Mn"
+    )
+
+
+def segment_sentences(text: str) -> List[str]:
+    """Split text into sentences (keeps common abbreviations together)"""
+    parts = [p.strip() for p in _SENTENCE_END.split(text) if p and p.strip()]
+    sentences: List[str] = []
+    for part in parts:
+        if sentences and sentences[-1].lower().endswith(_ABBREVIATIONS):
+            sentences[-1] = f"{sentences[-1]} {' '.join(part.split())}"
+        else:
+            sentences.append(" ".join(part.split()))
+    return sentences
+
+
+def tokenize(sentence: str) -> List[str]:
+    """Lowercased words of a sentence"""
+    return [w.lower() for w in _WORD.findall(sentence)]
+
+
+def lemma(term: str) -> str:
+    """Crude Portuguese lemma: accentless singular form"""
+    w = term.lower()
+    if w.endswith(("ões", "ães")):
+        w = w[:-3] + "ão"
+    elif w.endswith("ais") and len(w) > 4:
+        w = w[:-2] + "l"
+    elif w.endswith("es") and len(w) > 4 and w[-3] in "rzs":
+        w = w[:-2]
+    elif w.endswith("s") and len(w) > 3:
+        w = w[:-1]
+    return strip_accents(w)
+
+
+def is_keyword(term: str) -> bool:
+    return len(term) >= MIN_KEYWORD_LENGTH and term not in STOPWORDS
+
+
+def count_syllables(word: str) -> int:
+    return max(1, len(_VOWEL_GROUP.findall(strip_accents(word.lower()))))
+
+
+def _map_array(path: Path) -> np.ndarray:
+    try:
+        # Read-only memory map: pages are shared with the OS cache
+        return np.load(path, mmap_mode="r")
+    except ValueError:
+        # Empty arrays cannot be memory-mapped
+        return np.load(path)
+
+
+class ContentIndex:
+    """
+    Read-only index of one text. Use ContentIndex.build() or ContentIndex.load().
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray], vocab: List[str], readability: Dict[str, float]):
+        for name in ARRAYS:
+            setattr(self, name, arrays[name])
+        self.vocab = vocab
+        self.readability = readability
+        self._term_ids: Optional[Dict[str, int]] = None
+        self._sentences: Optional[List[str]] = None
+        self._keywords: Optional[List[str]] = None
+        self._scores: Optional[Dict[str, float]] = None
+
+    # ------------------------------------------------------------------
+    # Build / persist
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(cls, text: str) -> "ContentIndex":
+        sentences = segment_sentences(text or "")
+        term_ids: Dict[str, int] = {}
+        tokens: List[int] = []
+        sentence_tokens = [0]
+        postings: Dict[int, List[int]] = {}
+
+        for i, sentence in enumerate(sentences):
+            for term in tokenize(sentence):
+                tid = term_ids.setdefault(term, len(term_ids))
+                tokens.append(tid)
+                seen = postings.setdefault(tid, [])
+                if not seen or seen[-1] != i:
+                    seen.append(i)
+            sentence_tokens.append(len(tokens))
+
+        vocab_size = len(term_ids)
+        encoded = [s.encode("utf-8") for s in sentences]
+        posting_lists = [postings[tid] for tid in range(vocab_size)]
+
+        arrays = {
+            "text_bytes": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+            "sentence_bytes": np.cumsum([0] + [len(b) for b in encoded], dtype=np.int64),
+            "tokens": np.asarray(tokens, dtype=np.int32),
+            "sentence_tokens": np.asarray(sentence_tokens, dtype=np.int64),
+            "term_freq": np.bincount(np.asarray(tokens, dtype=np.int32), minlength=vocab_size).astype(np.int32),
+            "sentence_freq": np.asarray([len(p) for p in posting_lists], dtype=np.int32),
+            "first_seen": np.asarray([p[0] for p in posting_lists], dtype=np.int32),
+            "postings": np.asarray([i for p in posting_lists for i in p], dtype=np.int32),
+            "postings_offsets": np.cumsum([0] + [len(p) for p in posting_lists], dtype=np.int64),
+        }
+        vocab = sorted(term_ids, key=term_ids.get)
+        return cls(arrays, vocab, cls._readability(sentences, vocab, arrays))
+
+    @staticmethod
+    def _readability(sentences: List[str], vocab: List[str], arrays: Dict[str, np.ndarray]) -> Dict[str, float]:
+        words = int(arrays["tokens"].size)
+        n = len(sentences)
+        if not words:
+            return {"sentences": n, "words": 0, "avg_sentence_words": 0.0, "avg_word_chars": 0.0,
+                    "avg_word_syllables": 0.0, "long_word_ratio": 0.0, "flesch_pt": 0.0}
+
+        freq = arrays["term_freq"]
+        chars = sum(len(t) * int(f) for t, f in zip(vocab, freq))
+        syllables = [count_syllables(t) for t in vocab]
+        total_syllables = sum(s * int(f) for s, f in zip(syllables, freq))
+        long_words = sum(int(f) for s, f in zip(syllables, freq) if s >= LONG_WORD_SYLLABLES)
+
+        asl = words / max(1, n)
+        asw = total_syllables / words
+        return {
+            "sentences": n,
+            "words": words,
+            "avg_sentence_words": round(asl, 2),
+            "avg_word_chars": round(chars / words, 2),
+            "avg_word_syllables": round(asw, 2),
+            "long_word_ratio": round(long_words / words, 3),
+            # Flesch reading ease adapted to Portuguese (Martins et al., 1996)
+            "flesch_pt": round(248.835 - 1.015 * asl - 84.6 * asw, 1),
+        }
+
+    def save(self, directory: Path) -> None:
+        """Write the arrays, then the manifest (atomic per file)"""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in ARRAYS:
+            self._atomic_write(directory / f"{name}.npy", lambda f, a=getattr(self, name): np.save(f, a))
+        manifest = {"version": INDEX_VERSION, "vocab": self.vocab, "readability": self.readability}
+        self._atomic_write(
+            directory / MANIFEST_FILE,
+            lambda f: f.write(json.dumps(manifest, ensure_ascii=False).encode("utf-8")),
+        )
+
+    @classmethod
+    def load(cls, directory: Path) -> Optional["ContentIndex"]:
+        """Memory-map a saved index (None if missing or from another version)"""
+        directory = Path(directory)
+        try:
+            manifest = json.loads((directory / MANIFEST_FILE).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        if manifest.get("version") != INDEX_VERSION:
+            logger.warning(f"Unsupported content index version in {directory}")
+            return None
+        arrays = {name: _map_array(directory / f"{name}.npy") for name in ARRAYS}
+        return cls(arrays, manifest["vocab"], manifest["readability"])
+
+    @staticmethod
+    def _atomic_write(path: Path, writer) -> None:
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp, "wb") as f:
+            writer(f)
+        os.replace(tmp, path)
+
+    # ------------------------------------------------------------------
+    # Sentences
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.sentence_tokens) - 1
+
+    def sentence(self, i: int) -> str:
+        start, end = int(self.sentence_bytes[i]), int(self.sentence_bytes[i + 1])
+        return bytes(self.text_bytes[start:end]).decode("utf-8")
+
+    @property
+    def sentences(self) -> List[str]:
+        if self._sentences is None:
+            self._sentences = [self.sentence(i) for i in range(len(self))]
+        return self._sentences
+
+    def tokens_of(self, i: int) -> List[str]:
+        """Terms of sentence i, in reading order"""
+        start, end = int(self.sentence_tokens[i]), int(self.sentence_tokens[i + 1])
+        return [self.vocab[t] for t in self.tokens[start:end]]
+
+    def sentence_lengths(self) -> np.ndarray:
+        return np.diff(self.sentence_tokens)
+
+    # ------------------------------------------------------------------
+    # Terms
+    # ------------------------------------------------------------------
+
+    def term_id(self, term: str) -> Optional[int]:
+        if self._term_ids is None:
+            self._term_ids = {t: i for i, t in enumerate(self.vocab)}
+        return self._term_ids.get(term.lower())
+
+    def __contains__(self, term: str) -> bool:
+        return self.term_id(term) is not None
+
+    def term_frequency(self, term: str) -> int:
+        tid = self.term_id(term)
+        return 0 if tid is None else int(self.term_freq[tid])
+
+    def sentences_with(self, term: str) -> List[int]:
+        """Sentence ids containing a term (reading order)"""
+        tid = self.term_id(term)
+        if tid is None:
+            return []
+        return self.postings[self.postings_offsets[tid]:self.postings_offsets[tid + 1]].tolist()
+
+    def lemma_frequencies(self) -> Counter:
+        counts: Counter = Counter()
+        for term, freq in zip(self.vocab, self.term_freq):
+            counts[lemma(term)] += int(freq)
+        return counts
+
+    def keyword_score(self, term: str) -> float:
+        """Frequent, long, and not spread over every sentence"""
+        if self._scores is None:
+            n = max(1, len(self))
+            self._scores = {
+                t: int(tf) * min(len(t), 12) * (1 + math.log(n / int(sf)))
+                for t, tf, sf in zip(self.vocab, self.term_freq, self.sentence_freq)
+                if is_keyword(t)
+            }
+        return self._scores.get(term, 0.0)
+
+    @property
+    def keywords(self) -> List[str]:
+        """Content terms ranked by keyword_score"""
+        if self._keywords is None:
+            self.keyword_score("")
+            self._keywords = sorted(
+                self._scores,
+                key=lambda t: (-self._scores[t], int(self.first_seen[self.term_id(t)]), t),
+            )
+        return self._keywords
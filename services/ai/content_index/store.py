@@ -0,0 +1,111 @@
+"""
+Content Index Store - per-content indexes, built once and loaded lazily
+
+Indexes of stored contents are saved under CONTENT_INDEX_DIR/<content_id>/
+when an asset is generated and memory-mapped on first use in any process.
+Text without a content id (e.g. a game's content slice) is indexed in
+memory, keyed by a hash of the text. Both are kept in one LRU.
+"""
+import hashlib
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .index import ContentIndex
+
+logger = logging.getLogger(__name__)
+
+CONTENT_INDEX_DIR = os.getenv("CONTENT_INDEX_DIR", "data/content_index")
+CONTENT_INDEX_MAX_LOADED = int(os.getenv("CONTENT_INDEX_MAX_LOADED", "256"))
+
+_SAFE_ID = re.compile(r"^[A-Za-z0-9_-]{1,128}$")
+
+
+class ContentIndexStore:
+    """
+    Args:
+        root_dir: Where content indexes are saved (None = memory only)
+        max_loaded: LRU bound on indexes kept open
+    """
+
+    def __init__(self, root_dir: Optional[Path] = None, max_loaded: int = CONTENT_INDEX_MAX_LOADED):
+        self.root_dir = Path(root_dir or CONTENT_INDEX_DIR)
+        self.max_loaded = max_loaded
+        self._loaded: "OrderedDict[str, ContentIndex]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "loads": 0, "builds": 0, "misses": 0}
+
+    def _path(self, content_id: str) -> Path:
+        name = content_id if _SAFE_ID.match(content_id) else hashlib.sha1(content_id.encode("utf-8")).hexdigest()
+        return self.root_dir / name
+
+    def _remember(self, key: str, index: ContentIndex) -> ContentIndex:
+        with self._lock:
+            self._loaded[key] = index
+            self._loaded.move_to_end(key)
+            while len(self._loaded) > self.max_loaded:
+                self._loaded.popitem(last=False)
+        return index
+
+    def _cached(self, key: str) -> Optional[ContentIndex]:
+        with self._lock:
+            index = self._loaded.get(key)
+            if index is not None:
+                self._loaded.move_to_end(key)
+                self._stats["hits"] += 1
+            return index
+
+    def build(self, content_id: str, text: str, persist: bool = True) -> ContentIndex:
+        """Index a content's text (at ingestion / asset time) and save it"""
+        index = ContentIndex.build(text)
+        self._stats["builds"] += 1
+        if persist:
+            try:
+                index.save(self._path(content_id))
+            except OSError as e:
+                logger.warning(f"Failed to save content index for {content_id}: {e}")
+        return self._remember(f"id:{content_id}", index)
+
+    def get(self, content_id: Optional[str]) -> Optional[ContentIndex]:
+        """Index of a stored content, memory-mapped on first use (None if never built)"""
+        if not content_id:
+            return None
+        key = f"id:{content_id}"
+        index = self._cached(key)
+        if index is not None:
+            return index
+
+        try:
+            index = ContentIndex.load(self._path(content_id))
+        except Exception as e:
+            logger.warning(f"Failed to load content index for {content_id}: {e}")
+            index = None
+        if index is None:
+            self._stats["misses"] += 1
+            return None
+        self._stats["loads"] += 1
+        return self._remember(key, index)
+
+    def for_text(self, text: str) -> ContentIndex:
+        """In-memory index of a text, built once per distinct text"""
+        key = "text:" + hashlib.sha1((text or "").encode("utf-8")).hexdigest()
+        index = self._cached(key)
+        if index is not None:
+            return index
+        self._stats["builds"] += 1
+        return self._remember(key, ContentIndex.build(text or ""))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._loaded.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self._stats, "loaded": len(self._loaded), "max_loaded": self.max_loaded}
+
+
+# Global store
+content_indexes = ContentIndexStore()
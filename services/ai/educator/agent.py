@@ -26,13 +26,21 @@ except ImportError:
             from langgraph.checkpoint.memory import MemorySaver as RedisSaver
 
 from .state import EducatorState
+import asyncio
+from .checkpointer import SlimCheckpointer
+from utils.tracing import traced
+from utils.service_container import services
 import logging
 import redis
 import os
 
 logger = logging.getLogger(__name__)
 
+# Idle educator threads expire after this long (default: 7 days)
+CHECKPOINT_TTL_MINUTES = int(os.getenv("EDUCATOR_CHECKPOINT_TTL_MINUTES", "10080"))
 
+
+@traced("graph.route")
 def route_by_phase(state: EducatorState) -> str:
     """
     Route to appropriate phase handler.
@@ -52,7 +60,7 @@ def route_by_phase(state: EducatorState) -> str:
     return phase
 
 
-def create_educator_graph():
+def create_educator_graph(checkpointer=None):
     """
     Create LangGraph for Educator Agent.
     
@@ -61,7 +69,11 @@ def create_educator_graph():
     - Nodes: pre_phase, during_phase, post_phase
     - Exit: All nodes → END
     
-    Checkpointing: MemorySaver (upgrade to Postgres in Phase 2b)
+    Checkpointing: RedisSaver with TTL, wrapped in SlimCheckpointer
+    
+    Args:
+        checkpointer: Inner saver to use instead of Redis (e.g. MemorySaver in
+            benchmarks/tests); still wrapped in SlimCheckpointer
     """
     
     # Import nodes here to avoid circular imports
@@ -73,10 +85,13 @@ def create_educator_graph():
     workflow = StateGraph(EducatorState)
     
     # Add phase handler nodes
-    workflow.add_node("pre", pre_phase_handle)
-    workflow.add_node("during", during_phase_handle)
-    workflow.add_node("post", post_phase_handle)
-    workflow.add_node("game", game_phase_handle)  # NEW: Game node
+    # Sync handlers call LLMs with .invoke(); under ainvoke LangGraph runs
+    # sync nodes in its thread pool, so they never stall the event loop
+    # (tests/integration/test_loop_blocking.py)
+    workflow.add_node("pre", traced("node.pre")(pre_phase_handle))
+    workflow.add_node("during", traced("node.during")(during_phase_handle))
+    workflow.add_node("post", traced("node.post")(post_phase_handle))
+    workflow.add_node("game", traced("node.game")(game_phase_handle))  # NEW: Game node
     
     # Set entry point with conditional routing
     workflow.set_conditional_entry_point(
@@ -98,20 +113,62 @@ def create_educator_graph():
     # Compile with Redis checkpointer for persistent, shared state
     # Benefits: survives restarts, shared across instances, TTL support
     redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-    redis_client = redis.Redis.from_url(redis_url, decode_responses=False)
     
-    checkpointer = RedisSaver(redis_client)
-    checkpointer.setup()  # Creates necessary Redis structures
+    if checkpointer is not None:
+        inner = checkpointer
+    elif RedisSaver.__name__ == "MemorySaver":
+        inner = RedisSaver()
+    else:
+        redis_client = redis.Redis.from_url(redis_url, decode_responses=False)
+        inner = RedisSaver(
+            redis_client=redis_client,
+            ttl={
+                # Idle threads expire; reads keep active ones alive
+                "default_ttl": CHECKPOINT_TTL_MINUTES,
+                "refresh_on_read": True,
+            },
+        )
+        inner.setup()  # Creates necessary Redis structures
     
-    logger.info(f"Educator graph compiled with RedisSaver (Redis: {redis_url})")
+    # Persist only durable state (game progress, phase), not per-turn inputs
+    checkpointer = SlimCheckpointer(inner)
+    
+    logger.info(
+        f"Educator graph compiled with {type(inner).__name__} "
+        f"(Redis: {redis_url}, TTL: {CHECKPOINT_TTL_MINUTES} min)"
+    )
     
     return workflow.compile(checkpointer=checkpointer)
 
 
-# Global graph instance
-try:
-    educator_graph = create_educator_graph()
-    logger.info("Educator graph created successfully")
-except Exception as e:
-    logger.error(f"Failed to create educator graph: {e}")
-    educator_graph = None
+# Global graph instance: built on first turn (or POST /warmup), not at import,
+# so a missing Redis/LLM key does not slow down or break app startup.
+services.register("educator_graph", create_educator_graph)
+
+
+def get_educator_graph():
+    """
+    Return the compiled educator graph, building it on first call.
+    
+    Returns:
+        Compiled graph, or None if it cannot be built (error is logged; next call retries)
+    """
+    try:
+        return services.get("educator_graph")
+    except Exception as e:
+        logger.error(f"Failed to create educator graph: {e}")
+        return None
+
+
+async def aget_educator_graph():
+    """Async variant: first build runs in a worker thread (Redis setup is blocking)"""
+    if services.is_initialized("educator_graph"):
+        return services.get("educator_graph")
+    return await asyncio.to_thread(get_educator_graph)
+
+
+def __getattr__(name):
+    # Backwards compatibility: `from educator.agent import educator_graph`
+    if name == "educator_graph":
+        return get_educator_graph()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
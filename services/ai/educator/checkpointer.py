@@ -0,0 +1,216 @@
+"""
+Slim Checkpointer for the Educator Graph
+
+Wraps the real checkpointer (RedisSaver / MemorySaver) and drops ephemeral
+per-turn channels (context pack, prompt message, outputs) before they are
+persisted. Only durable state - game progress and current phase - is
+checkpointed, so every thread costs a few hundred bytes instead of the
+full context pack on every super-step.
+
+Also reports bytes written per turn (see metrics.track_checkpoint_write).
+"""
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator, FrozenSet, Iterator, Optional, Sequence, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.constants import START
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
+
+from metrics import track_checkpoint_write
+from utils.tracing import span
+from .state import EPHEMERAL_FIELDS
+
+logger = logging.getLogger(__name__)
+
+
+class SlimCheckpointer(BaseCheckpointSaver):
+    """
+    Delegating checkpointer that never persists ephemeral channels.
+
+    Ephemeral channels are removed from channel_values, pending writes and
+    new_versions (the channels whose blobs the inner saver stores this step),
+    so no blob is written for them. The checkpoint's own channel_versions
+    and versions_seen are left as they are. That is safe for resume: LangGraph
+    still sees the same versions when scheduling, and the saver finds no blob
+    for those channels on load, so they come back empty (as an "empty" blob
+    would) and /educator/turn fills them again from the new request.
+    """
+
+    def __init__(
+        self,
+        inner: BaseCheckpointSaver,
+        ephemeral_channels: FrozenSet[str] = EPHEMERAL_FIELDS
+    ):
+        """
+        Args:
+            inner: Checkpointer that actually stores data
+            ephemeral_channels: State keys to drop before persisting
+        """
+        super().__init__(serde=inner.serde)
+        self.inner = inner
+        self.ephemeral_channels = frozenset(ephemeral_channels)
+
+    @property
+    def config_specs(self):
+        return self.inner.config_specs
+
+    # ------------------------------------------------------------------
+    # Filtering
+    # ------------------------------------------------------------------
+
+    def _slim_value(self, channel: str, value: Any) -> Any:
+        # Graph input is staged whole in the START channel
+        if channel == START and isinstance(value, dict):
+            return {k: v for k, v in value.items() if k not in self.ephemeral_channels}
+        return value
+
+    def _slim_checkpoint(
+        self,
+        checkpoint: Checkpoint,
+        new_versions: ChannelVersions
+    ) -> Tuple[Checkpoint, ChannelVersions, int]:
+        kept = {
+            k: self._slim_value(k, v) for k, v in checkpoint["channel_values"].items()
+            if k not in self.ephemeral_channels
+        }
+        slim = {**checkpoint, "channel_values": kept}
+        slim_versions = {
+            k: v for k, v in new_versions.items()
+            if k not in self.ephemeral_channels
+        }
+        return slim, slim_versions, self._size_of(kept.values())
+
+    def _slim_writes(
+        self,
+        writes: Sequence[Tuple[str, Any]]
+    ) -> Tuple[Sequence[Tuple[str, Any]], int]:
+        kept = [
+            (c, self._slim_value(c, v)) for c, v in writes
+            if c not in self.ephemeral_channels
+        ]
+        return kept, self._size_of(v for _, v in kept)
+
+    def _size_of(self, values) -> int:
+        size = 0
+        for value in values:
+            try:
+                size += len(self.serde.dumps_typed(value)[1])
+            except Exception:
+                # Size is informational only
+                pass
+        return size
+
+    @staticmethod
+    def _is_new_turn(metadata: CheckpointMetadata) -> bool:
+        return (metadata or {}).get("source") == "input"
+
+    # ------------------------------------------------------------------
+    # Sync API
+    # ------------------------------------------------------------------
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        with span("checkpoint.get"):
+            return self.inner.get_tuple(config)
+
+    def list(self, config: Optional[RunnableConfig], **kwargs) -> Iterator[CheckpointTuple]:
+        return self.inner.list(config, **kwargs)
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        slim, slim_versions, size = self._slim_checkpoint(checkpoint, new_versions)
+        track_checkpoint_write(size, new_turn=self._is_new_turn(metadata))
+        with span("checkpoint.put"):
+            return self.inner.put(config, slim, metadata, slim_versions)
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        kept, size = self._slim_writes(writes)
+        if not kept:
+            return
+        track_checkpoint_write(size)
+        with span("checkpoint.put"):
+            self.inner.put_writes(config, kept, task_id, task_path)
+
+    def delete_thread(self, thread_id: str) -> None:
+        self.inner.delete_thread(thread_id)
+
+    def get_next_version(self, current, channel):
+        return self.inner.get_next_version(current, channel)
+
+    # ------------------------------------------------------------------
+    # Async API (falls back to a worker thread for sync-only savers,
+    # e.g. RedisSaver, so ainvoke never blocks the event loop)
+    # ------------------------------------------------------------------
+
+    def _has_native_async(self, name: str) -> bool:
+        return getattr(type(self.inner), name) is not getattr(BaseCheckpointSaver, name)
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        with span("checkpoint.get"):
+            if self._has_native_async("aget_tuple"):
+                return await self.inner.aget_tuple(config)
+            return await asyncio.to_thread(self.inner.get_tuple, config)
+
+    async def alist(self, config: Optional[RunnableConfig], **kwargs) -> AsyncIterator[CheckpointTuple]:
+        if self._has_native_async("alist"):
+            async for item in self.inner.alist(config, **kwargs):
+                yield item
+        else:
+            items = await asyncio.to_thread(lambda: list(self.inner.list(config, **kwargs)))
+            for item in items:
+                yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        slim, slim_versions, size = self._slim_checkpoint(checkpoint, new_versions)
+        track_checkpoint_write(size, new_turn=self._is_new_turn(metadata))
+        with span("checkpoint.put"):
+            if self._has_native_async("aput"):
+                return await self.inner.aput(config, slim, metadata, slim_versions)
+            return await asyncio.to_thread(self.inner.put, config, slim, metadata, slim_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        kept, size = self._slim_writes(writes)
+        if not kept:
+            return
+        track_checkpoint_write(size)
+        with span("checkpoint.put"):
+            if self._has_native_async("aput_writes"):
+                await self.inner.aput_writes(config, kept, task_id, task_path)
+            else:
+                await asyncio.to_thread(self.inner.put_writes, config, kept, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        if self._has_native_async("adelete_thread"):
+            await self.inner.adelete_thread(thread_id)
+        else:
+            await asyncio.to_thread(self.inner.delete_thread, thread_id)
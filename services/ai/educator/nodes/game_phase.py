@@ -4,10 +4,16 @@ Game Phase Node - Handles game rounds
 Integrated into Educator Agent LangGraph.
 Triggered when user_text = "START_GAME" or when in active game.
 """
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+import asyncio
 import logging
 from ..state import EducatorState
-from games.registry import game_registry
+from games.pool import game_pool
+from games.pregen import round_pregen
+from games.eval_cache import eval_cache
+from games.triggers import trigger_engine
+from games.scoring import scoring_engine
+from games.mastery.difficulty import DifficultyAdapter
 from games.middleware import GamePipeline, CorrelationIdMiddleware, MetricsMiddleware, EventEmitterMiddleware
 
 logger = logging.getLogger(__name__)
@@ -40,7 +46,7 @@ async def handle(state: EducatorState) -> EducatorState:
     
     # Check if starting new game
     if user_text.upper() == 'START_GAME' or game_mode is None:
-        return _start_new_game(state)
+        return await _start_new_game(state)
     
     # Continuing existing game - evaluate answer
     elif game_round_data:
@@ -56,30 +62,75 @@ async def handle(state: EducatorState) -> EducatorState:
         }
 
 
-def _start_new_game(state: EducatorState) -> EducatorState:
-    """Start a new game round"""
+def build_ped_state(state: EducatorState) -> Dict[str, Any]:
+    """Pedagogical state a round is created from (also the pre-generation key)"""
+    context = state.get('context', {})
+    return {
+        'content_slice': context.get('contentSlice', {}).get('text', ''),
+        'target_words': context.get('targetWords', []),
+        'phase': state.get('current_phase', 'POST'),
+        'learner_profile': context.get('learner', {}), # Pass user preferences
+    }
+
+
+def _as_float(value: Any, default: float = 0.0) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def build_trigger_event(metadata: Dict[str, Any], ped_state: Dict[str, Any]) -> Tuple[str, Optional[str], Dict[str, Any]]:
+    """(trigger, key, facts) evaluated against triggers.yaml when no game mode is requested"""
+    if metadata.get('intent'):
+        trigger, key = 'on_intent', metadata['intent']
+    elif metadata.get('gapType'):
+        trigger, key = 'on_gap_detected', metadata['gapType']
+    else:
+        trigger, key = 'on_reading_complete', None
     
-    # Get game mode from metadata
-    metadata = state.get('prompt_message', {}).get('metadata', {})
-    game_mode = metadata.get('gameMode', 'FREE_RECALL_SCORE')  # Default for testing
-    difficulty = metadata.get('difficulty', 2)
+    content_slice = ped_state.get('content_slice') or ''
+    facts = {
+        'content_slice': bool(content_slice),
+        'content_length': len(content_slice),
+        'target_word_count': len(ped_state.get('target_words') or []),
+        'user_mastery': _as_float(metadata.get('userMastery')),
+        'phase': ped_state.get('phase'),
+    }
+    return trigger, key, facts
+
+
+def _learner_id(state: EducatorState) -> Optional[str]:
+    return state.get('context', {}).get('learner', {}).get('id')
+
+
+def _adapted_difficulty(user_id: Optional[str], game_mode: str) -> int:
+    """Level the learner's recent results in this mode call for"""
+    if not user_id:
+        return DifficultyAdapter.DEFAULT_DIFFICULTY
+    return DifficultyAdapter(user_id).get_difficulty(game_mode)
+
+
+async def _start_new_game(state: EducatorState) -> EducatorState:
+    """Start a new game round (from the pre-generation pool when one is ready)"""
     
-    logger.info(f"Starting new game: {game_mode}")
+    metadata = state.get('prompt_message', {}).get('metadata', {})
+    ped_state = build_ped_state(state)
     
     try:
-        # Get game class from registry
-        game_registry.discover_games()  # Ensure games are discovered
-        game_class = game_registry.get_game(game_mode)
-        game = game_class()
-        
-        # Build pedagogical state from context
-        context = state.get('context', {})
-        ped_state = {
-            'content_slice': context.get('contentSlice', {}).get('text', ''),
-            'target_words': context.get('targetWords', []),
-            'phase': state.get('current_phase', 'POST'),
-            'learner_profile': context.get('learner', {}), # Pass user preferences
-        }
+        # Requested game mode, else the one triggers.yaml picks for this event
+        game_mode = metadata.get('gameMode')
+        if not game_mode:
+            trigger, key, facts = build_trigger_event(metadata, ped_state)
+            game_mode = trigger_engine.decide(trigger, facts, key) or 'FREE_RECALL_SCORE'
+        difficulty = metadata.get('difficulty')
+        if difficulty is None:
+            difficulty = await asyncio.to_thread(_adapted_difficulty, _learner_id(state), game_mode)
+        
+        logger.info(f"Starting new game: {game_mode}")
+        
+        # Shared instance with the LLM service injected
+        game = game_pool.get(game_mode)
         
         # Create round using pipeline
         round_context = {
@@ -87,10 +138,17 @@ def _start_new_game(state: EducatorState) -> EducatorState:
             'correlation_id': metadata.get('correlationId'),
         }
         
-        def create_round_handler(ctx):
-            return game.create_round(ped_state, difficulty)
+        # Ready round from the pool (refilled in the background after a hit)
+        pregenerated = round_pregen.pop(ped_state, game_mode, difficulty)
         
-        round_data = game_pipeline.execute(round_context, create_round_handler)
+        if pregenerated is not None:
+            round_data = game_pipeline.execute(round_context, lambda ctx: pregenerated)
+        else:
+            def create_round_handler(ctx):
+                return game.create_round(ped_state, difficulty)
+            
+            # create_round may block on the LLM: keep it off the event loop
+            round_data = await asyncio.to_thread(game_pipeline.execute, round_context, create_round_handler)
         
         # Get quick replies
         quick_replies = game.get_quick_replies(round_data)
@@ -104,6 +162,7 @@ def _start_new_game(state: EducatorState) -> EducatorState:
                     'game_mode': game_mode,
                     'difficulty': difficulty,
                     'correlation_id': metadata.get('correlationId'),
+                    'pregenerated': pregenerated is not None,
                 }
             }
         ]
@@ -141,8 +200,7 @@ async def _evaluate_game_answer(state: EducatorState) -> EducatorState:
     
     try:
         # Get game instance
-        game_class = game_registry.get_game(game_mode)
-        game = game_class()
+        game = game_pool.get(game_mode)
         
         # Evaluate using pipeline
         eval_context = {
@@ -152,10 +210,25 @@ async def _evaluate_game_answer(state: EducatorState) -> EducatorState:
         }
         
         async def evaluate_handler(ctx):
-            return await game.evaluate_answer(game_round_data, user_text)
+            # Identical answers to identical rounds are evaluated once (opt-in per mode)
+            return await eval_cache.evaluate(game, game_round_data, user_text)
         
         result = await game_pipeline.execute_async(eval_context, evaluate_handler)
         
+        # Gamified points: difficulty / streak multipliers and bonuses
+        scoring_engine.apply(
+            game_mode, result, game_round_data.get('difficulty'), eval_context['metadata'].get('streak', 0)
+        )
+        
+        # Adapt the mode's difficulty to the learner's recent accuracy
+        next_difficulty = None
+        user_id = _learner_id(state)
+        if user_id and result.get('max_score'):
+            next_difficulty = await asyncio.to_thread(
+                DifficultyAdapter(user_id).record_result,
+                game_mode, result['score'] / result['max_score'], game_round_data.get('difficulty'),
+            )
+        
         # Build feedback prompt
         feedback = result['feedback']
         score = result['score']
@@ -222,6 +295,8 @@ async def _evaluate_game_answer(state: EducatorState) -> EducatorState:
                         'game_mode': game_mode,
                         'score': score,
                         'max_score': max_score,
+                        'points': result['points'],
+                        **({'next_difficulty': next_difficulty} if next_difficulty else {}),
                         **result.get('breakdown', {}),
                     }
                 }
@@ -9,7 +9,6 @@ Handles post-reading consolidation:
 """
 
 from ..state import EducatorState
-from llm_factory import get_smart_llm  # Use smarter model for POST
 from langchain_core.prompts import ChatPromptTemplate
 import logging
 
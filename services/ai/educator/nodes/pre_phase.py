@@ -8,6 +8,7 @@ Handles pre-reading phase:
 """
 
 from ..state import EducatorState
+from content_index import content_indexes
 from llm_factory import llm_factory
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
@@ -72,11 +73,14 @@ do que você acha que o texto trata?"""
     if not session.get('targetWords') or len(session.get('targetWords', [])) == 0:
         logger.debug("Proposing target words")
         
-        # Simple heuristic: suggest common academic words
-        # In production, this would use the content text
+        # Top keywords of the content when it has been indexed,
+        # otherwise common academic words for the level
+        index = content_indexes.get(session.get('contentId'))
         level = context['learner']['educationLevel']
         
-        if level in ['FUNDAMENTAL_1', 'FUNDAMENTAL_2']:
+        if index is not None and len(index.keywords) >= 4:
+            suggested_words = index.keywords[:4]
+        elif level in ['FUNDAMENTAL_1', 'FUNDAMENTAL_2']:
             suggested_words = ["ideia", "exemplo", "causa", "efeito"]
         elif level == 'MEDIO':
             suggested_words = ["análise", "contexto", "inferir", "evidência"]
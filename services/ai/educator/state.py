@@ -5,7 +5,7 @@ TypedDict for LangGraph state management.
 All nodes receive and return this state structure.
 """
 
-from typing import TypedDict, List, Optional, Dict
+from typing import TypedDict, List, Optional, Dict, FrozenSet
 
 
 class EducatorState(TypedDict):
@@ -37,3 +37,16 @@ class EducatorState(TypedDict):
     quick_replies: List[str]  # Quick reply options for user
     events_to_write: List[Dict]  # SessionEvents to persist in NestJS
     hil_request: Optional[Dict]  # Human-in-loop request (if needed)
+
+
+# Fields that must survive between turns of a thread (checkpointed).
+DURABLE_FIELDS: FrozenSet[str] = frozenset({
+    'current_phase',
+    'game_mode',
+    'game_round_data',
+    'game_metadata',
+})
+
+# Per-turn inputs/outputs, rebuilt by /educator/turn on every call.
+# Never checkpointed (the context pack alone is several KB per thread).
+EPHEMERAL_FIELDS: FrozenSet[str] = frozenset(EducatorState.__annotations__) - DURABLE_FIELDS
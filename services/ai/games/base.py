@@ -4,9 +4,12 @@ Base classes and protocols for game modules.
 All game modules must implement the GameModule protocol to be
 auto-discovered by the game registry.
 """
-from typing import Dict, Any, List, Protocol, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Protocol, Tuple
 from abc import ABC, abstractmethod
 
+from games.evaluation import cascade_policies, evaluate_cascade
+from games.scoring import GameScorer, scoring_engine
+
 
 class GameModule(Protocol):
     """
@@ -74,6 +77,9 @@ class BaseGame(ABC):
     """
     Abstract base class for game modules.
     Provides common utilities and enforces interface.
+    
+    Instances are pooled and shared across requests (games/pool.py):
+    keep per-round state in round_data, not on self.
     """
     
     # Subclasses must define these
@@ -84,6 +90,12 @@ class BaseGame(ABC):
     REQUIRES_CONTENT: bool = True
     GAME_INTENT: str = "solo"
     
+    # Bump when the evaluation prompt or scoring changes (invalidates games/eval_cache.py)
+    EVAL_PROMPT_VERSION: int = 1
+    
+    # Fixed cascade policy (tests); None: scoring_rules.yaml, hot-reloaded
+    _cascade_policy: Optional[Dict[str, Any]] = None
+    
     def __init__(self, llm_service=None):
         """Initialize game instance with optional LLM service"""
         if self.GAME_ID is NotImplemented:
@@ -106,6 +118,49 @@ class BaseGame(ABC):
         """Evaluate user's answer - must be implemented by subclass"""
         pass
     
+    @property
+    def scorer(self) -> GameScorer:
+        """Score scale and criteria weights of this mode (scoring_rules.yaml, hot-reloaded)"""
+        return scoring_engine.scorer(self.GAME_ID)
+    
+    async def evaluate_cascade(
+        self,
+        answer: str,
+        heuristic: Callable[[], Dict[str, Any]],
+        llm: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """
+        Heuristic first, LLM only when the heuristic is ambiguous
+        (thresholds: scoring_rules.yaml -> evaluation_cascade, see games/evaluation.py).
+        
+        Args:
+            answer: User's text response
+            heuristic: Returns the heuristic evaluation
+            llm: Returns the LLM evaluation coroutine (skipped without llm_service)
+        """
+        return await evaluate_cascade(
+            self.GAME_ID,
+            answer,
+            heuristic,
+            llm if self.llm_service is not None else None,
+            self._cascade_policy or cascade_policies.get(self.GAME_ID),
+        )
+    
+    def eval_cache_variant(self, round_data: Dict[str, Any]) -> str:
+        """
+        Extra evaluation cache key component, for modes whose evaluation
+        depends on more than the round and the answer (e.g. an A/B group).
+        """
+        return ""
+    
+    def personalize_feedback(self, result: Dict[str, Any], round_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Adjust an evaluation for the current player. Applied to every result
+        returned by games/eval_cache.py, including cache hits.
+        Default: unchanged.
+        """
+        return result
+    
     def get_quick_replies(self, round_data: Dict[str, Any]) -> List[str]:
         """
         Get quick replies for this round.
@@ -0,0 +1,139 @@
+"""
+Game Catalog - precomputed, indexed view of the game manifest
+
+The catalog never changes at runtime, so everything is computed once:
+- immutable records (one read-only mapping per game)
+- secondary indexes: game_intent, requires_content, and sorted duration /
+  difficulty indexes for the range filters
+- pre-serialized JSON bytes + ETag for GET /games and GET /games/{id}
+
+Filtered queries intersect index sets instead of scanning every game.
+"""
+import bisect
+import hashlib
+import json
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+
+
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:20] + '"'
+
+
+def _serialize(payload: Any) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class _SortedIndex:
+    """Game IDs sorted by a numeric key, for <= / >= queries"""
+
+    def __init__(self, items: Iterable[Tuple[int, str]]):
+        ordered = sorted(items)
+        self._keys = [key for key, _ in ordered]
+        self._ids = [game_id for _, game_id in ordered]
+
+    def at_most(self, value: int) -> FrozenSet[str]:
+        return frozenset(self._ids[:bisect.bisect_right(self._keys, value)])
+
+    def at_least(self, value: int) -> FrozenSet[str]:
+        return frozenset(self._ids[bisect.bisect_left(self._keys, value):])
+
+
+class GameCatalog:
+    """
+    Read-only game catalog built from manifest entries.
+
+    Args:
+        entries: {game_id: manifest entry} (see games/manifest.py)
+    """
+
+    def __init__(self, entries: Mapping[str, Mapping[str, Any]]):
+        self._order: List[str] = list(entries)
+        self._records: Dict[str, Mapping[str, Any]] = {
+            game_id: MappingProxyType({
+                'id': game_id,
+                'name': entry['name'],
+                'duration_min': entry['duration_min'],
+                'requires_content': entry['requires_content'],
+                'game_intent': entry['game_intent'],
+                'difficulty_range': tuple(entry['difficulty_range']),
+            })
+            for game_id, entry in entries.items()
+        }
+        self._all: FrozenSet[str] = frozenset(self._order)
+
+        # Secondary indexes
+        self._by_intent: Dict[str, FrozenSet[str]] = self._group('game_intent')
+        self._by_requires_content: Dict[bool, FrozenSet[str]] = self._group('requires_content')
+        self._by_duration = _SortedIndex((r['duration_min'], i) for i, r in self._records.items())
+        self._by_difficulty_low = _SortedIndex((r['difficulty_range'][0], i) for i, r in self._records.items())
+        self._by_difficulty_high = _SortedIndex((r['difficulty_range'][1], i) for i, r in self._records.items())
+
+        # Pre-serialized responses
+        listing = [self._jsonable(self._records[i]) for i in self._order]
+        self.list_body: bytes = _serialize({"games": listing, "total": len(listing)})
+        self.list_etag: str = _etag(self.list_body)
+        self._item_bodies: Dict[str, Tuple[bytes, str]] = {}
+        for game_id in self._order:
+            body = _serialize(self._jsonable(self._records[game_id]))
+            self._item_bodies[game_id] = (body, _etag(body))
+
+    def _group(self, field: str) -> Dict[Any, FrozenSet[str]]:
+        groups: Dict[Any, set] = {}
+        for game_id, record in self._records.items():
+            groups.setdefault(record[field], set()).add(game_id)
+        return {key: frozenset(ids) for key, ids in groups.items()}
+
+    @staticmethod
+    def _jsonable(record: Mapping[str, Any]) -> Dict[str, Any]:
+        return {**record, 'difficulty_range': list(record['difficulty_range'])}
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, game_id: str) -> bool:
+        return game_id in self._records
+
+    def get(self, game_id: str) -> Optional[Mapping[str, Any]]:
+        """Immutable record for one game (None if unknown)"""
+        return self._records.get(game_id)
+
+    def item_body(self, game_id: str) -> Optional[Tuple[bytes, str]]:
+        """(JSON bytes, ETag) for one game (None if unknown)"""
+        return self._item_bodies.get(game_id)
+
+    def query(self, filters: Optional[Dict[str, Any]] = None) -> List[Mapping[str, Any]]:
+        """
+        Records matching all filters, in catalog order.
+
+        Filters (all optional): max_duration, min_duration, requires_content,
+        game_intent, difficulty_min, difficulty_max (same semantics as
+        GameRegistry.list_games).
+        """
+        if not filters:
+            return [self._records[i] for i in self._order]
+
+        candidates = self._all
+        if 'max_duration' in filters:
+            candidates &= self._by_duration.at_most(filters['max_duration'])
+        if 'min_duration' in filters:
+            candidates &= self._by_duration.at_least(filters['min_duration'])
+        if 'requires_content' in filters:
+            candidates &= self._by_requires_content.get(filters['requires_content'], frozenset())
+        if 'game_intent' in filters:
+            candidates &= self._by_intent.get(filters['game_intent'], frozenset())
+        if 'difficulty_min' in filters:
+            # Range must reach up to the requested minimum
+            candidates &= self._by_difficulty_high.at_least(filters['difficulty_min'])
+        if 'difficulty_max' in filters:
+            candidates &= self._by_difficulty_low.at_most(filters['difficulty_max'])
+
+        return [self._records[i] for i in self._order if i in candidates]
+
+    def query_body(self, filters: Optional[Dict[str, Any]] = None) -> Tuple[bytes, str]:
+        """(JSON bytes, ETag) of a /games listing for the given filters"""
+        if not filters:
+            return self.list_body, self.list_etag
+        listing = [self._jsonable(r) for r in self.query(filters)]
+        body = _serialize({"games": listing, "total": len(listing)})
+        return body, _etag(body)
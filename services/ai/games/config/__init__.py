@@ -1,2 +1,2 @@
 """Config package init"""
-from .loader import config_loader, GameConfigLoader
+from .loader import config_loader, ConfigLoadError, GameConfigLoader
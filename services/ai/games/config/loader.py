@@ -6,6 +6,10 @@ Includes:
 - Game Triggers
 - Scoring Rules
 - Balancing Policy
+
+Files are re-read when their mtime changes, so edits apply without a restart.
+A file that fails to parse never replaces the last good version: lenient
+loads keep returning it, strict loads raise ConfigLoadError.
 """
 import yaml
 import logging
@@ -16,11 +20,17 @@ import os
 logger = logging.getLogger(__name__)
 
 
+class ConfigLoadError(ValueError):
+    """Config file exists but could not be read or parsed"""
+
+
 class GameConfigLoader:
     """Singleton loader for game configurations"""
     
     _instance = None
     _config_cache: Dict[str, Any] = {}
+    _mtimes: Dict[str, int] = {}
+    _failed: Dict[str, tuple] = {}  # filename -> (mtime, error) of the last failed parse
     
     CONFIG_DIR = Path(__file__).parent
     
@@ -29,36 +39,61 @@ class GameConfigLoader:
             cls._instance = super(GameConfigLoader, cls).__new__(cls)
         return cls._instance
 
-    def load_triggers(self) -> Dict[str, Any]:
+    def load_triggers(self, strict: bool = False) -> Dict[str, Any]:
         """Load game_triggers.yaml"""
-        return self._load_yaml("triggers.yaml")
+        return self._load_yaml("triggers.yaml", strict)
         
-    def load_scoring(self) -> Dict[str, Any]:
+    def load_scoring(self, strict: bool = False) -> Dict[str, Any]:
         """Load scoring_rules.yaml"""
-        return self._load_yaml("scoring_rules.yaml")
+        return self._load_yaml("scoring_rules.yaml", strict)
+    
+    def mtime(self, filename: str) -> Optional[int]:
+        """Current mtime (ns) of a config file, None if missing"""
+        try:
+            return os.stat(self.CONFIG_DIR / filename).st_mtime_ns
+        except OSError:
+            return None
     
-    def _load_yaml(self, filename: str) -> Dict[str, Any]:
-        """Generic YAML loader with caching"""
-        if filename in self._config_cache:
+    def _load_yaml(self, filename: str, strict: bool = False) -> Dict[str, Any]:
+        """
+        Generic YAML loader with caching (reloads when the file changes).
+        
+        On a read/parse failure the last good data is returned (or {} if
+        there is none); with strict=True ConfigLoadError is raised instead.
+        A broken file is parsed once per mtime, not on every call.
+        """
+        mtime = self.mtime(filename)
+        if filename in self._config_cache and self._mtimes.get(filename) == mtime:
             return self._config_cache[filename]
         
         file_path = self.CONFIG_DIR / filename
-        
-        try:
-            if not file_path.exists():
-                logger.warning(f"Config file not found: {file_path}")
-                return {}
-                
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-                
-            self._config_cache[filename] = data
-            logger.info(f"Loaded config: {filename}")
-            return data
-            
-        except Exception as e:
-            logger.error(f"Failed to load config {filename}: {e}")
+        if mtime is None:
+            logger.warning(f"Config file not found: {file_path}")
             return {}
+        
+        failed = self._failed.get(filename)
+        if failed is None or failed[0] != mtime:
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    data = yaml.safe_load(f)
+                if data is None:
+                    data = {}
+                if not isinstance(data, dict):
+                    raise ValueError(f"expected a mapping, got {type(data).__name__}")
+            except Exception as e:
+                logger.error(f"Failed to load config {filename}, keeping the previous version: {e}")
+                failed = self._failed[filename] = (mtime, str(e))
+            else:
+                reloaded = filename in self._config_cache
+                self._config_cache[filename] = data
+                self._mtimes[filename] = mtime
+                self._failed.pop(filename, None)
+                logger.info(f"{'Reloaded' if reloaded else 'Loaded'} config: {filename}")
+                return data
+        
+        if strict:
+            raise ConfigLoadError(f"Invalid {filename}: {failed[1]}")
+        return self._config_cache.get(filename, {})
 
 # Global instance
 config_loader = GameConfigLoader()
@@ -0,0 +1,136 @@
+"""
+Evaluation Cache - reuse evaluations of identical answers to identical rounds
+
+Many rounds are templated (cloze/SRS cards, boss-fight vocab, word-hunt
+text) and a class often submits the same normalized answer, yet each
+submission paid for its own evaluate_answer LLM call. Results are cached
+per mode, keyed by:
+
+    (round fingerprint, normalized answer, EVAL_PROMPT_VERSION, cache variant)
+
+The store is a ContextCache with one field per mode, so entries get the
+mode's TTL, an LRU bound, and concurrent identical submissions share one
+evaluation. Modes opt in under `evaluation_cache` in scoring_rules.yaml
+(re-read when the file changes).
+Results from an LLM fallback are not kept. Feedback personalization
+(BaseGame.personalize_feedback) runs on every returned copy, hits included.
+"""
+import copy
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+import unicodedata
+from typing import Any, Callable, Dict, Optional
+
+from games.evaluation import PolicyLoader
+from utils.context_cache import ContextCache
+
+logger = logging.getLogger(__name__)
+
+EVAL_CACHE_MAX_ENTRIES = int(os.getenv("EVAL_CACHE_MAX_ENTRIES", "20000"))
+
+# Used when scoring_rules.yaml has no evaluation_cache section
+DEFAULT_CACHE_POLICY = {
+    "enabled": False,
+    "ttl_seconds": 86400,
+}
+
+# Per-player / presentation fields that do not change how an answer is scored
+ROUND_VOLATILE_KEYS = frozenset({"user_id", "prompt", "correlation_id"})
+
+_NON_WORD = re.compile(r"[^\w\s]")
+
+
+def normalize_answer(answer: str) -> str:
+    """Case-, punctuation- and whitespace-insensitive form of an answer"""
+    text = unicodedata.normalize("NFKC", answer).casefold()
+    return " ".join(_NON_WORD.sub(" ", text).split())
+
+
+def round_fingerprint(round_data: Dict[str, Any]) -> str:
+    """Hash of the parts of a round that affect evaluation"""
+    stable = {k: v for k, v in round_data.items() if k not in ROUND_VOLATILE_KEYS}
+    payload = json.dumps(stable, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class EvaluationCache:
+    """
+    Per-mode cache of evaluate_answer results.
+
+    Args:
+        rules: scoring_rules.yaml content (default: loaded via config_loader, hot-reloaded)
+        max_entries: LRU bound across all modes
+        clock: Time source (for tests)
+    """
+
+    def __init__(
+        self,
+        rules: Optional[Dict[str, Any]] = None,
+        max_entries: int = EVAL_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._policies = PolicyLoader("evaluation_cache", DEFAULT_CACHE_POLICY, rules)
+        self._store = ContextCache(max_entries=max_entries, clock=clock, default_ttls={})
+
+    def policy(self, game_id: str) -> Dict[str, Any]:
+        """Cache settings for a mode (default section merged with its override)"""
+        policy = self._policies.get(game_id)
+        if policy["enabled"]:
+            self._store.ttls[game_id] = float(policy["ttl_seconds"])
+        return policy
+
+    def key(self, game, round_data: Dict[str, Any], answer: str) -> str:
+        return "|".join((
+            round_fingerprint(round_data),
+            normalize_answer(answer),
+            str(game.EVAL_PROMPT_VERSION),
+            game.eval_cache_variant(round_data),
+        ))
+
+    async def evaluate(self, game, round_data: Dict[str, Any], answer: str) -> Dict[str, Any]:
+        """
+        game.evaluate_answer(round_data, answer), served from cache when the
+        mode opted in and the same answer to the same round was seen.
+        """
+        game_id = game.GAME_ID
+        if not self.policy(game_id)["enabled"] or not normalize_answer(answer):
+            return game.personalize_feedback(await game.evaluate_answer(round_data, answer), round_data)
+
+        key = self.key(game, round_data, answer)
+        evaluated = False
+
+        async def fetch():
+            nonlocal evaluated
+            evaluated = True
+            return await game.evaluate_answer(round_data, answer)
+
+        result = await self._store.get_or_fetch(game_id, key, fetch)
+
+        if result.get("evaluation_path") == "llm_fallback":
+            # Degraded result: let the next submission retry the LLM
+            self._store.discard(game_id, key)
+
+        result = copy.deepcopy(result)
+        if not evaluated:
+            result["cached"] = True
+        return game.personalize_feedback(result, round_data)
+
+    def clear(self) -> None:
+        self._store.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-mode hit rates for /metrics"""
+        stats = self._store.get_stats()
+        return {
+            "modes": stats["fields"],
+            "entries": stats["entries"],
+            "max_entries": stats["max_entries"],
+        }
+
+
+# Global cache
+eval_cache = EvaluationCache()
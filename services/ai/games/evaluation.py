@@ -0,0 +1,210 @@
+"""
+Evaluation Cascade - heuristic first, LLM only when the heuristic is unsure
+
+Every mode has a cheap `_heuristic_evaluate` and an `_llm_evaluate`. The
+cascade runs the heuristic, maps its score to [0, 1] and:
+
+- accepts it when the ratio is at/below `reject_below` (clearly wrong) or
+  at/above `accept_above` (clearly right)
+- otherwise escalates to the LLM (falling back to the heuristic on error)
+
+Empty answers never reach the LLM. Thresholds live in scoring_rules.yaml
+under `evaluation_cascade` (a default plus per-mode overrides); `null`
+disables that side of the band, so a mode whose heuristic is too coarse to
+trust (e.g. word counts) can still escalate every non-trivial answer.
+Edits to the file apply on the next evaluation (PolicyLoader).
+"""
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from games.batch_eval import answer_scope
+
+logger = logging.getLogger(__name__)
+
+# Used when scoring_rules.yaml has no evaluation_cascade section
+DEFAULT_POLICY = {
+    "enabled": True,
+    "reject_below": None,
+    "accept_above": None,
+}
+
+PATH_EMPTY = "empty"
+PATH_HEURISTIC = "heuristic"
+PATH_LLM = "llm"
+PATH_LLM_FALLBACK = "llm_fallback"
+
+
+def merge_policy(rules: Dict[str, Any], section: str, defaults: Dict[str, Any], game_id: str) -> Dict[str, Any]:
+    """A mode's settings from a scoring_rules.yaml section: defaults < `default` < `modes.<game_id>`"""
+    body = rules.get(section) or {}
+    return {
+        **defaults,
+        **(body.get("default") or {}),
+        **((body.get("modes") or {}).get(game_id) or {}),
+    }
+
+
+def load_policy(game_id: str, rules: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Cascade thresholds for a mode (default section merged with its override)"""
+    if rules is None:
+        from games.config import config_loader
+        rules = config_loader.load_scoring() or {}
+    return merge_policy(rules, "evaluation_cascade", DEFAULT_POLICY, game_id)
+
+
+class PolicyLoader:
+    """
+    Per-mode settings of one scoring_rules.yaml section, hot-reloaded.
+
+    The file's mtime is checked on every lookup (one stat); merged
+    policies are memoized until it changes. A broken file keeps the last
+    good rules (GameConfigLoader).
+
+    Args:
+        section: Top-level section, e.g. "evaluation_cascade"
+        defaults: Settings the section does not override
+        rules: Fixed scoring_rules.yaml content (no reloading)
+    """
+
+    def __init__(self, section: str, defaults: Dict[str, Any], rules: Optional[Dict[str, Any]] = None):
+        self.section = section
+        self.defaults = defaults
+        self._static = rules is not None
+        self._rules: Dict[str, Any] = rules or {}
+        self._loaded = self._static
+        self._version: Optional[int] = None
+        self._policies: Dict[str, Dict[str, Any]] = {}
+
+    def _refresh(self) -> None:
+        if self._static:
+            return
+        from games.config import config_loader
+        from games.scoring import SCORING_FILE
+        version = config_loader.mtime(SCORING_FILE)
+        if self._loaded and version == self._version:
+            return
+        self._rules = config_loader.load_scoring() or {}
+        self._policies = {}
+        self._loaded = True
+        self._version = version
+
+    def get(self, game_id: str) -> Dict[str, Any]:
+        self._refresh()
+        policy = self._policies.get(game_id)
+        if policy is None:
+            policy = self._policies[game_id] = merge_policy(self._rules, self.section, self.defaults, game_id)
+        return policy
+
+
+cascade_policies = PolicyLoader("evaluation_cascade", DEFAULT_POLICY)
+
+
+def heuristic_ratio(result: Dict[str, Any]) -> float:
+    """Heuristic score normalized to [0, 1]"""
+    max_score = result.get("max_score") or 0
+    if max_score <= 0:
+        return 0.0
+    return max(0.0, min(1.0, result.get("score", 0) / max_score))
+
+
+def is_decisive(ratio: float, policy: Dict[str, Any]) -> bool:
+    """True if the heuristic result is outside the ambiguous band"""
+    reject_below = policy.get("reject_below")
+    accept_above = policy.get("accept_above")
+    if reject_below is not None and ratio <= reject_below:
+        return True
+    if accept_above is not None and ratio >= accept_above:
+        return True
+    return False
+
+
+class CascadeStats:
+    """Per-mode counters: escalation rate and heuristic/LLM agreement"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._modes: Dict[str, Dict[str, int]] = {}
+
+    def record(self, game_id: str, path: str, agreed: Optional[bool] = None) -> None:
+        with self._lock:
+            counts = self._modes.setdefault(game_id, {
+                "evaluations": 0, "empty": 0, "heuristic": 0,
+                "llm": 0, "llm_fallback": 0, "agreed": 0,
+            })
+            counts["evaluations"] += 1
+            counts[path] += 1
+            if agreed:
+                counts["agreed"] += 1
+
+    @staticmethod
+    def _rates(counts: Dict[str, int]) -> Dict[str, Any]:
+        escalated = counts["llm"] + counts["llm_fallback"]
+        return {
+            **counts,
+            "escalation_rate": round(escalated / counts["evaluations"], 3) if counts["evaluations"] else 0.0,
+            "agreement_rate": round(counts["agreed"] / counts["llm"], 3) if counts["llm"] else None,
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            modes = {game_id: dict(counts) for game_id, counts in self._modes.items()}
+
+        totals = {"evaluations": 0, "empty": 0, "heuristic": 0, "llm": 0, "llm_fallback": 0, "agreed": 0}
+        for counts in modes.values():
+            for field in totals:
+                totals[field] += counts[field]
+
+        return {
+            **self._rates(totals),
+            "modes": {game_id: self._rates(counts) for game_id, counts in modes.items()},
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._modes.clear()
+
+
+cascade_stats = CascadeStats()
+
+
+async def evaluate_cascade(
+    game_id: str,
+    answer: str,
+    heuristic: Callable[[], Dict[str, Any]],
+    llm: Optional[Callable[[], Awaitable[Dict[str, Any]]]],
+    policy: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Run the cascade for one answer.
+
+    Args:
+        game_id: Mode (for metrics)
+        answer: Student answer
+        heuristic: Builds the heuristic result
+        llm: Awaitable LLM evaluation (None: no LLM available)
+        policy: Thresholds from load_policy()
+
+    Returns:
+        The accepted result, with `evaluation_path` set
+    """
+    result = heuristic()
+    if not answer.strip():
+        cascade_stats.record(game_id, PATH_EMPTY)
+        return {**result, "evaluation_path": PATH_EMPTY}
+
+    if llm is None or (policy.get("enabled", True) and is_decisive(heuristic_ratio(result), policy)):
+        cascade_stats.record(game_id, PATH_HEURISTIC)
+        return {**result, "evaluation_path": PATH_HEURISTIC}
+
+    try:
+        # Lets the LLM service batch this with other answers to the same round
+        with answer_scope(answer):
+            llm_result = await llm()
+    except Exception as e:
+        logger.warning(f"LLM evaluation failed for {game_id}: {e}")
+        cascade_stats.record(game_id, PATH_LLM_FALLBACK)
+        return {**result, "evaluation_path": PATH_LLM_FALLBACK}
+
+    cascade_stats.record(game_id, PATH_LLM, agreed=llm_result.get("correct") == result.get("correct"))
+    return {**llm_result, "evaluation_path": PATH_LLM}
@@ -0,0 +1,109 @@
+"""
+Game LLM Service - shared async LLM for game modes
+
+Game modes call `await self.llm_service.predict_json(prompt, schema, temperature)`.
+One instance is shared by every pooled game (see games/pool.py); chat
+models are created lazily per temperature and reused, so no provider
+client is built per round or per evaluation.
+"""
+import json
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from langchain_core.output_parsers import JsonOutputParser
+
+from games.batch_eval import (
+    GAME_EVAL_BATCHING, GAME_EVAL_BATCH_MAX, GAME_EVAL_BATCH_WINDOW_MS, AnswerBatcher, current_answer,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _default_model_factory(temperature: Optional[float]):
+    from llm_factory import llm_factory
+    # Games are high-volume evaluation: cheap tier (Gemini Flash / gpt-4o-mini)
+    return llm_factory.get_cheap_llm(temperature=temperature)
+
+
+class GameLLMService:
+    """
+    Shared LLM service implementing predict_json for game modes.
+    
+    Args:
+        model_factory: temperature -> LangChain chat model (default: llm_factory cheap tier)
+        batching: Batch evaluations of answers to the same round (games/batch_eval.py)
+    """
+
+    def __init__(
+        self,
+        model_factory: Optional[Callable[[Optional[float]], Any]] = None,
+        batching: bool = GAME_EVAL_BATCHING,
+        batch_window_ms: float = GAME_EVAL_BATCH_WINDOW_MS,
+        batch_max: int = GAME_EVAL_BATCH_MAX,
+    ):
+        self._model_factory = model_factory or _default_model_factory
+        self._models: Dict[Optional[float], Any] = {}
+        self._lock = threading.Lock()
+        self._parser = JsonOutputParser()
+        self.batcher = AnswerBatcher(self._predict_json, batch_window_ms, batch_max) if batching else None
+
+    def get_chat_model(self, temperature: Optional[float] = None):
+        """Chat model for a temperature, built once and reused"""
+        model = self._models.get(temperature)
+        if model is None:
+            with self._lock:
+                model = self._models.get(temperature)
+                if model is None:
+                    model = self._model_factory(temperature)
+                    self._models[temperature] = model
+        return model
+
+    async def predict_json(
+        self,
+        prompt: str,
+        schema: Optional[Dict[str, Any]] = None,
+        temperature: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Ask the model for a JSON object.
+        
+        Calls made while evaluating an answer (answer_scope) may be batched
+        with other answers to the same prompt.
+        
+        Raises:
+            ValueError: If the model does not return a JSON object
+                (games catch this and fall back to heuristic scoring)
+        """
+        answer = current_answer()
+        if self.batcher is not None and answer is not None:
+            return await self.batcher.submit(prompt, schema, temperature, answer)
+        return await self._predict_json(prompt, schema, temperature)
+
+    async def _predict_json(
+        self,
+        prompt: str,
+        schema: Optional[Dict[str, Any]] = None,
+        temperature: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        instructions = "\n\nResponda SOMENTE com um objeto JSON válido."
+        if schema:
+            instructions += f"\nJSON Schema:\n{json.dumps(schema, ensure_ascii=False)}"
+
+        message = await self.get_chat_model(temperature).ainvoke(prompt + instructions)
+        result = self._parser.parse(message.content if hasattr(message, "content") else str(message))
+
+        if not isinstance(result, dict):
+            raise ValueError(f"Expected a JSON object from LLM, got {type(result).__name__}")
+        return result
+
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Evaluation batching stats for /metrics"""
+        if self.batcher is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.batcher.get_stats()}
+
+
+# Shared instance (models are created on first use)
+game_llm_service = GameLLMService()
@@ -0,0 +1,172 @@
+"""
+Game Manifest - static index of game modules
+
+Maps each GAME_ID to its module/class plus catalog metadata, extracted by
+parsing games/modes/*.py with `ast` (nothing is imported). The registry
+answers catalog queries from the manifest and imports a mode's module only
+when that game is actually played.
+
+The manifest is written to games/manifest.json at build time:
+    python -m games.manifest
+
+or on first run if missing. Each entry records a hash of its source file,
+so an edited mode is picked up automatically (the manifest is rebuilt).
+"""
+import ast
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+DEFAULT_MODES_DIR = Path(__file__).parent / "modes"
+DEFAULT_MANIFEST_PATH = Path(
+    os.getenv("GAMES_MANIFEST_PATH", str(Path(__file__).parent / "manifest.json"))
+)
+
+# BaseGame defaults for attributes a mode does not override
+METADATA_DEFAULTS = {
+    "GAME_NAME": "Unknown",
+    "DIFFICULTY_RANGE": (1, 5),
+    "DURATION_MIN": 5,
+    "REQUIRES_CONTENT": True,
+    "GAME_INTENT": "solo",
+}
+
+
+def _source_hash(source: bytes) -> str:
+    return hashlib.sha256(source).hexdigest()[:16]
+
+
+def _class_constants(node: ast.ClassDef) -> Dict[str, Any]:
+    """Literal class-level UPPER_CASE assignments"""
+    constants = {}
+    for stmt in node.body:
+        if isinstance(stmt, ast.Assign):
+            targets, value = stmt.targets, stmt.value
+        elif isinstance(stmt, ast.AnnAssign) and stmt.value is not None:
+            targets, value = [stmt.target], stmt.value
+        else:
+            continue
+        for target in targets:
+            if isinstance(target, ast.Name) and target.id.isupper():
+                try:
+                    constants[target.id] = ast.literal_eval(value)
+                except ValueError:
+                    pass  # Not a literal (e.g. NotImplemented)
+    return constants
+
+
+def scan_module(path: Path, package: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Extract manifest entries from one mode file.
+
+    Returns:
+        {game_id: entry} for every class defining a literal GAME_ID
+    """
+    source = path.read_bytes()
+    tree = ast.parse(source, filename=str(path))
+    entries = {}
+
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        constants = _class_constants(node)
+        game_id = constants.get("GAME_ID")
+        if not isinstance(game_id, str):
+            continue
+
+        metadata = {**METADATA_DEFAULTS, **constants}
+        entries[game_id] = {
+            "module": f"{package}.{path.stem}",
+            "class_name": node.name,
+            "source_hash": _source_hash(source),
+            "name": metadata["GAME_NAME"],
+            "duration_min": metadata["DURATION_MIN"],
+            "requires_content": metadata["REQUIRES_CONTENT"],
+            "game_intent": metadata["GAME_INTENT"],
+            "difficulty_range": list(metadata["DIFFICULTY_RANGE"]),
+        }
+    return entries
+
+
+def _mode_files(modes_dir: Path):
+    return sorted(f for f in modes_dir.glob("*.py") if not f.name.startswith("_"))
+
+
+def build_manifest(modes_dir: Path = DEFAULT_MODES_DIR, package: str = "games.modes") -> Dict[str, Any]:
+    """Scan all mode files (skipping _private ones) into a manifest dict"""
+    games: Dict[str, Dict[str, Any]] = {}
+    files: Dict[str, str] = {}
+
+    for path in _mode_files(modes_dir):
+        try:
+            entries = scan_module(path, package)
+        except SyntaxError as e:
+            logger.error(f"Failed to parse game module: {path.name}", extra={"error": str(e)})
+            continue
+        files[path.name] = _source_hash(path.read_bytes())
+        for game_id, entry in entries.items():
+            if game_id in games:
+                logger.warning(f"Duplicate GAME_ID {game_id} in {path.name}; keeping {games[game_id]['module']}")
+                continue
+            games[game_id] = entry
+
+    return {"version": MANIFEST_VERSION, "package": package, "files": files, "games": games}
+
+
+def is_fresh(manifest: Dict[str, Any], modes_dir: Path = DEFAULT_MODES_DIR) -> bool:
+    """True if the manifest matches the current mode sources"""
+    if manifest.get("version") != MANIFEST_VERSION:
+        return False
+    try:
+        current = {p.name: _source_hash(p.read_bytes()) for p in _mode_files(modes_dir)}
+    except OSError:
+        return False
+    return current == manifest.get("files")
+
+
+def write_manifest(manifest: Dict[str, Any], path: Path = DEFAULT_MANIFEST_PATH) -> bool:
+    """Write the manifest; returns False (and logs) if the location is read-only"""
+    try:
+        tmp = Path(f"{path}.tmp")
+        tmp.write_text(json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+        return True
+    except OSError as e:
+        logger.warning(f"Could not write game manifest to {path}: {e}")
+        return False
+
+
+def load_manifest(
+    path: Path = DEFAULT_MANIFEST_PATH,
+    modes_dir: Path = DEFAULT_MODES_DIR,
+    package: str = "games.modes",
+) -> Dict[str, Any]:
+    """
+    Load the manifest, rebuilding (and rewriting) it if missing or stale.
+    """
+    manifest: Optional[Dict[str, Any]] = None
+    try:
+        manifest = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        pass
+
+    if manifest is not None and manifest.get("package") == package and is_fresh(manifest, modes_dir):
+        return manifest
+
+    logger.info(f"Building game manifest from {modes_dir}")
+    manifest = build_manifest(modes_dir, package)
+    write_manifest(manifest, Path(path))
+    return manifest
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    built = build_manifest()
+    if write_manifest(built):
+        print(f"Wrote {len(built['games'])} games to {DEFAULT_MANIFEST_PATH}")
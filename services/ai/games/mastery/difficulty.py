@@ -2,82 +2,262 @@
 Difficulty Adaptation System
 
 Automatically adjusts game difficulty based on user performance.
+
+State per (user, game) lives in Redis, shared by all workers:
+    difficulty:user:{<user_id>}               hash, per mode: <mode>:sum, :n, :pos,
+                                              :level, :since
+    difficulty:user:{<user_id>}:ring:<mode>   last WINDOW results, one byte (0-100) each
+The braces are a hash tag: both keys of a user hash to the same Redis
+Cluster slot, so the script may touch them together.
+A Lua script pushes a result into the ring, keeps the running sum and
+count, and applies the thresholds and cooldown atomically: O(1) per game,
+one round trip. All modes' levels are one HGETALL (get_difficulties).
+Without Redis the same update runs on process-local state.
 """
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 import logging
+import os
 from datetime import datetime, timedelta
 
+from .tracker import get_redis
+
 logger = logging.getLogger(__name__)
 
+DIFFICULTY_WINDOW = int(os.getenv("DIFFICULTY_WINDOW", "10"))
+DIFFICULTY_TTL_SECONDS = 86400 * 90
+
+# KEYS: state hash, ring
+# ARGV: mode, score (0-100), window, cooldown, up %, down %, min, max, default level, ttl
+RECORD_RESULT_LUA = """
+local mode = ARGV[1]
+local score = tonumber(ARGV[2])
+local window = tonumber(ARGV[3])
+local cooldown = tonumber(ARGV[4])
+local up = tonumber(ARGV[5])
+local down = tonumber(ARGV[6])
+local min_level = tonumber(ARGV[7])
+local max_level = tonumber(ARGV[8])
+
+local f = redis.call('HMGET', KEYS[1], mode .. ':sum', mode .. ':n', mode .. ':pos', mode .. ':level', mode .. ':since')
+local sum = tonumber(f[1]) or 0
+local n = tonumber(f[2]) or 0
+local pos = (tonumber(f[3]) or 0) % window
+local level = tonumber(f[4]) or tonumber(ARGV[9])
+local since = tonumber(f[5]) or 0
+
+if n >= window then
+    sum = sum - string.byte(redis.call('GETRANGE', KEYS[2], pos, pos))
+else
+    n = n + 1
+end
+redis.call('SETRANGE', KEYS[2], pos, string.char(score))
+sum = sum + score
+pos = (pos + 1) % window
+
+local new_level = level
+if since < cooldown then
+    since = since + 1
+else
+    if sum > up * n and level < max_level then
+        new_level = level + 1
+    elseif sum < down * n and level > min_level then
+        new_level = level - 1
+    end
+    if new_level ~= level then
+        since = 0
+        sum, n, pos = 0, 0, 0
+    else
+        since = since + 1
+    end
+end
+
+redis.call('HSET', KEYS[1], mode .. ':sum', sum, mode .. ':n', n, mode .. ':pos', pos,
+    mode .. ':level', new_level, mode .. ':since', since)
+redis.call('EXPIRE', KEYS[1], ARGV[10])
+redis.call('EXPIRE', KEYS[2], ARGV[10])
+return {new_level, level, sum, n}
+"""
+
+
+def state_key(user_id: str) -> str:
+    return f"difficulty:user:{{{user_id}}}"
+
+
+def ring_key(user_id: str, game_mode: str) -> str:
+    return f"difficulty:user:{{{user_id}}}:ring:{game_mode}"
+
 
 class DifficultyAdapter:
     """
     Adapts difficulty based on accuracy.
-    
+
     Rules:
     - Accuracy > 80%: Increase difficulty (max 5)
     - Accuracy < 50%: Decrease difficulty (min 1)
     - Cooldown: 3 games between adjustments
+
+    record_result() measures accuracy over the last DIFFICULTY_WINDOW games
+    of the mode at the current level (the window restarts on a level change).
+
+    Args:
+        user_id: User whose difficulty is adapted
+        redis_client: Redis client (default: shared client from REDIS_URL)
     """
-    
+
     SCALE_MIN = 1
     SCALE_MAX = 5
     COOLDOWN_GAMES = 3
-    
-    def __init__(self, user_id: str):
+    ACCURACY_UP = 80    # %
+    ACCURACY_DOWN = 50  # %
+    DEFAULT_DIFFICULTY = 2
+
+    def __init__(self, user_id: str, redis_client=None):
         self.user_id = user_id
+        self.redis = redis_client if redis_client is not None else get_redis()
+        self._script = None
         self._last_adjustment = None
         self._games_since_adjustment = 0
-        
+
+    @classmethod
+    def next_level(cls, total: float, count: int, level: int, since: int) -> Tuple[int, int]:
+        """
+        Thresholds + cooldown: (new level, games since adjustment) after a
+        game, given the window's total (sum of 0-100 results) and size.
+        """
+        if since < cls.COOLDOWN_GAMES:
+            return level, since + 1
+        new_level = level
+        if total > cls.ACCURACY_UP * count and level < cls.SCALE_MAX:
+            new_level = level + 1
+        elif total < cls.ACCURACY_DOWN * count and level > cls.SCALE_MIN:
+            new_level = level - 1
+        return new_level, (0 if new_level != level else since + 1)
+
     def should_adjust(self, accuracy: float, current_difficulty: int) -> Optional[int]:
         """
-        Determine if difficulty should be adjusted.
-        
+        Determine if difficulty should be adjusted (process-local cooldown;
+        record_result() keeps durable, shared state).
+
         Args:
             accuracy: Performance accuracy (0-1)
             current_difficulty: Current difficulty level (1-5)
-            
+
         Returns:
             New difficulty level, or None if no change
         """
-        # Check cooldown
-        if self._games_since_adjustment < self.COOLDOWN_GAMES:
-            self._games_since_adjustment += 1
+        new_difficulty, self._games_since_adjustment = self.next_level(
+            accuracy * 100, 1, current_difficulty, self._games_since_adjustment
+        )
+        if new_difficulty == current_difficulty:
             return None
-        
-        new_difficulty = current_difficulty
-        
-        # High accuracy → increase difficulty
-        if accuracy > 0.80 and current_difficulty < self.SCALE_MAX:
-            new_difficulty = min(current_difficulty + 1, self.SCALE_MAX)
-            logger.info(f"Increasing difficulty: {current_difficulty} → {new_difficulty}")
-            
-        # Low accuracy → decrease difficulty
-        elif accuracy < 0.50 and current_difficulty > self.SCALE_MIN:
-            new_difficulty = max(current_difficulty - 1, self.SCALE_MIN)
-            logger.info(f"Decreasing difficulty: {current_difficulty} → {new_difficulty}")
-        
-        # If changed, reset cooldown
-        if new_difficulty != current_difficulty:
-            self._games_since_adjustment = 0
-            self._last_adjustment = datetime.now()
-            return new_difficulty
-        else:
-            self._games_since_adjustment += 1
+
+        arrow = "Increasing" if new_difficulty > current_difficulty else "Decreasing"
+        logger.info(f"{arrow} difficulty: {current_difficulty} → {new_difficulty}")
+        self._last_adjustment = datetime.now()
+        return new_difficulty
+
+    def record_result(
+        self,
+        game_mode: str,
+        accuracy: float,
+        current_difficulty: Optional[int] = None,
+    ) -> Optional[int]:
+        """
+        Record one game and adapt the mode's difficulty (O(1), atomic).
+
+        Args:
+            game_mode: Game mode ID
+            accuracy: Performance accuracy (0-1)
+            current_difficulty: Level to start from if the mode has no state yet
+
+        Returns:
+            New difficulty level, or None if no change
+        """
+        score = int(round(min(1.0, max(0.0, accuracy)) * 100))
+        default_level = current_difficulty or self.DEFAULT_DIFFICULTY
+        args = [
+            game_mode, score, DIFFICULTY_WINDOW, self.COOLDOWN_GAMES, self.ACCURACY_UP,
+            self.ACCURACY_DOWN, self.SCALE_MIN, self.SCALE_MAX, default_level, DIFFICULTY_TTL_SECONDS,
+        ]
+
+        result = None
+        if self.redis:
+            try:
+                if self._script is None:
+                    # Sent by SHA (EVALSHA), loaded on first use per server
+                    self._script = self.redis.register_script(RECORD_RESULT_LUA)
+                result = self._script(keys=[state_key(self.user_id), ring_key(self.user_id, game_mode)], args=args)
+            except Exception as e:
+                logger.error(f"Failed to record difficulty state in Redis: {e}")
+        if result is None:
+            result = _local_store.record(self.user_id, game_mode, score, default_level)
+
+        new_level, level = int(result[0]), int(result[1])
+        if new_level == level:
             return None
-    
+        logger.info(f"{game_mode} difficulty for {self.user_id}: {level} → {new_level}")
+        return new_level
+
+    def get_difficulties(
+        self,
+        game_modes: Optional[Sequence[str]] = None,
+        mastery_scores: Optional[Dict[str, float]] = None,
+    ) -> Dict[str, int]:
+        """
+        Current difficulty of every mode in one call (one HGETALL).
+
+        Modes without state get the mastery-based recommendation when a
+        mastery score is given, else DEFAULT_DIFFICULTY.
+
+        Args:
+            game_modes: Modes to include (default: every registered game)
+            mastery_scores: {game_mode: mastery (0-100)}
+        """
+        if game_modes is None:
+            from games.registry import game_registry
+            game_modes = [game['id'] for game in game_registry.list_games()]
+
+        levels: Dict[str, int] = {}
+        if self.redis:
+            try:
+                state = self.redis.hgetall(state_key(self.user_id)) or {}
+                levels = {
+                    field[:-len(':level')]: int(value)
+                    for field, value in state.items()
+                    if field.endswith(':level')
+                }
+            except Exception as e:
+                logger.error(f"Failed to get difficulty state from Redis: {e}")
+                levels = _local_store.levels(self.user_id)
+        else:
+            levels = _local_store.levels(self.user_id)
+
+        mastery_scores = mastery_scores or {}
+        return {
+            mode: levels[mode] if mode in levels else (
+                self.get_recommended_difficulty(mode, mastery_scores[mode])
+                if mode in mastery_scores else self.DEFAULT_DIFFICULTY
+            )
+            for mode in game_modes
+        }
+
+    def get_difficulty(self, game_mode: str, mastery_score: Optional[float] = None) -> int:
+        """Current difficulty of one mode"""
+        mastery = {game_mode: mastery_score} if mastery_score is not None else None
+        return self.get_difficulties([game_mode], mastery)[game_mode]
+
     def get_recommended_difficulty(
-        self, 
-        game_mode: str, 
+        self,
+        game_mode: str,
         mastery_score: float
     ) -> int:
         """
         Get recommended starting difficulty based on mastery.
-        
+
         Args:
             game_mode: Game mode ID
             mastery_score: User's mastery score (0-100)
-            
+
         Returns:
             Recommended difficulty (1-5)
         """
@@ -92,3 +272,46 @@ class DifficultyAdapter:
             return 2  # Beginner
         else:
             return 1  # Novice
+
+
+class LocalDifficultyStore:
+    """Process-local twin of RECORD_RESULT_LUA, used when Redis is unavailable"""
+
+    def __init__(self):
+        # user_id -> game_mode -> {'sum', 'n', 'pos', 'level', 'since', 'ring'}
+        self._states: Dict[str, Dict[str, Dict]] = {}
+
+    def record(self, user_id: str, game_mode: str, score: int, default_level: int) -> List[int]:
+        """Same update and return value ([new level, old level, sum, n]) as the script"""
+        window = DIFFICULTY_WINDOW
+        modes = self._states.setdefault(user_id, {})
+        state = modes.get(game_mode)
+        if state is None:
+            state = modes[game_mode] = {
+                'sum': 0, 'n': 0, 'pos': 0, 'level': default_level, 'since': 0, 'ring': bytearray(window),
+            }
+        ring = state['ring']
+        pos = state['pos']
+
+        if state['n'] >= window:
+            state['sum'] -= ring[pos]
+        else:
+            state['n'] += 1
+        ring[pos] = score
+        state['sum'] += score
+        state['pos'] = (pos + 1) % window
+
+        level = state['level']
+        state['level'], state['since'] = DifficultyAdapter.next_level(state['sum'], state['n'], level, state['since'])
+        if state['level'] != level:
+            state['sum'] = state['n'] = state['pos'] = 0
+        return [state['level'], level, state['sum'], state['n']]
+
+    def levels(self, user_id: str) -> Dict[str, int]:
+        return {mode: state['level'] for mode, state in self._states.get(user_id, {}).items()}
+
+    def clear(self) -> None:
+        self._states.clear()
+
+
+_local_store = LocalDifficultyStore()
@@ -0,0 +1,58 @@
+"""
+Forgetting Curve
+
+Mastery is stored as (value, updated_at, stability) and decayed lazily
+when read, so no background job ever touches idle words:
+
+    retention = exp(-elapsed_days / stability)
+    mastery   = floor + (value - floor) * retention,  floor = min(value, 50)
+
+Mastery above the default drifts back towards "unknown" (50) as the word
+is forgotten; weak mastery is not forgotten upwards. Stability (days
+until retention falls to 1/e) grows on successful reviews, more the
+more the word had been forgotten (spacing effect), and shrinks on lapses.
+
+Every function takes scalars or NumPy arrays, so thousands of words are
+scored in one vectorized pass.
+"""
+import os
+
+import numpy as np
+
+DEFAULT_MASTERY = 50.0
+SECONDS_PER_DAY = 86400.0
+
+STABILITY_INITIAL_DAYS = float(os.getenv("MASTERY_STABILITY_DAYS", "2"))
+STABILITY_MIN_DAYS = 0.5
+STABILITY_MAX_DAYS = 365.0
+STABILITY_GROWTH = 2.0  # Growth on a success after full forgetting: S * (1 + 2)
+LAPSE_FACTOR = 0.5
+RECALL_THRESHOLD = 60.0  # Performance (0-100) that counts as a successful recall
+
+
+def retention(updated_at, stability, now: float):
+    """Fraction retained since updated_at (epoch seconds); 1.0 right after an update"""
+    elapsed_days = np.maximum(0.0, (now - np.asarray(updated_at, dtype=np.float64)) / SECONDS_PER_DAY)
+    return np.exp(-elapsed_days / np.maximum(np.asarray(stability, dtype=np.float64), STABILITY_MIN_DAYS))
+
+
+def decayed_mastery(values, updated_at, stability, now: float):
+    """Mastery (0-100) as of `now`"""
+    values = np.asarray(values, dtype=np.float64)
+    floor = np.minimum(values, DEFAULT_MASTERY)
+    return floor + (values - floor) * retention(updated_at, stability, now)
+
+
+def next_stability(stability, retained, performance):
+    """Stability after a review at the given retention with the given performance (0-100)"""
+    stability = np.asarray(stability, dtype=np.float64)
+    grown = stability * (1.0 + STABILITY_GROWTH * (1.0 - np.asarray(retained, dtype=np.float64)))
+    updated = np.where(np.asarray(performance) >= RECALL_THRESHOLD, grown, stability * LAPSE_FACTOR)
+    return np.clip(updated, STABILITY_MIN_DAYS, STABILITY_MAX_DAYS)
+
+
+def due_at(updated_at, stability, min_retention: float):
+    """Epoch seconds at which retention falls to min_retention"""
+    return np.asarray(updated_at, dtype=np.float64) + (
+        np.asarray(stability, dtype=np.float64) * -np.log(min_retention) * SECONDS_PER_DAY
+    )
@@ -0,0 +1,97 @@
+"""
+Mastery Key Migration
+
+Moves the legacy layout - one string key per (user, word) and (user, theme):
+    mastery:user:{user_id}:word:{word}
+    mastery:user:{user_id}:theme:{theme}
+into the per-user hashes MasteryTracker reads (mastery:user:{user_id}:words,
+...:themes). Values become "mastery|now|initial stability"; fields already in
+a hash are kept (HSETNX). Legacy keys are deleted once copied, so the script
+can be re-run safely and stopped at any point.
+
+Usage:
+    python -m games.mastery.migrate --redis-url redis://localhost:6379/0
+"""
+import argparse
+import sys
+import time
+from typing import Dict, List, Optional
+
+from .forgetting import STABILITY_INITIAL_DAYS
+from .tracker import MASTERY_TTL_SECONDS, _encode, themes_key, words_key
+
+KINDS = {
+    "word": words_key,
+    "theme": themes_key,
+}
+
+
+def _parse(key: str, kind: str) -> Optional[tuple]:
+    """(user_id, name) of a legacy key, None if it is not one"""
+    prefix = "mastery:user:"
+    if not key.startswith(prefix):
+        return None
+    user_id, sep, name = key[len(prefix):].partition(f":{kind}:")
+    if not (sep and user_id and name):
+        return None
+    return user_id, name
+
+
+def migrate(client, batch: int = 500, now: Optional[float] = None) -> Dict[str, int]:
+    """
+    Migrate every legacy mastery key (SCAN, one MGET and one pipeline per batch).
+
+    Returns:
+        {"word": migrated, "theme": migrated}
+    """
+    now = time.time() if now is None else now
+    migrated = dict.fromkeys(KINDS, 0)
+    for kind, hash_key in KINDS.items():
+        keys: List[str] = []
+        for key in client.scan_iter(match=f"mastery:user:*:{kind}:*", count=batch):
+            keys.append(key)
+            if len(keys) >= batch:
+                migrated[kind] += _migrate_batch(client, kind, hash_key, keys, now)
+                keys = []
+        if keys:
+            migrated[kind] += _migrate_batch(client, kind, hash_key, keys, now)
+    return migrated
+
+
+def _migrate_batch(client, kind: str, hash_key, keys: List[str], now: float) -> int:
+    count = 0
+    values = client.mget(keys)
+    with client.pipeline(transaction=False) as pipe:
+        for key, value in zip(keys, values):
+            parsed = _parse(key, kind)
+            if parsed is None or value is None:
+                continue
+            try:
+                mastery = float(value)
+            except ValueError:
+                continue
+            user_id, name = parsed
+            target = hash_key(user_id)
+            pipe.hsetnx(target, name, _encode((mastery, now, STABILITY_INITIAL_DAYS)))
+            pipe.expire(target, MASTERY_TTL_SECONDS)
+            pipe.delete(key)
+            count += 1
+        pipe.execute()
+    return count
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Move legacy per-word mastery keys into per-user hashes")
+    parser.add_argument("--redis-url", default="redis://localhost:6379/0")
+    parser.add_argument("--batch", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    import redis
+    client = redis.from_url(args.redis_url, decode_responses=True)
+    migrated = migrate(client, args.batch)
+    print(f"Migrated {migrated['word']} word and {migrated['theme']} theme keys")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,14 +3,50 @@ Mastery Tracking System
 
 Tracks per-word and per-theme mastery scores.
 Persists to Redis for long-term retention.
+
+Layout: one hash per user and kind, field = word/theme,
+value = "mastery|updated_at|stability_days"
+    mastery:user:{user_id}:words
+    mastery:user:{user_id}:themes
+so a game's words are read with one HMGET, written in one MULTI/EXEC
+pipeline, and a user's report is an HSCAN of their own hash (no keyspace SCAN).
+Stored mastery is decayed on read along a forgetting curve (see forgetting.py).
+
+Legacy layout: one string key per word/theme (mastery:user:{user_id}:word:{word},
+...:theme:{theme}). `python -m games.mastery.migrate` moves them into the
+hashes; until then a hash miss reads the legacy key and moves it over
+(MASTERY_LEGACY_FALLBACK, one extra MGET on misses; turn off once migrated).
 """
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 import logging
-import json
+import os
+import time
 from datetime import datetime
 
+import numpy as np
+from redis.exceptions import WatchError
+
+from .forgetting import (
+    DEFAULT_MASTERY,
+    STABILITY_INITIAL_DAYS,
+    decayed_mastery,
+    due_at,
+    next_stability,
+    retention,
+)
+
 logger = logging.getLogger(__name__)
 
+# (mastery, updated_at epoch seconds, stability days)
+State = Tuple[float, float, float]
+
+EMA_ALPHA = 0.3  # Weight of the new performance
+MASTERY_TTL_SECONDS = 86400 * 90  # 90 days since the user's last update
+SCAN_COUNT = 500
+DUE_RETENTION = 0.7  # Words below this retention are due for review
+WATCH_RETRIES = 5
+MASTERY_LEGACY_FALLBACK = os.getenv("MASTERY_LEGACY_FALLBACK", "true").lower() == "true"
+
 # Redis connection (lazy init)
 _redis_client = None
 
@@ -30,113 +66,353 @@ def get_redis():
     return _redis_client
 
 
+def words_key(user_id: str) -> str:
+    return f"mastery:user:{user_id}:words"
+
+
+def themes_key(user_id: str) -> str:
+    return f"mastery:user:{user_id}:themes"
+
+
+def legacy_word_key(user_id: str, word: str) -> str:
+    return f"mastery:user:{user_id}:word:{word}"
+
+
+def legacy_theme_key(user_id: str, theme: str) -> str:
+    return f"mastery:user:{user_id}:theme:{theme}"
+
+
+def _encode(state: State) -> str:
+    mastery, updated_at, stability = state
+    return f"{mastery:.4f}|{updated_at:.0f}|{stability:.4f}"
+
+
+def _decode(value: Optional[str], now: float) -> Optional[State]:
+    """Stored state; a bare mastery number counts as updated now"""
+    if value is None:
+        return None
+    try:
+        parts = value.split('|')
+        if len(parts) == 3:
+            return float(parts[0]), float(parts[1]), float(parts[2])
+        return float(parts[0]), now, STABILITY_INITIAL_DAYS
+    except ValueError:
+        return None
+
+
+def _decay(states: Sequence[State], now: float) -> np.ndarray:
+    """Mastery of many states as of `now`, in one vectorized pass"""
+    if not states:
+        return np.empty(0)
+    values, updated_at, stability = np.array(states, dtype=np.float64).T
+    return decayed_mastery(values, updated_at, stability, now)
+
+
 class MasteryTracker:
     """
     Tracks mastery scores for words and themes.
-    
+
     Mastery Score: 0-100
     - Based on game performance history
     - Exponential moving average
+    - Decays with time since the last update (forgetting curve)
     - Persists to Redis
+
+    Args:
+        user_id: User whose mastery is tracked
+        redis_client: Redis client (default: shared client from REDIS_URL)
+        clock: Epoch-seconds time source (for tests)
     """
-    
-    def __init__(self, user_id: str):
+
+    def __init__(
+        self,
+        user_id: str,
+        redis_client=None,
+        clock: Callable[[], float] = time.time,
+        legacy_fallback: Optional[bool] = None,
+    ):
         self.user_id = user_id
-        self.redis = get_redis()
-        
+        self.redis = redis_client if redis_client is not None else get_redis()
+        self._clock = clock
+        self.legacy_fallback = MASTERY_LEGACY_FALLBACK if legacy_fallback is None else legacy_fallback
+
+    @staticmethod
+    def _performance(score: float, max_score: float) -> float:
+        return (score / max_score) * 100 if max_score > 0 else 0
+
+    @staticmethod
+    def _apply(current: Dict[str, State], words: Sequence[str], performances: Sequence[float], now: float) -> Dict[str, State]:
+        """EMA of each word's decayed mastery over its new performances, in order"""
+        updated = dict(current)
+        for word, performance in zip(words, performances):
+            mastery, updated_at, stability = updated.get(word) or (DEFAULT_MASTERY, now, STABILITY_INITIAL_DAYS)
+            retained = float(retention(updated_at, stability, now))
+            mastery = float(decayed_mastery(mastery, updated_at, stability, now))
+            # Exponential moving average (α = 0.3)
+            # Gives 70% weight to history, 30% to new performance
+            updated[word] = (
+                mastery * (1 - EMA_ALPHA) + performance * EMA_ALPHA,
+                now,
+                float(next_stability(stability, retained, performance)),
+            )
+        return updated
+
     def update_word_mastery(self, word: str, score: float, max_score: float) -> float:
         """
         Update mastery for a word based on recent performance.
-        
+
         Args:
             word: Target word
             score: Score achieved
             max_score: Maximum possible score
-            
+
         Returns:
             Updated mastery score (0-100)
         """
-        # Calculate performance percentage
-        performance = (score / max_score) * 100 if max_score > 0 else 0
-        
-        # Get current mastery
-        current_mastery = self.get_word_mastery(word)
-        
-        # Exponential moving average (α = 0.3)
-        # Gives 70% weight to history, 30% to new performance
-        new_mastery = current_mastery * 0.7 + performance * 0.3
-        
-        # Store in Redis
+        return self.update_many([word], [score], max_score)[word]
+
+    def update_many(
+        self,
+        words: Sequence[str],
+        scores: Sequence[float],
+        max_score: float = 100.0,
+    ) -> Dict[str, float]:
+        """
+        Update mastery for all words of a game at once.
+
+        One HMGET under WATCH, then HSET + EXPIRE in one MULTI/EXEC
+        (retried if another worker updated the user meanwhile), instead of
+        GET/SET/EXPIRE per word. A word listed twice is updated twice, in order.
+
+        Args:
+            words: Target words
+            scores: Score achieved for each word
+            max_score: Maximum possible score
+
+        Returns:
+            {word: updated mastery (0-100)}
+        """
+        if len(words) != len(scores):
+            raise ValueError(f"Got {len(words)} words and {len(scores)} scores")
+        if not words:
+            return {}
+        performances = [self._performance(score, max_score) for score in scores]
+        fields = list(dict.fromkeys(words))
+
         if self.redis:
-            key = f"mastery:user:{self.user_id}:word:{word}"
             try:
-                self.redis.set(key, new_mastery)
-                self.redis.expire(key, 86400 * 90)  # 90 days TTL
+                return self._update_in_redis(fields, words, performances)
             except Exception as e:
                 logger.error(f"Failed to save mastery to Redis: {e}")
-        
-        return new_mastery
-    
+
+        updated = self._apply({}, words, performances, self._clock())
+        return {word: updated[word][0] for word in fields}
+
+    def _legacy_words(self, client, fields: Sequence[str], stored: Sequence[Optional[str]]) -> Dict[str, str]:
+        """Legacy per-word values of the fields the hash misses (one MGET)"""
+        missing = [word for word, value in zip(fields, stored) if value is None]
+        if not (self.legacy_fallback and missing):
+            return {}
+        values = client.mget([legacy_word_key(self.user_id, word) for word in missing])
+        return {word: value for word, value in zip(missing, values) if value is not None}
+
+    def _adopt_legacy(self, key: str, legacy_keys: Sequence[str], values: Dict[str, str], now: float) -> None:
+        """Move legacy values into the hash; HSETNX keeps anything written there meanwhile"""
+        try:
+            with self.redis.pipeline(transaction=False) as pipe:
+                for field, value in values.items():
+                    pipe.hsetnx(key, field, _encode(_decode(value, now)))
+                pipe.expire(key, MASTERY_TTL_SECONDS)
+                pipe.delete(*legacy_keys)
+                pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to migrate legacy mastery keys: {e}")
+
+    def _update_in_redis(self, fields: List[str], words: Sequence[str], performances: Sequence[float]) -> Dict[str, float]:
+        key = words_key(self.user_id)
+        with self.redis.pipeline() as pipe:
+            for _ in range(WATCH_RETRIES):
+                try:
+                    pipe.watch(key)
+                    stored = pipe.hmget(key, fields)
+                    legacy = self._legacy_words(pipe, fields, stored)
+                    stored = [legacy.get(word, value) for word, value in zip(fields, stored)]
+                    now = self._clock()
+                    current = {
+                        word: state
+                        for word, state in zip(fields, (_decode(v, now) for v in stored))
+                        if state is not None
+                    }
+                    updated = self._apply(current, words, performances, now)
+
+                    pipe.multi()
+                    pipe.hset(key, mapping={word: _encode(updated[word]) for word in fields})
+                    pipe.expire(key, MASTERY_TTL_SECONDS)
+                    if legacy:
+                        pipe.delete(*(legacy_word_key(self.user_id, word) for word in legacy))
+                    pipe.execute()
+                    return {word: updated[word][0] for word in fields}
+                except WatchError:
+                    continue
+        raise RuntimeError(f"Mastery of user {self.user_id} kept changing during {WATCH_RETRIES} attempts")
+
     def get_word_mastery(self, word: str) -> float:
         """Get current mastery score for a word (0-100)"""
-        if self.redis:
-            key = f"mastery:user:{self.user_id}:word:{word}"
-            try:
-                mastery = self.redis.get(key)
-                return float(mastery) if mastery else 50.0  # Default: 50
-            except Exception as e:
-                logger.error(f"Failed to get mastery from Redis: {e}")
-        
-        return 50.0  # Default if no Redis
-    
+        return self.get_many([word])[word]
+
+    def get_states(self, words: Sequence[str]) -> Dict[str, State]:
+        """Stored (mastery, updated_at, stability) of the words that have one (one HMGET)"""
+        fields = list(dict.fromkeys(words))
+        if not (self.redis and fields):
+            return {}
+        try:
+            stored = self.redis.hmget(words_key(self.user_id), fields)
+            legacy = self._legacy_words(self.redis, fields, stored)
+        except Exception as e:
+            logger.error(f"Failed to get mastery from Redis: {e}")
+            return {}
+        now = self._clock()
+        if legacy:
+            self._adopt_legacy(
+                words_key(self.user_id), [legacy_word_key(self.user_id, word) for word in legacy], legacy, now
+            )
+            stored = [legacy.get(word, value) for word, value in zip(fields, stored)]
+        return {
+            word: state
+            for word, state in zip(fields, (_decode(v, now) for v in stored))
+            if state is not None
+        }
+
+    def get_many(self, words: Sequence[str]) -> Dict[str, float]:
+        """Current (decayed) mastery of many words (one HMGET, one vectorized decay)"""
+        masteries = dict.fromkeys(words, DEFAULT_MASTERY)
+        states = self.get_states(words)
+        if states:
+            decayed = _decay(list(states.values()), self._clock())
+            masteries.update(zip(states.keys(), decayed.tolist()))
+        return masteries
+
+    def _scan_words(self) -> Tuple[List[str], List[State]]:
+        """Every tracked word of the user (HSCAN of their hash)"""
+        now = self._clock()
+        words, states = [], []
+        for word, value in self.redis.hscan_iter(words_key(self.user_id), count=SCAN_COUNT):
+            state = _decode(value, now)
+            if state is not None:
+                words.append(word)
+                states.append(state)
+        return words, states
+
+    def get_due_words(self, limit: int = 20, min_retention: float = DUE_RETENTION) -> List[Dict]:
+        """
+        Words whose retention has fallen below min_retention, least retained first.
+
+        Returns:
+            [{'word', 'mastery', 'retention', 'stability_days', 'due_at'}]
+        """
+        if not self.redis:
+            return []
+        try:
+            words, states = self._scan_words()
+        except Exception as e:
+            logger.error(f"Failed to scan mastery: {e}")
+            return []
+        if not states:
+            return []
+
+        now = self._clock()
+        values, updated_at, stability = np.array(states, dtype=np.float64).T
+        retained = retention(updated_at, stability, now)
+        due = np.flatnonzero(retained < min_retention)
+        due = due[np.argsort(retained[due], kind='stable')][:limit]
+        mastery = decayed_mastery(values[due], updated_at[due], stability[due], now)
+        due_times = due_at(updated_at[due], stability[due], min_retention)
+        return [
+            {
+                'word': words[i],
+                'mastery': round(float(m), 2),
+                'retention': round(float(retained[i]), 4),
+                'stability_days': round(float(stability[i]), 2),
+                'due_at': datetime.utcfromtimestamp(float(t)).isoformat(),
+            }
+            for i, m, t in zip(due.tolist(), mastery, due_times)
+        ]
+
     def update_theme_mastery(self, theme: str, words: List[str]) -> float:
         """
         Calculate theme mastery as average of word masteries.
-        
+
         Args:
             theme: Theme identifier (e.g., "Python Basics")
             words: List of words in this theme
-            
+
         Returns:
             Theme mastery score (0-100)
         """
         if not words:
-            return 50.0
-            
-        # Average mastery of all words in theme
-        word_masteries = [self.get_word_mastery(w) for w in words]
-        theme_mastery = sum(word_masteries) / len(word_masteries)
-        
-        # Store theme mastery
+            return DEFAULT_MASTERY
+
+        # Average mastery of all words in theme (one HMGET)
+        fields = list(dict.fromkeys(words))
+        states = self.get_states(fields)
+        now = self._clock()
+        decayed = _decay(list(states.values()), now)
+        theme_mastery = (float(decayed.sum()) + DEFAULT_MASTERY * (len(fields) - len(states))) / len(fields)
+
+        # Store theme mastery (decays with the words' average stability)
         if self.redis:
-            key = f"mastery:user:{self.user_id}:theme:{theme}"
+            key = themes_key(self.user_id)
+            stability = float(np.mean([s[2] for s in states.values()])) if states else STABILITY_INITIAL_DAYS
             try:
-                self.redis.set(key, theme_mastery)
-                self.redis.expire(key, 86400 * 90)
+                with self.redis.pipeline(transaction=False) as pipe:
+                    pipe.hset(key, theme, _encode((theme_mastery, now, stability)))
+                    pipe.expire(key, MASTERY_TTL_SECONDS)
+                    pipe.execute()
             except Exception as e:
                 logger.error(f"Failed to save theme mastery: {e}")
-        
+
         return theme_mastery
-    
+
     def get_theme_mastery(self, theme: str) -> float:
         """Get current mastery score for a theme"""
         if self.redis:
-            key = f"mastery:user:{self.user_id}:theme:{theme}"
             try:
-                mastery = self.redis.get(key)
-                return float(mastery) if mastery else 50.0
+                now = self._clock()
+                value = self.redis.hget(themes_key(self.user_id), theme)
+                if value is None and self.legacy_fallback:
+                    legacy_key = legacy_theme_key(self.user_id, theme)
+                    value = self.redis.get(legacy_key)
+                    if value is not None:
+                        self._adopt_legacy(themes_key(self.user_id), [legacy_key], {theme: value}, now)
+                state = _decode(value, now)
+                return float(_decay([state], now)[0]) if state is not None else DEFAULT_MASTERY
             except Exception as e:
                 logger.error(f"Failed to get theme mastery: {e}")
-        
-        return 50.0
-    
+
+        return DEFAULT_MASTERY
+
     def get_mastery_report(self) -> Dict:
-        """Get full mastery report for user"""
-        # This would scan Redis for all user's masteries
-        # For now, return placeholder
-        return {
+        """Get full mastery report for user (HSCAN of the user's own hashes)"""
+        report = {
             'user_id': self.user_id,
             'total_words_tracked': 0,
             'total_themes_tracked': 0,
-            'average_mastery': 50.0
+            'average_mastery': DEFAULT_MASTERY,
+            'words_due': 0
         }
+        if not self.redis:
+            return report
+
+        try:
+            _, states = self._scan_words()
+            report['total_words_tracked'] = len(states)
+            report['total_themes_tracked'] = self.redis.hlen(themes_key(self.user_id))
+            if states:
+                now = self._clock()
+                _, updated_at, stability = np.array(states, dtype=np.float64).T
+                report['average_mastery'] = round(float(_decay(states, now).mean()), 2)
+                report['words_due'] = int((retention(updated_at, stability, now) < DUE_RETENTION).sum())
+        except Exception as e:
+            logger.error(f"Failed to build mastery report: {e}")
+
+        return report
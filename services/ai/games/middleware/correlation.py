@@ -20,9 +20,34 @@ class CorrelationIdMiddleware(GameMiddleware):
     
     def process(self, context: Dict[str, Any], next_handler: Callable) -> Dict[str, Any]:
         """Inject or use existing correlation ID"""
+        correlation_id = self._start(context)
         
-        # Get or generate correlation ID
-        if 'correlation_id' not in context:
+        # Execute next handler
+        try:
+            result = next_handler(context)
+        except Exception as e:
+            self._failed(correlation_id, e)
+            raise
+        
+        self._completed(correlation_id)
+        return result
+    
+    async def process_async(self, context: Dict[str, Any], next_handler: Callable) -> Dict[str, Any]:
+        """Async variant of process()"""
+        correlation_id = self._start(context)
+        
+        try:
+            result = await next_handler(context)
+        except Exception as e:
+            self._failed(correlation_id, e)
+            raise
+        
+        self._completed(correlation_id)
+        return result
+    
+    def _start(self, context: Dict[str, Any]) -> str:
+        # Get or generate correlation ID (callers may pass None)
+        if not context.get('correlation_id'):
             context['correlation_id'] = str(uuid.uuid4())
             generated = True
         else:
@@ -41,29 +66,24 @@ class CorrelationIdMiddleware(GameMiddleware):
                 'generated': generated,
             }
         )
-        
-        # Execute next handler
-        try:
-            result = next_handler(context)
-            
-            logger.info(
-                "Request completed",
-                extra={
-                    'correlation_id': correlation_id,
-                    'success': True,
-                }
-            )
-            
-            return result
-            
-        except Exception as e:
-            logger.error(
-                "Request failed",
-                extra={
-                    'correlation_id': correlation_id,
-                    'error': str(e),
-                    'success': False,
-                },
-                exc_info=True
-            )
-            raise
+        return correlation_id
+    
+    def _completed(self, correlation_id: str):
+        logger.info(
+            "Request completed",
+            extra={
+                'correlation_id': correlation_id,
+                'success': True,
+            }
+        )
+    
+    def _failed(self, correlation_id: str, error: Exception):
+        logger.error(
+            "Request failed",
+            extra={
+                'correlation_id': correlation_id,
+                'error': str(error),
+                'success': False,
+            },
+            exc_info=True
+        )
@@ -16,7 +16,32 @@ class EventEmitterMiddleware(GameMiddleware):
     
     def process(self, context: Dict[str, Any], next_handler: Callable) -> Dict[str, Any]:
         """Emit game events at key points"""
+        correlation_id, game_mode = self._started(context)
         
+        try:
+            # Execute next handler
+            result = next_handler(context)
+        except Exception as e:
+            self._failed(correlation_id, game_mode, e)
+            raise
+        
+        self._completed(correlation_id, game_mode, result)
+        return result
+    
+    async def process_async(self, context: Dict[str, Any], next_handler: Callable) -> Dict[str, Any]:
+        """Async variant of process()"""
+        correlation_id, game_mode = self._started(context)
+        
+        try:
+            result = await next_handler(context)
+        except Exception as e:
+            self._failed(correlation_id, game_mode, e)
+            raise
+        
+        self._completed(correlation_id, game_mode, result)
+        return result
+    
+    def _started(self, context: Dict[str, Any]):
         correlation_id = context.get('correlation_id', 'unknown')
         game_mode = context.get('metadata', {}).get('gameMode', 'unknown')
         
@@ -26,30 +51,25 @@ class EventEmitterMiddleware(GameMiddleware):
             'game_mode': game_mode,
             'timestamp': None,  # Will be set by actual event system
         })
-        
-        try:
-            # Execute next handler
-            result = next_handler(context)
-            
-            # Emit GAME_ROUND_COMPLETED
-            self._emit_event('GAME_ROUND_COMPLETED', {
-                'correlation_id': correlation_id,
-                'game_mode': game_mode,
-                'score': result.get('score'),
-                'success': True,
-            })
-            
-            return result
-            
-        except Exception as e:
-            # Emit GAME_ROUND_FAILED
-            self._emit_event('GAME_ROUND_FAILED', {
-                'correlation_id': correlation_id,
-                'game_mode': game_mode,
-                'error': str(e),
-                'success': False,
-            })
-            raise
+        return correlation_id, game_mode
+    
+    def _completed(self, correlation_id: str, game_mode: str, result: Dict[str, Any]):
+        # Emit GAME_ROUND_COMPLETED
+        self._emit_event('GAME_ROUND_COMPLETED', {
+            'correlation_id': correlation_id,
+            'game_mode': game_mode,
+            'score': result.get('score'),
+            'success': True,
+        })
+    
+    def _failed(self, correlation_id: str, game_mode: str, error: Exception):
+        # Emit GAME_ROUND_FAILED
+        self._emit_event('GAME_ROUND_FAILED', {
+            'correlation_id': correlation_id,
+            'game_mode': game_mode,
+            'error': str(error),
+            'success': False,
+        })
     
     def _emit_event(self, event_type: str, payload: Dict[str, Any]):
         """
@@ -12,65 +12,84 @@ class MetricsMiddleware(GameMiddleware):
     Track game metrics automatically.
     
     Integrates with existing metrics.py system to track:
-    - Response time
+    - Round duration (latency histogram "game.pipeline" on /metrics)
     - Success/failure rate
     """
     
     def process(self, context: Dict[str, Any], next_handler: Callable) -> Dict[str, Any]:
         """Track execution metrics"""
         
-        start_time = time.time()
-        correlation_id = context.get('correlation_id', 'unknown')
-        game_mode = context.get('metadata', {}).get('gameMode', 'unknown')
+        start_time = time.perf_counter()
         
         try:
             # Execute next handler
             result = next_handler(context)
-            
-            # Track successful execution
-            duration_ms = (time.time() - start_time) * 1000
-            
-            logger.info(
-                "Game round completed",
-                extra={
-                    'correlation_id': correlation_id,
-                    'game_mode': game_mode,
-                    'duration_ms': round(duration_ms, 2),
-                    'success': True,
-                }
-            )
-            
-            # Integrate with metrics.py
-            try:
-                from metrics import track_response_time
-                track_response_time(duration_ms)
-            except ImportError:
-                # metrics.py not available
-                pass
-            
-            return result
-            
         except Exception as e:
-            # Track failed execution
-            duration_ms = (time.time() - start_time) * 1000
-            
-            logger.error(
-                "Game round failed",
-                extra={
-                    'correlation_id': correlation_id,
-                    'game_mode': game_mode,
-                    'duration_ms': round(duration_ms, 2),
-                    'error': str(e),
-                    'success': False,
-                },
-                exc_info=True
-            )
-            
-            # Track failure metric
-            try:
-                from metrics import track_memory_job_failure
-                track_memory_job_failure()
-            except ImportError:
-                pass
-            
+            self._track_failure(context, start_time, e)
             raise
+        
+        self._track_success(context, start_time)
+        return result
+    
+    async def process_async(self, context: Dict[str, Any], next_handler: Callable) -> Dict[str, Any]:
+        """Async variant of process() (e.g. LLM-backed evaluations)"""
+        
+        start_time = time.perf_counter()
+        
+        try:
+            result = await next_handler(context)
+        except Exception as e:
+            self._track_failure(context, start_time, e)
+            raise
+        
+        self._track_success(context, start_time)
+        return result
+    
+    def _track_success(self, context: Dict[str, Any], start_time: float):
+        """Track successful execution"""
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        correlation_id = context.get('correlation_id', 'unknown')
+        game_mode = context.get('metadata', {}).get('gameMode', 'unknown')
+        
+        logger.info(
+            "Game round completed",
+            extra={
+                'correlation_id': correlation_id,
+                'game_mode': game_mode,
+                'duration_ms': round(duration_ms, 2),
+                'success': True,
+            }
+        )
+        
+        # Integrate with metrics.py (in-process histogram: no Redis I/O on the event loop)
+        try:
+            from metrics import observe_latency
+            observe_latency("game.pipeline", duration_ms)
+        except ImportError:
+            # metrics.py not available
+            pass
+    
+    def _track_failure(self, context: Dict[str, Any], start_time: float, error: Exception):
+        """Track failed execution"""
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        correlation_id = context.get('correlation_id', 'unknown')
+        game_mode = context.get('metadata', {}).get('gameMode', 'unknown')
+        
+        logger.error(
+            "Game round failed",
+            extra={
+                'correlation_id': correlation_id,
+                'game_mode': game_mode,
+                'duration_ms': round(duration_ms, 2),
+                'error': str(error),
+                'success': False,
+            },
+            exc_info=True
+        )
+        
+        # Game failure counter (in-process: no Redis I/O on the event loop)
+        try:
+            from metrics import track_game_failure
+            track_game_failure(game_mode)
+        except ImportError:
+            pass
@@ -1,8 +1,11 @@
 """
 Middleware pipeline for game processing.
 Modular, composable, traceable.
+
+The middleware chain is compiled once (at construction / add_middleware),
+for both the sync path (process) and the async path (process_async).
 """
-from typing import Callable, Dict, Any, List
+from typing import Awaitable, Callable, Dict, Any, List
 import logging
 
 logger = logging.getLogger(__name__)
@@ -25,6 +28,24 @@ class GameMiddleware:
         raise NotImplementedError(
             f"{self.__class__.__name__} must implement process()"
         )
+    
+    async def process_async(
+        self,
+        context: Dict[str, Any],
+        next_handler: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Async variant of process(): next_handler returns an awaitable.
+        
+        Default: pass through. Middleware that only implements process()
+        is skipped on the async path (a warning is logged when the
+        pipeline is compiled).
+        """
+        return await next_handler(context)
+    
+    @classmethod
+    def supports_async(cls) -> bool:
+        return cls.process_async is not GameMiddleware.process_async
 
 
 class GamePipeline:
@@ -53,11 +74,46 @@ class GamePipeline:
             middlewares: List of middleware instances (order matters!)
         """
         self.middlewares = middlewares
+        self._compile()
         logger.info(
             f"Game pipeline created with {len(middlewares)} middleware(s)",
             extra={'middleware_count': len(middlewares)}
         )
     
+    def _compile(self):
+        """Build the sync and async chains once: chain(context, handler) -> result"""
+        def run_sync(ctx, handler):
+            return handler(ctx)
+        
+        async def run_async(ctx, handler):
+            return await handler(ctx)
+        
+        sync_chain, async_chain = run_sync, run_async
+        for middleware in reversed(self.middlewares):
+            sync_chain = self._link_sync(middleware.process, sync_chain)
+            if middleware.supports_async():
+                async_chain = self._link_async(middleware.process_async, async_chain)
+            else:
+                logger.warning(
+                    f"{middleware.__class__.__name__} has no process_async(); "
+                    f"skipped on the async path"
+                )
+        
+        self._sync_chain = sync_chain
+        self._async_chain = async_chain
+    
+    @staticmethod
+    def _link_sync(process: Callable, next_link: Callable) -> Callable:
+        def link(ctx, handler):
+            return process(ctx, lambda c: next_link(c, handler))
+        return link
+    
+    @staticmethod
+    def _link_async(process_async: Callable, next_link: Callable) -> Callable:
+        async def link(ctx, handler):
+            return await process_async(ctx, lambda c: next_link(c, handler))
+        return link
+    
     def execute(self, context: Dict[str, Any], handler: Callable) -> Dict[str, Any]:
         """
         Execute pipeline with middlewares.
@@ -69,22 +125,7 @@ class GamePipeline:
         Returns:
             Result from handler
         """
-        def build_chain(index: int) -> Callable:
-            """Build nested chain of middleware"""
-            if index >= len(self.middlewares):
-                # End of chain - execute actual handler
-                return handler
-            
-            def next_handler(ctx: Dict[str, Any]) -> Dict[str, Any]:
-                # Get next middleware in chain
-                next_chain = build_chain(index + 1)
-                # Execute current middleware
-                return self.middlewares[index].process(ctx, next_chain)
-            
-            return next_handler
-        
-        # Execute from first middleware
-        return build_chain(0)(context)
+        return self._sync_chain(context, handler)
     
     async def execute_async(self, context: Dict[str, Any], handler: Callable) -> Dict[str, Any]:
         """
@@ -97,13 +138,12 @@ class GamePipeline:
         Returns:
             Result from handler
         """
-        # For MVP, skip middleware for async and call handler directly
-        # TODO: Implement async middleware chain if needed
-        return await handler(context)
+        return await self._async_chain(context, handler)
     
     def add_middleware(self, middleware: GameMiddleware):
         """Add middleware to end of pipeline"""
         self.middlewares.append(middleware)
+        self._compile()
         logger.info(
             f"Added middleware: {middleware.__class__.__name__}",
             extra={'middleware': middleware.__class__.__name__}
@@ -120,16 +120,17 @@ class TemplateGame(BaseGame):
         # TODO: Implement your scoring logic
         # For simple games: heuristic rules
         # For complex games: LLM-based evaluation
+        # Scale and criteria weights: game_specific.<GAME_ID> in scoring_rules.yaml
+        # (self.scorer.scale(llm_score) / self.scorer.heuristic_score({...}))
         
-        score = 0
-        max_score = 10
+        score = self.scorer.heuristic_score({'word_count': len(answer.split()) >= 10})
         feedback = "Feedback here..."
         
         result = {
             'score': score,
-            'max_score': max_score,
+            'max_score': self.scorer.max_score,
             'feedback': feedback,
-            'correct': score >= (max_score * 0.6),  # 60% threshold
+            'correct': self.scorer.passed(score, 0.6),  # 60% threshold
             'breakdown': {
                 # Detailed scoring info
                 'word_count': len(answer.split()),
@@ -40,11 +40,11 @@ Exemplo: "Um neurônio é como uma estação de trem, recebendo sinais de vária
         """Evaluate analogy quality using LLM"""
         concept = round_data['data']['concept']
         
-        try:
-            return await self._llm_evaluate(concept, answer)
-        except Exception as e:
-            logger.warning(f"LLM failed: {e}")
-            return self._heuristic_evaluate(answer)
+        return await self.evaluate_cascade(
+            answer,
+            heuristic=lambda: self._heuristic_evaluate(answer),
+            llm=lambda: self._llm_evaluate(concept, answer),
+        )
     
     async def _llm_evaluate(self, concept: str, analogy: str) -> Dict[str, Any]:
         """LLM evaluation of analogy quality"""
@@ -86,8 +86,8 @@ Retorne JSON com:
         score = result.get("score", 0)
         
         return {
-            'score': int(score * 1.5),  # Scale to 150
-            'max_score': 150,
+            'score': self.scorer.scale(score),
+            'max_score': self.scorer.max_score,
             'feedback': f"🎨 {result.get('feedback', 'Analogia recebida!')}",
             'correct': score >= 60,
             'breakdown': {
@@ -103,18 +103,15 @@ Retorne JSON com:
         is_sufficient = word_count >= 10
         has_comparison = any(w in answer.lower() for w in ["como", "igual", "semelhante", "parecido"])
         
-        score = 0
-        if is_sufficient:
-            score += 75
-        if has_comparison:
-            score += 75
+        score = self.scorer.heuristic_score({'is_sufficient': is_sufficient, 'has_comparison': has_comparison})
+        complete = is_sufficient and has_comparison
             
         return {
             'score': score,
-            'max_score': 150,
-            'feedback': f"🎨 Analogia {'criativa' if score >= 100 else 'registrada'}! " + 
-                       (f"✅ Tem {word_count} palavras e comparação clara." if score >= 100 
+            'max_score': self.scorer.max_score,
+            'feedback': f"🎨 Analogia {'criativa' if complete else 'registrada'}! " + 
+                       (f"✅ Tem {word_count} palavras e comparação clara." if complete 
                         else "💡 Tente expandir e usar 'como' ou 'parecido com'."),
-            'correct': score >= 90,
+            'correct': self.scorer.passed(score, 0.6),
             'breakdown': {'word_count': word_count, 'has_comparison': has_comparison, 'method': 'heuristic'}
         }
@@ -55,11 +55,11 @@ class BossFightGame(BaseGame):
         word = round_data['data']['word']
         definition = round_data['data']['definition']
         
-        try:
-            return await self._llm_evaluate(word, definition, answer)
-        except Exception as e:
-            logger.warning(f"LLM failed: {e}")
-            return self._heuristic_evaluate(word, answer)
+        return await self.evaluate_cascade(
+            answer,
+            heuristic=lambda: self._heuristic_evaluate(word, answer),
+            llm=lambda: self._llm_evaluate(word, definition, answer),
+        )
     
     async def _llm_evaluate(self, word: str, definition: str, sentence: str) -> Dict[str, Any]:
         """LLM evaluates vocabulary usage"""
@@ -104,8 +104,8 @@ JSON:
         damage = result.get("damage_to_boss", 0)
         
         return {
-            'score': int(score * 1.5),  # Scale to 150
-            'max_score': 150,
+            'score': self.scorer.scale(score),
+            'max_score': self.scorer.max_score,
             'feedback': f"⚔️ Dano causado: {damage} HP! {result.get('feedback', '')}",
             'correct': score >= 60,
             'breakdown': {
@@ -121,21 +121,14 @@ JSON:
         word_in_answer = word.lower() in answer.lower()
         is_sentence = len(answer.split()) >= 5
         
-        score = 0
-        damage = 0
-        
-        if word_in_answer:
-            score += 75
-            damage += 25
-        if is_sentence:
-            score += 75
-            damage += 25
+        score = self.scorer.heuristic_score({'word_used': word_in_answer, 'is_sentence': is_sentence})
+        damage = 25 * (word_in_answer + is_sentence)
             
         return {
             'score': score,
-            'max_score': 150,
-            'feedback': f"⚔️ Dano causado: {damage} HP! " + ("✅ Bom uso!" if score >= 105 else "💡 Use a palavra em contexto."),
-            'correct': score >= 90,
+            'max_score': self.scorer.max_score,
+            'feedback': f"⚔️ Dano causado: {damage} HP! " + ("✅ Bom uso!" if self.scorer.passed(score, 0.7) else "💡 Use a palavra em contexto."),
+            'correct': self.scorer.passed(score, 0.6),
             'breakdown': {
                 'damage': damage,
                 'word_used': word_in_answer,
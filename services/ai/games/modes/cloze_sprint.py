@@ -2,6 +2,7 @@
 from typing import List, Dict, Any
 import logging
 from games.base import BaseGame
+from games.round_builder import build_cloze
 
 logger = logging.getLogger(__name__)
 
@@ -18,20 +19,24 @@ class CloseSprintGame(BaseGame):
     def create_round(self, state: Dict[str, Any], difficulty: int) -> Dict[str, Any]:
         difficulty = self.validate_difficulty(difficulty)
         
-        # Mock cloze text - would come from content
-        sentence = "A ___ é o processo pelo qual plantas produzem ___ usando luz solar."
-        blanks = [
-            {"id": 0, "correct": "fotossíntese", "alternatives": ["fotossintese", "fotossintesis"]},
-            {"id": 1, "correct": "alimento", "alternatives": ["glicose", "energia"]},
-        ]
+        # Built locally from the content (no LLM); sample sentence if too short
+        built = build_cloze(state.get('content_slice', ''), state.get('target_words'), difficulty)
+        if built:
+            sentence, blanks = built['sentence'], built['blanks']
+        else:
+            sentence = "A ___ é o processo pelo qual plantas produzem ___ usando luz solar."
+            blanks = [
+                {"id": 0, "correct": "fotossíntese", "alternatives": ["fotossintese", "fotossintesis"]},
+                {"id": 1, "correct": "alimento", "alternatives": ["glicose", "energia"]},
+            ]
         
+        slots = "\n".join(f"{i + 1}. ___ = ?" for i in range(len(blanks)))
         prompt = f"""⚡ **Sprint de Lacunas - Complete Rápido!**
 
 {sentence}
 
 **Complete as lacunas** (você tem 30 segundos):
-1. ___ = ?
-2. ___ = ?"""
+{slots}"""
         
         return {
             'game_mode': self.GAME_ID,
@@ -49,11 +54,11 @@ class CloseSprintGame(BaseGame):
         blanks = round_data['data']['blanks']
         sentence = round_data['data']['sentence']
         
-        try:
-            return await self._llm_evaluate(sentence, blanks, answer)
-        except Exception as e:
-            logger.warning(f"LLM failed: {e}")
-            return self._heuristic_evaluate(blanks, answer)
+        return await self.evaluate_cascade(
+            answer,
+            heuristic=lambda: self._heuristic_evaluate(blanks, answer),
+            llm=lambda: self._llm_evaluate(sentence, blanks, answer),
+        )
     
     async def _llm_evaluate(self, sentence: str, blanks: List[Dict], user_answer: str) -> Dict[str, Any]:
         """LLM evaluates cloze answers with semantic understanding"""
@@ -98,8 +103,8 @@ JSON:
         score = result.get("score", 0)
         
         return {
-            'score': int(score * 1.2),  # Scale to 120
-            'max_score': 120,
+            'score': self.scorer.scale(score),
+            'max_score': self.scorer.max_score,
             'feedback': f"⚡ {result.get('feedback', 'Lacunas avaliadas!')}",
             'correct': score >= 70,
             'breakdown': {
@@ -121,14 +126,14 @@ JSON:
             elif any(alt.lower() in answer_lower for alt in blank.get('alternatives', [])):
                 correct_count += 0.8  # Partial credit for alternatives
                 
-        score = int((correct_count / len(blanks)) * 120)
+        score = self.scorer.scale(correct_count / len(blanks) * 100)
         
         return {
             'score': score,
-            'max_score': 120,
+            'max_score': self.scorer.max_score,
             'feedback': f"⚡ Você acertou {int(correct_count)}/{len(blanks)} lacunas! " +
-                       ("✅ Rápido e preciso!" if score >= 84 else "💡 Continue praticando!"),
-            'correct': score >= 84,
+                       ("✅ Rápido e preciso!" if self.scorer.passed(score, 0.7) else "💡 Continue praticando!"),
+            'correct': self.scorer.passed(score, 0.7),
             'breakdown': {
                 'correct_count': correct_count,
                 'total_blanks': len(blanks),
@@ -2,6 +2,7 @@ from typing import List, Dict, Any
 import logging
 import random
 from games.base import BaseGame
+from games.round_builder import related_terms
 
 logger = logging.getLogger(__name__)
 
@@ -31,8 +32,10 @@ class ConceptLinkingGame(BaseGame):
         target = target_words[0] if isinstance(target_words[0], dict) else {"text": target_words[0]}
         word = target.get("text", target_words[0])
         
-        # Generate forbidden words (mock for now)
-        forbidden = self._mock_llm_generation(word)["forbidden"]
+        # Forbidden words: terms that co-occur with the word in the content
+        forbidden = related_terms(state.get('content_slice', ''), word)
+        if len(forbidden) < 3:
+            forbidden = self._mock_llm_generation(word)["forbidden"]
         
         prompt = f"""📝 **Taboo de Conceitos**
 
@@ -63,18 +66,18 @@ Sua descrição deve fazer alguém entender o que é **{word}** sem mencionar as
         if violations:
             return {
                 'score': 0,
-                'max_score': 100,
+                'max_score': self.scorer.max_score,
                 'feedback': f"❌ Você usou uma palavra proibida: **{violations[0].upper()}**. Tente novamente sem usar {', '.join(forbidden)}!",
                 'correct': False,
                 'breakdown': {'violations': violations, 'method': 'rule_check'}
             }
         
         # No violations - evaluate quality with LLM
-        try:
-            return await self._llm_evaluate(target, answer, forbidden)
-        except Exception as e:
-            logger.warning(f"LLM failed: {e}")
-            return self._heuristic_evaluate(target, answer)
+        return await self.evaluate_cascade(
+            answer,
+            heuristic=lambda: self._heuristic_evaluate(target, answer),
+            llm=lambda: self._llm_evaluate(target, answer, forbidden),
+        )
     
     async def _llm_evaluate(self, target: str, description: str, forbidden: List[str]) -> Dict[str, Any]:
         """LLM evaluates description quality"""
@@ -114,8 +117,8 @@ JSON com:
         score = result.get("score", 0)
         
         return {
-            'score': int(score),
-            'max_score': 100,
+            'score': self.scorer.scale(score),
+            'max_score': self.scorer.max_score,
             'feedback': f"✅ {result.get('feedback', 'Descrição válida!')}",
             'correct': score >= 70,
             'breakdown': {
@@ -130,16 +133,16 @@ JSON com:
         
         if is_good:
             return {
-                'score': 100,
-                'max_score': 100,
+                'score': self.scorer.scale(100),
+                'max_score': self.scorer.max_score,
                 'feedback': f"✅ Excelente! Você descreveu '{target}' perfeitamente sem usar as palavras proibidas.",
                 'correct': True,
                 'breakdown': {'word_count': len(answer.split()), 'method': 'heuristic'}
             }
         else:
             return {
-                'score': 50,
-                'max_score': 100,
+                'score': self.scorer.scale(50),
+                'max_score': self.scorer.max_score,
                 'feedback': "⚠️ Muito breve. Tente ser mais descritivo (pelo menos 5 palavras).",
                 'correct': False,
                 'breakdown': {'word_count': len(answer.split()), 'method': 'heuristic'}
@@ -44,11 +44,11 @@ class DebateMasterGame(BaseGame):
         counterargument = round_data['data']['counterargument']
         
         # Try LLM evaluation first
-        try:
-            return await self._llm_evaluate(thesis, counterargument, answer)
-        except Exception as e:
-            logger.warning(f"LLM evaluation failed, using fallback: {e}")
-            return self._heuristic_evaluate(answer)
+        return await self.evaluate_cascade(
+            answer,
+            heuristic=lambda: self._heuristic_evaluate(answer),
+            llm=lambda: self._llm_evaluate(thesis, counterargument, answer),
+        )
     
     async def _llm_evaluate(self, thesis: str, counterargument: str, argument: str) -> Dict[str, Any]:
         """Use LLM to evaluate debate argument"""
@@ -97,8 +97,8 @@ Retorne JSON com:
         feedback = result.get("feedback", "Argumento recebido.")
         
         return {
-            'score': int(score * 1.5),  # Scale to 150 max
-            'max_score': 150,
+            'score': self.scorer.scale(score),
+            'max_score': self.scorer.max_score,
             'feedback': f"🎭 {feedback}",
             'correct': score >= 70,
             'breakdown': {
@@ -113,26 +113,24 @@ Retorne JSON com:
         has_substance = len(answer.split()) > 20
         addresses_counter = any(kw in answer.lower() for kw in ["porém", "no entanto", "mas", "evidência"])
         
-        score = 0
+        score = self.scorer.heuristic_score({'substance': has_substance, 'refutation': addresses_counter})
         feedback_parts = []
         
         if has_substance:
-            score += 75
             feedback_parts.append("✅ Argumento substancial")
         else:
             feedback_parts.append("⚠️ Muito breve - adicione mais evidências")
             
         if addresses_counter:
-            score += 75
             feedback_parts.append("✅ Refutou o contra-argumento")
         else:
             feedback_parts.append("💡 Tente refutar o ponto da IA diretamente")
         
-        is_correct = score >= 100
+        is_correct = has_substance and addresses_counter
         
         return {
             'score': score,
-            'max_score': 150,
+            'max_score': self.scorer.max_score,
             'feedback': ("🏆 **Defesa Forte!**\n" if is_correct else "🤔 **Precisa Fortalecer**\n") + "\n".join(feedback_parts),
             'correct': is_correct,
             'breakdown': {'substance': has_substance, 'refutation': addresses_counter, 'method': 'heuristic'}
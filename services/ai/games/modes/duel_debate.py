@@ -23,11 +23,14 @@ class DuelDebateGame(BaseGame):
     REQUIRES_CONTENT = True
     GAME_INTENT = "group_sync" # Multiplayer
     
-    def __init__(self):
-        super().__init__()
-        self.llm_factory = LLMFactory()
+    def __init__(self, llm_service=None):
+        super().__init__(llm_service)
         # Use TIER_CHEAP (Gemini Flash) for evaluation
-        self.llm = self.llm_factory.get_cheap_llm(temperature=0.3) 
+        if llm_service is not None and hasattr(llm_service, 'get_chat_model'):
+            # Reuse the shared service's chat model (games/pool.py)
+            self.llm = llm_service.get_chat_model(temperature=0.3)
+        else:
+            self.llm = LLMFactory().get_cheap_llm(temperature=0.3)
         
     def create_round(self, state: Dict[str, Any], difficulty: int) -> Dict[str, Any]:
         """
@@ -141,7 +144,7 @@ class DuelDebateGame(BaseGame):
             
             return {
                 "score": max(result['score_a'], result['score_b']), # Return max score as round score
-                "max_score": 100,
+                "max_score": self.scorer.max_score,
                 "feedback": feedback_text,
                 "correct": True, # Debate is always "valid" completion
                 "breakdown": result
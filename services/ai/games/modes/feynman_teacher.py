@@ -39,11 +39,11 @@ Eu sou um estudante confuso. Acabei de ouvir sobre **{concept}**, mas não enten
         concept = round_data['data']['concept']
         
         # Try LLM evaluation first
-        try:
-            return await self._llm_evaluate(concept, answer)
-        except Exception as e:
-            logger.warning(f"LLM evaluation failed, using fallback: {e}")
-            return self._heuristic_evaluate(round_data, answer)
+        return await self.evaluate_cascade(
+            answer,
+            heuristic=lambda: self._heuristic_evaluate(round_data, answer),
+            llm=lambda: self._llm_evaluate(concept, answer),
+        )
     
     async def _llm_evaluate(self, concept: str, explanation: str) -> Dict[str, Any]:
         """Use LLM to evaluate explanation quality"""
@@ -86,8 +86,8 @@ Retorne JSON com:
         feedback = result.get("feedback", "Boa tentativa!")
         
         return {
-            'score': int(score * 2),  # Scale to 200 max
-            'max_score': 200,
+            'score': self.scorer.scale(score),
+            'max_score': self.scorer.max_score,
             'feedback': f"💡 {feedback}",
             'correct': score >= 70,
             'breakdown': {
@@ -105,8 +105,8 @@ Retorne JSON com:
         
         if coverage >= 0.6:
             return {
-                'score': 200,
-                'max_score': 200,
+                'score': self.scorer.scale(100),
+                'max_score': self.scorer.max_score,
                 'feedback': f"💡 Ah, agora entendi! Você mencionou {', '.join(found_facts)} e tudo fez sentido. Obrigado, professor!",
                 'correct': True,
                 'breakdown': {'facts_covered': found_facts, 'coverage': coverage, 'method': 'heuristic'}
@@ -114,8 +114,8 @@ Retorne JSON com:
         else:
             missing = [f for f in facts if f not in found_facts]
             return {
-                'score': 50,
-                'max_score': 200,
+                'score': self.scorer.scale(25),
+                'max_score': self.scorer.max_score,
                 'feedback': f"🤔 Ainda estou confuso sobre: **{missing[0]}**. Pode explicar essa parte?",
                 'correct': False,
                 'breakdown': {'facts_covered': found_facts, 'missing': missing, 'method': 'heuristic'}
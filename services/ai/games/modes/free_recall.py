@@ -53,11 +53,11 @@ Dica: Foque nos pontos principais e conceitos-chave."""
         reference = round_data['data']['reference_content']
         topic = round_data['data']['topic']
         
-        try:
-            return await self._llm_evaluate(topic, reference, answer)
-        except Exception as e:
-            logger.warning(f"LLM failed: {e}")
-            return self._heuristic_evaluate(round_data, answer)
+        return await self.evaluate_cascade(
+            answer,
+            heuristic=lambda: self._heuristic_evaluate(round_data, answer),
+            llm=lambda: self._llm_evaluate(topic, reference, answer),
+        )
     
     async def _llm_evaluate(self, topic: str, reference: str, recall: str) -> Dict[str, Any]:
         """LLM evaluates recall accuracy and completeness"""
@@ -101,8 +101,8 @@ JSON:
         score = result.get("score", 0)
         
         return {
-            'score': int(score * 2),  # Scale to 200
-            'max_score': 200,
+            'score': self.scorer.scale(score),
+            'max_score': self.scorer.max_score,
             'feedback': f"📝 {result.get('feedback', 'Resumo avaliado!')}",
             'correct': score >= 70,
             'breakdown': {
@@ -124,16 +124,14 @@ JSON:
         
         word_count = len(answer.split())
         
-        # Score: 60% coverage + 40% length
-        coverage_score = coverage * 120
-        length_score = min(80, word_count * 4)  # Cap at 80 for 20+ words
-        score = int(coverage_score + length_score)
+        # Weighted coverage + length (full at 20+ words), see scoring_rules.yaml
+        score = self.scorer.heuristic_score({'coverage': coverage, 'length': min(1.0, word_count / 20)})
         
         return {
             'score': score,
-            'max_score': 200,
+            'max_score': self.scorer.max_score,
             'feedback': f"📝 Você mencionou {len(points_found)}/{len(key_points)} pontos-chave. Palavras: {word_count}.",
-            'correct': score >= 140,
+            'correct': self.scorer.passed(score, 0.7),
             'breakdown': {
                 'coverage': coverage,
                 'points_found': points_found,
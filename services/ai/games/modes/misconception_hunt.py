@@ -51,11 +51,11 @@ Qual destas afirmações contém um ERRO ou EQUÍVOCO?
         """Evaluate error identification + explanation with LLM"""
         correct_misc = round_data['data']['correct_misconception']
         
-        try:
-            return await self._llm_evaluate(correct_misc, answer)
-        except Exception as e:
-            logger.warning(f"LLM failed: {e}")
-            return self._heuristic_evaluate(correct_misc, answer)
+        return await self.evaluate_cascade(
+            answer,
+            heuristic=lambda: self._heuristic_evaluate(correct_misc, answer),
+            llm=lambda: self._llm_evaluate(correct_misc, answer),
+        )
     
     async def _llm_evaluate(self, misconception: Dict, answer: str) -> Dict[str, Any]:
         """LLM evaluates identification + explanation"""
@@ -97,8 +97,8 @@ JSON:
         score = result.get("score", 0)
         
         return {
-            'score': int(score * 1.3),  # Scale to 130
-            'max_score': 130,
+            'score': self.scorer.scale(score),
+            'max_score': self.scorer.max_score,
             'feedback': f"🔍 {result.get('feedback', 'Avaliado!')}",
             'correct': score >= 70,
             'breakdown': {
@@ -118,17 +118,13 @@ JSON:
         identified = any(word in answer_lower for word in misc_text.split()[:3])
         has_explanation = len(answer.split()) > 10
         
-        score = 0
-        if identified:
-            score += 65
-        if has_explanation:
-            score += 65
+        score = self.scorer.heuristic_score({'identified': identified, 'explained': has_explanation})
             
         return {
             'score': score,
-            'max_score': 130,
+            'max_score': self.scorer.max_score,
             'feedback': f"🔍 " + ("✅ Erro identificado!" if identified else "❌ Erro não identificado.") + 
                        (" Boa explicação!" if has_explanation else " 💡 Explique melhor."),
-            'correct': score >= 91,
+            'correct': self.scorer.passed(score, 0.7),
             'breakdown': {'identified': identified, 'explained': has_explanation, 'method': 'heuristic'}
         }
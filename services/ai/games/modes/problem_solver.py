@@ -64,18 +64,18 @@ Opções:
         if not is_correct:
             return {
                 'score': 0,
-                'max_score': 100,
+                'max_score': self.scorer.max_score,
                 'feedback': f"❌ Incorreto. A resposta correta era: **{correct}**",
                 'correct': False,
                 'breakdown': {'chosen': choice, 'correct': correct}
             }
         
         # Correct answer - evaluate reasoning with LLM
-        try:
-            return await self._llm_evaluate_reasoning(question, answer, correct)
-        except Exception as e:
-            logger.warning(f"LLM failed: {e}")
-            return self._heuristic_evaluate(choice, correct, answer)
+        return await self.evaluate_cascade(
+            answer,
+            heuristic=lambda: self._heuristic_evaluate(choice, correct, answer),
+            llm=lambda: self._llm_evaluate_reasoning(question, answer, correct),
+        )
     
     async def _llm_evaluate_reasoning(self, question: str, answer: str, correct: str) -> Dict[str, Any]:
         """LLM evaluates quality of reasoning"""
@@ -114,8 +114,8 @@ JSON:
         score = result.get("score", 70)  # Default 70 for correct answer
         
         return {
-            'score': int(score),
-            'max_score': 100,
+            'score': self.scorer.scale(score),
+            'max_score': self.scorer.max_score,
             'feedback': f"✅ Correto! {result.get('feedback', '')}",
             'correct': True,
             'breakdown': {
@@ -128,13 +128,12 @@ JSON:
         """Fallback: Give points for correct + explanation length"""
         has_explanation = len(answer.split()) > 5
         
-        score = 70  # Base for correct
-        if has_explanation:
-            score += 30  # Bonus for explaining
+        # Correct choice, plus credit for explaining
+        score = self.scorer.heuristic_score({'correct': True, 'has_explanation': has_explanation})
             
         return {
             'score': score,
-            'max_score': 100,
+            'max_score': self.scorer.max_score,
             'feedback': f"✅ Correto! " + ("Boa explicação!" if has_explanation else "💡 Adicione explicação para mais pontos."),
             'correct': True,
             'breakdown': {'has_explanation': has_explanation, 'method': 'heuristic'}
@@ -53,11 +53,11 @@ class RecommendationGame(BaseGame):
         profile = round_data['data']['profile']
         games = round_data['data']['games']
         
-        try:
-            return await self._llm_evaluate(profile, games, answer)
-        except Exception as e:
-            logger.warning(f"LLM failed: {e}")
-            return self._heuristic_evaluate(round_data, answer)
+        return await self.evaluate_cascade(
+            answer,
+            heuristic=lambda: self._heuristic_evaluate(round_data, answer),
+            llm=lambda: self._llm_evaluate(profile, games, answer),
+        )
     
     async def _llm_evaluate(self, profile: str, games: List[str], recommendation: str) -> Dict[str, Any]:
         """LLM evaluates recommendation quality"""
@@ -99,8 +99,8 @@ JSON:
         score = result.get("score", 0)
         
         return {
-            'score': int(score),
-            'max_score': 100,
+            'score': self.scorer.scale(score),
+            'max_score': self.scorer.max_score,
             'feedback': f"💡 {result.get('feedback', 'Recomendação avaliada!')}",
             'correct': score >= 70,
             'breakdown': {
@@ -118,17 +118,13 @@ JSON:
         matches_best = recommended.lower() in choice
         has_justification = len(answer.split()) > 10
         
-        score = 0
-        if matches_best:
-            score += 50
-        if has_justification:
-            score += 50
+        score = self.scorer.heuristic_score({'matches_best': matches_best, 'justified': has_justification})
             
         return {
             'score': score,
-            'max_score': 100,
+            'max_score': self.scorer.max_score,
             'feedback': f"💡 " + ("✅ Boa escolha!" if matches_best else "💡 Considere o perfil do usuário.") + 
                        (" Justificativa clara!" if has_justification else ""),
-            'correct': score >= 70,
+            'correct': self.scorer.passed(score, 0.7),
             'breakdown': {'matches_best': matches_best, 'justified': has_justification, 'method': 'heuristic'}
         }
@@ -22,11 +22,14 @@ class RoleplayGame(BaseGame):
     REQUIRES_CONTENT = True
     GAME_INTENT = "duo"
     
-    def __init__(self):
-        super().__init__()
-        self.llm_factory = LLMFactory()
+    def __init__(self, llm_service=None):
+        super().__init__(llm_service)
         # Use TIER_CHEAP (Gemini Flash) for this high-volume conversational game
-        self.llm = self.llm_factory.get_cheap_llm(temperature=0.7) 
+        if llm_service is not None and hasattr(llm_service, 'get_chat_model'):
+            # Reuse the shared service's chat model (games/pool.py)
+            self.llm = llm_service.get_chat_model(temperature=0.7)
+        else:
+            self.llm = LLMFactory().get_cheap_llm(temperature=0.7)
         
     def create_round(self, state: Dict[str, Any], difficulty: int) -> Dict[str, Any]:
         """
@@ -131,8 +134,8 @@ class RoleplayGame(BaseGame):
                 response_text += "\n\n🏁 **Fim do Roleplay**"
             
             return {
-                "score": result.get('score', 0),
-                "max_score": 100,
+                "score": self.scorer.scale(result.get('score', 0)),
+                "max_score": self.scorer.max_score,
                 "feedback": response_text,
                 "correct": result.get('score', 0) > 70,
                 "breakdown": {
@@ -45,11 +45,11 @@ class SituationSimGame(BaseGame):
         situation = round_data['data']['situation']
         stage = round_data['data']['stage']
         
-        try:
-            return await self._llm_evaluate(situation, stage, answer)
-        except Exception as e:
-            logger.warning(f"LLM failed: {e}")
-            return self._heuristic_evaluate(round_data, answer)
+        return await self.evaluate_cascade(
+            answer,
+            heuristic=lambda: self._heuristic_evaluate(round_data, answer),
+            llm=lambda: self._llm_evaluate(situation, stage, answer),
+        )
     
     async def _llm_evaluate(self, situation: str, stage: int, decision: str) -> Dict[str, Any]:
         """LLM evaluates decision quality"""
@@ -92,8 +92,8 @@ JSON:
         score = result.get("score", 0)
         
         return {
-            'score': int(score * 1.5),  # Scale to 150
-            'max_score': 150,
+            'score': self.scorer.scale(score),
+            'max_score': self.scorer.max_score,
             'feedback': f"🎮 {result.get('feedback', 'Decisão avaliada!')}",
             'correct': score >= 70,
             'breakdown': {
@@ -112,16 +112,12 @@ JSON:
         matches_pattern = pattern.lower() in answer.lower()
         has_detail = len(answer.split()) >= 15
         
-        score = 0
-        if matches_pattern:
-            score += 75
-        if has_detail:
-            score += 75
+        score = self.scorer.heuristic_score({'matches_pattern': matches_pattern, 'detailed': has_detail})
             
         return {
             'score': score,
-            'max_score': 150,
-            'feedback': f"🎮 Etapa {stage}/{total}: " + ("✅ Boa decisão!" if score >= 100 else "💡 Considere mais detalhes."),
-            'correct': score >= 105,
+            'max_score': self.scorer.max_score,
+            'feedback': f"🎮 Etapa {stage}/{total}: " + ("✅ Boa decisão!" if matches_pattern and has_detail else "💡 Considere mais detalhes."),
+            'correct': self.scorer.passed(score, 0.7),
             'breakdown': {'matches_pattern': matches_pattern, 'detailed': has_detail, 'method': 'heuristic'}
         }
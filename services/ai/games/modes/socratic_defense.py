@@ -45,11 +45,11 @@ Responda com profundidade, incluindo evidências e considerando múltiplas persp
         question = round_data['data']['probing_question']
         
         # Try LLM evaluation first
-        try:
-            return await self._llm_evaluate(claim, question, answer)
-        except Exception as e:
-            logger.warning(f"LLM evaluation failed, using fallback: {e}")
-            return self._heuristic_evaluate(round_data, answer)
+        return await self.evaluate_cascade(
+            answer,
+            heuristic=lambda: self._heuristic_evaluate(round_data, answer),
+            llm=lambda: self._llm_evaluate(claim, question, answer),
+        )
     
     async def _llm_evaluate(self, claim: str, question: str, answer: str) -> Dict[str, Any]:
         """Use LLM to evaluate depth of thinking"""
@@ -99,8 +99,8 @@ Retorne JSON com:
         depth = result.get("depth_level", "moderado")
         
         return {
-            'score': int(score * 1.8),  # Scale to 180 max
-            'max_score': 180,
+            'score': self.scorer.scale(score),
+            'max_score': self.scorer.max_score,
             'feedback': f"🤔 {feedback}",
             'correct': score >= 70,
             'breakdown': {
@@ -116,21 +116,14 @@ Retorne JSON com:
         word_count = len(answer.split())
         has_nuance = any(w in answer.lower() for w in ["depende", "porém", "embora", "contexto", "às vezes"])
         
-        score = 0
-        if word_count >= 30:
-            score += 90
-        elif word_count >= 15:
-            score += 60
-        else:
-            score += 30
-            
-        if has_nuance:
-            score += 90
+        # Full length credit at 30+ words, 2/3 at 15+, 1/3 below
+        length = 1.0 if word_count >= 30 else 2 / 3 if word_count >= 15 else 1 / 3
+        score = self.scorer.heuristic_score({'length': length, 'has_nuance': has_nuance})
         
         return {
             'score': score,
-            'max_score': 180,
+            'max_score': self.scorer.max_score,
             'feedback': f"🤔 Resposta com {word_count} palavras. " + ("✅ Mostra nuance!" if has_nuance else "💡 Adicione mais nuance e múltiplas perspectivas."),
-            'correct': score >= 120,
+            'correct': self.scorer.passed(score, 2 / 3),
             'breakdown': {'word_count': word_count, 'has_nuance': has_nuance, 'method': 'heuristic'}
         }
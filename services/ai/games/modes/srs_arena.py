@@ -2,6 +2,7 @@
 from typing import List, Dict, Any
 import logging
 from games.base import BaseGame
+from games.round_builder import build_flashcards
 
 logger = logging.getLogger(__name__)
 
@@ -18,8 +19,8 @@ class SrsArenaGame(BaseGame):
     def create_round(self, state: Dict[str, Any], difficulty: int) -> Dict[str, Any]:
         difficulty = self.validate_difficulty(difficulty)
         
-        # Mock flashcards - would come from content
-        cards = [
+        # Built locally from the content (no LLM); sample cards if too short
+        cards = build_flashcards(state.get('content_slice', ''), state.get('target_words')) or [
             {"front": "O que é mitocôndria?", "back": "Organela produtora de energia (ATP)"},
             {"front": "Qual a função do DNA?", "back": "Armazenar informação genética"},
         ]
@@ -40,6 +41,7 @@ Digite sua resposta de memória:"""
             'data': {
                 'question': card['front'],
                 'correct_answer': card['back'],
+                'alternatives': card.get('alternatives', []),
                 'card_index': card_index,
                 'total_cards': len(cards)
             }
@@ -49,12 +51,13 @@ Digite sua resposta de memória:"""
         """Evaluate recall accuracy with LLM"""
         question = round_data['data']['question']
         correct = round_data['data']['correct_answer']
+        alternatives = round_data['data'].get('alternatives', [])
         
-        try:
-            return await self._llm_evaluate(question, correct, answer)
-        except Exception as e:
-            logger.warning(f"LLM failed: {e}")
-            return self._heuristic_evaluate(correct, answer)
+        return await self.evaluate_cascade(
+            answer,
+            heuristic=lambda: self._heuristic_evaluate(correct, answer, alternatives),
+            llm=lambda: self._llm_evaluate(question, correct, answer),
+        )
     
     async def _llm_evaluate(self, question: str, correct_answer: str, user_answer: str) -> Dict[str, Any]:
         """LLM evaluates recall accuracy"""
@@ -98,8 +101,8 @@ JSON:
         score = result.get("score", 0)
         
         return {
-            'score': int(score),
-            'max_score': 100,
+            'score': self.scorer.scale(score),
+            'max_score': self.scorer.max_score,
             'feedback': f"🎴 {result.get('feedback', 'Resposta avaliada!')}",
             'correct': score >= 70,
             'breakdown': {
@@ -110,18 +113,21 @@ JSON:
             }
         }
     
-    def _heuristic_evaluate(self, correct: str, answer: str) -> Dict[str, Any]:
+    def _heuristic_evaluate(self, correct: str, answer: str, alternatives: List[str] = ()) -> Dict[str, Any]:
         """Fallback heuristic"""
         # Simple keyword matching
         correct_keywords = correct.lower().split()[:5]  # First 5 words
         answer_lower = answer.lower()
         
         matches = sum(1 for kw in correct_keywords if kw in answer_lower and len(kw) > 3)
-        score = int((matches / len(correct_keywords)) * 100) if correct_keywords else 0
+        # An accepted form of the answer (e.g. singular of a plural term) counts in full
+        if any(alt.lower() in answer_lower for alt in alternatives):
+            matches = len(correct_keywords)
+        score = self.scorer.scale(matches / len(correct_keywords) * 100) if correct_keywords else 0
         
         return {
             'score': score,
-            'max_score': 100,
+            'max_score': self.scorer.max_score,
             'feedback': f"🎴 Correspondência: {matches}/{len(correct_keywords)} palavras-chave. " +
                        ("✅ Boa memória!" if score >= 70 else "💡 Revise este card."),
             'correct': score >= 70,
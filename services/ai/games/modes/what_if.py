@@ -40,11 +40,11 @@ Liste pelo menos 3 consequências científicas deste cenário hipotético."""
         """Evaluate prediction quality with LLM"""
         scenario = round_data['data']['scenario']
         
-        try:
-            return await self._llm_evaluate(scenario, answer)
-        except Exception as e:
-            logger.warning(f"LLM failed: {e}")
-            return self._heuristic_evaluate(round_data, answer)
+        return await self.evaluate_cascade(
+            answer,
+            heuristic=lambda: self._heuristic_evaluate(round_data, answer),
+            llm=lambda: self._llm_evaluate(scenario, answer),
+        )
     
     async def _llm_evaluate(self, scenario: str, predictions: str) -> Dict[str, Any]:
         """LLM evaluates prediction quality"""
@@ -85,8 +85,8 @@ JSON:
         score = result.get("score", 0)
         
         return {
-            'score': int(score * 1.2),  # Scale to 120
-            'max_score': 120,
+            'score': self.scorer.scale(score),
+            'max_score': self.scorer.max_score,
             'feedback': f"🔮 {result.get('feedback', 'Previsões analisadas!')}",
             'correct': score >= 70,
             'breakdown': {
@@ -102,11 +102,11 @@ JSON:
         found = [c for c in consequences if any(word in answer.lower() for word in c.split())]
         coverage = len(found) / len(consequences)
         
-        score = int(coverage * 120)
+        score = self.scorer.scale(coverage * 100)
         
         return {
             'score': score,
-            'max_score': 120,
+            'max_score': self.scorer.max_score,
             'feedback': f"🔮 Você identificou {len(found)}/{len(consequences)} consequências-chave!",
             'correct': coverage >= 0.6,
             'breakdown': {'coverage': coverage, 'found': found, 'method': 'heuristic'}
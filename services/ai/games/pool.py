@@ -0,0 +1,81 @@
+"""
+Game Instance Pool - one shared instance per game mode
+
+Game objects used to be built per round and per evaluation, without an
+LLM service, so LLM-backed evaluations always fell back to heuristics.
+The pool instantiates each mode once (on first use), injects the shared
+GameLLMService, and hands the same instance to every request.
+
+Instances are shared across concurrent requests: game modes must keep
+per-round state in round_data, never on `self`.
+
+Usage:
+    from games.pool import game_pool
+    game = game_pool.get("FREE_RECALL_SCORE")
+"""
+import logging
+import threading
+from typing import Any, Dict, List
+
+from games.llm_service import game_llm_service
+from games.registry import GameRegistry, game_registry
+
+logger = logging.getLogger(__name__)
+
+
+class GameInstancePool:
+    """
+    Per-process cache of game instances.
+    
+    Args:
+        registry: Registry to resolve game classes from
+        llm_service: Service injected into every instance (predict_json)
+    """
+
+    def __init__(self, registry: GameRegistry, llm_service: Any = None):
+        self.registry = registry
+        self._llm_service = llm_service
+        self._instances: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def llm_service(self) -> Any:
+        return self._llm_service
+
+    @llm_service.setter
+    def llm_service(self, service: Any) -> None:
+        """Swap the shared LLM service (drops existing instances)"""
+        with self._lock:
+            self._llm_service = service
+            self._instances.clear()
+
+    def get(self, game_id: str) -> Any:
+        """
+        Shared instance of a game mode (imports and builds it on first use).
+        
+        Raises:
+            ValueError: If game_id not found
+        """
+        instance = self._instances.get(game_id)
+        if instance is not None:
+            return instance
+
+        game_class = self.registry.get_game(game_id)
+        with self._lock:
+            instance = self._instances.get(game_id)
+            if instance is None:
+                instance = game_class(llm_service=self._llm_service)
+                self._instances[game_id] = instance
+                logger.info(f"Pooled game instance: {game_id}")
+        return instance
+
+    def clear(self) -> None:
+        with self._lock:
+            self._instances.clear()
+
+    def loaded(self) -> List[str]:
+        return sorted(self._instances)
+
+
+# Global pool
+game_pool = GameInstancePool(game_registry, llm_service=game_llm_service)
@@ -0,0 +1,313 @@
+"""
+Round Pre-generation - ready-made game rounds per (content, mode, difficulty)
+
+START_GAME used to run create_round on the user's critical path; LLM-backed
+modes take seconds. This pool keeps a few ready rounds per key and refills
+in the background:
+
+- pop() takes a ready round (or None); a hit schedules a refill for its
+  key, a miss does not (the caller is building that round already)
+- warm() fills rounds for the modes triggers.yaml is likely to start
+  (on_reading_complete probabilities, from the hot-reloaded trigger
+  engine), e.g. when a session enters POST
+- entries expire after PREGEN_TTL_SECONDS; the pool is bounded by
+  PREGEN_MAX_ROUNDS and PREGEN_MAX_BYTES (oldest keys are evicted first)
+
+Rounds are keyed by (content, target words, learner language, mode,
+difficulty): the inputs a round is built from. Some modes write their
+prompt in the learner's language (TOOL_WORD_HUNT, ROLEPLAY_DISCOVERY), so
+the language is part of the key; the rest of the profile and the phase are
+not read by create_round and would only split the pool.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PREGEN_ENABLED = os.getenv("PREGEN_ENABLED", "true").lower() == "true"
+PREGEN_POOL_SIZE = int(os.getenv("PREGEN_POOL_SIZE", "2"))
+PREGEN_TTL_SECONDS = float(os.getenv("PREGEN_TTL_SECONDS", "1800"))
+PREGEN_MAX_ROUNDS = int(os.getenv("PREGEN_MAX_ROUNDS", "500"))
+PREGEN_MAX_BYTES = int(os.getenv("PREGEN_MAX_BYTES", str(5 * 1024 * 1024)))
+PREGEN_CONCURRENCY = int(os.getenv("PREGEN_CONCURRENCY", "4"))
+PREGEN_MIN_PROBABILITY = float(os.getenv("PREGEN_MIN_PROBABILITY", "0.3"))
+
+Key = Tuple[str, str, int]
+
+
+def state_key(ped_state: Dict[str, Any]) -> str:
+    """Stable hash of the content, target words and learner language a round is built from"""
+    language = (ped_state.get("learner_profile") or {}).get("language", "PT")
+    payload = json.dumps(
+        [ped_state.get("content_slice", ""), ped_state.get("target_words") or [], language],
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class RoundPregenPool:
+    """
+    Background pool of pre-generated rounds.
+
+    Args:
+        game_pool: Source of shared game instances (games/pool.py)
+        trigger_engine: Rules to warm from (default: the global, hot-reloaded engine)
+        size_per_key: Ready rounds kept per (content, mode, difficulty) at probability 1
+        ttl_seconds: Round lifetime
+        max_rounds / max_bytes: Pool bounds
+        concurrency: Max rounds generated at once
+        clock: Time source (for tests)
+    """
+
+    def __init__(
+        self,
+        game_pool=None,
+        trigger_engine=None,
+        size_per_key: int = PREGEN_POOL_SIZE,
+        ttl_seconds: float = PREGEN_TTL_SECONDS,
+        max_rounds: int = PREGEN_MAX_ROUNDS,
+        max_bytes: int = PREGEN_MAX_BYTES,
+        concurrency: int = PREGEN_CONCURRENCY,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._game_pool = game_pool
+        self._trigger_engine = trigger_engine
+        self.size_per_key = size_per_key
+        self.ttl_seconds = ttl_seconds
+        self.max_rounds = max_rounds
+        self.max_bytes = max_bytes
+        self.concurrency = concurrency
+        self._clock = clock
+
+        # key -> deque of (expires_at, size_bytes, round); keys in LRU order
+        self._entries: "OrderedDict[Key, Deque[Tuple[float, int, Dict]]]" = OrderedDict()
+        self._targets: Dict[Key, int] = {}
+        self._rounds = 0
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._inflight: Dict[Key, asyncio.Task] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop = None
+        self._stats = {"hits": 0, "misses": 0, "generated": 0, "failed": 0, "expired": 0, "evicted": 0}
+
+    @property
+    def game_pool(self):
+        if self._game_pool is None:
+            from games.pool import game_pool
+            self._game_pool = game_pool
+        return self._game_pool
+
+    @property
+    def trigger_engine(self):
+        if self._trigger_engine is None:
+            from games.triggers import trigger_engine
+            self._trigger_engine = trigger_engine
+        return self._trigger_engine
+
+    # ------------------------------------------------------------------
+    # Trigger-driven warm-up
+    # ------------------------------------------------------------------
+
+    def warm_targets(self, trigger: str = "on_reading_complete") -> Dict[str, int]:
+        """
+        Rounds to keep per mode for a trigger, from the trigger engine's
+        rule probabilities (1.0 when a rule has none, as decide() rolls).
+
+        Modes below PREGEN_MIN_PROBABILITY are not warmed; the rest get
+        ceil(size_per_key * probability) rounds.
+        """
+        targets: Dict[str, int] = {}
+        for rule in self.trigger_engine.rules(trigger):
+            if rule.probability >= PREGEN_MIN_PROBABILITY:
+                target = max(1, math.ceil(self.size_per_key * min(1.0, rule.probability)))
+                targets[rule.game] = max(target, targets.get(rule.game, 0))
+        return targets
+
+    def warm(
+        self,
+        ped_state: Dict[str, Any],
+        difficulty: int = 2,
+        trigger: str = "on_reading_complete",
+        difficulties: Optional[Dict[str, int]] = None,
+    ) -> List[str]:
+        """
+        Schedule background generation for the modes a trigger is likely to start.
+
+        Args:
+            difficulty: Level of the modes missing from `difficulties`
+            difficulties: {game_mode: level}, e.g. the learner's adapted levels
+        """
+        difficulties = difficulties or {}
+        warmed = []
+        for game_mode, target in self.warm_targets(trigger).items():
+            if self.schedule_refill(ped_state, game_mode, difficulties.get(game_mode, difficulty), target):
+                warmed.append(game_mode)
+        return warmed
+
+    # ------------------------------------------------------------------
+    # Pool operations
+    # ------------------------------------------------------------------
+
+    def pop(self, ped_state: Dict[str, Any], game_mode: str, difficulty: int) -> Optional[Dict[str, Any]]:
+        """Take a ready round, or None; a hit schedules a refill for the key"""
+        key = (state_key(ped_state), game_mode, difficulty)
+        round_data = None
+
+        with self._lock:
+            self._expire(key)
+            entries = self._entries.get(key)
+            if entries:
+                _, size, round_data = entries.popleft()
+                self._rounds -= 1
+                self._bytes -= size
+                self._entries.move_to_end(key)
+                if not entries:
+                    del self._entries[key]
+            self._stats["hits" if round_data is not None else "misses"] += 1
+
+        if round_data is not None:
+            self.schedule_refill(ped_state, game_mode, difficulty)
+        return round_data
+
+    def put(self, key: Key, round_data: Dict[str, Any]) -> None:
+        size = len(json.dumps(round_data, ensure_ascii=False, default=str))
+        with self._lock:
+            self._entries.setdefault(key, deque()).append((self._clock() + self.ttl_seconds, size, round_data))
+            self._entries.move_to_end(key)
+            self._rounds += 1
+            self._bytes += size
+            self._enforce_bounds()
+
+    def ready(self, ped_state: Dict[str, Any], game_mode: str, difficulty: int) -> int:
+        """Ready (unexpired) rounds for a key"""
+        key = (state_key(ped_state), game_mode, difficulty)
+        with self._lock:
+            self._expire(key)
+            return len(self._entries.get(key, ()))
+
+    def _expire(self, key: Key) -> None:
+        entries = self._entries.get(key)
+        now = self._clock()
+        while entries and entries[0][0] <= now:
+            _, size, _ = entries.popleft()
+            self._rounds -= 1
+            self._bytes -= size
+            self._stats["expired"] += 1
+        if entries is not None and not entries:
+            del self._entries[key]
+
+    def _enforce_bounds(self) -> None:
+        while self._entries and (self._rounds > self.max_rounds or self._bytes > self.max_bytes):
+            key, entries = next(iter(self._entries.items()))
+            _, size, _ = entries.popleft()
+            self._rounds -= 1
+            self._bytes -= size
+            self._stats["evicted"] += 1
+            if not entries:
+                del self._entries[key]
+
+    # ------------------------------------------------------------------
+    # Background refill
+    # ------------------------------------------------------------------
+
+    def schedule_refill(
+        self,
+        ped_state: Dict[str, Any],
+        game_mode: str,
+        difficulty: int,
+        target: Optional[int] = None,
+    ) -> bool:
+        """
+        Start a background refill for a key (no-op without a running loop,
+        when disabled, or when one is already running for the key).
+        """
+        if not PREGEN_ENABLED:
+            return False
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+
+        key = (state_key(ped_state), game_mode, difficulty)
+        if target is not None:
+            self._targets[key] = max(target, self._targets.get(key, 0))
+        if key in self._inflight:
+            return False
+
+        task = loop.create_task(self._refill(key, dict(ped_state)))
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return True
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _refill(self, key: Key, ped_state: Dict[str, Any]) -> None:
+        _, game_mode, difficulty = key
+        target = self._targets.get(key, self.size_per_key)
+
+        while True:
+            with self._lock:
+                self._expire(key)
+                missing = target - len(self._entries.get(key, ()))
+            if missing <= 0:
+                return
+
+            try:
+                game = self.game_pool.get(game_mode)
+                async with self._get_semaphore():
+                    # create_round is sync (LLM-backed modes block): keep it off the loop
+                    round_data = await asyncio.to_thread(game.create_round, dict(ped_state), difficulty)
+            except Exception as e:
+                self._stats["failed"] += 1
+                logger.warning(f"Round pre-generation failed for {game_mode}: {e}")
+                return
+
+            if round_data.get("step") == "error":
+                self._stats["failed"] += 1
+                return
+
+            self.put(key, round_data)
+            self._stats["generated"] += 1
+
+    async def drain(self) -> None:
+        """Wait for in-flight refills (tests, shutdown)"""
+        while self._inflight:
+            await asyncio.gather(*list(self._inflight.values()), return_exceptions=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._targets.clear()
+            self._rounds = 0
+            self._bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else 0.0,
+                "rounds": self._rounds,
+                "bytes": self._bytes,
+                "keys": len(self._entries),
+                "inflight": len(self._inflight),
+                "enabled": PREGEN_ENABLED,
+            }
+
+
+# Global pool
+round_pregen = RoundPregenPool()
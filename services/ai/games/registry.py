@@ -2,6 +2,10 @@
 Game Registry - Auto-discovery of game modules
 No hard-coded game lists - modules self-register by implementing GameModule protocol.
 
+Discovery reads a static manifest (games/manifest.py) built by parsing
+games/modes/ without importing it. A mode's module is imported only when
+that game is first played (get_game); catalog queries never import modes.
+
 Usage:
     from games.registry import game_registry
     
@@ -15,12 +19,15 @@ Usage:
     # List with filters
     short_games = game_registry.list_games({'max_duration': 5})
 """
-from typing import Dict, Type, Optional, List
+from typing import Any, Dict, Type, Optional, List
 import importlib
-import inspect
+import threading
 from pathlib import Path
 import logging
 
+from games.catalog import GameCatalog
+from games.manifest import DEFAULT_MANIFEST_PATH, DEFAULT_MODES_DIR, load_manifest
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,62 +37,76 @@ class GameRegistry:
     Modules self-register by implementing the GameModule protocol.
     """
     
-    def __init__(self):
-        self._games: Dict[str, Type] = {}
+    def __init__(
+        self,
+        modes_dir: Path = DEFAULT_MODES_DIR,
+        package: str = "games.modes",
+        manifest_path: Path = DEFAULT_MANIFEST_PATH,
+    ):
+        self.modes_dir = Path(modes_dir)
+        self.package = package
+        self.manifest_path = Path(manifest_path)
+        self._manifest: Dict[str, Dict[str, Any]] = {}
+        self._games: Dict[str, Type] = {}  # Imported game classes
+        self._catalog: Optional[GameCatalog] = None
         self._discovered = False
+        self._lock = threading.Lock()
     
     def discover_games(self):
         """
-        Auto-discover game modules from games/modes/ directory.
-        Call this explicitly after imports are ready.
+        Load the game manifest (no game module is imported).
+        Idempotent and cheap after the first call.
         """
         if self._discovered:
-            logger.debug("Games already discovered, skipping")
-            return
-        
-        games_dir = Path(__file__).parent / "modes"
-        
-        if not games_dir.exists():
-            logger.warning(f"Games directory not found: {games_dir}")
             return
         
-        logger.info(f"Discovering games in: {games_dir}")
-        
-        for file in games_dir.glob("*.py"):
-            if file.name.startswith("_"):
-                continue
+        with self._lock:
+            if self._discovered:
+                return
             
-            try:
-                module_name = f"games.modes.{file.stem}"
-                module = importlib.import_module(module_name)
-                
-                # Find classes that have GAME_ID attribute
-                for name, obj in inspect.getmembers(module, inspect.isclass):
-                    if hasattr(obj, 'GAME_ID') and hasattr(obj, 'create_round'):
-                        game_id = obj.GAME_ID
-                        
-                        # Skip abstract/template classes where GAME_ID is not set
-                        if game_id is NotImplemented:
-                            continue
-                            
-                        self._games[game_id] = obj
-                        logger.info(
-                            f"Registered game: {game_id}",
-                            extra={
-                                'game_id': game_id,
-                                'game_name': getattr(obj, 'GAME_NAME', 'Unknown'),
-                                'module': module_name
-                            }
-                        )
-            except Exception as e:
-                logger.error(
-                    f"Failed to load game module: {file.name}",
-                    extra={'error': str(e)},
-                    exc_info=True
-                )
+            if not self.modes_dir.exists():
+                logger.warning(f"Games directory not found: {self.modes_dir}")
+                return
+            
+            manifest = load_manifest(self.manifest_path, self.modes_dir, self.package)
+            self._manifest = manifest["games"]
+            self._catalog = None
+            self._discovered = True
+            logger.info(f"Game discovery complete. Registered {len(self._manifest)} games")
+    
+    def _load_class(self, game_id: str) -> Type:
+        """Import the module of one game (first play only)"""
+        entry = self._manifest[game_id]
+        module = importlib.import_module(entry["module"])
+        game_class = getattr(module, entry["class_name"])
+        self._games[game_id] = game_class
+        logger.info(
+            f"Loaded game: {game_id}",
+            extra={'game_id': game_id, 'game_module': entry["module"]}
+        )
+        return game_class
+    
+    def get_metadata(self, game_id: str) -> Dict[str, Any]:
+        """
+        Catalog metadata for one game, without importing its module.
         
-        self._discovered = True
-        logger.info(f"Game discovery complete. Registered {len(self._games)} games")
+        Raises:
+            ValueError: If game_id not found
+        """
+        record = self.catalog.get(game_id)
+        if record is None:
+            raise ValueError(f"Unknown game mode: {game_id}")
+        
+        return dict(record)
+    
+    @property
+    def catalog(self) -> GameCatalog:
+        """Indexed, pre-serialized catalog (built once from the manifest)"""
+        if self._catalog is None:
+            if not self._discovered:
+                self.discover_games()
+            self._catalog = GameCatalog(self._manifest)
+        return self._catalog
     
     def get_game(self, game_id: str) -> Type:
         """
@@ -100,17 +121,23 @@ class GameRegistry:
         Raises:
             ValueError: If game_id not found
         """
+        if game_id in self._games:
+            return self._games[game_id]
+        
         if not self._discovered:
             self.discover_games()
         
-        if game_id not in self._games:
-            available = list(map(str, self._games.keys()))  # Convert to str for safety
+        if game_id not in self._manifest:
+            available = list(map(str, self._manifest.keys()))  # Convert to str for safety
             raise ValueError(
                 f"Unknown game mode: {game_id}. "
                 f"Available games: {', '.join(available)}"
             )
         
-        return self._games[game_id]
+        with self._lock:
+            if game_id in self._games:
+                return self._games[game_id]
+            return self._load_class(game_id)
     
     def list_games(self, filters: Optional[Dict] = None) -> List[Dict]:
         """
@@ -128,66 +155,19 @@ class GameRegistry:
         Returns:
             List of game metadata dicts
         """
-        if not self._discovered:
-            self.discover_games()
-        
-        games = []
-        
-        for game_id, game_class in self._games.items():
-            metadata = {
-                'id': game_id,
-                'name': getattr(game_class, 'GAME_NAME', 'Unknown'),
-                'duration_min': getattr(game_class, 'DURATION_MIN', 0),
-                'requires_content': getattr(game_class, 'REQUIRES_CONTENT', True),
-                'game_intent': getattr(game_class, 'GAME_INTENT', 'solo'),
-                'difficulty_range': getattr(game_class, 'DIFFICULTY_RANGE', (1, 5)),
-            }
-            
-            # Apply filters
-            if filters:
-                # Duration filters
-                if 'max_duration' in filters:
-                    if metadata['duration_min'] > filters['max_duration']:
-                        continue
-                
-                if 'min_duration' in filters:
-                    if metadata['duration_min'] < filters['min_duration']:
-                        continue
-                
-                # Content requirement filter
-                if 'requires_content' in filters:
-                    if metadata['requires_content'] != filters['requires_content']:
-                        continue
-                
-                # Game intent filter
-                if 'game_intent' in filters:
-                    if metadata['game_intent'] != filters['game_intent']:
-                        continue
-                
-                # Difficulty filters
-                if 'difficulty_min' in filters:
-                    if metadata['difficulty_range'][1] < filters['difficulty_min']:
-                        continue
-                
-                if 'difficulty_max' in filters:
-                    if metadata['difficulty_range'][0] > filters['difficulty_max']:
-                        continue
-            
-            games.append(metadata)
-        
-        return games
+        return [dict(record) for record in self.catalog.query(filters)]
     
     def is_registered(self, game_id: str) -> bool:
         """Check if a game is registered"""
         if not self._discovered:
             self.discover_games()
-        return game_id in self._games
+        return game_id in self._manifest
     
     def count(self) -> int:
         """Get count of registered games"""
         if not self._discovered:
             self.discover_games()
-        return len(self._games)
+        return len(self._manifest)
 
 
 # Global registry instance
@@ -0,0 +1,186 @@
+"""
+Local Round Builder - game rounds derived from the reading content
+
+Cloze blanks, flashcards, word-hunt targets and taboo words are built
+straight from `state['content_slice']` and `target_words`, without an LLM:
+
+- sentences, term frequencies and keyword rankings come from the shared
+  content index (content_index), built once per distinct text
+- target words that occur in the text come first, then the top keywords
+- each answer gets a list of accepted alternative forms (accents dropped,
+  singular/plural)
+
+Builders are deterministic (same content + difficulty -> same round) and
+return None when the text is too short to build from; modes then keep
+their built-in sample round. The LLM is only used to evaluate answers.
+"""
+import re
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence
+
+from content_index import ContentIndex, content_indexes, is_keyword, strip_accents
+
+MIN_SENTENCE_WORDS = 6
+BLANK = "___"
+
+
+def word_forms(word: str) -> List[str]:
+    """Accepted alternative forms of a word (not including the word itself)"""
+    w = word.lower()
+    forms = set()
+
+    if w.endswith("ões") or w.endswith("ães"):
+        forms.add(w[:-3] + "ão")
+    elif w.endswith("ais") and len(w) > 4:
+        forms.add(w[:-2] + "l")
+    elif w.endswith("es") and len(w) > 4 and w[-3] in "rzs":
+        forms.add(w[:-2])
+    elif w.endswith("s") and len(w) > 3:
+        forms.add(w[:-1])
+    elif w.endswith("ão"):
+        forms.add(w[:-2] + "ões")
+    elif w.endswith("l"):
+        forms.add(w[:-1] + "is")
+    elif w.endswith(("r", "z")):
+        forms.add(w + "es")
+    else:
+        forms.add(w + "s")
+
+    forms |= {strip_accents(f) for f in forms | {w}}
+    forms.discard(w)
+    return sorted(forms)
+
+
+def _target_texts(target_words: Optional[Sequence[Any]]) -> List[str]:
+    texts = []
+    for item in target_words or []:
+        text = item.get("text") if isinstance(item, dict) else item
+        if isinstance(text, str) and text.strip():
+            texts.append(text.strip())
+    return texts
+
+
+def get_index(text: str) -> ContentIndex:
+    """Shared index of a text (see content_index), built once per distinct content"""
+    return content_indexes.for_text(text)
+
+
+def _usable_sentences(index: ContentIndex) -> List[int]:
+    return [i for i, n in enumerate(index.sentence_lengths().tolist()) if n >= MIN_SENTENCE_WORDS]
+
+
+def _candidates(index: ContentIndex, target_words: Optional[Sequence[Any]]) -> List[str]:
+    """Target words found in the text, then the top keywords"""
+    targets = [t.lower() for t in _target_texts(target_words) if t.lower() in index]
+    return targets + [k for k in index.keywords if k not in targets]
+
+
+def _blank_out(sentence: str, words: Sequence[str]) -> str:
+    for word in words:
+        sentence = re.sub(rf"(?<!\w){re.escape(word)}(?!\w)", BLANK, sentence, count=1, flags=re.IGNORECASE)
+    return sentence
+
+
+def _quote_around(sentence: str, word: str, length: int = 4) -> str:
+    """`length` consecutive words of the sentence that include the word"""
+    words = sentence.split()
+    match = re.search(rf"(?<!\w){re.escape(word)}(?!\w)", sentence, flags=re.IGNORECASE)
+    position = len(sentence[:match.start()].split()) if match else 0
+    start = max(0, min(position - 1, len(words) - length))
+    return " ".join(words[start:start + length])
+
+
+def _best_sentence(index: ContentIndex, candidates: List[str], wanted: int) -> Optional[tuple]:
+    """Usable sentence holding the most (highest ranked) candidates"""
+    rank = {term: r for r, term in enumerate(candidates)}
+    best = None
+    for i in _usable_sentences(index):
+        terms = index.tokens_of(i)
+        # A word repeated in the sentence would give its own blank away
+        present = sorted({t for t in terms if t in rank and terms.count(t) == 1}, key=rank.get)[:wanted]
+        if not present:
+            continue
+        key = (-len(present), sum(rank[t] for t in present), i)
+        if best is None or key < best[0]:
+            best = (key, i, present)
+    return None if best is None else (best[1], best[2])
+
+
+def build_cloze(content: str, target_words: Optional[Sequence[Any]], difficulty: int) -> Optional[Dict[str, Any]]:
+    """
+    One sentence from the text with 1-3 keywords blanked (more at higher difficulty).
+
+    Returns:
+        {'sentence', 'blanks': [{'id', 'correct', 'alternatives'}]} or None
+    """
+    index = get_index(content or "")
+    found = _best_sentence(index, _candidates(index, target_words), max(1, min(3, difficulty)))
+    if found is None:
+        return None
+    i, words = found
+    # Blanks in reading order
+    terms = index.tokens_of(i)
+    words = sorted(words, key=terms.index)
+    return {
+        'sentence': _blank_out(index.sentence(i), words),
+        'blanks': [
+            {'id': n, 'correct': word, 'alternatives': word_forms(word)}
+            for n, word in enumerate(words)
+        ],
+    }
+
+
+def build_flashcards(content: str, target_words: Optional[Sequence[Any]], limit: int = 5) -> List[Dict[str, str]]:
+    """Cards asking for the keyword missing from a sentence of the text"""
+    index = get_index(content or "")
+    usable = set(_usable_sentences(index))
+    cards, used_sentences = [], set()
+    for term in _candidates(index, target_words):
+        sentence_ids = [i for i in index.sentences_with(term) if i in usable and i not in used_sentences]
+        if not sentence_ids:
+            continue
+        i = sentence_ids[0]
+        used_sentences.add(i)
+        cards.append({
+            'front': f"Qual termo completa a frase do texto?\n«{_blank_out(index.sentence(i), [term])}»",
+            'back': term,
+            'alternatives': word_forms(term),
+        })
+        if len(cards) >= limit:
+            break
+    return cards
+
+
+def build_word_hunt(content: str, target_words: Optional[Sequence[Any]], difficulty: int) -> Optional[Dict[str, str]]:
+    """
+    A target word plus the passage it appears in.
+
+    Returns:
+        {'text', 'target_word', 'expected_quote'} or None
+    """
+    index = get_index(content or "")
+    usable = set(_usable_sentences(index))
+    for term in _candidates(index, target_words):
+        sentence_ids = [i for i in index.sentences_with(term) if i in usable]
+        if not sentence_ids:
+            continue
+        i = sentence_ids[0]
+        # Harder rounds show more surrounding text to search through
+        radius = max(0, min(2, difficulty - 2))
+        passage = " ".join(index.sentence(j) for j in range(max(0, i - radius), min(len(index), i + radius + 1)))
+        return {
+            'text': passage,
+            'target_word': term,
+            'expected_quote': _quote_around(index.sentence(i), term),
+        }
+    return None
+
+
+def related_terms(content: str, word: str, n: int = 4) -> List[str]:
+    """Keywords from the text that co-occur with a word (taboo list)"""
+    index = get_index(content or "")
+    word = word.lower()
+    counts: Counter = Counter()
+    for i in index.sentences_with(word):
+        counts.update(t for t in set(index.tokens_of(i)) if t != word and is_keyword(t))
+    return sorted(counts, key=lambda t: (-counts[t], -index.keyword_score(t), t))[:n]
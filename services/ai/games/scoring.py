@@ -0,0 +1,240 @@
+"""
+Scoring Engine - score scales, criteria weights, bonuses and multipliers
+
+scoring_rules.yaml is compiled once into one GameScorer per mode; modes
+report raw results and the scorer turns them into points:
+
+- scale(raw):  0-100 raw score (e.g. the LLM's) -> 0..max_score
+- heuristic_score(values):  per-criterion results (0-1 or bool) weighted
+  by `heuristic_criteria` -> 0..max_score
+- points:  score x difficulty multiplier x streak multiplier + bonuses
+  (a bonus is awarded when the result's breakdown flag of that name is truthy)
+
+`score` / `max_score` stay the mode's own scale (what `correct` thresholds
+and the cascade compare against); `points` is the gamified total. Points
+for a whole class or tournament are computed in one NumPy pass
+(apply_batch). The rules are recompiled when scoring_rules.yaml changes
+on disk (GameConfigLoader mtime), checked at most every SCORING_RELOAD_SECONDS.
+"""
+import logging
+import os
+import re
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SCORING_FILE = "scoring_rules.yaml"
+SCORING_RELOAD_SECONDS = float(os.getenv("SCORING_RELOAD_SECONDS", "2"))
+
+DEFAULT_MAX_SCORE = 100
+DEFAULT_DIFFICULTY_LEVELS = {1: "easy", 2: "easy", 3: "medium", 4: "hard", 5: "hard"}
+
+_STREAK_KEY = re.compile(r"^(\d+)")
+
+
+class GameScorer:
+    """Compiled scoring rules of one game mode"""
+
+    def __init__(
+        self,
+        game_id: str,
+        max_score: int = DEFAULT_MAX_SCORE,
+        heuristic_criteria: Optional[Dict[str, float]] = None,
+        bonus: Optional[Dict[str, float]] = None,
+        difficulty_multipliers: Optional[np.ndarray] = None,
+        streak_thresholds: Optional[np.ndarray] = None,
+        streak_multipliers: Optional[np.ndarray] = None,
+    ):
+        self.game_id = game_id
+        self.max_score = int(max_score)
+        self.heuristic_criteria = dict(heuristic_criteria or {})
+        self._criteria_total = sum(self.heuristic_criteria.values()) or 1.0
+        self.bonus = dict(bonus or {})
+        # Index = round difficulty (0 unused)
+        self.difficulty_multipliers = (
+            difficulty_multipliers if difficulty_multipliers is not None else np.ones(6)
+        )
+        # Ascending win counts; multiplier i applies from threshold i on (index 0 = no streak)
+        self.streak_thresholds = streak_thresholds if streak_thresholds is not None else np.zeros(1, dtype=np.int64)
+        self.streak_multipliers = streak_multipliers if streak_multipliers is not None else np.ones(1)
+
+    def scale(self, raw: float) -> int:
+        """0-100 raw score -> 0..max_score"""
+        raw = min(100.0, max(0.0, float(raw)))
+        # Epsilon: 70 * 110 / 100 must give 77, not 76.999...
+        return int(raw * self.max_score / 100 + 1e-9)
+
+    def heuristic_score(self, values: Dict[str, Any]) -> int:
+        """Weighted per-criterion results (bool or 0-1) -> 0..max_score"""
+        raw = sum(
+            weight * min(1.0, max(0.0, float(values.get(name, 0))))
+            for name, weight in self.heuristic_criteria.items()
+        )
+        return self.scale(raw * 100 / self._criteria_total)
+
+    def passed(self, score: float, fraction: float) -> bool:
+        """score reaches `fraction` of max_score"""
+        return score >= fraction * self.max_score - 1e-9
+
+    def difficulty_multiplier(self, difficulty: Optional[int]) -> float:
+        index = min(len(self.difficulty_multipliers) - 1, max(1, int(difficulty or 1)))
+        return float(self.difficulty_multipliers[index])
+
+    def streak_multiplier(self, streak: int) -> float:
+        index = int(np.searchsorted(self.streak_thresholds, max(0, int(streak or 0)), side="right")) - 1
+        return float(self.streak_multipliers[max(0, index)])
+
+    def bonus_points(self, breakdown: Optional[Dict[str, Any]]) -> float:
+        if not breakdown:
+            return 0.0
+        return float(sum(points for name, points in self.bonus.items() if breakdown.get(name)))
+
+    def points(self, result: Dict[str, Any], difficulty: Optional[int] = None, streak: int = 0) -> int:
+        score = float(result.get("score") or 0)
+        total = score * self.difficulty_multiplier(difficulty) * self.streak_multiplier(streak)
+        return int(round(total + self.bonus_points(result.get("breakdown"))))
+
+
+def compile_scorers(rules: Dict[str, Any]) -> Dict[str, GameScorer]:
+    """One GameScorer per mode listed under game_specific"""
+    rules = rules or {}
+    multipliers = rules.get("multipliers") or {}
+
+    levels = {int(k): v for k, v in (rules.get("difficulty_levels") or DEFAULT_DIFFICULTY_LEVELS).items()}
+    by_level = multipliers.get("difficulty") or {}
+    difficulty = np.ones(max(levels, default=5) + 1)
+    for value, level in levels.items():
+        difficulty[value] = float(by_level.get(level, 1.0))
+
+    streaks = sorted(
+        (int(_STREAK_KEY.match(str(key)).group(1)), float(mult))
+        for key, mult in (multipliers.get("streak") or {}).items()
+        if _STREAK_KEY.match(str(key))
+    )
+    thresholds = np.array([0] + [wins for wins, _ in streaks], dtype=np.int64)
+    streak_mults = np.array([1.0] + [mult for _, mult in streaks])
+
+    default_max = (rules.get("base_scoring") or {}).get("perfect_score", DEFAULT_MAX_SCORE)
+    scorers = {}
+    for game_id, spec in (rules.get("game_specific") or {}).items():
+        spec = spec or {}
+        scorers[game_id] = GameScorer(
+            game_id,
+            max_score=spec.get("max_score", default_max),
+            heuristic_criteria={k: float(v) for k, v in (spec.get("heuristic_criteria") or {}).items()},
+            bonus={k: float(v) for k, v in (spec.get("bonus") or {}).items()},
+            difficulty_multipliers=difficulty,
+            streak_thresholds=thresholds,
+            streak_multipliers=streak_mults,
+        )
+    scorers[""] = GameScorer(
+        "", max_score=default_max,
+        difficulty_multipliers=difficulty, streak_thresholds=thresholds, streak_multipliers=streak_mults,
+    )
+    return scorers
+
+
+class ScoringEngine:
+    """
+    Args:
+        rules: scoring_rules.yaml content (default: loaded via config_loader, hot-reloaded)
+        reload_seconds: Minimum interval between mtime checks
+        clock: Time source (for tests)
+    """
+
+    def __init__(
+        self,
+        rules: Optional[Dict[str, Any]] = None,
+        reload_seconds: float = SCORING_RELOAD_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._static = rules is not None
+        self.reload_seconds = reload_seconds
+        self._clock = clock
+        self._scorers: Dict[str, GameScorer] = compile_scorers(rules) if self._static else {}
+        self._version: Optional[int] = None
+        self._next_check = 0.0
+        self._stats = {"scored": 0, "batches": 0, "reloads": 0, "reload_errors": 0}
+
+    def _refresh(self) -> None:
+        now = self._clock()
+        if self._static or now < self._next_check:
+            return
+        self._next_check = now + self.reload_seconds
+
+        from games.config import config_loader
+        version = config_loader.mtime(SCORING_FILE)
+        if version == self._version:
+            return
+        try:
+            # ConfigLoadError (unparsable file) is a ValueError
+            scorers = compile_scorers(config_loader.load_scoring(strict=True))
+        except (TypeError, ValueError, AttributeError) as e:
+            # Keep serving the last good rules
+            self._stats["reload_errors"] += 1
+            logger.error(f"Invalid {SCORING_FILE}, keeping previous scoring rules: {e}")
+        else:
+            if self._version is not None:
+                self._stats["reloads"] += 1
+                logger.info(f"Recompiled {SCORING_FILE} ({len(scorers) - 1} game scorers)")
+            self._scorers = scorers
+        self._version = version
+
+    def scorer(self, game_id: str) -> GameScorer:
+        """Scorer of a mode (base_scoring defaults if the mode has no section)"""
+        self._refresh()
+        scorer = self._scorers.get(game_id) or self._scorers.get("")
+        if scorer is None:
+            scorer = self._scorers[""] = GameScorer("")
+        return scorer
+
+    def apply(self, game_id: str, result: Dict[str, Any], difficulty: Optional[int] = None, streak: int = 0) -> Dict[str, Any]:
+        """Add `points` to one evaluation result (in place)"""
+        self._stats["scored"] += 1
+        result["points"] = self.scorer(game_id).points(result, difficulty, streak)
+        return result
+
+    def apply_batch(
+        self,
+        game_id: str,
+        results: List[Dict[str, Any]],
+        difficulties: Optional[Sequence[Optional[int]]] = None,
+        streaks: Optional[Sequence[int]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Add `points` to many results of one mode in a single vectorized pass
+        (classroom / tournament results).
+        """
+        if not results:
+            return results
+        scorer = self.scorer(game_id)
+        n = len(results)
+
+        scores = np.fromiter((float(r.get("score") or 0) for r in results), dtype=np.float64, count=n)
+        levels = np.fromiter(
+            (int(d or 1) for d in (difficulties if difficulties is not None else [1] * n)), dtype=np.int64, count=n
+        )
+        wins = np.fromiter(
+            (max(0, int(s or 0)) for s in (streaks if streaks is not None else [0] * n)), dtype=np.int64, count=n
+        )
+        bonus = np.fromiter((scorer.bonus_points(r.get("breakdown")) for r in results), dtype=np.float64, count=n)
+
+        difficulty_mult = scorer.difficulty_multipliers[np.clip(levels, 1, len(scorer.difficulty_multipliers) - 1)]
+        streak_mult = scorer.streak_multipliers[np.searchsorted(scorer.streak_thresholds, wins, side="right") - 1]
+        points = np.rint(scores * difficulty_mult * streak_mult + bonus).astype(np.int64)
+
+        for result, value in zip(results, points.tolist()):
+            result["points"] = value
+        self._stats["scored"] += n
+        self._stats["batches"] += 1
+        return results
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self._stats, "game_scorers": max(0, len(self._scorers) - 1)}
+
+
+# Global engine (hot-reloads scoring_rules.yaml)
+scoring_engine = ScoringEngine()
@@ -0,0 +1,296 @@
+"""
+Trigger Engine - decides which game an event starts, from triggers.yaml
+
+Rules are compiled once into predicate closures and indexed by
+(trigger, key), e.g. ("on_reading_complete", None) or ("on_intent",
+"challenge"); evaluating an event is a dict lookup plus a few closure
+calls, with no parsing or eval at request time.
+
+Rule fields:
+    game                 Game mode to start
+    probability          Chance the rule fires when it matches (default 1)
+    priority             high | normal | low (rules are tried in that order)
+    min_content_length   facts['content_length'] >= value
+    target_word_count    facts['target_word_count'] >= value
+    requires             facts[field] must be truthy for every field
+    condition            Expression over facts, e.g. "user_mastery > 0.7";
+                         comparisons, and/or/not, numbers, strings, booleans
+
+Facts missing from an event count as 0.
+The rule set is recompiled when triggers.yaml changes on disk
+(GameConfigLoader mtime), checked at most every TRIGGERS_RELOAD_SECONDS.
+"""
+import ast
+import logging
+import operator
+import os
+import random
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+TRIGGERS_FILE = "triggers.yaml"
+TRIGGERS_RELOAD_SECONDS = float(os.getenv("TRIGGERS_RELOAD_SECONDS", "2"))
+
+PRIORITIES = {"high": 0, "normal": 1, "low": 2}
+
+Facts = Dict[str, Any]
+Predicate = Callable[[Facts], bool]
+
+_COMPARE = {
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+}
+
+
+class TriggerConfigError(ValueError):
+    """Invalid rule in triggers.yaml"""
+
+
+def _always(facts: Facts) -> bool:
+    return True
+
+
+def _operand(node: ast.AST) -> Callable[[Facts], Any]:
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float, str, bool)):
+        value = node.value
+        return lambda facts: value
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub) and isinstance(node.operand, ast.Constant):
+        value = -node.operand.value
+        return lambda facts: value
+    if isinstance(node, ast.Name):
+        if node.id in ("true", "false"):
+            value = node.id == "true"
+            return lambda facts: value
+        name = node.id
+        return lambda facts: facts.get(name, 0)
+    raise TriggerConfigError(f"Unsupported operand: {ast.dump(node)}")
+
+
+def _compile_node(node: ast.AST) -> Predicate:
+    if isinstance(node, ast.BoolOp):
+        parts = [_compile_node(v) for v in node.values]
+        if isinstance(node.op, ast.And):
+            return lambda facts: all(p(facts) for p in parts)
+        return lambda facts: any(p(facts) for p in parts)
+
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        inner = _compile_node(node.operand)
+        return lambda facts: not inner(facts)
+
+    if isinstance(node, ast.Compare):
+        # a < b <= c -> (a < b) and (b <= c)
+        operands = [_operand(node.left)] + [_operand(c) for c in node.comparators]
+        steps = []
+        for i, op in enumerate(node.ops):
+            fn = _COMPARE.get(type(op))
+            if fn is None:
+                raise TriggerConfigError(f"Unsupported comparison: {type(op).__name__}")
+            steps.append((fn, operands[i], operands[i + 1]))
+        if len(steps) == 1:
+            fn, left, right = steps[0]
+            return lambda facts: _safe_compare(fn, left(facts), right(facts))
+        return lambda facts: all(_safe_compare(fn, l(facts), r(facts)) for fn, l, r in steps)
+
+    # Bare fact name or constant: truthiness
+    value = _operand(node)
+    return lambda facts: bool(value(facts))
+
+
+def _safe_compare(fn, left, right) -> bool:
+    try:
+        return fn(left, right)
+    except TypeError:
+        return False
+
+
+def compile_condition(expression: str) -> Predicate:
+    """Compile a condition string into a predicate over facts"""
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+    except SyntaxError as e:
+        raise TriggerConfigError(f"Invalid condition {expression!r}: {e.msg}") from e
+    return _compile_node(tree.body)
+
+
+class CompiledRule:
+    __slots__ = ("game", "probability", "priority", "predicate", "source")
+
+    def __init__(self, game: str, probability: float, priority: int, predicate: Predicate, source: Dict[str, Any]):
+        self.game = game
+        self.probability = probability
+        self.priority = priority
+        self.predicate = predicate
+        self.source = source
+
+
+def _number(rule: Dict[str, Any], field: str, cast: Callable[[Any], Any], default: Any = None) -> Any:
+    try:
+        return cast(rule.get(field, default))
+    except (TypeError, ValueError) as e:
+        raise TriggerConfigError(f"Invalid {field} {rule.get(field)!r} for {rule.get('game')}") from e
+
+
+def compile_rule(rule: Dict[str, Any]) -> CompiledRule:
+    """Compile one triggers.yaml rule into a single predicate"""
+    if not isinstance(rule, dict) or not rule.get("game"):
+        raise TriggerConfigError(f"Rule without a game: {rule}")
+
+    checks: List[Predicate] = []
+    if "min_content_length" in rule:
+        min_length = _number(rule, "min_content_length", int)
+        checks.append(lambda facts: facts.get("content_length", 0) >= min_length)
+    if "target_word_count" in rule:
+        min_words = _number(rule, "target_word_count", int)
+        checks.append(lambda facts: facts.get("target_word_count", 0) >= min_words)
+    requires = rule.get("requires") or []
+    if not isinstance(requires, list):
+        raise TriggerConfigError(f"requires must be a list for {rule['game']}")
+    for field in requires:
+        checks.append(lambda facts, field=field: bool(facts.get(field)))
+    if rule.get("condition"):
+        checks.append(compile_condition(str(rule["condition"])))
+
+    if not checks:
+        predicate = _always
+    elif len(checks) == 1:
+        predicate = checks[0]
+    else:
+        predicate = lambda facts: all(check(facts) for check in checks)
+
+    priority = str(rule.get("priority", "normal")).lower()
+    if priority not in PRIORITIES:
+        raise TriggerConfigError(f"Unknown priority {priority!r} for {rule['game']}")
+
+    return CompiledRule(
+        game=rule["game"],
+        probability=_number(rule, "probability", float, 1.0),
+        priority=PRIORITIES[priority],
+        predicate=predicate,
+        source=rule,
+    )
+
+
+def compile_triggers(config: Dict[str, Any]) -> Dict[Tuple[str, Optional[str]], List[CompiledRule]]:
+    """
+    Index compiled rules by (trigger, key).
+
+    A trigger is either a list of rules (key None) or a mapping of
+    key (intent, gap type...) -> list of rules.
+    """
+    index: Dict[Tuple[str, Optional[str]], List[CompiledRule]] = {}
+    triggers = (config or {}).get("triggers") or {}
+    if not isinstance(triggers, dict):
+        raise TriggerConfigError("triggers must be a mapping of event -> rules")
+    for trigger, body in triggers.items():
+        groups = body.items() if isinstance(body, dict) else [(None, body)]
+        for key, rules in groups:
+            if not isinstance(rules or [], list):
+                raise TriggerConfigError(f"Rules of {trigger}/{key} must be a list")
+            compiled = [compile_rule(rule) for rule in rules or []]
+            # Stable: YAML order within a priority
+            index[(trigger, key)] = sorted(compiled, key=lambda r: r.priority)
+    return index
+
+
+class TriggerEngine:
+    """
+    Args:
+        config: triggers.yaml content (default: loaded via config_loader, hot-reloaded)
+        rng: Random source for rule probabilities (seed it for reproducible runs)
+        reload_seconds: Minimum interval between mtime checks
+        clock: Time source (for tests)
+    """
+
+    def __init__(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        rng: Optional[random.Random] = None,
+        reload_seconds: float = TRIGGERS_RELOAD_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._static = config is not None
+        self._rng = rng or random.Random()
+        self.reload_seconds = reload_seconds
+        self._clock = clock
+        self._index: Dict[Tuple[str, Optional[str]], List[CompiledRule]] = {}
+        self._version: Optional[int] = None
+        self._next_check = 0.0
+        self._stats = {"decisions": 0, "fired": 0, "reloads": 0, "reload_errors": 0}
+        if self._static:
+            self._index = compile_triggers(config)
+
+    def _refresh(self) -> None:
+        now = self._clock()
+        if self._static or now < self._next_check:
+            return
+        self._next_check = now + self.reload_seconds
+
+        from games.config import ConfigLoadError, config_loader
+        version = config_loader.mtime(TRIGGERS_FILE)
+        if version == self._version:
+            return
+        try:
+            self._index = compile_triggers(config_loader.load_triggers(strict=True))
+        except (TriggerConfigError, ConfigLoadError) as e:
+            # Keep serving the last good rule set
+            self._stats["reload_errors"] += 1
+            logger.error(f"Invalid {TRIGGERS_FILE}, keeping previous rules: {e}")
+        else:
+            if self._version is not None:
+                self._stats["reloads"] += 1
+                logger.info(f"Recompiled {TRIGGERS_FILE} ({len(self._index)} rule groups)")
+        self._version = version
+
+    def rules(self, trigger: str, key: Optional[str] = None) -> List[CompiledRule]:
+        self._refresh()
+        return self._index.get((trigger, key), [])
+
+    def matching(self, trigger: str, facts: Facts, key: Optional[str] = None) -> List[CompiledRule]:
+        """Rules whose conditions hold for the facts (ignoring probabilities)"""
+        return [rule for rule in self.rules(trigger, key) if rule.predicate(facts)]
+
+    def decide(self, trigger: str, facts: Facts, key: Optional[str] = None) -> Optional[str]:
+        """
+        Game to start for one event: the first matching rule (by priority,
+        then file order) that passes its probability roll, or None.
+        """
+        self._refresh()
+        self._stats["decisions"] += 1
+        roll = self._rng.random
+        for rule in self._index.get((trigger, key), ()):
+            if rule.predicate(facts) and (rule.probability >= 1.0 or roll() < rule.probability):
+                self._stats["fired"] += 1
+                return rule.game
+        return None
+
+    def decide_batch(self, events: Iterable[Tuple[str, Optional[str], Facts]]) -> List[Optional[str]]:
+        """decide() for many (trigger, key, facts) events, e.g. one per user"""
+        self._refresh()
+        index, roll = self._index, self._rng.random
+        decisions: List[Optional[str]] = []
+        append = decisions.append
+        fired = 0
+        for trigger, key, facts in events:
+            game = None
+            for rule in index.get((trigger, key), ()):
+                if rule.predicate(facts) and (rule.probability >= 1.0 or roll() < rule.probability):
+                    game = rule.game
+                    fired += 1
+                    break
+            append(game)
+        self._stats["decisions"] += len(decisions)
+        self._stats["fired"] += fired
+        return decisions
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self._stats, "rule_groups": len(self._index)}
+
+
+# Global engine (hot-reloads triggers.yaml)
+trigger_engine = TriggerEngine()
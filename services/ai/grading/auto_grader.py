@@ -9,6 +9,7 @@ from typing import Dict, Any, List, Optional
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 from llm_factory import LLMFactory
+from utils.service_container import services
 
 logger = logging.getLogger(__name__)
 
@@ -244,5 +245,5 @@ Output em JSON:
             }
 
 
-# Singleton
-auto_grader = AutoGrader()
+# Singleton (built on first use or by POST /warmup)
+auto_grader = services.lazy("auto_grader", AutoGrader)
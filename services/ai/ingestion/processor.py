@@ -8,6 +8,7 @@ import logging
 import re
 from typing import Dict, Any, Optional
 from io import BytesIO
+from utils.service_container import services
 
 logger = logging.getLogger(__name__)
 
@@ -198,5 +199,5 @@ class ContentProcessor:
                 "difficulty_level": "3"
             }
 
-# Singleton
-content_processor = ContentProcessor()
+# Singleton (built on first use or by POST /warmup)
+content_processor = services.lazy("content_processor", ContentProcessor)
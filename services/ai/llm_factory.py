@@ -1,13 +1,20 @@
 """
 LLM Factory - Multi-provider support with task-specific optimization
 Supports OpenAI, Anthropic, and Google Gemini with cost-optimized selection
+
+Provider SDKs are imported when a model is first built, not at import time
+(they dominate the service's cold start).
 """
+from __future__ import annotations
+
 import os
-from typing import Optional, Literal
+from typing import TYPE_CHECKING, Optional, Literal
 from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI, AzureChatOpenAI
-from langchain_anthropic import ChatAnthropic
-from langchain_google_genai import ChatGoogleGenerativeAI
+
+if TYPE_CHECKING:
+    from langchain_anthropic import ChatAnthropic
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    from langchain_openai import AzureChatOpenAI, ChatOpenAI
 
 # Provider tiers for cost optimization
 TIER_PREMIUM = 'premium'  # GPT-4 ($10/1M tokens)
@@ -70,6 +77,7 @@ class LLMFactory:
         """Get OpenAI LLM"""
         if not self.openai_key:
             raise ValueError("OPENAI_API_KEY not set in environment")
+        from langchain_openai import ChatOpenAI
         
         return ChatOpenAI(
             model=model or self.openai_model,
@@ -85,6 +93,7 @@ class LLMFactory:
         """Get Azure OpenAI LLM"""
         if not self.azure_endpoint or not self.azure_key:
             raise ValueError("Azure OpenAI credentials not set")
+        from langchain_openai import AzureChatOpenAI
         
         return AzureChatOpenAI(
             azure_endpoint=self.azure_endpoint,
@@ -102,6 +111,7 @@ class LLMFactory:
         """Get Anthropic LLM"""
         if not self.anthropic_key:
             raise ValueError("ANTHROPIC_API_KEY not set")
+        from langchain_anthropic import ChatAnthropic
         
         return ChatAnthropic(
             model=model,
@@ -119,6 +129,7 @@ class LLMFactory:
         """Get Google Gemini LLM"""
         if not self.google_key:
             raise ValueError("GOOGLE_API_KEY not set")
+        from langchain_google_genai import ChatGoogleGenerativeAI
             
         return ChatGoogleGenerativeAI(
             model=model,
@@ -177,11 +188,7 @@ class LLMFactory:
         if self.google_key:
             return self.get_google_llm(model="gemini-1.5-flash", temperature=temperature)
         elif self.openai_key:
-            return ChatOpenAI(
-                model="gpt-4o-mini",  # Cheap and fast
-                temperature=temperature if temperature is not None else self.default_temperature,
-                api_key=self.openai_key
-            )
+            return self.get_openai_llm(model="gpt-4o-mini", temperature=temperature)  # Cheap and fast
         
         # Fallback logic - Strict check
         allow_mock = os.getenv("ALLOW_MOCK_LLM", "false").lower() == "true"
@@ -199,11 +206,7 @@ class LLMFactory:
         Use for: evaluation, analysis, difficult tasks
         """
         if self.openai_key:
-            return ChatOpenAI(
-                model="gpt-4o",  # Smarter but more expensive
-                temperature=temperature if temperature is not None else self.default_temperature,
-                api_key=self.openai_key
-            )
+            return self.get_openai_llm(model="gpt-4o", temperature=temperature)  # Smarter but more expensive
         elif self.anthropic_key:
             return self.get_anthropic_llm(model="claude-3-5-sonnet-20241022", temperature=temperature)
         
@@ -4,41 +4,20 @@ Used by educator phase handlers to get relevant past insights.
 """
 import logging
 from typing import List, Dict, Any, Optional
-from langchain_redis import RedisVectorStore
-from langchain_openai.embeddings import OpenAIEmbeddings
+from memory_store import vector_store_registry
+from memory_store.base import VectorStoreBackend
+from utils.tracing import traced
 import os
 
 logger = logging.getLogger(__name__)
 
-# Lazy globals (initialized on first use)
-_embeddings: Optional[OpenAIEmbeddings] = None
-_vector_stores: Dict[str, RedisVectorStore] = {}  # Cache per tenant
 
-
-def _get_embeddings() -> OpenAIEmbeddings:
-    """Get or create embeddings model (lazy, singleton)"""
-    global _embeddings
-    if _embeddings is None:
-        # Same as cache_config and memory_handler for consistency
-        _embeddings = OpenAIEmbeddings(model="text-embedding-3-small")
-    return _embeddings
-
-
-def _get_vector_store(tenant_id: str) -> RedisVectorStore:
-    """Get or create vector store for tenant (lazy, cached)"""
-    global _vector_stores
-    
-    if tenant_id not in _vector_stores:
-        redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-        _vector_stores[tenant_id] = RedisVectorStore(
-            redis_url=redis_url,
-            index_name=f"mem:index:{tenant_id}",
-            embedding=_get_embeddings(),
-        )
-    
-    return _vector_stores[tenant_id]
+def _get_vector_store(tenant_id: str) -> VectorStoreBackend:
+    """Get backend serving tenant (NumPy for small tenants, Redis otherwise)"""
+    return vector_store_registry.get_store(tenant_id)
 
 
+@traced("memory.retrieve")
 def retrieve_memories(
     tenant_id: str,
     query: str,
@@ -71,17 +50,16 @@ def retrieve_memories(
     try:
         vs = _get_vector_store(tenant_id)
         
-        # Perform semantic search
-        # Note: filter_kind requires metadata filtering - may need custom implementation
-        docs = vs.similarity_search_with_score(query=query, k=top_k)
+        # Perform semantic search (backend applies the kind filter)
+        docs = vs.similarity_search_with_score(
+            query=query,
+            k=top_k,
+            filter={"kind": filter_kind} if filter_kind else None
+        )
         
         # Format results
         memories = []
         for doc, score in docs:
-            # Filter by kind if specified (client-side for now)
-            if filter_kind and doc.metadata.get('kind') != filter_kind:
-                continue
-            
             memories.append({
                 "text": doc.page_content,
                 "meta": doc.metadata,
@@ -225,5 +203,6 @@ def clear_tenant_memories(tenant_id: str) -> int:
         if cursor == 0:
             break
     
+    deleted += vector_store_registry.purge_local(tenant_id)
     logger.warning(f"Cleared {deleted} memory keys for tenant {tenant_id}")
     return deleted
@@ -0,0 +1,11 @@
+"""Pluggable vector store backends for pedagogical memories"""
+from .base import VectorStoreBackend
+from .numpy_store import NumpyVectorStore
+from .registry import VectorStoreRegistry, vector_store_registry
+
+__all__ = [
+    'VectorStoreBackend',
+    'NumpyVectorStore',
+    'VectorStoreRegistry',
+    'vector_store_registry',
+]
@@ -0,0 +1,75 @@
+"""
+Vector Store Backend Interface
+
+Common contract for pedagogical memory storage.
+memory_retrieval and memory_handler talk to this interface only, so the
+concrete backend (in-process NumPy or Redis) can be chosen per tenant.
+"""
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.documents import Document
+
+
+class VectorStoreBackend(ABC):
+    """
+    Abstract vector store backend.
+
+    Scores returned by similarity_search_with_score are cosine
+    similarities (higher is better), regardless of backend.
+    """
+
+    # Short backend name for logs/metrics ("numpy" | "redis")
+    name: str = "base"
+
+    @abstractmethod
+    def add_texts(
+        self,
+        texts: List[str],
+        metadatas: Optional[List[Dict[str, Any]]] = None
+    ) -> int:
+        """
+        Embed and store texts.
+
+        Returns:
+            Number of texts stored
+        """
+
+    @abstractmethod
+    def similarity_search_with_score(
+        self,
+        query: str,
+        k: int = 6,
+        filter: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[Document, float]]:
+        """
+        Top-k semantic search.
+
+        Args:
+            query: Search query
+            k: Number of results
+            filter: Optional metadata equality filter (e.g. {"kind": "blocker"})
+
+        Returns:
+            List of (Document, similarity) sorted by similarity desc
+        """
+
+    @abstractmethod
+    def count(self) -> int:
+        """Number of stored documents (best effort for remote backends)"""
+
+    def all_documents(self) -> List[Document]:
+        """
+        Return every stored document (used when promoting a tenant
+        to another backend). Remote backends may not support it.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support full export"
+        )
+
+
+def matches_filter(metadata: Dict[str, Any], filter: Optional[Dict[str, Any]]) -> bool:
+    """Check metadata against an equality filter"""
+    if not filter:
+        return True
+    return all(metadata.get(key) == value for key, value in filter.items())
@@ -0,0 +1,274 @@
+"""
+In-process NumPy Vector Store
+
+For small tenants (a few hundred/thousand memories) a network hop to Redis
+costs more than the search itself. This backend keeps all embeddings in one
+contiguous float32 matrix (rows L2-normalized) and scores a query with a
+single matrix-vector product.
+
+Persistence: snapshots to disk as vectors.npy + docs.json + manifest.json.
+Snapshots are loaded with np.load(mmap_mode="r"), so readers share pages
+with the OS cache and reload cheaply when the writer publishes a new one.
+"""
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from langchain_core.documents import Document
+
+from .base import VectorStoreBackend, matches_filter
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+VECTORS_FILE = "vectors.npy"
+DOCS_FILE = "docs.json"
+MANIFEST_FILE = "manifest.json"
+
+
+class NumpyVectorStore(VectorStoreBackend):
+    """
+    Contiguous float32 matrix + batched cosine scoring.
+
+    Thread-safe for one writer (RabbitMQ consumer thread) and many readers.
+    """
+
+    name = "numpy"
+
+    INITIAL_CAPACITY = 64
+
+    def __init__(self, embedding, snapshot_dir: Optional[Path] = None):
+        """
+        Args:
+            embedding: LangChain Embeddings (embed_query / embed_documents)
+            snapshot_dir: Directory for disk snapshots (None = memory only)
+        """
+        self.embedding = embedding
+        self.snapshot_dir = Path(snapshot_dir) if snapshot_dir else None
+        self._lock = threading.RLock()
+        self._matrix: Optional[np.ndarray] = None  # (capacity, dim) float32
+        self._size = 0
+        self._texts: List[str] = []
+        self._metadatas: List[Dict[str, Any]] = []
+        self._snapshot_mtime: Optional[float] = None
+
+        if self.snapshot_dir:
+            self._load_snapshot()
+
+    # ------------------------------------------------------------------
+    # Write path
+    # ------------------------------------------------------------------
+
+    def add_texts(
+        self,
+        texts: List[str],
+        metadatas: Optional[List[Dict[str, Any]]] = None
+    ) -> int:
+        if not texts:
+            return 0
+
+        metadatas = metadatas or [{} for _ in texts]
+        vectors = self._normalize(
+            np.asarray(self.embedding.embed_documents(list(texts)), dtype=np.float32)
+        )
+
+        with self._lock:
+            self._append(vectors)
+            self._texts.extend(texts)
+            self._metadatas.extend(dict(m) for m in metadatas)
+
+            if self.snapshot_dir:
+                self.snapshot()
+
+        logger.debug(f"NumpyVectorStore: added {len(texts)} docs (total={self._size})")
+        return len(texts)
+
+    def _append(self, vectors: np.ndarray) -> None:
+        """Append normalized rows, growing the matrix geometrically"""
+        n_new, dim = vectors.shape
+        needed = self._size + n_new
+
+        if self._matrix is None:
+            capacity = max(self.INITIAL_CAPACITY, needed)
+            self._matrix = np.zeros((capacity, dim), dtype=np.float32)
+        elif self._matrix.shape[1] != dim:
+            raise ValueError(
+                f"Embedding dimension mismatch: store={self._matrix.shape[1]}, new={dim}"
+            )
+        elif needed > self._matrix.shape[0] or not self._matrix.flags.writeable:
+            # Grow (or detach from a read-only memory map) with one copy
+            capacity = max(needed, self._matrix.shape[0] * 2)
+            grown = np.zeros((capacity, dim), dtype=np.float32)
+            grown[:self._size] = self._matrix[:self._size]
+            self._matrix = grown
+
+        self._matrix[self._size:needed] = vectors
+        self._size = needed
+
+    # ------------------------------------------------------------------
+    # Read path
+    # ------------------------------------------------------------------
+
+    def similarity_search_with_score(
+        self,
+        query: str,
+        k: int = 6,
+        filter: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[Document, float]]:
+        self.refresh_if_stale()
+
+        with self._lock:
+            n = self._size
+            if n == 0 or k <= 0:
+                return []
+            matrix = self._matrix[:n]
+            texts = self._texts
+            metadatas = self._metadatas
+
+        q = self._normalize(
+            np.asarray(self.embedding.embed_query(query), dtype=np.float32)[None, :]
+        )[0]
+
+        # One batched mat-vec for all rows (cosine, rows are unit-norm)
+        scores = matrix @ q
+
+        if filter:
+            mask = np.fromiter(
+                (matches_filter(m, filter) for m in metadatas[:n]),
+                dtype=bool,
+                count=n
+            )
+            scores = np.where(mask, scores, -np.inf)
+            k = min(k, int(mask.sum()))
+            if k == 0:
+                return []
+
+        k = min(k, n)
+        if k < n:
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(n)
+        top = top[np.argsort(-scores[top], kind="stable")]
+
+        return [
+            (Document(page_content=texts[i], metadata=dict(metadatas[i])), float(scores[i]))
+            for i in top
+        ]
+
+    def count(self) -> int:
+        return self._size
+
+    def all_documents(self) -> List[Document]:
+        with self._lock:
+            return [
+                Document(page_content=t, metadata=dict(m))
+                for t, m in zip(self._texts, self._metadatas)
+            ]
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> None:
+        """
+        Persist current state atomically.
+        Manifest is written last, so readers never see a half-written snapshot.
+        """
+        if not self.snapshot_dir:
+            return
+
+        with self._lock:
+            self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+            if self._matrix is not None:
+                dim = self._matrix.shape[1]
+                vectors = np.ascontiguousarray(self._matrix[:self._size])
+            else:
+                dim = 0
+                vectors = np.zeros((0, 0), dtype=np.float32)
+
+            self._atomic_write(VECTORS_FILE, lambda f: np.save(f, vectors))
+            self._atomic_write(
+                DOCS_FILE,
+                lambda f: f.write(json.dumps(
+                    {"texts": self._texts, "metadatas": self._metadatas},
+                    ensure_ascii=False
+                ).encode("utf-8"))
+            )
+            self._atomic_write(
+                MANIFEST_FILE,
+                lambda f: f.write(json.dumps({
+                    "version": SNAPSHOT_VERSION,
+                    "count": self._size,
+                    "dim": dim,
+                }).encode("utf-8"))
+            )
+            self._snapshot_mtime = self._manifest_mtime()
+
+    def refresh_if_stale(self) -> bool:
+        """
+        Reload from disk if another process published a newer snapshot.
+
+        Returns:
+            True if reloaded
+        """
+        if not self.snapshot_dir:
+            return False
+        mtime = self._manifest_mtime()
+        if mtime is None or mtime == self._snapshot_mtime:
+            return False
+        self._load_snapshot()
+        return True
+
+    def _load_snapshot(self) -> None:
+        manifest_path = self.snapshot_dir / MANIFEST_FILE
+        if not manifest_path.exists():
+            return
+
+        try:
+            with self._lock:
+                mtime = self._manifest_mtime()
+                manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+                if manifest.get("version") != SNAPSHOT_VERSION:
+                    logger.warning(f"Unsupported snapshot version in {self.snapshot_dir}")
+                    return
+
+                docs = json.loads((self.snapshot_dir / DOCS_FILE).read_text(encoding="utf-8"))
+                count = int(manifest.get("count", 0))
+
+                if count:
+                    # Read-only memory map; first write copies into RAM
+                    self._matrix = np.load(self.snapshot_dir / VECTORS_FILE, mmap_mode="r")
+                else:
+                    self._matrix = None
+
+                self._size = count
+                self._texts = docs["texts"][:count]
+                self._metadatas = docs["metadatas"][:count]
+                self._snapshot_mtime = mtime
+
+            logger.debug(f"Loaded vector snapshot {self.snapshot_dir} ({count} docs)")
+        except Exception as e:
+            logger.warning(f"Failed to load vector snapshot {self.snapshot_dir}: {e}")
+
+    def _atomic_write(self, filename: str, writer) -> None:
+        path = self.snapshot_dir / filename
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp, "wb") as f:
+            writer(f)
+        os.replace(tmp, path)
+
+    def _manifest_mtime(self) -> Optional[float]:
+        try:
+            return os.stat(self.snapshot_dir / MANIFEST_FILE).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (vectors / norms).astype(np.float32, copy=False)
@@ -0,0 +1,79 @@
+"""
+Redis Vector Store Backend
+
+Thin adapter over langchain_redis.RedisVectorStore for large tenants.
+langchain_redis is imported lazily so the rest of the service (and tests)
+work without it installed.
+"""
+import logging
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.documents import Document
+
+from .base import VectorStoreBackend, matches_filter
+
+logger = logging.getLogger(__name__)
+
+# Index schema shared by writer (memory_handler) and reader (memory_retrieval)
+METADATA_SCHEMA = [
+    {"name": "tenant_id", "type": "tag"},
+    {"name": "user_id", "type": "tag"},
+    {"name": "content_id", "type": "tag"},
+    {"name": "kind", "type": "tag"},  # blocker|intervention|vocab
+    {"name": "timestamp", "type": "numeric"},
+]
+
+
+class RedisVectorStoreBackend(VectorStoreBackend):
+    """One RediSearch index per tenant: mem:index:{tenant_id}"""
+
+    name = "redis"
+
+    def __init__(self, tenant_id: str, embedding, redis_url: Optional[str] = None):
+        from langchain_redis import RedisVectorStore
+
+        self.tenant_id = tenant_id
+        self.index_name = f"mem:index:{tenant_id}"
+        self._store = RedisVectorStore(
+            redis_url=redis_url or os.getenv("REDIS_URL", "redis://localhost:6379/0"),
+            index_name=self.index_name,
+            embedding=embedding,
+            content_key="text",
+            metadata_schema=METADATA_SCHEMA,
+        )
+
+    def add_texts(
+        self,
+        texts: List[str],
+        metadatas: Optional[List[Dict[str, Any]]] = None
+    ) -> int:
+        if not texts:
+            return 0
+        self._store.add_texts(texts=texts, metadatas=metadatas)
+        return len(texts)
+
+    def similarity_search_with_score(
+        self,
+        query: str,
+        k: int = 6,
+        filter: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[Document, float]]:
+        docs = self._store.similarity_search_with_score(query=query, k=k)
+
+        results = []
+        for doc, distance in docs:
+            # Metadata filtering is client-side (tag filter syntax varies by version)
+            if not matches_filter(doc.metadata, filter):
+                continue
+            # RediSearch returns cosine distance; normalize to similarity
+            results.append((doc, 1.0 - float(distance)))
+        return results
+
+    def count(self) -> int:
+        try:
+            info = self._store.index.info()
+            return int(info.get("num_docs", 0))
+        except Exception as e:
+            logger.debug(f"Could not read index size for {self.index_name}: {e}")
+            return 0
@@ -0,0 +1,172 @@
+"""
+Vector Store Registry - per-tenant backend selection
+
+Small tenants are served by the in-process NumpyVectorStore (snapshotted
+under MEMORY_STORE_DIR); once a tenant grows past LOCAL_VECTOR_STORE_MAX_DOCS
+it is promoted to Redis and its local snapshot is retired.
+
+Usage:
+    from memory_store import vector_store_registry
+
+    vector_store_registry.add_texts(tenant_id, texts, metadatas)
+    store = vector_store_registry.get_store(tenant_id)
+    docs = store.similarity_search_with_score("blocker", k=6)
+
+Env:
+    VECTOR_STORE_BACKEND: auto | numpy | redis (default: auto)
+    LOCAL_VECTOR_STORE_MAX_DOCS: size threshold for auto mode (default: 2000)
+    MEMORY_STORE_DIR: snapshot root (default: data/memory_store)
+"""
+import logging
+import os
+import re
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .base import VectorStoreBackend
+from .numpy_store import NumpyVectorStore
+
+logger = logging.getLogger(__name__)
+
+PROMOTED_MARKER = "PROMOTED"
+
+
+def _default_remote_factory(tenant_id: str, embedding) -> VectorStoreBackend:
+    from .redis_store import RedisVectorStoreBackend
+    return RedisVectorStoreBackend(tenant_id, embedding)
+
+
+class VectorStoreRegistry:
+    """Caches one backend per tenant and routes by size threshold"""
+
+    def __init__(
+        self,
+        embedding=None,
+        mode: Optional[str] = None,
+        max_local_docs: Optional[int] = None,
+        root_dir: Optional[Path] = None,
+        remote_factory: Optional[Callable[[str, Any], VectorStoreBackend]] = None,
+    ):
+        self._embedding = embedding
+        self.mode = (mode or os.getenv("VECTOR_STORE_BACKEND", "auto")).lower()
+        self.max_local_docs = (
+            max_local_docs if max_local_docs is not None
+            else int(os.getenv("LOCAL_VECTOR_STORE_MAX_DOCS", "2000"))
+        )
+        self.root_dir = Path(root_dir or os.getenv("MEMORY_STORE_DIR", "data/memory_store"))
+        self._remote_factory = remote_factory or _default_remote_factory
+        self._stores: Dict[str, VectorStoreBackend] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def embedding(self):
+        """Shared embeddings model (lazy, same model as semantic cache)"""
+        if self._embedding is None:
+            from langchain_openai.embeddings import OpenAIEmbeddings
+            self._embedding = OpenAIEmbeddings(model="text-embedding-3-small")
+        return self._embedding
+
+    def get_store(self, tenant_id: str) -> VectorStoreBackend:
+        """Get (or create) the backend currently serving this tenant"""
+        store = self._stores.get(tenant_id)
+        if store is not None:
+            # Another process (the memory consumer) may have promoted the tenant
+            if store.name == "numpy" and self._is_promoted(tenant_id):
+                with self._lock:
+                    self._stores.pop(tenant_id, None)
+                return self.get_store(tenant_id)
+            return store
+
+        with self._lock:
+            store = self._stores.get(tenant_id)
+            if store is None:
+                store = self._create_store(tenant_id)
+                self._stores[tenant_id] = store
+                logger.info(f"Vector store for tenant {tenant_id}: {store.name}")
+        return store
+
+    def add_texts(
+        self,
+        tenant_id: str,
+        texts: List[str],
+        metadatas: Optional[List[Dict[str, Any]]] = None
+    ) -> int:
+        """
+        Store texts for tenant, promoting to Redis when the local store
+        would exceed the size threshold.
+        """
+        store = self.get_store(tenant_id)
+
+        if (
+            self.mode == "auto"
+            and store.name == "numpy"
+            and store.count() + len(texts) > self.max_local_docs
+        ):
+            store = self._promote(tenant_id, store)
+
+        return store.add_texts(texts, metadatas)
+
+    def backend_for(self, tenant_id: str) -> str:
+        """Backend name serving tenant (for logs/metrics)"""
+        return self.get_store(tenant_id).name
+
+    def clear(self, tenant_id: Optional[str] = None) -> None:
+        """Drop cached backends (tests / config reloads)"""
+        with self._lock:
+            if tenant_id is None:
+                self._stores.clear()
+            else:
+                self._stores.pop(tenant_id, None)
+
+    def purge_local(self, tenant_id: str) -> int:
+        """
+        Delete tenant's local snapshot (GDPR / admin clears).
+
+        Returns:
+            Number of local documents removed
+        """
+        with self._lock:
+            store = self._stores.pop(tenant_id, None)
+        removed = store.count() if store is not None and store.name == "numpy" else 0
+        shutil.rmtree(self._tenant_dir(tenant_id), ignore_errors=True)
+        return removed
+
+    # ------------------------------------------------------------------
+
+    def _create_store(self, tenant_id: str) -> VectorStoreBackend:
+        if self.mode == "redis" or (self.mode == "auto" and self._is_promoted(tenant_id)):
+            return self._remote_factory(tenant_id, self.embedding)
+        return NumpyVectorStore(self.embedding, snapshot_dir=self._tenant_dir(tenant_id))
+
+    def _promote(self, tenant_id: str, local: VectorStoreBackend) -> VectorStoreBackend:
+        logger.info(
+            f"Promoting tenant {tenant_id} to remote vector store "
+            f"({local.count()} docs > threshold {self.max_local_docs})"
+        )
+        remote = self._remote_factory(tenant_id, self.embedding)
+
+        docs = local.all_documents()
+        if docs:
+            remote.add_texts([d.page_content for d in docs], [d.metadata for d in docs])
+
+        tenant_dir = self._tenant_dir(tenant_id)
+        shutil.rmtree(tenant_dir, ignore_errors=True)
+        tenant_dir.mkdir(parents=True, exist_ok=True)
+        (tenant_dir / PROMOTED_MARKER).write_text(remote.name, encoding="utf-8")
+
+        with self._lock:
+            self._stores[tenant_id] = remote
+        return remote
+
+    def _is_promoted(self, tenant_id: str) -> bool:
+        return (self._tenant_dir(tenant_id) / PROMOTED_MARKER).exists()
+
+    def _tenant_dir(self, tenant_id: str) -> Path:
+        safe = re.sub(r"[^A-Za-z0-9_.-]", "_", tenant_id)
+        return self.root_dir / safe
+
+
+# Global registry
+vector_store_registry = VectorStoreRegistry()
@@ -2,6 +2,7 @@
 AI Service Metrics Tracker
 Collects and exposes metrics for monitoring AI optimization impact
 """
+import bisect
 import time
 import logging
 from typing import Dict, Any, Optional
@@ -21,6 +22,10 @@ _metrics = {
     'response_times': [],
     'memory_jobs_processed': 0,
     'memory_jobs_failed': 0,
+    'checkpoint_turns': 0,
+    'checkpoint_writes': 0,
+    'checkpoint_bytes_written': 0,
+    'game_rounds_failed': {},
     'last_reset': time.time(),
 }
 
@@ -130,6 +135,95 @@ def track_memory_job_failure():
             logger.debug(f"Failed to persist memory job failure: {e}")
 
 
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram (ms).
+    
+    Constant memory per series, so it can sit on every hot path.
+    Percentiles are estimated from bucket upper bounds.
+    """
+    
+    BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+    
+    def __init__(self, buckets: Optional[tuple] = None):
+        self.buckets = tuple(buckets or self.BUCKETS_MS)
+        self.counts = [0] * (len(self.buckets) + 1)  # last = +Inf
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+    
+    def observe(self, duration_ms: float):
+        """Record one observation"""
+        self.counts[bisect.bisect_left(self.buckets, duration_ms)] += 1
+        self.count += 1
+        self.sum_ms += duration_ms
+        if duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+    
+    def percentile(self, q: float) -> float:
+        """Estimate the q-th percentile (0-100) as a bucket upper bound"""
+        if self.count == 0:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= rank:
+                return float(self.buckets[i]) if i < len(self.buckets) else self.max_ms
+        return self.max_ms
+    
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'avg_ms': round(self.sum_ms / self.count, 2) if self.count else 0,
+            'p50_ms': self.percentile(50),
+            'p95_ms': self.percentile(95),
+            'p99_ms': self.percentile(99),
+            'max_ms': round(self.max_ms, 2),
+            'buckets': {
+                **{f'le_{b}': c for b, c in zip(self.buckets, self.counts)},
+                'le_inf': self.counts[-1],
+            },
+        }
+
+
+# Named latency series, e.g. "nestjs.session"
+_latency_histograms: Dict[str, LatencyHistogram] = {}
+
+
+def observe_latency(name: str, duration_ms: float):
+    """Record a latency sample for a named series (in-memory only)"""
+    hist = _latency_histograms.get(name)
+    if hist is None:
+        hist = _latency_histograms[name] = LatencyHistogram()
+    hist.observe(duration_ms)
+
+
+def get_latency_histograms() -> Dict[str, Dict[str, Any]]:
+    """Snapshot of all latency series"""
+    return {name: hist.snapshot() for name, hist in sorted(_latency_histograms.items())}
+
+
+def track_checkpoint_write(bytes_written: int, new_turn: bool = False):
+    """
+    Track bytes sent to the LangGraph checkpointer.
+    In-memory only: a Redis round trip per checkpoint would defeat the purpose.
+    """
+    _metrics['checkpoint_writes'] += 1
+    _metrics['checkpoint_bytes_written'] += bytes_written
+    if new_turn:
+        _metrics['checkpoint_turns'] += 1
+
+
+def track_game_failure(game_mode: str):
+    """
+    Track a failed game round, per mode.
+    In-memory only: called from the game pipeline on the event loop.
+    """
+    failed = _metrics['game_rounds_failed']
+    failed[game_mode] = failed.get(game_mode, 0) + 1
+
+
 def get_metrics() -> Dict[str, Any]:
     """
     Get current metrics snapshot
@@ -183,6 +277,20 @@ def get_metrics() -> Dict[str, Any]:
             'max_response_time_ms': round(max(_metrics['response_times']), 2) if _metrics['response_times'] else 0,
             'samples': len(_metrics['response_times']),
         },
+        'checkpoints': {
+            'turns': _metrics['checkpoint_turns'],
+            'writes': _metrics['checkpoint_writes'],
+            'bytes_written': _metrics['checkpoint_bytes_written'],
+            'avg_bytes_per_turn': round(
+                _metrics['checkpoint_bytes_written'] / max(1, _metrics['checkpoint_turns']),
+                2
+            ),
+        },
+        'games': {
+            'rounds_failed': sum(_metrics['game_rounds_failed'].values()),
+            'rounds_failed_by_mode': dict(_metrics['game_rounds_failed']),
+        },
+        'latency': get_latency_histograms(),
         'system': {
             'uptime_seconds': round(uptime_seconds),
             'uptime_hours': round(uptime_seconds / 3600, 2),
@@ -275,8 +383,13 @@ def reset_metrics():
         'response_times': [],
         'memory_jobs_processed': 0,
         'memory_jobs_failed': 0,
+        'checkpoint_turns': 0,
+        'checkpoint_writes': 0,
+        'checkpoint_bytes_written': 0,
+        'game_rounds_failed': {},
         'last_reset': time.time(),
     }
+    _latency_histograms.clear()
     logger.info("Metrics reset")
 
 
@@ -3,6 +3,7 @@ from typing import Dict, List, Any
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 from llm_factory import LLMFactory
+from utils.service_container import services
 
 logger = logging.getLogger(__name__)
 
@@ -76,5 +77,5 @@ class ContentRecommender:
                 "recommendations": []
             }
 
-# Singleton
-recommender = ContentRecommender()
+# Singleton (built on first use or by POST /warmup)
+recommender = services.lazy("recommender", ContentRecommender)
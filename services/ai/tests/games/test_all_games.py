@@ -257,7 +257,7 @@ class TestClozeSprint:
         
         game = CloseSprintGame(llm_service=mock_llm)
         round_data = game.create_round({}, 1)
-        result = await game.evaluate_answer(round_data, "1. fotossíntese 2. alimento")
+        result = await game.evaluate_answer(round_data, "1. fotossíntese 2. nutriente")
         
         assert result['score'] == 102  # 85 * 1.2
         assert result['breakdown']['semantic_match'] == True
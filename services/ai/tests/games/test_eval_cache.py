@@ -0,0 +1,154 @@
+"""
+Tests for the evaluation result cache
+"""
+import asyncio
+import os
+
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from games.eval_cache import EvaluationCache, normalize_answer, round_fingerprint
+from games.modes.cloze_sprint import CloseSprintGame
+from games.modes.free_recall import FreeRecallGame
+
+RULES = {
+    "evaluation_cache": {
+        "default": {"enabled": False, "ttl_seconds": 60},
+        "modes": {"CLOZE_SPRINT": {"enabled": True}},
+    }
+}
+
+LLM_RESULT = {"score": 90, "feedback": "Sinônimo aceito", "blank_scores": [100, 80], "semantic_match": True}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def cloze_game(side_effect=None):
+    mock_llm = Mock()
+    mock_llm.predict_json = AsyncMock(return_value=LLM_RESULT, side_effect=side_effect)
+    return CloseSprintGame(llm_service=mock_llm)
+
+
+def test_normalized_answers_match():
+    assert normalize_answer("Fotossíntese,  alimento!") == normalize_answer("fotossíntese alimento")
+    assert normalize_answer("fotossíntese") != normalize_answer("fotossintese")
+
+
+def test_fingerprint_ignores_player_fields():
+    round_data = {"game_mode": "CLOZE_SPRINT", "data": {"sentence": "x"}, "user_id": "u1", "prompt": "Olá Ana"}
+
+    assert round_fingerprint(round_data) == round_fingerprint({**round_data, "user_id": "u2", "prompt": "Olá Bia"})
+    assert round_fingerprint(round_data) != round_fingerprint({**round_data, "data": {"sentence": "y"}})
+
+
+@pytest.mark.asyncio
+async def test_identical_answers_are_evaluated_once():
+    cache = EvaluationCache(rules=RULES)
+    game = cloze_game()
+    round_data = game.create_round({}, 1)
+
+    first = await cache.evaluate(game, round_data, "fotossíntese, comida")
+    second = await cache.evaluate(game, {**round_data, "user_id": "u2"}, "Fotossíntese comida.")
+
+    assert game.llm_service.predict_json.await_count == 1
+    assert second["score"] == first["score"] == 108
+    assert second["cached"] is True
+    assert "cached" not in first
+    assert cache.get_stats()["modes"]["CLOZE_SPRINT"]["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_class_submissions_share_one_evaluation():
+    cache = EvaluationCache(rules=RULES)
+    game = cloze_game()
+    round_data = game.create_round({}, 1)
+
+    results = await asyncio.gather(*[cache.evaluate(game, round_data, "fotossíntese, comida") for _ in range(30)])
+
+    assert game.llm_service.predict_json.await_count == 1
+    assert {r["score"] for r in results} == {108}
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_and_prompt_version_changes_the_key():
+    clock = FakeClock()
+    cache = EvaluationCache(rules=RULES, clock=clock)
+    game = cloze_game()
+    round_data = game.create_round({}, 1)
+
+    await cache.evaluate(game, round_data, "fotossíntese, comida")
+    clock.now = 61
+    await cache.evaluate(game, round_data, "fotossíntese, comida")
+    assert game.llm_service.predict_json.await_count == 2
+
+    game.EVAL_PROMPT_VERSION = 2
+    await cache.evaluate(game, round_data, "fotossíntese, comida")
+    assert game.llm_service.predict_json.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_llm_fallback_results_are_not_cached():
+    cache = EvaluationCache(rules=RULES)
+    game = cloze_game(side_effect=RuntimeError("timeout"))
+    round_data = game.create_round({}, 1)
+
+    await cache.evaluate(game, round_data, "fotossíntese, comida")
+    await cache.evaluate(game, round_data, "fotossíntese, comida")
+
+    assert game.llm_service.predict_json.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_opt_in_follows_scoring_rules_changes(game_config_dir):
+    path = game_config_dir / "scoring_rules.yaml"
+    path.write_text("evaluation_cache:\n  default:\n    enabled: false\n", encoding="utf-8")
+    cache = EvaluationCache()
+    game = cloze_game()
+    round_data = game.create_round({}, 1)
+
+    await cache.evaluate(game, round_data, "fotossíntese, comida")
+    path.write_text("evaluation_cache:\n  modes:\n    CLOZE_SPRINT:\n      enabled: true\n", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+    await cache.evaluate(game, round_data, "fotossíntese, comida")
+    hit = await cache.evaluate(game, round_data, "fotossíntese, comida")
+
+    assert hit["cached"] is True
+    assert game.llm_service.predict_json.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_modes_not_opted_in_always_evaluate():
+    cache = EvaluationCache(rules=RULES)
+    mock_llm = Mock()
+    mock_llm.predict_json = AsyncMock(return_value={"score": 80, "feedback": "ok", "accuracy": "alta"})
+    game = FreeRecallGame(llm_service=mock_llm)
+    round_data = game.create_round({}, 1)
+    answer = "Plantas usam luz e CO2 para produzir glicose."
+
+    await cache.evaluate(game, round_data, answer)
+    await cache.evaluate(game, round_data, answer)
+
+    assert mock_llm.predict_json.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_feedback_is_personalized_on_hits():
+    cache = EvaluationCache(rules=RULES)
+    game = cloze_game()
+    game.personalize_feedback = lambda result, round_data: {
+        **result, "feedback": f"{round_data.get('user_id')}: {result['feedback']}"
+    }
+    round_data = game.create_round({}, 1)
+
+    await cache.evaluate(game, {**round_data, "user_id": "ana"}, "fotossíntese, comida")
+    hit = await cache.evaluate(game, {**round_data, "user_id": "bia"}, "fotossíntese, comida")
+
+    assert hit["cached"] is True
+    assert hit["feedback"].startswith("bia: ")
@@ -0,0 +1,128 @@
+"""
+Tests for the heuristic-first evaluation cascade
+"""
+import os
+
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from games.evaluation import PolicyLoader, cascade_stats, heuristic_ratio, is_decisive, load_policy
+from games.modes.boss_fight import BossFightGame
+from games.modes.cloze_sprint import CloseSprintGame
+from games.modes.free_recall import FreeRecallGame
+
+RULES = {
+    "evaluation_cascade": {
+        "default": {"enabled": True, "reject_below": None, "accept_above": None},
+        "modes": {"CLOZE_SPRINT": {"accept_above": 1.0}},
+    }
+}
+
+
+def llm_returning(payload):
+    mock_llm = Mock()
+    mock_llm.predict_json = AsyncMock(return_value=payload)
+    return mock_llm
+
+
+@pytest.fixture(autouse=True)
+def reset_stats():
+    cascade_stats.reset()
+    yield
+    cascade_stats.reset()
+
+
+class TestPolicy:
+
+    def test_mode_override_merges_with_default(self):
+        assert load_policy("CLOZE_SPRINT", RULES) == {"enabled": True, "reject_below": None, "accept_above": 1.0}
+        assert load_policy("WHAT_IF_SCENARIO", RULES)["accept_above"] is None
+
+    def test_loader_follows_file_changes(self, game_config_dir):
+        path = game_config_dir / "scoring_rules.yaml"
+        path.write_text("evaluation_cascade:\n  default:\n    accept_above: 0.9\n", encoding="utf-8")
+        loader = PolicyLoader("evaluation_cascade", {"enabled": True, "accept_above": None})
+        assert loader.get("CLOZE_SPRINT")["accept_above"] == 0.9
+
+        path.write_text("evaluation_cascade:\n  default:\n    accept_above: 0.8\n", encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+        assert loader.get("CLOZE_SPRINT") == {"enabled": True, "accept_above": 0.8}
+
+    def test_band_edges_are_decisive(self):
+        policy = {"reject_below": 0.1, "accept_above": 0.9}
+
+        assert is_decisive(0.1, policy)
+        assert is_decisive(0.9, policy)
+        assert not is_decisive(0.5, policy)
+        assert not is_decisive(0.0, {"reject_below": None, "accept_above": None})
+
+    def test_ratio_is_clamped(self):
+        assert heuristic_ratio({"score": 250, "max_score": 200}) == 1.0
+        assert heuristic_ratio({"score": 5, "max_score": 0}) == 0.0
+
+
+class TestCascade:
+
+    @pytest.mark.asyncio
+    async def test_empty_recall_never_calls_llm(self):
+        game = FreeRecallGame(llm_service=llm_returning({"score": 90, "feedback": "?", "accuracy": "alta"}))
+        round_data = game.create_round({}, 1)
+
+        result = await game.evaluate_answer(round_data, "   ")
+
+        assert result["evaluation_path"] == "empty"
+        assert result["score"] == 0
+        game.llm_service.predict_json.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_clearly_wrong_answer_is_settled_by_heuristic(self):
+        game = BossFightGame(llm_service=llm_returning({"score": 90, "feedback": "?", "damage_to_boss": 50}))
+        round_data = game.create_round({}, 1)
+
+        result = await game.evaluate_answer(round_data, "não sei")
+
+        assert result["evaluation_path"] == "heuristic"
+        game.llm_service.predict_json.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_ambiguous_answer_escalates_and_records_agreement(self):
+        game = CloseSprintGame(llm_service=llm_returning({
+            "score": 90, "feedback": "Sinônimo aceito", "blank_scores": [100, 80], "semantic_match": True,
+        }))
+        round_data = game.create_round({}, 1)
+
+        result = await game.evaluate_answer(round_data, "fotossíntese, comida")
+
+        assert result["evaluation_path"] == "llm"
+        assert result["score"] == 108
+        stats = cascade_stats.get_stats()["modes"]["CLOZE_SPRINT"]
+        assert stats["llm"] == 1
+        assert stats["escalation_rate"] == 1.0
+        assert stats["agreement_rate"] == 0.0  # heuristic said wrong, LLM said right
+
+    @pytest.mark.asyncio
+    async def test_llm_failure_falls_back_to_heuristic(self):
+        mock_llm = Mock()
+        mock_llm.predict_json = AsyncMock(side_effect=RuntimeError("timeout"))
+        game = CloseSprintGame(llm_service=mock_llm)
+        round_data = game.create_round({}, 1)
+
+        result = await game.evaluate_answer(round_data, "fotossíntese, comida")
+
+        assert result["evaluation_path"] == "llm_fallback"
+        assert result["breakdown"]["method"] == "heuristic"
+        assert cascade_stats.get_stats()["llm_fallback"] == 1
+
+    @pytest.mark.asyncio
+    async def test_disabled_cascade_always_escalates(self):
+        game = CloseSprintGame(llm_service=llm_returning({
+            "score": 100, "feedback": "ok", "blank_scores": [100, 100], "semantic_match": True,
+        }))
+        game._cascade_policy = {"enabled": False, "reject_below": None, "accept_above": 1.0}
+        round_data = game.create_round({}, 1)
+
+        result = await game.evaluate_answer(round_data, "fotossíntese, alimento")
+
+        assert result["evaluation_path"] == "llm"
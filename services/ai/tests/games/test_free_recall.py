@@ -95,7 +95,7 @@ class TestFreeRecallGame:
             'score': 75, 'feedback': 'OK', 'accuracy': 'média'
         }
         
-        await game_with_llm.evaluate_answer(sample_round_data, "Test")
+        await game_with_llm.evaluate_answer(sample_round_data, "Plantas usam luz para produzir glicose.")
         
         call_args = game_with_llm.llm_service.predict_json.call_args
         temp = call_args.kwargs['temperature']
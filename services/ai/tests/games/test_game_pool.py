@@ -0,0 +1,122 @@
+"""
+Tests for the pooled game instances and the shared LLM service
+"""
+import json
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from games.llm_service import GameLLMService
+from games.pool import GameInstancePool
+from games.registry import game_registry
+
+# Keys the chat-chain games (duel, roleplay) read from the model output
+CHAT_GAME_FIELDS = {
+    "topic": "Energia solar deve substituir combustíveis fósseis?",
+    "side_a": "Sim", "side_b": "Não",
+    "score_a": 80, "score_b": 70, "winner": "A", "reasoning": "Mais evidências",
+    "feedback_a": "Bom", "feedback_b": "Bom",
+    "persona_name": "Dra. Clorofila", "persona_description": "Cientista",
+    "opening_line": "Olá!", "learning_objective": "Fotossíntese",
+    "score": 80, "character_response": "Interessante!", "is_concluded": False,
+    "feedback_meta": "ok",
+}
+
+
+def sample_for_schema(schema):
+    kind = schema.get("type")
+    if "enum" in schema:
+        return schema["enum"][-1]
+    if kind == "object":
+        return {k: sample_for_schema(v) for k, v in schema.get("properties", {}).items()}
+    if kind == "array":
+        return [sample_for_schema(schema.get("items", {"type": "string"}))]
+    if kind == "number":
+        return float(schema.get("maximum", 100)) * 0.8
+    if kind == "integer":
+        return int(schema.get("maximum", 3))
+    if kind == "boolean":
+        return True
+    return "resposta"
+
+
+class FakeModel:
+    """Chat model stand-in: answers the JSON Schema in the prompt, or CHAT_GAME_FIELDS"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, prompt):
+        self.calls += 1
+        text = prompt.to_string() if hasattr(prompt, "to_string") else str(prompt)
+        if "JSON Schema:\n" in text:
+            payload = sample_for_schema(json.loads(text.split("JSON Schema:\n", 1)[1]))
+        else:
+            payload = CHAT_GAME_FIELDS
+        return AIMessage(content=json.dumps(payload, ensure_ascii=False))
+
+
+@pytest.fixture
+def fake_model():
+    return FakeModel()
+
+
+@pytest.fixture
+def pool(fake_model):
+    runnable = RunnableLambda(fake_model)
+    return GameInstancePool(game_registry, GameLLMService(model_factory=lambda temperature: runnable))
+
+
+STATE = {
+    "content_slice": "A fotossíntese converte luz, água e CO2 em glicose e oxigênio.",
+    "target_words": ["clorofila", "glicose"],
+    "phase": "POST",
+    "learner_profile": {"language": "PT"},
+    "topic": "Fotossíntese",
+}
+ANSWER = "A planta usa luz e CO2 para produzir glicose e oxigênio."
+# Modes that only call the LLM for a particular answer shape
+ANSWERS = {
+    "PROBLEM_SOLVER": "B) Diminui, porque a planta deixa de liberar oxigênio.",
+    # Rounds are built from the content: names the target word but not the quote
+    "TOOL_WORD_HUNT": "Glicose indica o produto final do processo.",
+    # An exact answer to the content-built card would be accepted heuristically
+    "SRS_ARENA": "Um açúcar que a planta produz.",
+}
+
+
+class TestGameInstancePool:
+
+    def test_instances_are_shared_and_get_the_llm_service(self, pool):
+        game = pool.get("FREE_RECALL_SCORE")
+
+        assert pool.get("FREE_RECALL_SCORE") is game
+        assert game.llm_service is pool.llm_service
+        assert pool.loaded() == ["FREE_RECALL_SCORE"]
+
+        pool.llm_service = GameLLMService()
+        assert pool.get("FREE_RECALL_SCORE") is not game
+
+    @pytest.mark.asyncio
+    async def test_every_mode_evaluates_through_the_llm(self, pool, fake_model):
+        game_ids = [g["id"] for g in game_registry.list_games()]
+        assert len(game_ids) == game_registry.count() >= 17
+
+        for game_id in game_ids:
+            game = pool.get(game_id)
+            round_data = game.create_round(dict(STATE), difficulty=3)
+            calls_before = fake_model.calls
+
+            result = await game.evaluate_answer(round_data, ANSWERS.get(game_id, ANSWER))
+
+            assert fake_model.calls > calls_before, game_id
+            assert result["max_score"] > 0, game_id
+            assert result.get("breakdown", {}).get("method") != "heuristic", game_id
+
+    @pytest.mark.asyncio
+    async def test_predict_json_rejects_non_objects(self):
+        service = GameLLMService(model_factory=lambda t: RunnableLambda(lambda p: AIMessage(content="[1, 2]")))
+
+        with pytest.raises(ValueError):
+            await service.predict_json("?")
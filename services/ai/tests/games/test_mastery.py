@@ -1,8 +1,37 @@
 """
 Tests for Mastery Tracking System
 """
+import os
+import uuid
+
+import numpy as np
 import pytest
-from games.mastery.tracker import MasteryTracker
+from unittest.mock import patch
+
+from benchmarks.fake_redis import FakeRedis
+from benchmarks.mastery_benchmark import run_benchmark
+from games.mastery import difficulty
+from games.mastery.difficulty import RECORD_RESULT_LUA, ring_key, state_key
+from games.mastery.forgetting import decayed_mastery, next_stability, retention
+from games.mastery.migrate import migrate
+from games.mastery.tracker import (
+    MasteryTracker,
+    legacy_theme_key,
+    legacy_word_key,
+    themes_key,
+    words_key,
+)
+
+DAY = 86400
+T0 = 1_700_000_000
+
+
+class FakeClock:
+    def __init__(self, now=T0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
 from games.mastery.difficulty import DifficultyAdapter
 from games.mastery.rewards import RewardsSystem
 
@@ -28,6 +57,152 @@ class TestMasteryTracker:
         assert new_mastery < 50.0  # Should decrease
 
 
+class TestMasteryStore:
+
+    def test_update_many_writes_one_hash_per_user(self):
+        client = FakeRedis()
+        tracker = MasteryTracker("u1", redis_client=client, clock=FakeClock())
+
+        updated = tracker.update_many(["gato", "casa", "gato"], [100, 0, 100])
+
+        assert updated == {"gato": pytest.approx(75.5), "casa": pytest.approx(35.0)}
+        assert client.hgetall(words_key("u1")) == {
+            "gato": f"75.5000|{T0}|2.0000",
+            "casa": f"35.0000|{T0}|1.0000",
+        }
+        assert client.ttl(words_key("u1")) > 0
+        assert tracker.get_word_mastery("gato") == pytest.approx(75.5)
+        assert MasteryTracker("u2", redis_client=client).get_word_mastery("gato") == 50.0
+
+    def test_batch_update_is_constant_round_trips(self):
+        client = FakeRedis()
+        tracker = MasteryTracker("u1", redis_client=client, legacy_fallback=False)
+
+        tracker.update_many([f"w{i}" for i in range(40)], [80] * 40)
+
+        assert client.round_trips == 3  # WATCH, HMGET, MULTI/EXEC
+
+    def test_legacy_keys_are_read_and_moved(self):
+        client = FakeRedis()
+        client.set(legacy_word_key("u1", "gato"), "90")
+        client.set(legacy_theme_key("u1", "animais"), "70")
+        tracker = MasteryTracker("u1", redis_client=client, clock=FakeClock())
+
+        assert tracker.get_many(["gato", "casa"]) == {"gato": 90.0, "casa": 50.0}
+        assert tracker.get_theme_mastery("animais") == 70.0
+
+        assert client.get(legacy_word_key("u1", "gato")) is None
+        assert client.get(legacy_theme_key("u1", "animais")) is None
+        assert client.hget(words_key("u1"), "gato") == f"90.0000|{T0}|2.0000"
+        assert client.hget(themes_key("u1"), "animais").startswith("70.0000|")
+
+    def test_update_starts_from_legacy_value(self):
+        client = FakeRedis()
+        client.set(legacy_word_key("u1", "gato"), "90")
+        tracker = MasteryTracker("u1", redis_client=client, clock=FakeClock())
+
+        updated = tracker.update_many(["gato"], [0])
+
+        assert updated["gato"] == pytest.approx(63.0)
+        assert client.get(legacy_word_key("u1", "gato")) is None
+
+    def test_migration_moves_every_legacy_key(self):
+        client = FakeRedis()
+        client.set(legacy_word_key("u1", "gato"), "90")
+        client.set(legacy_word_key("u:2", "casa"), "30")
+        client.set(legacy_theme_key("u1", "animais"), "70")
+        client.hset(words_key("u1"), "gato", f"40.0000|{T0}|2.0000")
+        client.set("mastery:user:u1:words:extra", "1")
+
+        migrated = migrate(client, batch=2, now=T0)
+
+        assert migrated == {"word": 2, "theme": 1}
+        # Newer hash values win
+        assert client.hget(words_key("u1"), "gato") == f"40.0000|{T0}|2.0000"
+        assert client.hget(words_key("u:2"), "casa") == f"30.0000|{T0}|2.0000"
+        assert MasteryTracker("u1", redis_client=client).get_mastery_report()["total_themes_tracked"] == 1
+        assert client.scan(match="mastery:user:*:word:*", count=100)[1] == []
+
+    def test_concurrent_write_is_retried(self):
+        client = FakeRedis()
+        tracker = MasteryTracker("u1", redis_client=client)
+        original_hmget = FakeRedis._do_hmget
+        calls = []
+
+        def racing_hmget(self, name, keys, *args):
+            stored = original_hmget(self, name, keys, *args)
+            calls.append(name)
+            if len(calls) == 1:
+                # Another worker records a game between our read and EXEC
+                self._do_hset(name, "gato", "90.0000")
+            return stored
+
+        with patch.object(FakeRedis, "_do_hmget", racing_hmget):
+            updated = tracker.update_many(["gato"], [100])
+
+        assert len(calls) == 2
+        assert updated["gato"] == pytest.approx(93.0)
+
+    def test_theme_mastery_and_report(self):
+        client = FakeRedis()
+        tracker = MasteryTracker("u1", redis_client=client, clock=FakeClock(), legacy_fallback=False)
+        tracker.update_many(["gato", "casa"], [100, 0])
+        tracker.update_many([f"w{i}" for i in range(1200)], [50] * 1200)
+
+        client.reset_counters()
+        theme = tracker.update_theme_mastery("animais", ["gato", "casa", "novo"])
+
+        assert theme == pytest.approx((65 + 35 + 50) / 3)
+        assert client.round_trips == 2
+        assert client.hget(themes_key("u1"), "animais") == f"50.0000|{T0}|1.5000"
+
+        report = tracker.get_mastery_report()
+        assert report["total_words_tracked"] == 1202
+        assert report["total_themes_tracked"] == 1
+        assert report["average_mastery"] == 50.0
+
+    def test_bare_numbers_still_read(self):
+        client = FakeRedis()
+        client.hset(words_key("u1"), "gato", "80.0000")
+
+        assert MasteryTracker("u1", redis_client=client).get_word_mastery("gato") == pytest.approx(80.0)
+
+    def test_benchmark_smoke(self):
+        results = run_benchmark(users=3, words=5, games=2, rtt_ms=0)
+
+        assert results["keys"]["round_trips_per_game"] == 20
+        assert results["hash"]["round_trips_per_game"] == 5
+
+
+def record_result_script(client, keys, args):
+    """Python stand-in for RECORD_RESULT_LUA on FakeRedis (no Lua runtime here)"""
+    state, ring = keys
+    mode, score, window, cooldown, up, down, low, high, default, ttl = args
+    score, window, cooldown = int(score), int(window), int(cooldown)
+    fields = [f"{mode}:{name}" for name in ("sum", "n", "pos", "level", "since")]
+    stored = client._do_hmget(state, fields)
+    total, n, pos = (int(v or 0) for v in stored[:3])
+    level = int(stored[3] or default)
+    since = int(stored[4] or 0)
+    pos %= window
+
+    if n >= window:
+        total -= ord(client._do_getrange(ring, pos, pos))
+    else:
+        n += 1
+    client._do_setrange(ring, pos, chr(score))
+    total += score
+    pos = (pos + 1) % window
+
+    new_level, since = DifficultyAdapter.next_level(total, n, level, since)
+    if new_level != level:
+        total = n = pos = 0
+    client._do_hset(state, mapping=dict(zip(fields, (total, n, pos, new_level, since))))
+    client._do_expire(state, int(ttl))
+    client._do_expire(ring, int(ttl))
+    return [new_level, level, total, n]
+
+
 class TestDifficultyAdapter:
     
     def test_high_accuracy_increases_difficulty(self):
@@ -104,3 +279,225 @@ class TestRewardsSystem:
         assert rewards.is_difficulty_unlocked(4, 65) == True
         assert rewards.is_difficulty_unlocked(5, 65) == False
         assert rewards.is_difficulty_unlocked(5, 85) == True
+
+
+class TestForgetting:
+
+    def test_retention_follows_the_curve(self):
+        assert retention(T0, 2.0, T0) == 1.0
+        assert retention(T0, 2.0, T0 + 2 * DAY) == pytest.approx(np.exp(-1))
+        assert retention(T0, 2.0, T0 - DAY) == 1.0  # clock skew
+
+    def test_mastery_decays_towards_default_only_from_above(self):
+        decayed = decayed_mastery([90.0, 20.0, 90.0], T0, [2.0, 2.0, 60.0], T0 + 365 * DAY)
+
+        assert decayed[0] == pytest.approx(50.0)
+        assert decayed[1] == 20.0
+        assert 50.0 < decayed[2] < 60.0
+
+    def test_stability_rewards_spaced_recall(self):
+        immediate, spaced, lapse = next_stability(4.0, [1.0, np.exp(-1), 1.0], [100, 100, 0])
+
+        assert immediate == 4.0
+        assert spaced == pytest.approx(4.0 * (1 + 2 * (1 - np.exp(-1))))
+        assert lapse == 2.0
+
+    def test_mastered_word_is_forgotten_without_writes(self):
+        clock = FakeClock()
+        client = FakeRedis()
+        tracker = MasteryTracker("u1", redis_client=client, clock=clock)
+        for _ in range(5):
+            tracker.update_many(["gato"], [100])
+        mastered = tracker.get_word_mastery("gato")
+
+        clock.now += 365 * DAY
+        client.reset_counters()
+
+        assert mastered > 80
+        assert tracker.get_word_mastery("gato") == pytest.approx(50.0, abs=0.5)
+        assert client.commands == 1  # one HGET-like read, nothing written
+
+    def test_update_starts_from_the_decayed_mastery(self):
+        clock = FakeClock()
+        tracker = MasteryTracker("u1", redis_client=FakeRedis(), clock=clock)
+        tracker.update_many(["gato"], [100])  # 65, stability 2 days
+
+        clock.now += 2 * DAY
+        decayed = 50 + 15 * np.exp(-1)
+
+        assert tracker.update_many(["gato"], [100])["gato"] == pytest.approx(decayed * 0.7 + 30)
+
+    def test_vectorized_read_matches_single_reads(self):
+        clock = FakeClock()
+        client = FakeRedis()
+        tracker = MasteryTracker("u1", redis_client=client, clock=clock)
+        words = [f"w{i}" for i in range(300)]
+        for day in range(10):
+            clock.now = T0 + day * DAY
+            tracker.update_many(words[day::10], [(day * 37) % 101] * len(words[day::10]))
+        clock.now = T0 + 20 * DAY
+
+        batch = tracker.get_many(words)
+
+        assert batch == pytest.approx({w: tracker.get_word_mastery(w) for w in words})
+
+    def test_due_words_are_least_retained_first(self):
+        clock = FakeClock()
+        client = FakeRedis()
+        tracker = MasteryTracker("u1", redis_client=client, clock=clock)
+        tracker.update_many(["velho"], [100])
+        clock.now += DAY
+        tracker.update_many(["medio"], [100])
+        clock.now += DAY
+        tracker.update_many(["novo"], [100])
+
+        due = tracker.get_due_words(min_retention=0.7)
+
+        assert [d["word"] for d in due] == ["velho", "medio"]
+        assert due[0]["retention"] == pytest.approx(np.exp(-1), abs=1e-4)
+        assert tracker.get_mastery_report()["words_due"] == 2
+
+
+class TestDurableDifficulty:
+
+    @pytest.fixture
+    def client(self):
+        return FakeRedis(scripts={RECORD_RESULT_LUA: record_result_script})
+
+    def test_accuracy_is_a_rolling_window(self, client):
+        adapter = DifficultyAdapter("u1", redis_client=client)
+        with patch.object(difficulty, "DIFFICULTY_WINDOW", 4):
+            for accuracy in (0.6, 0.6, 0.6, 0.6, 1.0, 1.0):
+                assert adapter.record_result("CLOZE_SPRINT", accuracy) is None
+            # Window is now 0.6, 0.6, 1.0, 1.0 -> 80%, not above the threshold
+            assert client.hget(state_key("u1"), "CLOZE_SPRINT:sum") == "320"
+            assert len(client.get(ring_key("u1", "CLOZE_SPRINT"))) == 4
+
+            assert adapter.record_result("CLOZE_SPRINT", 1.0) == 3
+
+        assert client.hget(state_key("u1"), "CLOZE_SPRINT:n") == "0"  # window restarts at the new level
+
+    def test_cooldown_and_state_are_shared_across_workers(self, client):
+        workers = [DifficultyAdapter("u1", redis_client=client) for _ in range(2)]
+
+        results = [workers[i % 2].record_result("SRS_ARENA", 0.2, 4) for i in range(8)]
+
+        assert results == [None, None, None, 3, None, None, None, 2]
+        assert client.ttl(ring_key("u1", "SRS_ARENA")) > 0
+
+    def test_each_update_is_one_round_trip(self, client):
+        adapter = DifficultyAdapter("u1", redis_client=client)
+        for _ in range(50):
+            adapter.record_result("CLOZE_SPRINT", 0.7)
+
+        assert client.round_trips == 50
+
+    def test_all_modes_in_one_call(self, client):
+        adapter = DifficultyAdapter("u1", redis_client=client)
+        for _ in range(4):
+            adapter.record_result("CLOZE_SPRINT", 1.0, 2)
+        client.reset_counters()
+
+        levels = adapter.get_difficulties(
+            ["CLOZE_SPRINT", "SRS_ARENA", "BOSS_FIGHT_VOCAB"], mastery_scores={"BOSS_FIGHT_VOCAB": 85}
+        )
+
+        assert levels == {"CLOZE_SPRINT": 3, "SRS_ARENA": 2, "BOSS_FIGHT_VOCAB": 5}
+        assert client.round_trips == 1
+        assert set(adapter.get_difficulties()) >= {"CLOZE_SPRINT", "FREE_RECALL_SCORE"}
+
+    def test_keys_share_a_cluster_hash_tag(self):
+        assert state_key("u1") == "difficulty:user:{u1}"
+        assert ring_key("u1", "CLOZE_SPRINT") == "difficulty:user:{u1}:ring:CLOZE_SPRINT"
+
+    def test_lua_script_on_real_redis(self):
+        import redis
+
+        client = redis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379/0"),
+                                decode_responses=True, socket_connect_timeout=0.5)
+        try:
+            client.ping()
+        except redis.RedisError:
+            pytest.skip("REDIS_URL is unreachable")
+
+        user = f"lua-{uuid.uuid4()}"
+        try:
+            adapter = DifficultyAdapter(user, redis_client=client)
+            with patch.object(difficulty, "DIFFICULTY_WINDOW", 4):
+                results = [adapter.record_result("CLOZE_SPRINT", accuracy) for accuracy in (0.6, 0.6, 0.6, 0.6, 1.0, 1.0)]
+                assert results == [None] * 6
+                assert client.hget(state_key(user), "CLOZE_SPRINT:sum") == "320"
+                assert client.strlen(ring_key(user, "CLOZE_SPRINT")) == 4
+
+                assert adapter.record_result("CLOZE_SPRINT", 1.0) == 3
+
+            assert adapter.get_difficulties(["CLOZE_SPRINT", "SRS_ARENA"]) == {"CLOZE_SPRINT": 3, "SRS_ARENA": 2}
+            assert client.ttl(ring_key(user, "CLOZE_SPRINT")) > 0
+        finally:
+            client.delete(state_key(user), ring_key(user, "CLOZE_SPRINT"))
+
+    @pytest.mark.asyncio
+    async def test_turn_context_records_the_learner_result(self, client):
+        from educator.nodes import game_phase
+        from games.modes.cloze_sprint import CloseSprintGame
+        from utils.context_builder import ContextPackBuilder
+        from utils.context_cache import ContextCache
+
+        class FakeNestJS:
+            async def get_session(self, session_id):
+                return {"id": session_id, "userId": "learner-7", "contentId": "c1", "phase": "POST"}
+
+            async def get_learner_profile(self, user_id):
+                return {"educationLevel": "MEDIO"}
+
+            async def get_vocab_focus(self, user_id, limit=50):
+                return {"dueWords": [], "totalDue": 0}
+
+            async def get_content_metadata(self, content_id):
+                return {"title": "Fotossíntese"}
+
+        with patch("utils.context_builder.nestjs_client", FakeNestJS()):
+            context = await ContextPackBuilder(cache=ContextCache()).build({"readingSessionId": "s1"})
+
+        game = CloseSprintGame()
+        round_data = game.create_round({}, 2)
+        state = {
+            "context": context,
+            "current_phase": "POST",
+            "game_mode": game.GAME_ID,
+            "game_round_data": round_data,
+            "user_text": "fotossíntese, alimento",
+        }
+        with patch.object(difficulty, "get_redis", lambda: client):
+            await game_phase.handle(state)
+
+        assert context["learner"]["id"] == "learner-7"
+        assert len(client.get(ring_key("learner-7", game.GAME_ID))) == 1
+
+    def test_local_state_without_redis(self):
+        user = f"local-{uuid.uuid4()}"
+        with patch.object(difficulty, "get_redis", lambda: None):
+            adapter = DifficultyAdapter(user)
+            results = [adapter.record_result("CLOZE_SPRINT", 0.95, 2) for _ in range(4)]
+
+            assert results == [None, None, None, 3]
+            assert DifficultyAdapter(user).get_difficulty("CLOZE_SPRINT") == 3
+
+    @pytest.mark.asyncio
+    async def test_difficulty_endpoint_lists_every_mode(self):
+        import httpx
+        from fastapi import FastAPI
+        from api.games_router import router
+
+        app = FastAPI()
+        app.include_router(router)
+        user = f"api-{uuid.uuid4()}"
+        with patch.object(difficulty, "get_redis", lambda: None):
+            for _ in range(4):
+                DifficultyAdapter(user).record_result("SRS_ARENA", 0.1, 3)
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+                response = await client.get(f"/games/difficulty/{user}")
+
+        body = response.json()
+        assert body["difficulties"]["SRS_ARENA"] == 2
+        assert body["difficulties"]["FREE_RECALL_SCORE"] == DifficultyAdapter.DEFAULT_DIFFICULTY
@@ -130,6 +130,23 @@ class TestMetricsMiddleware:
         
         with pytest.raises(ValueError, match="Test error"):
             mw.process(context, failing_handler)
+    
+    def test_metrics_middleware_counts_game_failures(self, monkeypatch):
+        """Failures are counted per game mode, not as memory jobs, without Redis"""
+        import metrics
+        metrics.reset_metrics()
+        monkeypatch.setattr(metrics, '_get_redis', lambda: pytest.fail("Redis used on the event loop"))
+        mw = MetricsMiddleware()
+        
+        def failing_handler(ctx):
+            raise ValueError("Test error")
+        
+        with pytest.raises(ValueError):
+            mw.process({'metadata': {'gameMode': 'CLOZE_SPRINT'}}, failing_handler)
+        
+        snapshot = metrics.get_metrics()
+        assert snapshot['games']['rounds_failed_by_mode'] == {'CLOZE_SPRINT': 1}
+        assert snapshot['memory_jobs']['failed'] == 0
 
 
 class TestEventEmitterMiddleware:
@@ -182,3 +199,108 @@ class TestFullPipeline:
         # Should have result data
         assert result['score'] == 15
         assert result['success'] == True
+
+
+class AsyncTestMiddleware(GameMiddleware):
+    """Async-capable test middleware that records call order"""
+    def __init__(self, name: str, calls: list):
+        self.name = name
+        self.calls = calls
+    
+    def process(self, context, next_handler):
+        self.calls.append(self.name)
+        return next_handler(context)
+    
+    async def process_async(self, context, next_handler):
+        self.calls.append(self.name)
+        result = await next_handler(context)
+        self.calls.append(f"{self.name}:after")
+        return result
+
+
+class TestAsyncPipeline:
+    """Test suite for the async middleware chain"""
+    
+    @pytest.mark.asyncio
+    async def test_async_middleware_executes_in_order(self):
+        """Test async middleware wrap the handler in order added"""
+        calls = []
+        pipeline = GamePipeline([AsyncTestMiddleware('a', calls), AsyncTestMiddleware('b', calls)])
+        
+        async def handler(ctx):
+            calls.append('handler')
+            return {'score': 1}
+        
+        result = await pipeline.execute_async({}, handler)
+        
+        assert result == {'score': 1}
+        assert calls == ['a', 'b', 'handler', 'b:after', 'a:after']
+    
+    @pytest.mark.asyncio
+    async def test_default_middleware_run_on_async_path(self):
+        """Test correlation, metrics and events apply to async evaluations"""
+        from metrics import get_latency_histograms, reset_metrics
+        reset_metrics()
+        pipeline = GamePipeline([
+            CorrelationIdMiddleware(),
+            MetricsMiddleware(),
+            EventEmitterMiddleware(),
+        ])
+        context = {'metadata': {'gameMode': 'TEST_GAME'}, 'correlation_id': None}
+        
+        async def handler(ctx):
+            return {'score': 15}
+        
+        await pipeline.execute_async(context, handler)
+        
+        assert context['correlation_id']  # None replaced by a generated ID
+        assert get_latency_histograms()['game.pipeline']['count'] == 1
+    
+    @pytest.mark.asyncio
+    async def test_async_errors_propagate(self):
+        """Test async handler errors propagate through middleware"""
+        pipeline = GamePipeline([CorrelationIdMiddleware(), MetricsMiddleware(), EventEmitterMiddleware()])
+        
+        async def failing_handler(ctx):
+            raise RuntimeError("LLM down")
+        
+        with pytest.raises(RuntimeError, match="LLM down"):
+            await pipeline.execute_async({}, failing_handler)
+    
+    @pytest.mark.asyncio
+    async def test_sync_only_middleware_skipped_on_async_path(self):
+        """Test middleware without process_async does not break async execution"""
+        mw = TestMiddleware('sync_only')
+        pipeline = GamePipeline([mw])
+        
+        async def handler(ctx):
+            return ctx
+        
+        result = await pipeline.execute_async({}, handler)
+        
+        assert not mw.called
+        assert 'marker_sync_only' not in result
+    
+    def test_chain_compiled_once(self):
+        """Test chain is built at construction, rebuilt only on add_middleware"""
+        pipeline = GamePipeline([TestMiddleware('x')])
+        chain = pipeline._sync_chain
+        
+        pipeline.execute({}, lambda ctx: ctx)
+        assert pipeline._sync_chain is chain
+        
+        pipeline.add_middleware(TestMiddleware('y'))
+        assert pipeline._sync_chain is not chain
+        assert pipeline.execute({}, lambda ctx: ctx)['marker_y'] == True
+
+
+class TestPipelineBenchmark:
+    """Smoke test for benchmarks/pipeline_benchmark"""
+    
+    def test_reports_overhead_for_both_paths(self):
+        from benchmarks.pipeline_benchmark import run_benchmark
+        
+        results = run_benchmark(iterations=50)
+        
+        assert set(results) == {'sync', 'async'}
+        assert all('overhead_us' in stats for stats in results.values())
@@ -0,0 +1,126 @@
+"""
+Tests for local content-derived round generation
+"""
+import time
+
+from games.round_builder import (
+    BLANK,
+    build_cloze,
+    build_flashcards,
+    build_word_hunt,
+    get_index,
+    related_terms,
+    word_forms,
+)
+from games.modes.cloze_sprint import CloseSprintGame
+from games.modes.concept_linking import ConceptLinkingGame
+from games.modes.srs_arena import SrsArenaGame
+from games.modes.tool_word_hunt import ToolWordHuntGame
+
+CONTENT = (
+    "A fotossíntese é o processo pelo qual as plantas produzem glicose usando a luz solar. "
+    "Durante a fotossíntese, a clorofila absorve a luz e converte energia luminosa em energia química. "
+    "As plantas liberam oxigênio como subproduto da fotossíntese nas folhas. "
+    "A respiração celular usa a glicose produzida para liberar energia nas células."
+)
+
+
+def test_word_forms_cover_accents_and_plural():
+    assert "fotossintese" in word_forms("fotossíntese")
+    assert "fotossínteses" in word_forms("fotossíntese")
+    assert "célula" in word_forms("células")
+    assert "fotossíntese" not in word_forms("fotossíntese")
+
+
+def test_index_ranks_repeated_terms_first():
+    index = get_index(CONTENT)
+
+    assert len(index) == 4
+    assert index.keywords[0] == "fotossíntese"
+    assert get_index(CONTENT) is index
+
+
+def test_cloze_is_deterministic_and_blanks_the_sentence():
+    first = build_cloze(CONTENT, None, 2)
+
+    assert first == build_cloze(CONTENT, None, 2)
+    assert first["sentence"].count(BLANK) == len(first["blanks"]) == 2
+    for blank in first["blanks"]:
+        assert blank["correct"] not in first["sentence"].lower()
+        assert blank["alternatives"]
+
+
+def test_cloze_prefers_target_words_and_scales_with_difficulty():
+    easy = build_cloze(CONTENT, [{"text": "clorofila"}], 1)
+    hard = build_cloze(CONTENT, None, 5)
+
+    assert [b["correct"] for b in easy["blanks"]] == ["clorofila"]
+    assert len(hard["blanks"]) == 3
+
+
+def test_flashcards_use_distinct_sentences():
+    cards = build_flashcards(CONTENT, ["glicose"], limit=3)
+
+    assert cards[0]["back"] == "glicose"
+    assert len({card["front"] for card in cards}) == len(cards) == 3
+    assert all(BLANK in card["front"] for card in cards)
+
+
+def test_word_hunt_quote_comes_from_the_text():
+    built = build_word_hunt(CONTENT, ["clorofila"], 1)
+
+    assert built["target_word"] == "clorofila"
+    assert built["expected_quote"] in built["text"]
+    assert "clorofila" in built["expected_quote"]
+    assert "clorofila" in built["text"]
+
+    late = build_word_hunt(CONTENT, ["subproduto"], 1)
+    assert "subproduto" in late["expected_quote"]
+    assert len(late["expected_quote"].split()) == 4
+
+
+def test_related_terms_for_taboo():
+    terms = related_terms(CONTENT, "fotossíntese")
+
+    assert len(terms) == 4
+    assert "fotossíntese" not in terms
+
+
+def test_short_content_builds_nothing():
+    assert build_cloze("Text about AI", None, 3) is None
+    assert build_flashcards("", None) == []
+    assert build_word_hunt("Curto.", None, 3) is None
+
+
+def test_modes_build_rounds_from_content():
+    state = {"content_slice": CONTENT, "target_words": ["clorofila"]}
+
+    cloze = CloseSprintGame().create_round(state, 1)
+    srs = SrsArenaGame().create_round(state, 1)
+    hunt = ToolWordHuntGame().create_round(state, 1)
+    taboo = ConceptLinkingGame().create_round({**state, "target_words": ["fotossíntese"]}, 1)
+
+    assert cloze["data"]["blanks"][0]["correct"] == "clorofila"
+    assert "1. ___ = ?" in cloze["prompt"] and "2. ___ = ?" not in cloze["prompt"]
+    assert srs["data"]["correct_answer"] == "clorofila"
+    assert hunt["data"]["target_word"] == "clorofila"
+    assert set(taboo["data"]["forbidden_words"]) <= set(get_index(CONTENT).vocab)
+
+
+def test_modes_keep_sample_round_without_content():
+    cloze = CloseSprintGame().create_round({"content_slice": "Text about AI"}, 2)
+
+    assert cloze["data"]["blanks"][0]["correct"] == "fotossíntese"
+
+
+def test_round_building_is_fast():
+    text = " ".join([CONTENT] * 50)
+    get_index(text)
+
+    start = time.perf_counter()
+    for difficulty in range(1, 6):
+        build_cloze(text, None, difficulty)
+        build_word_hunt(text, None, difficulty)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.1
@@ -0,0 +1,249 @@
+"""
+Tests for the background round pre-generation pool
+"""
+import asyncio
+import os
+from unittest.mock import patch
+
+import pytest
+
+from educator.nodes import game_phase
+from games.pregen import RoundPregenPool
+from games.triggers import TriggerEngine
+
+TRIGGERS = {
+    "triggers": {
+        "on_reading_complete": [
+            {"game": "FREE_RECALL_SCORE", "probability": 0.8},
+            {"game": "CLOZE_SPRINT", "probability": 0.4},
+            {"game": "BOSS_FIGHT_VOCAB", "probability": 0.1},
+            {"game": "SRS_ARENA"},
+        ]
+    }
+}
+
+PED_STATE = {
+    "content_slice": "A fotossíntese converte luz em energia química.",
+    "target_words": ["fotossíntese"],
+    "phase": "POST",
+    "learner_profile": {},
+}
+
+
+class FakeGame:
+    def __init__(self, game_id):
+        self.game_id = game_id
+        self.created = 0
+
+    def create_round(self, state, difficulty):
+        self.created += 1
+        return {"prompt": f"{self.game_id} #{self.created}", "difficulty": difficulty}
+
+    def get_quick_replies(self, round_data):
+        return []
+
+
+class FakeGamePool:
+    def __init__(self):
+        self.games = {}
+
+    def get(self, game_id):
+        return self.games.setdefault(game_id, FakeGame(game_id))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_pool(**kwargs):
+    return RoundPregenPool(game_pool=FakeGamePool(), trigger_engine=TriggerEngine(TRIGGERS), **kwargs)
+
+
+def test_warm_targets_follow_trigger_probabilities():
+    pool = make_pool(size_per_key=3)
+
+    # 0.1 is below PREGEN_MIN_PROBABILITY; no probability means always (1.0)
+    assert pool.warm_targets() == {"FREE_RECALL_SCORE": 3, "CLOZE_SPRINT": 2, "SRS_ARENA": 3}
+
+
+def test_warm_targets_follow_trigger_reloads(game_config_dir, fake_clock):
+    (game_config_dir / "triggers.yaml").write_text(
+        "triggers:\n  on_reading_complete:\n    - game: CLOZE_SPRINT\n", encoding="utf-8"
+    )
+    engine = TriggerEngine(reload_seconds=0, clock=fake_clock)
+    pool = RoundPregenPool(game_pool=FakeGamePool(), trigger_engine=engine, size_per_key=2)
+    assert pool.warm_targets() == {"CLOZE_SPRINT": 2}
+
+    path = game_config_dir / "triggers.yaml"
+    path.write_text("triggers:\n  on_reading_complete:\n    - game: SRS_ARENA\n      probability: 0.5\n", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+    assert pool.warm_targets() == {"SRS_ARENA": 1}
+
+
+@pytest.mark.asyncio
+async def test_warm_then_pop_serves_ready_round_and_refills():
+    pool = make_pool(size_per_key=2)
+
+    assert set(pool.warm(PED_STATE, 2)) == {"FREE_RECALL_SCORE", "CLOZE_SPRINT", "SRS_ARENA"}
+    await pool.drain()
+    assert pool.ready(PED_STATE, "FREE_RECALL_SCORE", 2) == 2
+    assert pool.ready(PED_STATE, "CLOZE_SPRINT", 2) == 1
+
+    round_data = pool.pop(PED_STATE, "FREE_RECALL_SCORE", 2)
+    assert round_data["prompt"] == "FREE_RECALL_SCORE #1"
+    await pool.drain()
+
+    assert pool.ready(PED_STATE, "FREE_RECALL_SCORE", 2) == 2
+    assert pool.get_stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_warm_uses_per_mode_difficulties():
+    pool = make_pool()
+
+    pool.warm(PED_STATE, difficulties={"CLOZE_SPRINT": 4})
+    await pool.drain()
+
+    assert pool.ready(PED_STATE, "CLOZE_SPRINT", 4) == 1
+    assert pool.ready(PED_STATE, "CLOZE_SPRINT", 2) == 0
+    assert pool.ready(PED_STATE, "FREE_RECALL_SCORE", 2) > 0
+
+
+@pytest.mark.asyncio
+async def test_pop_misses_for_other_content_or_difficulty():
+    pool = make_pool()
+    pool.warm(PED_STATE, 2)
+    await pool.drain()
+
+    assert pool.pop({**PED_STATE, "content_slice": "outro texto"}, "FREE_RECALL_SCORE", 2) is None
+    assert pool.pop(PED_STATE, "FREE_RECALL_SCORE", 3) is None
+    assert pool.get_stats()["misses"] == 2
+    # The caller builds a missed round itself: no second create_round in the background
+    assert pool.get_stats()["inflight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_rounds_are_shared_across_learners_and_phases():
+    pool = make_pool()
+    pool.warm(PED_STATE, 2)
+    await pool.drain()
+
+    other = {**PED_STATE, "phase": "DURING", "learner_profile": {"level": "B2"}}
+    assert pool.pop(other, "FREE_RECALL_SCORE", 2) is not None
+    await pool.drain()
+
+
+@pytest.mark.asyncio
+async def test_rounds_are_not_shared_across_learner_languages():
+    pool = make_pool()
+    pool.warm({**PED_STATE, "learner_profile": {"language": "PT"}}, 2)
+    await pool.drain()
+
+    assert pool.pop({**PED_STATE, "learner_profile": {"language": "EN"}}, "FREE_RECALL_SCORE", 2) is None
+    assert pool.pop({**PED_STATE, "learner_profile": {"language": "PT"}}, "FREE_RECALL_SCORE", 2) is not None
+    await pool.drain()
+
+
+def test_expired_rounds_are_dropped():
+    clock = FakeClock()
+    pool = make_pool(ttl_seconds=60, clock=clock)
+    key = ("k", "FREE_RECALL_SCORE", 2)
+    pool.put(key, {"prompt": "old"})
+
+    clock.now = 61
+
+    with pool._lock:
+        pool._expire(key)
+    assert pool.get_stats()["rounds"] == 0
+    assert pool.get_stats()["expired"] == 1
+
+
+def test_pool_bounds_evict_oldest_keys():
+    pool = make_pool(max_rounds=2)
+    pool.put(("a", "FREE_RECALL_SCORE", 2), {"prompt": "a"})
+    pool.put(("b", "FREE_RECALL_SCORE", 2), {"prompt": "b"})
+    pool.put(("c", "FREE_RECALL_SCORE", 2), {"prompt": "c"})
+
+    stats = pool.get_stats()
+    assert stats["rounds"] == 2
+    assert stats["evicted"] == 1
+    assert ("a", "FREE_RECALL_SCORE", 2) not in pool._entries
+
+    small = make_pool(max_bytes=40)
+    small.put(("a", "FREE_RECALL_SCORE", 2), {"prompt": "x" * 20})
+    small.put(("b", "FREE_RECALL_SCORE", 2), {"prompt": "y" * 20})
+    assert small.get_stats()["rounds"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_generation_is_counted_not_raised():
+    pool = make_pool()
+
+    def broken(state, difficulty):
+        raise RuntimeError("LLM down")
+
+    pool.game_pool.get("FREE_RECALL_SCORE").create_round = broken
+    pool.schedule_refill(PED_STATE, "FREE_RECALL_SCORE", 2)
+    await pool.drain()
+
+    assert pool.get_stats()["failed"] == 1
+    assert pool.ready(PED_STATE, "FREE_RECALL_SCORE", 2) == 0
+
+
+@pytest.mark.asyncio
+async def test_start_new_game_uses_pregenerated_round():
+    pool = make_pool()
+    games = FakeGamePool()
+    pool._game_pool = games
+    state = {
+        "user_text": "START_GAME",
+        "current_phase": "POST",
+        "context": {
+            "contentSlice": {"text": PED_STATE["content_slice"]},
+            "targetWords": PED_STATE["target_words"],
+            "learner": {},
+        },
+        "prompt_message": {"metadata": {"gameMode": "FREE_RECALL_SCORE"}},
+    }
+
+    with patch.object(game_phase, "round_pregen", pool), \
+         patch.object(game_phase, "game_pool", games):
+        pool.warm(game_phase.build_ped_state(state), 2)
+        await pool.drain()
+
+        result = await game_phase.handle(state)
+        await pool.drain()
+
+    assert result["next_prompt"] == "FREE_RECALL_SCORE #1"
+    assert result["events_to_write"][0]["payloadJson"]["pregenerated"] is True
+    assert pool.get_stats()["hits"] == 1
+    # Refilled in the background after the pop
+    assert pool.ready(game_phase.build_ped_state(state), "FREE_RECALL_SCORE", 2) == 2
+
+
+@pytest.mark.asyncio
+async def test_start_new_game_falls_back_to_create_round():
+    pool = make_pool()
+    games = FakeGamePool()
+    state = {
+        "user_text": "START_GAME",
+        "context": {},
+        "prompt_message": {"metadata": {"gameMode": "CLOZE_SPRINT"}},
+    }
+
+    with patch.object(game_phase, "round_pregen", pool), \
+         patch.object(game_phase, "game_pool", games):
+        result = await game_phase.handle(state)
+        await asyncio.sleep(0)
+        await pool.drain()
+
+    assert result["next_prompt"] == "CLOZE_SPRINT #1"
+    assert result["events_to_write"][0]["payloadJson"]["pregenerated"] is False
+    assert pool.get_stats()["misses"] == 1
+    assert games.get("CLOZE_SPRINT").created == 1
@@ -0,0 +1,117 @@
+"""
+Tests for the scoring rules engine
+"""
+import os
+
+import pytest
+
+from games.modes.tool_word_hunt import ToolWordHuntGame
+from games.scoring import ScoringEngine, compile_scorers
+
+RULES = {
+    "base_scoring": {"perfect_score": 100},
+    "multipliers": {
+        "difficulty": {"easy": 1.0, "medium": 1.5, "hard": 2.0},
+        "streak": {"3_wins": 1.2, "5_wins": 1.5, "10_wins": 2.0},
+    },
+    "game_specific": {
+        "TOOL_WORD_HUNT": {
+            "max_score": 110,
+            "heuristic_criteria": {"has_quote": 30, "has_explanation": 40, "mentions_target": 30},
+        },
+        "FREE_RECALL_SCORE": {"max_score": 200, "bonus": {"found_open_loop": 10}},
+    },
+}
+
+
+def test_scale_and_criteria_match_the_old_arithmetic():
+    scorer = compile_scorers(RULES)["TOOL_WORD_HUNT"]
+
+    assert [scorer.scale(s) for s in (0, 70, 80, 100, 130)] == [0, 77, 88, 110, 110]
+    assert scorer.heuristic_score({"has_quote": True, "mentions_target": True}) == 66
+    assert scorer.heuristic_score({"has_explanation": True, "mentions_target": True}) == 77
+    assert scorer.passed(77, 0.7) and not scorer.passed(66, 0.7)
+
+
+def test_unknown_modes_use_base_scoring():
+    engine = ScoringEngine(rules=RULES)
+
+    assert engine.scorer("NOPE").max_score == 100
+
+
+@pytest.mark.parametrize("difficulty,streak,expected", [
+    (1, 0, 100),
+    (3, 0, 150),
+    (5, 4, 240),
+    (2, 12, 200),
+])
+def test_points_apply_difficulty_and_streak_multipliers(difficulty, streak, expected):
+    engine = ScoringEngine(rules=RULES)
+
+    result = engine.apply("FREE_RECALL_SCORE", {"score": 100}, difficulty, streak)
+
+    assert result["points"] == expected
+
+
+def test_bonus_from_breakdown_flags():
+    engine = ScoringEngine(rules=RULES)
+
+    result = engine.apply("FREE_RECALL_SCORE", {"score": 50, "breakdown": {"found_open_loop": True}})
+
+    assert result["points"] == 60
+
+
+def test_batch_matches_single_scoring():
+    engine = ScoringEngine(rules=RULES)
+    results = [{"score": s, "breakdown": {"found_open_loop": s > 100}} for s in range(0, 201, 7)]
+    difficulties = [1 + i % 5 for i in range(len(results))]
+    streaks = [i % 12 for i in range(len(results))]
+
+    single = [
+        engine.apply("FREE_RECALL_SCORE", dict(r), d, s)["points"]
+        for r, d, s in zip(results, difficulties, streaks)
+    ]
+    batch = engine.apply_batch("FREE_RECALL_SCORE", [dict(r) for r in results], difficulties, streaks)
+
+    assert [r["points"] for r in batch] == single
+    assert engine.get_stats()["batches"] == 1
+
+
+def test_modes_score_through_the_shipped_rules():
+    game = ToolWordHuntGame()
+    round_data = {"data": {"target_word": "ironicamente", "expected_quote": "Ironicamente, o mesmo"}}
+
+    result = game._heuristic_evaluate(round_data, "Ironicamente, o mesmo processo")
+
+    assert result["max_score"] == 110
+    assert result["score"] == 66
+    assert result["correct"] is False
+
+
+def write_rules(path, text, mtime):
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(mtime, mtime))
+
+
+def test_rules_are_recompiled_when_the_file_changes(game_config_dir, fake_clock):
+    path = game_config_dir / "scoring_rules.yaml"
+    write_rules(path, "game_specific:\n  CLOZE_SPRINT:\n    max_score: 120\n", 1_000_000_000)
+    engine = ScoringEngine(reload_seconds=1, clock=fake_clock)
+    assert engine.scorer("CLOZE_SPRINT").max_score == 120
+
+    write_rules(path, "game_specific:\n  CLOZE_SPRINT:\n    max_score: 60\n", 2_000_000_000)
+    fake_clock.now = 2
+    assert engine.scorer("CLOZE_SPRINT").max_score == 60
+    assert engine.get_stats()["reloads"] == 1
+
+
+def test_unparsable_file_keeps_previous_scorers(game_config_dir, fake_clock):
+    path = game_config_dir / "scoring_rules.yaml"
+    write_rules(path, "game_specific:\n  FREE_RECALL_SCORE:\n    max_score: 200\n", 1_000_000_000)
+    engine = ScoringEngine(reload_seconds=0, clock=fake_clock)
+    assert engine.scorer("FREE_RECALL_SCORE").max_score == 200
+
+    write_rules(path, "game_specific:\n  FREE_RECALL_SCORE: {max_score: 100\n", 2_000_000_000)
+
+    assert engine.scorer("FREE_RECALL_SCORE").max_score == 200
+    assert engine.get_stats()["reload_errors"] == 1
@@ -103,3 +103,20 @@ class TestSrsArenaGame:
         assert result['score'] > 0
         assert result['breakdown']['method'] == 'heuristic'
         assert result['breakdown']['keyword_matches'] > 0
+    
+    @pytest.mark.asyncio
+    async def test_fallback_accepts_card_alternatives(self, game):
+        """Cards built from the text accept the term's other forms"""
+        state = {
+            'content_slice': (
+                "As mitocôndrias produzem energia para a célula inteira. "
+                "Sem mitocôndrias a célula não consegue respirar direito."
+            ),
+            'target_words': ['mitocôndrias'],
+        }
+        round_data = game.create_round(state, 1)
+        assert 'mitocôndria' in round_data['data']['alternatives']
+        
+        result = await game.evaluate_answer(round_data, "mitocôndria")
+        
+        assert result['correct'] == True
@@ -34,7 +34,7 @@ class TestToolWordHuntGame:
         }
         
         round_data = game.create_round({}, 1)
-        result = await game.evaluate_answer(round_data, "The quote is 'xyz' and it means...")
+        result = await game.evaluate_answer(round_data, "'Ironicamente' here means the opposite of what was expected...")
         
         assert result['score'] > 0
         assert result['breakdown']['found_quote'] == True
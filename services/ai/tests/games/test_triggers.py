@@ -0,0 +1,183 @@
+"""
+Tests for the compiled trigger engine
+"""
+import os
+import random
+
+import pytest
+from unittest.mock import patch
+
+from benchmarks.trigger_benchmark import run_benchmark
+from games.triggers import TriggerConfigError, TriggerEngine, compile_condition, compile_triggers
+
+CONFIG = {
+    "triggers": {
+        "on_reading_complete": [
+            {"game": "FREE_RECALL_SCORE", "min_content_length": 500, "requires": ["content_slice"]},
+            {"game": "CLOZE_SPRINT", "target_word_count": 3},
+            {"game": "SRS_ARENA", "priority": "high", "condition": "user_mastery < 0.2"},
+        ],
+        "on_intent": {
+            "challenge": [{"game": "BOSS_FIGHT_VOCAB", "condition": "user_mastery > 0.7"}],
+        },
+    }
+}
+
+
+def test_conditions_compile_to_predicates():
+    assert compile_condition("user_mastery > 0.7")({"user_mastery": 0.8})
+    assert not compile_condition("user_mastery > 0.7")({})
+    assert compile_condition("0.2 <= user_mastery < 0.5 and phase == 'POST'")({"user_mastery": 0.3, "phase": "POST"})
+    assert compile_condition("not streak or level != 'MEDIO'")({"streak": 0})
+    assert not compile_condition("phase > 3")({"phase": "POST"})
+
+
+@pytest.mark.parametrize("rule", [
+    {"game": "CLOZE_SPRINT", "probability": "high"},
+    {"game": "CLOZE_SPRINT", "min_content_length": None},
+    {"game": "CLOZE_SPRINT", "requires": "content_slice"},
+    ["CLOZE_SPRINT"],
+])
+def test_invalid_rule_fields_are_config_errors(rule):
+    with pytest.raises(TriggerConfigError):
+        compile_triggers({"triggers": {"on_reading_complete": [rule]}})
+
+
+@pytest.mark.parametrize("expression", ["__import__('os')", "a.b > 1", "x + 1 > 2", "a in b", "1 >"])
+def test_unsupported_conditions_are_rejected(expression):
+    with pytest.raises(TriggerConfigError):
+        compile_condition(expression)
+
+
+def test_rules_are_matched_by_event_and_priority():
+    engine = TriggerEngine(config=CONFIG)
+
+    assert engine.decide("on_reading_complete", {"user_mastery": 0.1, "content_length": 900, "content_slice": True}) == "SRS_ARENA"
+    assert engine.decide("on_reading_complete", {"user_mastery": 0.5, "content_length": 900, "content_slice": True}) == "FREE_RECALL_SCORE"
+    assert engine.decide("on_reading_complete", {"user_mastery": 0.5, "target_word_count": 3}) == "CLOZE_SPRINT"
+    assert engine.decide("on_reading_complete", {"user_mastery": 0.5}) is None
+    assert engine.decide("on_intent", {"user_mastery": 0.9}, key="challenge") == "BOSS_FIGHT_VOCAB"
+    assert engine.decide("on_intent", {"user_mastery": 0.9}, key="review") is None
+
+
+def test_probabilities_use_the_rng():
+    config = {"triggers": {"on_reading_complete": [{"game": "CLOZE_SPRINT", "probability": 0.4}]}}
+    engine = TriggerEngine(config=config, rng=random.Random(3))
+
+    fired = sum(engine.decide("on_reading_complete", {}) is not None for _ in range(2000))
+
+    assert 700 < fired < 900
+
+
+def test_batch_matches_single_decisions():
+    events = [
+        ("on_reading_complete", None, {"user_mastery": m / 10, "target_word_count": m % 4})
+        for m in range(10)
+    ] + [("on_intent", "challenge", {"user_mastery": 0.95})]
+
+    single = TriggerEngine(config=CONFIG)
+    batch = TriggerEngine(config=CONFIG)
+
+    assert batch.decide_batch(events) == [single.decide(t, f, k) for t, k, f in events]
+    assert batch.get_stats()["decisions"] == len(events)
+
+
+def test_shipped_triggers_compile():
+    engine = TriggerEngine()
+
+    assert engine.rules("on_intent", "challenge")[0].game == "BOSS_FIGHT_VOCAB"
+    assert engine.rules("on_intent", "review")[0].priority == 0
+
+
+class TestHotReload:
+
+    def write(self, path, game, mtime):
+        path.write_text(f"triggers:\n  on_reading_complete:\n    - game: {game}\n", encoding="utf-8")
+        os.utime(path, ns=(mtime, mtime))
+
+    def test_file_changes_are_recompiled(self, game_config_dir, fake_clock):
+        path = game_config_dir / "triggers.yaml"
+        self.write(path, "CLOZE_SPRINT", 1_000_000_000)
+        engine = TriggerEngine(reload_seconds=5, clock=fake_clock)
+
+        assert engine.decide("on_reading_complete", {}) == "CLOZE_SPRINT"
+
+        self.write(path, "SRS_ARENA", 2_000_000_000)
+        fake_clock.now = 1
+        assert engine.decide("on_reading_complete", {}) == "CLOZE_SPRINT"  # not checked yet
+        fake_clock.now = 6
+        assert engine.decide("on_reading_complete", {}) == "SRS_ARENA"
+        assert engine.get_stats()["reloads"] == 1
+
+    def test_invalid_file_keeps_previous_rules(self, game_config_dir, fake_clock):
+        path = game_config_dir / "triggers.yaml"
+        self.write(path, "CLOZE_SPRINT", 1_000_000_000)
+        engine = TriggerEngine(reload_seconds=0, clock=fake_clock)
+        engine.decide("on_reading_complete", {})
+
+        path.write_text("triggers:\n  on_reading_complete:\n    - probability: 0.5\n", encoding="utf-8")
+        os.utime(path, ns=(3_000_000_000, 3_000_000_000))
+
+        assert engine.decide("on_reading_complete", {}) == "CLOZE_SPRINT"
+        assert engine.get_stats()["reload_errors"] == 1
+
+    def test_yaml_syntax_error_keeps_previous_rules(self, game_config_dir, fake_clock):
+        path = game_config_dir / "triggers.yaml"
+        self.write(path, "CLOZE_SPRINT", 1_000_000_000)
+        engine = TriggerEngine(reload_seconds=0, clock=fake_clock)
+        engine.decide("on_reading_complete", {})
+
+        path.write_text("triggers:\n  on_reading_complete: [\n", encoding="utf-8")
+        os.utime(path, ns=(3_000_000_000, 3_000_000_000))
+
+        assert engine.decide("on_reading_complete", {}) == "CLOZE_SPRINT"
+        assert engine.decide("on_reading_complete", {}) == "CLOZE_SPRINT"
+        stats = engine.get_stats()
+        assert stats["reload_errors"] == 1
+        assert stats["rule_groups"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mastery", [None, "alta"])
+async def test_start_game_tolerates_bad_mastery_and_engine_errors(mastery):
+    from educator.nodes import game_phase
+
+    state = {
+        "user_text": "START_GAME",
+        "prompt_message": {"metadata": {"intent": "challenge", "userMastery": mastery, "difficulty": 2}},
+        "context": {"contentSlice": {"text": ""}, "targetWords": []},
+    }
+    _, _, facts = game_phase.build_trigger_event(state["prompt_message"]["metadata"], {})
+    assert facts["user_mastery"] == 0.0
+
+    def broken(*args, **kwargs):
+        raise RuntimeError("engine down")
+
+    with patch.object(game_phase.trigger_engine, "decide", broken):
+        result = await game_phase._start_new_game(state)
+
+    assert result["next_prompt"].startswith("❌")
+
+
+@pytest.mark.asyncio
+async def test_start_game_without_mode_asks_the_engine():
+    from educator.nodes import game_phase
+
+    state = {
+        "user_text": "START_GAME",
+        "prompt_message": {"metadata": {"intent": "challenge", "userMastery": 0.9}},
+        "context": {"contentSlice": {"text": ""}, "targetWords": []},
+    }
+
+    with patch.object(game_phase, "trigger_engine", TriggerEngine(config=CONFIG)), \
+            patch.object(game_phase.round_pregen, "pop", lambda *a: None):
+        result = await game_phase._start_new_game(state)
+
+    assert result["game_mode"] == "BOSS_FIGHT_VOCAB"
+
+
+def test_benchmark_smoke():
+    results = run_benchmark(users=500, rounds=1)
+
+    assert results["single_decisions_per_s"] > 0
+    assert 0 < results["fired_ratio"] <= 1
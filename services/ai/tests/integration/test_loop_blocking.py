@@ -0,0 +1,164 @@
+"""
+Integration tests: routes must not block the event loop
+
+Runs the legacy LLM routes and /educator/turn against fake LLM work whose
+sync path sleeps, under LoopBlockingMonitor. Any route that calls the LLM
+synchronously inside `async def` stalls the loop and fails the test.
+"""
+import asyncio
+import os
+import time
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import StateGraph, END
+
+from educator.state import EducatorState
+from utils.context_builder import ContextPackBuilder
+from utils.context_cache import ContextCache
+from utils.loop_monitor import LoopBlockingMonitor
+
+# main.py validates the HMAC secret at import time
+os.environ.setdefault("AI_SERVICE_SECRET", "test-secret-" + "x" * 32)
+
+BLOCK_BUDGET_MS = 50
+FAKE_LLM_LATENCY_S = 0.2
+
+
+class SlowSyncChatModel(BaseChatModel):
+    """Fake LLM with a blocking sync path (like a real HTTP client call)"""
+
+    response: str = '{"simplified_text": "ok", "translated_text": "ok", "questions": []}'
+
+    @property
+    def _llm_type(self) -> str:
+        return "slow-sync-fake"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        time.sleep(FAKE_LLM_LATENCY_S)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self.response))])
+
+
+def slow_node(state: EducatorState) -> dict:
+    """Sync phase handler blocked on an LLM call"""
+    time.sleep(FAKE_LLM_LATENCY_S)
+    return {"next_prompt": "done"}
+
+
+class FakeNestJS:
+    async def get_session(self, session_id):
+        await asyncio.sleep(0)
+        return {"id": session_id, "userId": "u1", "contentId": "ct_1", "phase": "DURING"}
+
+    async def get_learner_profile(self, user_id):
+        return {"educationLevel": "MEDIO"}
+
+    async def get_vocab_focus(self, user_id, limit=50):
+        return {"dueWords": [], "totalDue": 0}
+
+    async def get_content_metadata(self, content_id):
+        return {"title": "Fotossíntese"}
+
+
+@pytest_asyncio.fixture
+async def monitor():
+    monitor = LoopBlockingMonitor(threshold_ms=BLOCK_BUDGET_MS)
+    await monitor.start()
+    yield monitor
+    await monitor.stop()
+
+
+@pytest.fixture
+def app(monkeypatch):
+    import main
+    monkeypatch.setattr(main, "get_llm", lambda: SlowSyncChatModel())
+    return main.app
+
+
+LEGACY_ROUTES = [
+    ("/simplify", {"text": "Texto"}),
+    ("/translate", {"text": "Texto", "from_lang": "PT", "to_lang": "EN"}),
+    ("/generate-assessment", {"text": "Texto", "num_questions": 1}),
+]
+
+
+class TestEventLoopBlocking:
+
+    @pytest.mark.asyncio
+    async def test_monitor_detects_blocking_call(self, monitor):
+        time.sleep(0.15)
+        await monitor.stop()
+
+        assert monitor.get_stats()["blocks"] == 1
+        assert monitor.max_block_ms >= 100
+        assert "time.sleep" in "".join(monitor.events[0]["stack"])
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("path,payload", LEGACY_ROUTES)
+    async def test_legacy_routes_do_not_block(self, app, monitor, path, payload):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post(path, json=payload)
+
+        await monitor.stop()
+        assert response.status_code == 200, response.text
+        assert monitor.max_block_ms < BLOCK_BUDGET_MS, monitor.get_stats()
+
+    @pytest.mark.asyncio
+    async def test_sync_graph_node_does_not_block(self, monitor):
+        # ainvoke runs sync nodes in a worker thread: no wrapping needed
+        workflow = StateGraph(EducatorState)
+        workflow.add_node("pre", slow_node)
+        workflow.set_entry_point("pre")
+        workflow.add_edge("pre", END)
+
+        result = await workflow.compile().ainvoke({"user_text": "", "current_phase": "PRE"})
+
+        await monitor.stop()
+        assert result["next_prompt"] == "done"
+        assert monitor.max_block_ms < BLOCK_BUDGET_MS, monitor.get_stats()
+
+    @pytest.mark.asyncio
+    async def test_educator_turn_does_not_block(self, monitor, monkeypatch):
+        from api import routes
+        from educator import agent
+        from educator.nodes import during_phase
+
+        monkeypatch.setattr(during_phase, "handle", slow_node)
+        graph = agent.create_educator_graph(checkpointer=MemorySaver())
+
+        async def get_graph():
+            return graph
+
+        monkeypatch.setattr("utils.context_builder.nestjs_client", FakeNestJS())
+        monkeypatch.setattr(routes, "context_builder", ContextPackBuilder(cache=ContextCache()))
+        monkeypatch.setattr(routes, "aget_educator_graph", get_graph)
+        app = FastAPI()
+        app.include_router(routes.educator_router)
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post("/educator/turn", json={"promptMessage": {
+                "threadId": "th_1",
+                "readingSessionId": "rs_1",
+                "actorRole": "LEARNER",
+                "text": "oi",
+                "clientTs": "2024-01-01T10:00:00Z",
+                "metadata": {
+                    "uiMode": "DURING",
+                    "contentId": "ct_1",
+                    "assetLayer": "L1",
+                    "readingIntent": "analytical",
+                },
+            }})
+
+        await monitor.stop()
+        assert response.status_code == 200, response.text
+        assert response.json()["nextPrompt"] == "done"
+        assert monitor.max_block_ms < BLOCK_BUDGET_MS, monitor.get_stats()
@@ -0,0 +1,84 @@
+"""
+Unit Tests for SlimCheckpointer
+
+Durable fields survive across turns; per-turn inputs never reach storage.
+"""
+
+import pytest
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import StateGraph, END
+
+from educator.checkpointer import SlimCheckpointer
+from educator.state import EducatorState, EPHEMERAL_FIELDS
+from metrics import get_metrics, reset_metrics
+
+
+def game_node(state: EducatorState) -> dict:
+    if state['user_text'] == 'START_GAME':
+        return {'game_mode': 'FREE_RECALL_SCORE', 'next_prompt': 'Go!'}
+    return {'next_prompt': f"Still playing {state.get('game_mode')}"}
+
+
+def build_graph(checkpointer):
+    workflow = StateGraph(EducatorState)
+    workflow.add_node("game", game_node)
+    workflow.set_entry_point("game")
+    workflow.add_edge("game", END)
+    return workflow.compile(checkpointer=checkpointer)
+
+
+def turn(text):
+    return {
+        "prompt_message": {"text": text},
+        "context": {"content": {"title": "x" * 5000}},
+        "current_phase": "DURING",
+        "user_text": text,
+        "parsed_events": [],
+        "next_prompt": "",
+        "quick_replies": [],
+        "events_to_write": [],
+        "hil_request": None,
+    }
+
+
+class TestSlimCheckpointer:
+
+    @pytest.mark.asyncio
+    async def test_durable_state_survives_turns(self):
+        inner = MemorySaver()
+        graph = build_graph(SlimCheckpointer(inner))
+        config = {"configurable": {"thread_id": "t1"}}
+
+        first = await graph.ainvoke(turn("START_GAME"), config=config)
+        second = await graph.ainvoke(turn("answer"), config=config)
+
+        assert first['next_prompt'] == 'Go!'
+        assert second['next_prompt'] == 'Still playing FREE_RECALL_SCORE'
+
+        stored = inner.get_tuple(config).checkpoint["channel_values"]
+        assert stored['game_mode'] == 'FREE_RECALL_SCORE'
+        assert not EPHEMERAL_FIELDS & set(stored)
+
+    def test_pending_writes_skip_ephemeral_channels(self):
+        inner = MemorySaver()
+        graph = build_graph(SlimCheckpointer(inner))
+        config = {"configurable": {"thread_id": "t2"}}
+
+        graph.invoke(turn("START_GAME"), config=config)
+
+        for _, writes in inner.writes.items():
+            for _, channel, _, _ in writes.values():
+                assert channel not in EPHEMERAL_FIELDS
+
+    def test_bytes_per_turn_reported(self):
+        reset_metrics()
+        graph = build_graph(SlimCheckpointer(MemorySaver()))
+        config = {"configurable": {"thread_id": "t3"}}
+
+        graph.invoke(turn("START_GAME"), config=config)
+        graph.invoke(turn("answer"), config=config)
+
+        checkpoints = get_metrics()['checkpoints']
+        assert checkpoints['turns'] == 2
+        # The 5KB context pack is never written
+        assert 0 < checkpoints['avg_bytes_per_turn'] < 1000
@@ -0,0 +1,141 @@
+"""
+Unit Tests for POST /educator/turns:batch
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from unittest.mock import patch
+
+from api import routes
+from utils.context_builder import ContextPackBuilder
+from utils.context_cache import ContextCache
+
+
+class FakeNestJS:
+    def __init__(self):
+        self.content_calls = 0
+
+    async def get_session(self, session_id):
+        await asyncio.sleep(0.005)
+        return {"id": session_id, "userId": f"u-{session_id}", "contentId": "ct_1", "phase": "DURING"}
+
+    async def get_learner_profile(self, user_id):
+        return {"educationLevel": "MEDIO"}
+
+    async def get_vocab_focus(self, user_id, limit=50):
+        return {"dueWords": [], "totalDue": 0}
+
+    async def get_content_metadata(self, content_id):
+        self.content_calls += 1
+        await asyncio.sleep(0.01)
+        return {"title": "Fotossíntese"}
+
+
+class FakeGraph:
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.order = []
+
+    async def ainvoke(self, state, config=None):
+        if state["user_text"] == "boom":
+            raise RuntimeError("node failed")
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        self.order.append((config["configurable"]["thread_id"], state["user_text"]))
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return {**state, "next_prompt": f"echo {state['user_text']}"}
+
+
+def turn(thread_id, session_id, text="oi"):
+    return {
+        "promptMessage": {
+            "threadId": thread_id,
+            "readingSessionId": session_id,
+            "actorRole": "LEARNER",
+            "text": text,
+            "clientTs": "2024-01-01T10:00:00Z",
+            "metadata": {
+                "uiMode": "DURING",
+                "contentId": "ct_1",
+                "assetLayer": "L1",
+                "readingIntent": "analytical",
+            },
+        }
+    }
+
+
+@pytest.fixture
+def env():
+    fake_nestjs = FakeNestJS()
+    graph = FakeGraph()
+    builder = ContextPackBuilder(cache=ContextCache())
+
+    async def get_graph():
+        return graph
+
+    app = FastAPI()
+    app.include_router(routes.educator_router)
+
+    with patch("utils.context_builder.nestjs_client", fake_nestjs), \
+         patch.object(routes, "context_builder", builder), \
+         patch.object(routes, "aget_educator_graph", get_graph), \
+         patch.object(routes, "BATCH_CONCURRENCY", 4), \
+         patch.object(routes, "BATCH_MAX_TURNS", 30):
+        yield app, fake_nestjs, graph
+
+
+async def post_batch(app, body):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.post("/educator/turns:batch", json=body)
+
+
+class TestBatchTurns:
+
+    @pytest.mark.asyncio
+    async def test_class_batch_shares_content_fetch(self, env):
+        app, fake_nestjs, graph = env
+
+        response = await post_batch(app, {"turns": [turn(f"th_{i}", f"rs_{i}") for i in range(20)]})
+
+        body = response.json()
+        assert response.status_code == 200
+        assert body["succeeded"] == 20
+        assert [r["index"] for r in body["results"]] == list(range(20))
+        assert body["results"][3]["response"]["nextPrompt"] == "echo oi"
+        assert fake_nestjs.content_calls == 1
+        assert graph.max_active <= 4
+
+    @pytest.mark.asyncio
+    async def test_same_thread_turns_run_in_order(self, env):
+        app, _, graph = env
+
+        turns = [turn("th_a", "rs_a", text=f"t{i}") for i in range(3)] + [turn("th_b", "rs_b")]
+        await post_batch(app, {"turns": turns})
+
+        assert [text for thread, text in graph.order if thread == "th_a"] == ["t0", "t1", "t2"]
+
+    @pytest.mark.asyncio
+    async def test_failed_item_does_not_fail_batch(self, env):
+        app, _, _ = env
+
+        response = await post_batch(app, {"turns": [turn("th_1", "rs_1", "boom"), turn("th_2", "rs_2")]})
+
+        body = response.json()
+        assert body["failed"] == 1
+        assert body["results"][0]["status"] == 500
+        assert "node failed" in body["results"][0]["error"]
+        assert body["results"][1]["status"] == 200
+
+    @pytest.mark.asyncio
+    async def test_oversized_batch_rejected(self, env):
+        app, _, _ = env
+
+        response = await post_batch(app, {"turns": [turn(f"th_{i}", f"rs_{i}") for i in range(31)]})
+
+        assert response.status_code == 413
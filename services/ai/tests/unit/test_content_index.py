@@ -0,0 +1,114 @@
+"""
+Unit Tests for the per-content vocabulary and sentence index
+
+Covers building (sentences, term stats, postings, readability), the
+memory-mapped round trip, and lazy loading by content id.
+"""
+
+import numpy as np
+import pytest
+
+from content_index import ContentIndex, ContentIndexStore, lemma, segment_sentences
+from educator.nodes import pre_phase
+
+TEXT = (
+    "A fotossíntese é o processo pelo qual as plantas produzem glicose. "
+    "O Dr. Silva estudou a fotossíntese nas folhas. "
+    "As plantas liberam oxigênio durante a fotossíntese."
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ContentIndexStore(root_dir=tmp_path, max_loaded=2)
+
+
+class TestContentIndex:
+
+    def test_sentences_keep_abbreviations(self):
+        assert segment_sentences(TEXT)[1] == "O Dr. Silva estudou a fotossíntese nas folhas."
+
+    def test_terms_and_postings(self):
+        index = ContentIndex.build(TEXT)
+
+        assert len(index) == 3
+        assert index.sentence(2) == "As plantas liberam oxigênio durante a fotossíntese."
+        assert index.tokens_of(1)[:3] == ["o", "dr", "silva"]
+        assert index.term_frequency("Fotossíntese") == 3
+        assert index.sentences_with("plantas") == [0, 2]
+        assert index.sentences_with("ausente") == []
+        assert index.keywords[0] == "fotossíntese"
+        assert index.lemma_frequencies()["planta"] == 2
+
+    def test_readability_stats(self):
+        stats = ContentIndex.build(TEXT).readability
+
+        assert stats["sentences"] == 3
+        assert stats["words"] == 26
+        assert stats["avg_sentence_words"] == pytest.approx(26 / 3, abs=0.01)
+        assert 0 < stats["long_word_ratio"] < 1
+
+    def test_empty_text(self):
+        index = ContentIndex.build("")
+
+        assert len(index) == 0
+        assert index.keywords == []
+        assert index.readability["avg_sentence_words"] == 0.0
+
+    def test_lemma(self):
+        assert lemma("Soluções") == "solucao"
+        assert lemma("animais") == "animal"
+        assert lemma("plantas") == "planta"
+
+
+class TestContentIndexStore:
+
+    def test_saved_index_is_memory_mapped(self, store, tmp_path):
+        built = store.build("content-1", TEXT)
+        store.clear()
+
+        loaded = store.get("content-1")
+
+        assert isinstance(loaded.tokens, np.memmap)
+        assert loaded.sentences == built.sentences
+        assert loaded.keywords == built.keywords
+        assert loaded.readability == built.readability
+        assert store.get("content-1") is loaded
+        assert store.get_stats()["loads"] == 1
+
+    def test_unknown_content_is_none(self, store):
+        assert store.get("missing") is None
+        assert store.get(None) is None
+
+    def test_unsafe_ids_stay_inside_the_root(self, store, tmp_path):
+        store.build("../escape", TEXT)
+
+        assert not (tmp_path.parent / "escape").exists()
+        store.clear()
+        assert store.get("../escape") is not None
+
+    def test_text_indexes_are_shared_and_bounded(self, store):
+        first = store.for_text(TEXT)
+
+        assert store.for_text(TEXT) is first
+        store.for_text("Outro texto.")
+        store.for_text("Mais um texto.")
+        assert store.for_text(TEXT) is not first
+
+
+class TestConsumers:
+
+    def test_pre_phase_proposes_content_keywords(self, store, monkeypatch):
+        store.build("content-1", TEXT)
+        monkeypatch.setattr(pre_phase, "content_indexes", store)
+        state = {
+            "context": {
+                "session": {"id": "s1", "contentId": "content-1", "goalStatement": "x", "predictionText": "y"},
+                "learner": {"educationLevel": "MEDIO"},
+            },
+            "user_text": "",
+        }
+
+        result = pre_phase.handle(state)
+
+        assert "fotossíntese" in result["next_prompt"]
@@ -0,0 +1,100 @@
+"""
+Unit Tests for ContextPackBuilder speculative fetch
+
+The session index lets later turns fetch session, profile, vocab and
+content concurrently; a stale index falls back to the sequential path.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from utils.context_builder import ContextPackBuilder
+from utils.context_cache import ContextCache
+
+
+class FakeNestJS:
+    """Records call order; session resolves only after dependents were issued"""
+
+    def __init__(self, session):
+        self.session = session
+        self.calls = []
+
+    async def get_session(self, session_id):
+        self.calls.append("session")
+        await asyncio.sleep(0.01)
+        return dict(self.session)
+
+    async def get_learner_profile(self, user_id):
+        self.calls.append(f"profile:{user_id}")
+        return {"educationLevel": "MEDIO"}
+
+    async def get_vocab_focus(self, user_id, limit=50):
+        self.calls.append(f"vocab:{user_id}")
+        return {"dueWords": [], "totalDue": 0}
+
+    async def get_content_metadata(self, content_id):
+        self.calls.append(f"content:{content_id}")
+        return {"title": content_id}
+
+
+@pytest.fixture
+def builder():
+    # No caching, so every turn hits the (fake) NestJS client
+    cache = ContextCache(ttls={"content": 0, "profile": 0, "vocab": 0, "session": 0})
+    return ContextPackBuilder(cache=cache)
+
+
+def session(user_id="u1", content_id="c1"):
+    return {"id": "s1", "userId": user_id, "contentId": content_id, "phase": "DURING"}
+
+
+class TestSpeculativeContextFetch:
+
+    @pytest.mark.asyncio
+    async def test_second_turn_fetches_concurrently(self, builder):
+        fake = FakeNestJS(session())
+
+        with patch("utils.context_builder.nestjs_client", fake):
+            await builder.build({"readingSessionId": "s1"})
+            assert fake.calls[0] == "session"
+            assert builder.stats["sequential"] == 1
+
+            fake.calls.clear()
+            pack = await builder.build({"readingSessionId": "s1"})
+
+        # Dependents were issued before the session response arrived
+        assert fake.calls == ["session", "profile:u1", "vocab:u1", "content:c1"]
+        assert builder.stats["speculative_hits"] == 1
+        assert pack["content"]["title"] == "c1"
+
+    @pytest.mark.asyncio
+    async def test_stale_index_falls_back(self, builder):
+        fake = FakeNestJS(session())
+
+        with patch("utils.context_builder.nestjs_client", fake):
+            await builder.build({"readingSessionId": "s1"})
+
+            fake.session = session(content_id="c2")
+            fake.calls.clear()
+            pack = await builder.build({"readingSessionId": "s1"})
+
+        assert builder.stats["speculative_mismatches"] == 1
+        assert fake.calls[-1] == "content:c2"
+        assert pack["content"]["title"] == "c2"
+        assert pack["session"]["contentId"] == "c2"
+        assert builder.session_index.get("s1") == ("u1", "c2")
+
+    @pytest.mark.asyncio
+    async def test_session_failure_propagates(self, builder):
+        fake = FakeNestJS(session())
+
+        async def broken(session_id):
+            raise RuntimeError("nestjs down")
+
+        with patch("utils.context_builder.nestjs_client", fake):
+            await builder.build({"readingSessionId": "s1"})
+            fake.get_session = broken
+
+            with pytest.raises(RuntimeError):
+                await builder.build({"readingSessionId": "s1"})
@@ -0,0 +1,194 @@
+"""
+Unit Tests for ContextCache
+
+Covers per-field TTLs, invalidation, request coalescing and the
+cached ContextPackBuilder path.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from utils.context_cache import ContextCache
+from utils.context_builder import ContextPackBuilder
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return ContextCache(
+        ttls={"content": 3600, "profile": 600, "vocab": 60, "session": 0},
+        clock=clock
+    )
+
+
+class TestContextCache:
+
+    @pytest.mark.asyncio
+    async def test_hit_within_ttl_and_expiry(self, cache, clock):
+        fetch = AsyncMock(return_value={"title": "A"})
+
+        await cache.get_or_fetch("vocab", "u1", fetch)
+        await cache.get_or_fetch("vocab", "u1", fetch)
+        assert fetch.await_count == 1
+
+        clock.now += 61
+        await cache.get_or_fetch("vocab", "u1", fetch)
+        assert fetch.await_count == 2
+
+        stats = cache.get_stats()["fields"]["vocab"]
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_session_is_not_cached(self, cache):
+        fetch = AsyncMock(return_value={"id": "s1"})
+
+        await cache.get_or_fetch("session", "s1", fetch)
+        await cache.get_or_fetch("session", "s1", fetch)
+
+        assert fetch.await_count == 2
+        assert cache.get_stats()["fields"]["session"]["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_invalidate_user(self, cache):
+        fetch = AsyncMock(return_value={})
+        await cache.get_or_fetch("profile", "u1", fetch)
+        await cache.get_or_fetch("vocab", "u1", fetch)
+        await cache.get_or_fetch("content", "c1", fetch)
+
+        assert cache.invalidate_user("u1") == 2
+        assert cache.get_stats()["entries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_discard_removes_one_key_without_scanning(self, cache):
+        fetch = AsyncMock(return_value={})
+        await cache.get_or_fetch("content", "c1", fetch)
+        await cache.get_or_fetch("content", "c2", fetch)
+
+        class NoScan(type(cache._entries)):
+            def __iter__(self):
+                raise AssertionError("entries scanned")
+
+        cache._entries = NoScan(cache._entries)
+
+        assert cache.discard("content", "c1") is True
+        assert cache.discard("content", "c1") is False
+        assert cache.invalidate("content", "c2") == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidation_drops_in_flight_fetch(self, cache):
+        release = asyncio.Event()
+        versions = iter(["old", "new"])
+
+        async def fetch():
+            value = next(versions)
+            if value == "old":
+                await release.wait()
+            return value
+
+        stale = asyncio.create_task(cache.get_or_fetch("profile", "u1", fetch))
+        await asyncio.sleep(0)
+        cache.invalidate_user("u1")
+
+        # Not coalesced with the outdated fetch
+        assert await cache.get_or_fetch("profile", "u1", fetch) == "new"
+        release.set()
+        assert await stale == "old"
+
+        assert await cache.get_or_fetch("profile", "u1", AsyncMock()) == "new"
+        assert not cache._generations and not cache._running
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self, cache):
+        calls = 0
+
+        async def slow_fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"title": "A"}
+
+        results = await asyncio.gather(
+            *[cache.get_or_fetch("content", "c1", slow_fetch) for _ in range(10)]
+        )
+
+        assert calls == 1
+        assert all(r == {"title": "A"} for r in results)
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, cache):
+        fetch = AsyncMock(side_effect=[RuntimeError("down"), {"title": "A"}])
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_fetch("content", "c1", fetch)
+
+        assert await cache.get_or_fetch("content", "c1", fetch) == {"title": "A"}
+
+    @pytest.mark.asyncio
+    async def test_lru_bound(self, clock):
+        cache = ContextCache(max_entries=2, clock=clock)
+        fetch = AsyncMock(return_value={})
+
+        for key in ("c1", "c2", "c3"):
+            await cache.get_or_fetch("content", key, fetch)
+
+        assert cache.get_stats()["entries"] == 2
+        assert cache.invalidate_content("c1") == 0
+
+
+class TestCachedContextPackBuilder:
+
+    @pytest.mark.asyncio
+    async def test_second_turn_only_fetches_session(self, cache):
+        session = {"id": "s1", "userId": "u1", "contentId": "c1", "phase": "PRE"}
+
+        with patch("utils.context_builder.nestjs_client") as client:
+            client.get_session = AsyncMock(return_value=session)
+            client.get_learner_profile = AsyncMock(return_value={"educationLevel": "MEDIO"})
+            client.get_vocab_focus = AsyncMock(return_value={"dueWords": [], "totalDue": 0})
+            client.get_content_metadata = AsyncMock(return_value={"title": "Texto"})
+
+            builder = ContextPackBuilder(cache=cache)
+            await builder.build({"readingSessionId": "s1"})
+            pack = await builder.build({"readingSessionId": "s1"})
+
+        assert pack["content"]["title"] == "Texto"
+        assert client.get_session.await_count == 2
+        assert client.get_learner_profile.await_count == 1
+        assert client.get_vocab_focus.await_count == 1
+        assert client.get_content_metadata.await_count == 1
+
+
+class TestInvalidateEndpoint:
+
+    @pytest.mark.asyncio
+    async def test_unknown_fields_are_rejected(self, cache):
+        import httpx
+        from fastapi import FastAPI
+        from api import routes
+
+        app = FastAPI()
+        app.include_router(routes.educator_router)
+        await cache.get_or_fetch("profile", "u1", AsyncMock(return_value={}))
+
+        with patch.object(routes, "context_cache", cache):
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+                bad = await client.post("/educator/context/invalidate", json={"userId": "u1", "fields": ["profiel"]})
+                good = await client.post("/educator/context/invalidate", json={"userId": "u1", "fields": ["profile"]})
+
+        assert bad.status_code == 400
+        assert "profiel" in bad.json()["detail"]
+        assert good.json() == {"invalidated": 1}
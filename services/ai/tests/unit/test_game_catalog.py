@@ -0,0 +1,92 @@
+"""
+Unit Tests for the indexed game catalog and /games ETag handling
+"""
+
+import itertools
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from api.games_router import router
+from games.catalog import GameCatalog
+from games.registry import game_registry
+
+
+def brute_force(records, filters):
+    def keep(r):
+        low, high = r['difficulty_range']
+        return (
+            r['duration_min'] <= filters.get('max_duration', 10 ** 6)
+            and r['duration_min'] >= filters.get('min_duration', 0)
+            and r['requires_content'] == filters.get('requires_content', r['requires_content'])
+            and r['game_intent'] == filters.get('game_intent', r['game_intent'])
+            and high >= filters.get('difficulty_min', 0)
+            and low <= filters.get('difficulty_max', 10 ** 6)
+        )
+    return [r['id'] for r in records if keep(r)]
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(router)
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+class TestGameCatalog:
+
+    def test_indexed_queries_match_linear_filtering(self):
+        catalog = game_registry.catalog
+        records = catalog.query()
+        options = {
+            'max_duration': [None, 3, 5, 8],
+            'min_duration': [None, 5],
+            'requires_content': [None, True, False],
+            'game_intent': [None, 'recall', 'analysis', 'nope'],
+            'difficulty_min': [None, 4],
+            'difficulty_max': [None, 1, 3],
+        }
+
+        for combo in itertools.product(*options.values()):
+            filters = {k: v for k, v in zip(options, combo) if v is not None}
+            assert [r['id'] for r in catalog.query(filters)] == brute_force(records, filters), filters
+
+    def test_records_are_immutable(self):
+        record = game_registry.catalog.get('FREE_RECALL_SCORE')
+
+        with pytest.raises(TypeError):
+            record['name'] = 'changed'
+        assert isinstance(game_registry.list_games()[0], dict)
+
+    def test_list_body_is_precomputed(self):
+        catalog = GameCatalog({
+            'A': {'name': 'A', 'duration_min': 3, 'requires_content': True,
+                  'game_intent': 'recall', 'difficulty_range': [1, 3]},
+        })
+
+        assert catalog.query_body() == (catalog.list_body, catalog.list_etag)
+        assert catalog.list_body == (
+            b'{"games":[{"id":"A","name":"A","duration_min":3,"requires_content":true,'
+            b'"game_intent":"recall","difficulty_range":[1,3]}],"total":1}'
+        )
+
+    @pytest.mark.asyncio
+    async def test_etag_revalidation(self, client):
+        async with client:
+            first = await client.get("/games")
+            again = await client.get("/games", headers={"If-None-Match": first.headers["ETag"]})
+            filtered = await client.get("/games", params={"game_intent": "recall"})
+            item = await client.get("/games/FREE_RECALL_SCORE")
+            item_again = await client.get("/games/FREE_RECALL_SCORE", headers={"If-None-Match": item.headers["ETag"]})
+            missing = await client.get("/games/NOPE")
+
+        assert first.status_code == 200
+        assert first.json()["total"] == game_registry.count()
+        assert again.status_code == 304
+        assert again.content == b""
+        assert all(g["game_intent"] == "recall" for g in filtered.json()["games"])
+        assert filtered.headers["ETag"] != first.headers["ETag"]
+        assert item.json()["id"] == "FREE_RECALL_SCORE"
+        assert item_again.status_code == 304
+        assert missing.status_code == 404
@@ -0,0 +1,90 @@
+"""
+Unit Tests for manifest-based game discovery
+"""
+
+import importlib
+import json
+import sys
+
+import pytest
+
+from games.manifest import build_manifest
+from games.registry import GameRegistry
+
+GAME_SOURCE = '''
+from games.base import BaseGame
+
+IMPORTED = True
+
+
+class {cls}(BaseGame):
+    GAME_ID = "{game_id}"
+    GAME_NAME = "{name}"
+    DURATION_MIN = 4
+    GAME_INTENT = "recall"
+
+    def create_round(self, state, difficulty):
+        return {{"prompt": "?"}}
+
+    async def evaluate_answer(self, round_data, answer):
+        return {{"score": 1}}
+'''
+
+
+@pytest.fixture
+def fake_modes(tmp_path, monkeypatch):
+    package = tmp_path / "fakegames"
+    modes = package / "modes"
+    modes.mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    (modes / "__init__.py").write_text("")
+    (modes / "alpha.py").write_text(GAME_SOURCE.format(cls="AlphaGame", game_id="ALPHA", name="Alpha"))
+    (modes / "_draft.py").write_text(GAME_SOURCE.format(cls="DraftGame", game_id="DRAFT", name="Draft"))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield modes
+    for name in [m for m in sys.modules if m.startswith("fakegames")]:
+        del sys.modules[name]
+
+
+class TestGameManifest:
+
+    def test_manifest_matches_game_classes(self):
+        manifest = build_manifest()
+
+        assert len(manifest["games"]) >= 15
+        for game_id, entry in manifest["games"].items():
+            game_class = getattr(importlib.import_module(entry["module"]), entry["class_name"])
+            assert game_class.GAME_ID == game_id
+            assert entry["name"] == game_class.GAME_NAME
+            assert entry["duration_min"] == game_class.DURATION_MIN
+            assert entry["requires_content"] == game_class.REQUIRES_CONTENT
+            assert entry["game_intent"] == game_class.GAME_INTENT
+            assert tuple(entry["difficulty_range"]) == game_class.DIFFICULTY_RANGE
+
+    def test_catalog_does_not_import_modes(self, fake_modes, tmp_path):
+        registry = GameRegistry(fake_modes, "fakegames.modes", tmp_path / "manifest.json")
+
+        games = registry.list_games({"max_duration": 5})
+
+        assert [g["id"] for g in games] == ["ALPHA"]
+        assert games[0]["difficulty_range"] == (1, 5)  # BaseGame default
+        assert not registry.is_registered("DRAFT")
+        assert "fakegames.modes.alpha" not in sys.modules
+        assert (tmp_path / "manifest.json").exists()
+
+        game_class = registry.get_game("ALPHA")
+
+        assert game_class.__name__ == "AlphaGame"
+        assert "fakegames.modes.alpha" in sys.modules
+        with pytest.raises(ValueError):
+            registry.get_game("MISSING")
+
+    def test_stale_manifest_is_rebuilt(self, fake_modes, tmp_path):
+        manifest_path = tmp_path / "manifest.json"
+        GameRegistry(fake_modes, "fakegames.modes", manifest_path).discover_games()
+
+        (fake_modes / "alpha.py").write_text(GAME_SOURCE.format(cls="AlphaGame", game_id="ALPHA", name="Alpha v2"))
+        registry = GameRegistry(fake_modes, "fakegames.modes", manifest_path)
+
+        assert registry.get_metadata("ALPHA")["name"] == "Alpha v2"
+        assert json.loads(manifest_path.read_text())["games"]["ALPHA"]["name"] == "Alpha v2"
@@ -0,0 +1,116 @@
+"""
+Unit Tests for NestJSClient
+
+Uses httpx.MockTransport, so no NestJS instance is needed.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from metrics import get_latency_histograms, reset_metrics, LatencyHistogram
+from utils.nestjs_client import NestJSClient
+
+
+def make_client(handler, **kwargs):
+    return NestJSClient(
+        base_url="http://nestjs.test/api/v1",
+        transport=httpx.MockTransport(handler),
+        **kwargs
+    )
+
+
+class TestNestJSClient:
+
+    @pytest.mark.asyncio
+    async def test_requests_share_one_pooled_client(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request.url.path)
+            return httpx.Response(200, json={"id": "rs_1", "userId": "u1"})
+
+        client = make_client(handler)
+        await client.start()
+        pool = client._client
+
+        await client.get_session("rs_1")
+        await client.get_learner_profile("u1")
+
+        assert client._client is pool
+        assert seen == ["/api/v1/reading-sessions/rs_1", "/api/v1/profiles/u1"]
+        await client.aclose()
+        assert client._client is None
+
+    @pytest.mark.asyncio
+    async def test_per_endpoint_timeout_and_latency(self):
+        timeouts = {}
+
+        def handler(request):
+            timeouts[request.url.path] = request.extensions["timeout"]["read"]
+            return httpx.Response(200, json=[])
+
+        reset_metrics()
+        client = make_client(handler, timeouts={"session": 0.5, "vocab": 4.0})
+
+        await client.get_session("rs_1")
+        await client.get_vocab_focus("u1")
+
+        assert timeouts["/api/v1/reading-sessions/rs_1"] == 0.5
+        assert timeouts["/api/v1/vocab"] == 4.0
+        latency = get_latency_histograms()
+        assert latency["nestjs.session"]["count"] == 1
+        assert latency["nestjs.vocab"]["count"] == 1
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_vocab_error_returns_empty(self):
+        client = make_client(lambda request: httpx.Response(500))
+
+        assert await client.get_vocab_focus("u1") == {"dueWords": [], "totalDue": 0}
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_content_metadata("ct_1")
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_ping(self):
+        def down(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        assert await make_client(lambda request: httpx.Response(404)).ping() is True
+        assert await make_client(down).ping() is False
+
+
+    def test_client_from_another_loop_is_closed(self):
+        client = make_client(lambda request: httpx.Response(200, json={}))
+
+        async def open_pool():
+            await client.start()
+            return client._client
+
+        async def reuse():
+            await client.get_session("rs_1")
+            await asyncio.sleep(0)
+            return client._client
+
+        stale = asyncio.run(open_pool())
+        fresh = asyncio.run(reuse())
+
+        assert fresh is not stale
+        assert stale.is_closed
+        assert not client._closing
+        asyncio.run(client.aclose())
+
+
+class TestLatencyHistogram:
+
+    def test_percentiles_use_bucket_bounds(self):
+        hist = LatencyHistogram()
+        for ms in [3] * 90 + [40] * 9 + [20000]:
+            hist.observe(ms)
+
+        assert hist.percentile(50) == 5
+        assert hist.percentile(95) == 50
+        assert hist.percentile(100) == 20000
+        assert hist.snapshot()["count"] == 100
@@ -0,0 +1,124 @@
+"""
+Unit Tests for ServiceContainer (lazy singletons + warmup)
+"""
+
+import builtins
+import importlib
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from utils.service_container import ServiceContainer, services
+
+
+class Counter:
+    built = 0
+
+    def __init__(self):
+        Counter.built += 1
+        self.value = 42
+
+    def ping(self):
+        return "pong"
+
+
+class TestServiceContainer:
+
+    def test_lazy_proxy_builds_once_on_first_use(self):
+        container = ServiceContainer()
+        Counter.built = 0
+        proxy = container.lazy("counter", Counter)
+
+        assert Counter.built == 0
+        assert proxy.ping() == "pong"
+        assert proxy.value == 42
+        assert Counter.built == 1
+        assert container.is_initialized("counter")
+
+    def test_factory_error_is_not_cached(self):
+        container = ServiceContainer()
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("OPENAI_API_KEY not set")
+            return Counter()
+
+        container.register("flaky", flaky)
+
+        with pytest.raises(RuntimeError):
+            container.get("flaky")
+        assert container.get_stats()["flaky"]["error"] == "OPENAI_API_KEY not set"
+
+        assert container.get("flaky").value == 42
+        assert container.get_stats()["flaky"]["error"] is None
+
+    @pytest.mark.asyncio
+    async def test_warmup_runs_in_parallel(self):
+        container = ServiceContainer()
+
+        def slow():
+            time.sleep(0.2)
+            return object()
+
+        for name in ("a", "b", "c"):
+            container.register(name, slow)
+
+        start = time.perf_counter()
+        results = await container.warmup()
+        elapsed = time.perf_counter() - start
+
+        assert all(r["status"] == "ready" for r in results.values())
+        assert elapsed < 0.5
+
+    @pytest.mark.asyncio
+    async def test_warmup_reports_unknown_and_errors(self):
+        container = ServiceContainer()
+        container.register("broken", lambda: 1 / 0)
+
+        results = await container.warmup(["broken", "missing"])
+
+        assert results["broken"]["status"] == "error"
+        assert results["missing"]["status"] == "unknown"
+
+    def test_router_singletons_are_not_built_at_import(self):
+        from grading.auto_grader import auto_grader  # noqa: F401
+        from tutor.study_buddy import study_buddy  # noqa: F401
+
+        assert "auto_grader" in services.names()
+        assert "study_buddy" in services.names()
+        assert not services.is_initialized("auto_grader")
+
+    def test_failed_app_assembly_restores_import(self, monkeypatch):
+        original_import = builtins.__import__
+        monkeypatch.delitem(sys.modules, "main", raising=False)
+        monkeypatch.setenv("AI_SERVICE_SECRET", "too-short")
+
+        with pytest.raises(ValueError):
+            importlib.import_module("main")
+
+        assert builtins.__import__ is original_import
+
+    def test_app_assembly_does_not_import_llm_sdks(self):
+        # Fresh interpreter: this session has imported them already
+        code = (
+            "import sys, main; "
+            "print([m for m in ('langchain_openai', 'langchain_anthropic', 'langchain_google_genai') "
+            "if m in sys.modules])"
+        )
+        env = {**os.environ, "AI_SERVICE_SECRET": "test-secret-" + "x" * 32}
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env=env,
+            cwd=os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+            timeout=120,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip().splitlines()[-1] == "[]"
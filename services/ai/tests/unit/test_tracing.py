@@ -0,0 +1,76 @@
+"""
+Unit Tests for per-request tracing (spans, Server-Timing, histograms)
+"""
+
+import asyncio
+import os
+
+import httpx
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from metrics import get_latency_histograms, reset_metrics
+from utils.tracing import (
+    LLMTracingCallback,
+    end_trace,
+    exporter,
+    span,
+    start_trace,
+    traced,
+)
+
+
+class TestTracing:
+
+    def test_spans_accumulate_per_stage(self):
+        reset_metrics()
+        trace = start_trace("corr-1")
+
+        with span("nestjs.session"):
+            pass
+        with span("nestjs.session"):
+            pass
+        with span("graph"):
+            pass
+        end_trace(trace)
+
+        assert trace.stages["nestjs.session"]["count"] == 2
+        header = trace.server_timing()
+        assert header.startswith("nestjs.session;dur=")
+        assert "graph;dur=" in header
+        assert header.split(", ")[-1].startswith("total;dur=")
+        assert get_latency_histograms()["nestjs.session"]["count"] == 2
+        assert exporter.get("corr-1") is trace
+
+    @pytest.mark.asyncio
+    async def test_spans_from_worker_threads_reach_request_trace(self):
+        trace = start_trace("corr-2")
+
+        @traced("node.pre")
+        def sync_node():
+            return "ok"
+
+        assert await asyncio.to_thread(sync_node) == "ok"
+        assert "node.pre" in trace.stages
+
+    @pytest.mark.asyncio
+    async def test_llm_callback_records_llm_stage(self):
+        trace = start_trace("corr-3")
+        llm = FakeListChatModel(responses=["hello"])
+
+        await llm.ainvoke("hi", config={"callbacks": [LLMTracingCallback(trace)]})
+
+        assert trace.stages["llm"]["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_server_timing_header_on_responses(self):
+        os.environ.setdefault("AI_SERVICE_SECRET", "test-secret-" + "x" * 32)
+        import main
+
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/health", headers={"X-Correlation-ID": "corr-4"})
+            traces = await client.get("/traces", params={"trace_id": "corr-4"})
+
+        assert "total;dur=" in response.headers["Server-Timing"]
+        assert traces.json()["trace_id"] == "corr-4"
@@ -0,0 +1,54 @@
+"""
+Unit Tests for the educator turn benchmark harness
+"""
+
+import pytest
+
+from benchmarks.turn_benchmark import (
+    PHASES,
+    compare_reports,
+    parse_server_timing,
+    percentile,
+    run_benchmark,
+)
+
+
+class TestTurnBenchmark:
+
+    def test_percentile_and_server_timing_parsing(self):
+        assert percentile([5, 1, 4, 2, 3], 50) == 3
+        assert percentile([5, 1, 4, 2, 3], 99) == 5
+        assert parse_server_timing("context.build;dur=12.5, graph;dur=3, total;dur=16.0") == {
+            "context.build": 12.5,
+            "graph": 3.0,
+            "total": 16.0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_smoke_run_reports_every_phase(self):
+        report = await run_benchmark(turns=2, concurrency=4, nestjs_latency_ms=1, llm_latency_ms=1)
+
+        assert report["total"]["errors"] == 0
+        for phase in PHASES:
+            assert report["phases"][phase]["count"] == 2
+            assert "context.build" in report["phases"][phase]["stages"]
+        assert "node.game" in report["phases"]["GAME"]["stages"]
+        assert report["llm"]["calls"] == 1
+        assert {"session", "profile", "vocab"} <= set(report["nestjs_calls"])
+
+    def test_compare_reports_flags_p95_regressions(self):
+        baseline = {
+            "total": {"p95_ms": 100, "errors": 0},
+            "phases": {phase: {"p95_ms": 100, "errors": 0} for phase in PHASES},
+        }
+        current = {
+            "total": {"p95_ms": 110, "errors": 0},
+            "phases": {phase: {"p95_ms": 100, "errors": 0} for phase in PHASES},
+        }
+        current["phases"]["GAME"] = {"p95_ms": 180, "errors": 1}
+
+        regressions = compare_reports(baseline, current, tolerance=0.2)
+
+        assert len(regressions) == 2
+        assert regressions[0].startswith("GAME: p95")
+        assert "errors 0 → 1" in regressions[1]
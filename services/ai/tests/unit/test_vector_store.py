@@ -0,0 +1,139 @@
+"""
+Unit Tests for pluggable vector store backends
+
+Covers the in-process NumPy backend (search, filters, snapshots) and
+per-tenant backend selection in VectorStoreRegistry.
+"""
+
+import numpy as np
+import pytest
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from memory_store import NumpyVectorStore, VectorStoreRegistry
+from memory_store.base import VectorStoreBackend
+
+
+@pytest.fixture
+def embedding():
+    return DeterministicFakeEmbedding(size=32)
+
+
+class RecordingRemoteStore(VectorStoreBackend):
+    """Stand-in for the Redis backend"""
+    name = "redis"
+
+    def __init__(self):
+        self.texts = []
+
+    def add_texts(self, texts, metadatas=None):
+        self.texts.extend(texts)
+        return len(texts)
+
+    def similarity_search_with_score(self, query, k=6, filter=None):
+        return []
+
+    def count(self):
+        return len(self.texts)
+
+
+class TestNumpyVectorStore:
+
+    def test_exact_match_ranks_first(self, embedding):
+        store = NumpyVectorStore(embedding)
+        store.add_texts(
+            ["Blocker: 'inferir'.", "Blocker: 'premissa'.", "Vocabulário dominado: causa."],
+            [{"kind": "blocker"}, {"kind": "blocker"}, {"kind": "vocab_progress"}]
+        )
+
+        results = store.similarity_search_with_score("Blocker: 'premissa'.", k=2)
+
+        assert len(results) == 2
+        doc, score = results[0]
+        assert doc.page_content == "Blocker: 'premissa'."
+        assert score == pytest.approx(1.0, abs=1e-5)
+        assert results[0][1] >= results[1][1]
+
+    def test_filter_by_kind(self, embedding):
+        store = NumpyVectorStore(embedding)
+        store.add_texts(
+            ["a", "b", "c"],
+            [{"kind": "blocker"}, {"kind": "intervention"}, {"kind": "blocker"}]
+        )
+
+        results = store.similarity_search_with_score("b", k=5, filter={"kind": "blocker"})
+
+        assert {doc.page_content for doc, _ in results} == {"a", "c"}
+
+    def test_matrix_is_contiguous_float32(self, embedding):
+        store = NumpyVectorStore(embedding)
+        store.add_texts([f"memory {i}" for i in range(100)])
+
+        assert store.count() == 100
+        assert store._matrix.dtype == np.float32
+        assert store._matrix.flags.c_contiguous
+
+    def test_snapshot_roundtrip_is_memory_mapped(self, embedding, tmp_path):
+        writer = NumpyVectorStore(embedding, snapshot_dir=tmp_path)
+        writer.add_texts(["x", "y"], [{"kind": "blocker"}, {"kind": "struggle"}])
+
+        reader = NumpyVectorStore(embedding, snapshot_dir=tmp_path)
+
+        assert reader.count() == 2
+        assert isinstance(reader._matrix, np.memmap)
+        assert reader.similarity_search_with_score("y", k=1)[0][0].metadata == {"kind": "struggle"}
+
+        # Reader picks up a newer snapshot published by the writer
+        writer.add_texts(["z"])
+        assert reader.similarity_search_with_score("z", k=1)[0][0].page_content == "z"
+        assert reader.count() == 3
+
+    def test_write_after_mmap_load(self, embedding, tmp_path):
+        NumpyVectorStore(embedding, snapshot_dir=tmp_path).add_texts(["x"])
+
+        store = NumpyVectorStore(embedding, snapshot_dir=tmp_path)
+        store.add_texts(["y"])
+
+        assert store.count() == 2
+
+
+class TestVectorStoreRegistry:
+
+    def test_small_tenant_uses_numpy(self, embedding, tmp_path):
+        registry = VectorStoreRegistry(embedding=embedding, mode="auto", root_dir=tmp_path)
+
+        registry.add_texts("t1", ["a", "b"])
+
+        assert registry.backend_for("t1") == "numpy"
+
+    def test_promotes_over_threshold(self, embedding, tmp_path):
+        remote = RecordingRemoteStore()
+        registry = VectorStoreRegistry(
+            embedding=embedding,
+            mode="auto",
+            max_local_docs=3,
+            root_dir=tmp_path,
+            remote_factory=lambda tenant_id, emb: remote,
+        )
+
+        registry.add_texts("t1", ["a", "b"])
+        registry.add_texts("t1", ["c", "d"])
+
+        assert registry.backend_for("t1") == "redis"
+        assert remote.texts == ["a", "b", "c", "d"]
+
+        # Promotion survives a fresh registry (e.g. another worker)
+        other = VectorStoreRegistry(
+            embedding=embedding,
+            mode="auto",
+            max_local_docs=3,
+            root_dir=tmp_path,
+            remote_factory=lambda tenant_id, emb: RecordingRemoteStore(),
+        )
+        assert other.backend_for("t1") == "redis"
+
+    def test_purge_local(self, embedding, tmp_path):
+        registry = VectorStoreRegistry(embedding=embedding, mode="numpy", root_dir=tmp_path)
+        registry.add_texts("t1", ["a", "b"])
+
+        assert registry.purge_local("t1") == 2
+        assert registry.get_store("t1").count() == 0
@@ -11,6 +11,7 @@ from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from langchain_core.output_parsers import StrOutputParser
 from llm_factory import LLMFactory
+from utils.service_container import services
 
 logger = logging.getLogger(__name__)
 
@@ -204,5 +205,5 @@ Método de ensino:
             del self.chat_histories[user_id]
 
 
-# Singleton
-study_buddy = StudyBuddy()
+# Singleton (built on first use or by POST /warmup)
+study_buddy = services.lazy("study_buddy", StudyBuddy)
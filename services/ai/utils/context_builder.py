@@ -3,19 +3,121 @@ Context Pack Builder
 
 Assembles ContextPack for Educator Agent by calling NestJS API.
 This ensures we don't duplicate database access and maintain single source of truth.
+
+Profile, vocab and content depend on the session's userId/contentId. A small
+session index remembers those ids, so after the first turn of a session all
+four fetches run concurrently instead of session-then-rest.
 """
 
-from typing import Dict
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
 from .nestjs_client import nestjs_client
+from .context_cache import context_cache, FIELD_SESSION, FIELD_PROFILE, FIELD_VOCAB, FIELD_CONTENT
 import asyncio
 import logging
+import os
 
 logger = logging.getLogger(__name__)
 
 
+class SessionIndex:
+    """LRU map readingSessionId -> (userId, contentId)"""
+    
+    def __init__(self, max_entries: int = int(os.getenv("SESSION_INDEX_MAX_ENTRIES", "50000"))):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, str]]" = OrderedDict()
+    
+    def get(self, session_id: str) -> Optional[Tuple[str, str]]:
+        ids = self._entries.get(session_id)
+        if ids is not None:
+            self._entries.move_to_end(session_id)
+        return ids
+    
+    def put(self, session_id: str, user_id: str, content_id: str) -> None:
+        self._entries[session_id] = (user_id, content_id)
+        self._entries.move_to_end(session_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class ContextPackBuilder:
     """Builds ContextPack from PromptMessage using NestJS API"""
     
+    def __init__(self, cache=context_cache, session_index: Optional[SessionIndex] = None):
+        self.cache = cache
+        self.session_index = session_index or SessionIndex()
+        self.stats = {"speculative_hits": 0, "speculative_mismatches": 0, "sequential": 0}
+    
+    def _fetch_session(self, session_id: str):
+        return self.cache.get_or_fetch(
+            FIELD_SESSION, session_id,
+            lambda: nestjs_client.get_session(session_id)
+        )
+    
+    def _fetch_dependents(self, user_id: str, content_id: str):
+        """Profile, vocab and content fetches (served from cache within each field's TTL)"""
+        return [
+            self.cache.get_or_fetch(
+                FIELD_PROFILE, user_id,
+                lambda: nestjs_client.get_learner_profile(user_id)
+            ),
+            self.cache.get_or_fetch(
+                FIELD_VOCAB, user_id,
+                lambda: nestjs_client.get_vocab_focus(user_id, limit=50)
+            ),
+            self.cache.get_or_fetch(
+                FIELD_CONTENT, content_id,
+                lambda: nestjs_client.get_content_metadata(content_id)
+            ),
+        ]
+    
+    async def _fetch_all(self, session_id: str):
+        """
+        Fetch session + dependents.
+        
+        Known session: all four concurrently, verified against the session.
+        Unknown session or stale ids: session first, then the rest.
+        """
+        known = self.session_index.get(session_id)
+        
+        if known is not None:
+            results = await asyncio.gather(
+                self._fetch_session(session_id),
+                *self._fetch_dependents(*known),
+                return_exceptions=True  # Don't fail entire build if one fails
+            )
+            session = results[0]
+            if isinstance(session, BaseException):
+                raise session
+            if (session['userId'], session['contentId']) == known:
+                self.stats["speculative_hits"] += 1
+                return session, results[1:]
+            
+            # Session moved to another user/content: redo dependents
+            self.stats["speculative_mismatches"] += 1
+            logger.debug(f"Session index mismatch for {session_id}, refetching")
+        else:
+            self.stats["sequential"] += 1
+            # Get session first (contains userId and contentId)
+            session = await self._fetch_session(session_id)
+        
+        user_id = session['userId']
+        content_id = session['contentId']
+        self.session_index.put(session_id, user_id, content_id)
+        
+        dependents = await asyncio.gather(
+            *self._fetch_dependents(user_id, content_id),
+            return_exceptions=True  # Don't fail entire build if one fails
+        )
+        return session, dependents
+    
+    def get_stats(self) -> Dict:
+        """Speculative fetch counters for /metrics"""
+        return {**self.stats, "indexed_sessions": len(self.session_index)}
+    
     async def build(self, prompt_message: Dict) -> Dict:
         """
         Build minimal but sufficient context for Educator Agent.
@@ -46,19 +148,9 @@ class ContextPackBuilder:
             session_id = prompt_message['readingSessionId']
             metadata = prompt_message.get('metadata', {})
             
-            # Get session first (contains userId and contentId)
-            session = await nestjs_client.get_session(session_id)
-            user_id = session['userId']
+            session, (learner, vocab, content) = await self._fetch_all(session_id)
             content_id = session['contentId']
             
-            # Parallel fetch for efficiency
-            learner, vocab, content = await asyncio.gather(
-                nestjs_client.get_learner_profile(user_id),
-                nestjs_client.get_vocab_focus(user_id, limit=50),
-                nestjs_client.get_content_metadata(content_id),
-                return_exceptions=True  # Don't fail entire build if one fails
-            )
-            
             # Handle potential errors
             if isinstance(learner, Exception):
                 logger.error(f"Failed to fetch learner profile: {learner}")
@@ -75,6 +167,7 @@ class ContextPackBuilder:
             # Assemble ContextPack
             context_pack = {
                 "learner": {
+                    "id": session['userId'],
                     "educationLevel": learner.get('educationLevel', 'MEDIO'),
                     "age": learner.get('age'),
                     "language": learner.get('preferredLanguages', ['PT'])[0] if learner.get('preferredLanguages') else 'PT',
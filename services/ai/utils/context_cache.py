@@ -0,0 +1,200 @@
+"""
+Context Cache for ContextPackBuilder
+
+Learner profile and content metadata almost never change within a session,
+yet every /educator/turn fetched them from NestJS. This cache keeps each
+ContextPack field for its own TTL:
+
+    content  - content metadata     (long,   default 1h)
+    profile  - learner profile      (medium, default 10min)
+    vocab    - vocabulary focus     (short,  default 60s)
+    session  - reading session      (per-turn, not cached)
+
+NestJS calls POST /educator/context/invalidate when it updates any of them.
+Concurrent misses for the same key share one in-flight fetch. Invalidating
+a key bumps its generation: a fetch started before that is neither cached
+nor shared with later callers, so stale data cannot outlive the call.
+"""
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+FIELD_CONTENT = "content"
+FIELD_PROFILE = "profile"
+FIELD_VOCAB = "vocab"
+FIELD_SESSION = "session"
+
+DEFAULT_TTLS = {
+    FIELD_CONTENT: float(os.getenv("CONTEXT_CACHE_TTL_CONTENT", "3600")),
+    FIELD_PROFILE: float(os.getenv("CONTEXT_CACHE_TTL_PROFILE", "600")),
+    FIELD_VOCAB: float(os.getenv("CONTEXT_CACHE_TTL_VOCAB", "60")),
+    FIELD_SESSION: float(os.getenv("CONTEXT_CACHE_TTL_SESSION", "0")),
+}
+
+
+class ContextCache:
+    """Per-field TTL cache with LRU bound and in-flight request coalescing"""
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = int(os.getenv("CONTEXT_CACHE_MAX_ENTRIES", "10000")),
+        clock: Callable[[], float] = time.monotonic,
+        default_ttls: Optional[Dict[str, float]] = None,
+    ):
+        # default_ttls: base field TTLs (ContextPack fields unless given)
+        self.ttls = {**(DEFAULT_TTLS if default_ttls is None else default_ttls), **(ttls or {})}
+        self.max_entries = max_entries
+        self._clock = clock
+        # (field, key) -> (expires_at, value)
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Tuple[str, Hashable], asyncio.Future] = {}
+        # Per-key generation and running fetch count, kept only while fetches run
+        self._generations: Dict[Tuple[str, Hashable], int] = {}
+        self._running: Dict[Tuple[str, Hashable], int] = {}
+        self._stats = {field: {"hits": 0, "misses": 0} for field in self.ttls}
+
+    async def get_or_fetch(
+        self,
+        field: str,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Return cached value for (field, key) or fetch and cache it.
+        Exceptions from fetch are propagated and never cached; a value
+        fetched across an invalidation of the key is returned, not cached.
+        """
+        ttl = self.ttls.get(field, 0)
+        stats = self._stats.setdefault(field, {"hits": 0, "misses": 0})
+        cache_key = (field, key)
+
+        if ttl > 0:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > self._clock():
+                    self._entries.move_to_end(cache_key)
+                    stats["hits"] += 1
+                    return value
+                del self._entries[cache_key]
+
+        # Coalesce concurrent misses (e.g. a class hitting the same content)
+        pending = self._inflight.get(cache_key)
+        if pending is not None:
+            stats["hits"] += 1
+            return await asyncio.shield(pending)
+
+        stats["misses"] += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        generation = self._generations.get(cache_key, 0)
+        self._running[cache_key] = self._running.get(cache_key, 0) + 1
+        try:
+            value = await fetch()
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an un-awaited future does not log a warning
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            if ttl > 0 and self._generations.get(cache_key, 0) == generation:
+                self._store(cache_key, value, ttl)
+            return value
+        finally:
+            if self._inflight.get(cache_key) is future:
+                del self._inflight[cache_key]
+            self._running[cache_key] -= 1
+            if not self._running[cache_key]:
+                del self._running[cache_key]
+                self._generations.pop(cache_key, None)
+
+    def _store(self, cache_key: Tuple[str, Hashable], value: Any, ttl: float) -> None:
+        self._entries[cache_key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, field: Optional[str] = None, key: Optional[Hashable] = None) -> int:
+        """
+        Drop entries matching field and/or key (None = any).
+        With both given this is a single-key removal (O(1)); otherwise
+        every entry is scanned.
+
+        Returns:
+            Number of entries removed
+        """
+        if field is not None and key is not None:
+            return int(self.discard(field, key))
+        for k in list(self._running):
+            if (field is None or k[0] == field) and (key is None or k[1] == key):
+                self._next_generation(k)
+        doomed = [
+            k for k in self._entries
+            if (field is None or k[0] == field) and (key is None or k[1] == key)
+        ]
+        for k in doomed:
+            del self._entries[k]
+        if doomed:
+            logger.debug(f"Context cache invalidated {len(doomed)} entries (field={field}, key={key})")
+        return len(doomed)
+
+    def discard(self, field: str, key: Hashable) -> bool:
+        """Drop one entry (O(1)); True if it was cached"""
+        cache_key = (field, key)
+        if cache_key in self._running:
+            self._next_generation(cache_key)
+        return self._entries.pop(cache_key, None) is not None
+
+    def _next_generation(self, cache_key: Tuple[str, Hashable]) -> None:
+        """Outdate running fetches of a key: later misses start a fresh one"""
+        self._generations[cache_key] = self._generations.get(cache_key, 0) + 1
+        self._inflight.pop(cache_key, None)
+
+    def invalidate_user(self, user_id: str) -> int:
+        """Invalidate everything keyed by a user (profile, vocab)"""
+        return self.invalidate(FIELD_PROFILE, user_id) + self.invalidate(FIELD_VOCAB, user_id)
+
+    def invalidate_content(self, content_id: str) -> int:
+        """Invalidate content metadata"""
+        return self.invalidate(FIELD_CONTENT, content_id)
+
+    def clear(self) -> None:
+        """Drop all entries and reset stats"""
+        for cache_key in list(self._running):
+            self._next_generation(cache_key)
+        self._entries.clear()
+        self._stats = {field: {"hits": 0, "misses": 0} for field in self.ttls}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-field hit rates for /metrics"""
+        sizes: Dict[str, int] = {}
+        for field, _ in self._entries:
+            sizes[field] = sizes.get(field, 0) + 1
+
+        fields = {}
+        for field, counts in self._stats.items():
+            total = counts["hits"] + counts["misses"]
+            fields[field] = {
+                "hits": counts["hits"],
+                "misses": counts["misses"],
+                "hit_rate_percent": round(counts["hits"] / total * 100, 2) if total else 0.0,
+                "entries": sizes.get(field, 0),
+                "ttl_seconds": self.ttls.get(field, 0),
+            }
+
+        return {
+            "fields": fields,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+        }
+
+
+# Global instance
+context_cache = ContextCache()
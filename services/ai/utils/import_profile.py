@@ -0,0 +1,85 @@
+"""
+Import-time Profiler
+
+Measures how long each module takes to import while main.py loads, so cold
+start regressions (a router pulling in a heavy SDK at import time) are
+visible via GET /startup/profile instead of only through `python -X importtime`.
+
+Self time excludes nested imports; inclusive time includes them.
+"""
+import builtins
+import logging
+import sys
+import threading
+import time
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+class ImportProfiler:
+    """Times first-time imports by wrapping builtins.__import__"""
+
+    def __init__(self):
+        self.records: Dict[str, Dict[str, float]] = {}
+        self.total_ms = 0.0
+        self._original_import = None
+        self._stack: List[List[float]] = []  # [start, child_ms]
+        self._started_at = 0.0
+        self._thread_id = None
+
+    def start(self) -> None:
+        if self._original_import is not None:
+            return
+        self._original_import = builtins.__import__
+        self._started_at = time.perf_counter()
+        self._thread_id = threading.get_ident()
+        builtins.__import__ = self._import
+
+    def stop(self) -> None:
+        if self._original_import is None:
+            return
+        builtins.__import__ = self._original_import
+        self._original_import = None
+        self.total_ms = (time.perf_counter() - self._started_at) * 1000
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._original_import
+        if level != 0 or name in sys.modules or threading.get_ident() != self._thread_id:
+            # Relative imports, cache hits and other threads: not timed
+            return original(name, globals, locals, fromlist, level)
+
+        frame = [time.perf_counter(), 0.0]
+        self._stack.append(frame)
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            self._stack.pop()
+            inclusive = (time.perf_counter() - frame[0]) * 1000
+            if self._stack:
+                self._stack[-1][1] += inclusive
+            if name not in self.records:
+                self.records[name] = {
+                    "inclusive_ms": inclusive,
+                    "self_ms": max(inclusive - frame[1], 0.0),
+                }
+
+    def report(self, top: int = 25) -> Dict[str, Any]:
+        """Slowest modules by self time"""
+        ranked = sorted(self.records.items(), key=lambda kv: kv[1]["self_ms"], reverse=True)
+        return {
+            "total_ms": round(self.total_ms, 2),
+            "modules_imported": len(self.records),
+            "slowest": [
+                {
+                    "module": name,
+                    "self_ms": round(r["self_ms"], 2),
+                    "inclusive_ms": round(r["inclusive_ms"], 2),
+                }
+                for name, r in ranked[:top]
+            ],
+        }
+
+
+# Global profiler (started/stopped by main.py around app assembly)
+import_profiler = ImportProfiler()
@@ -0,0 +1,147 @@
+"""
+Event Loop Blocking Monitor
+
+Debug tool to find sync code running on the event loop (e.g. chain.invoke
+inside async def). A heartbeat task ticks on the loop; a watchdog thread
+notices when ticks stop for longer than the threshold and captures the
+loop thread's stack at that moment, so the log shows WHAT was blocking.
+
+Enable with LOOP_MONITOR_ENABLED=true (LOOP_MONITOR_THRESHOLD_MS, default 100).
+Also sets asyncio's own slow-callback logging to the same threshold.
+
+Fix for offenders: `await run_sync(func, ...)`. Sync LangGraph nodes need
+no wrapping: ainvoke already runs them in a worker thread.
+"""
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+LOOP_MONITOR_ENABLED = os.getenv("LOOP_MONITOR_ENABLED", "false").lower() == "true"
+LOOP_MONITOR_THRESHOLD_MS = float(os.getenv("LOOP_MONITOR_THRESHOLD_MS", "100"))
+
+
+class LoopBlockingMonitor:
+    """Detects and records event loop stalls longer than threshold_ms"""
+
+    def __init__(self, threshold_ms: float = LOOP_MONITOR_THRESHOLD_MS, max_events: int = 50):
+        self.threshold_ms = threshold_ms
+        self.interval = min(threshold_ms / 4000, 0.01)  # seconds between heartbeats
+        self.events: Deque[Dict[str, Any]] = deque(maxlen=max_events)
+        self.max_block_ms = 0.0
+        self._last_tick = 0.0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._heartbeat is not None
+
+    async def start(self) -> None:
+        """Start monitoring the running loop"""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._loop.slow_callback_duration = self.threshold_ms / 1000
+        self._last_tick = time.perf_counter()
+        self._stop.clear()
+
+        self._heartbeat = asyncio.create_task(self._beat())
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-blocking-monitor", daemon=True
+        )
+        self._watchdog.start()
+        logger.info(f"Event loop blocking monitor started (threshold={self.threshold_ms}ms)")
+
+    async def stop(self) -> None:
+        """Stop monitoring"""
+        if not self.running:
+            return
+        # Let the heartbeat tick and the watchdog close any stall in progress
+        await asyncio.sleep(self.interval * 3)
+        self._stop.set()
+        self._heartbeat.cancel()
+        try:
+            await self._heartbeat
+        except asyncio.CancelledError:
+            pass
+        self._heartbeat = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1)
+            self._watchdog = None
+
+    async def _beat(self) -> None:
+        while True:
+            self._last_tick = time.perf_counter()
+            await asyncio.sleep(self.interval)
+
+    def _watch(self) -> None:
+        blocked_since: Optional[float] = None
+        stack: List[str] = []
+
+        while not self._stop.wait(self.interval):
+            last_tick = self._last_tick
+            stalled_ms = (time.perf_counter() - last_tick) * 1000
+
+            if stalled_ms > self.threshold_ms:
+                if blocked_since != last_tick:
+                    # New stall: capture the loop thread's stack right now
+                    blocked_since = last_tick
+                    frame = sys._current_frames().get(self._loop_thread_id)
+                    stack = traceback.format_stack(frame) if frame else []
+                    logger.warning(
+                        f"Event loop blocked for >{self.threshold_ms:.0f}ms at:\n"
+                        + "".join(stack[-8:])
+                    )
+            elif blocked_since is not None:
+                self._record(blocked_since, stack)
+                blocked_since = None
+
+        if blocked_since is not None:
+            self._record(blocked_since, stack)
+
+    def _record(self, blocked_since: float, stack: List[str]) -> None:
+        duration_ms = (self._last_tick - blocked_since) * 1000
+        self.max_block_ms = max(self.max_block_ms, duration_ms)
+        self.events.append({
+            "duration_ms": round(duration_ms, 2),
+            "stack": stack[-8:],
+            "at": time.time(),
+        })
+
+    def reset(self) -> None:
+        self.events.clear()
+        self.max_block_ms = 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Summary for /metrics"""
+        return {
+            "enabled": self.running,
+            "threshold_ms": self.threshold_ms,
+            "blocks": len(self.events),
+            "max_block_ms": round(self.max_block_ms, 2),
+            "recent": [
+                {"duration_ms": e["duration_ms"], "where": e["stack"][-1].strip() if e["stack"] else None}
+                for e in list(self.events)[-5:]
+            ],
+        }
+
+
+async def run_sync(func: Callable, *args, **kwargs) -> Any:
+    """Run a blocking callable in the default thread pool (contextvars preserved)"""
+    return await asyncio.to_thread(func, *args, **kwargs)
+
+
+# Global instance (started by main.py lifespan when LOOP_MONITOR_ENABLED)
+loop_monitor = LoopBlockingMonitor()
@@ -3,8 +3,13 @@ NestJS API Client for AI Service
 
 Calls existing NestJS endpoints instead of duplicating database access.
 This ensures single source of truth and clean separation of concerns.
+
+One long-lived httpx.AsyncClient is shared by all calls (keep-alive pool,
+optional HTTP/2). It is opened/closed by the FastAPI lifespan; outside the
+app (workers, tests) it is created lazily on first use.
 """
 
+import asyncio
 import httpx
 import os
 from typing import Dict, List, Optional
@@ -12,22 +17,165 @@ import logging
 
 # Phase 1: Centralized URL Configuration
 from config.urls import NESTJS_API_URL
+from utils.tracing import span
 
 logger = logging.getLogger(__name__)
 
 
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        logger.warning(f"Invalid {name}, using {default}")
+        return default
+
+
+# Per-endpoint timeouts (seconds). Session is on the critical path of every
+# turn, so it fails fast; events can be larger payloads.
+DEFAULT_TIMEOUTS = {
+    "profile": _env_float("NESTJS_TIMEOUT_PROFILE", 3.0),
+    "vocab": _env_float("NESTJS_TIMEOUT_VOCAB", 3.0),
+    "session": _env_float("NESTJS_TIMEOUT_SESSION", 2.0),
+    "session_events": _env_float("NESTJS_TIMEOUT_SESSION_EVENTS", 5.0),
+    "content": _env_float("NESTJS_TIMEOUT_CONTENT", 3.0),
+    "ping": _env_float("NESTJS_TIMEOUT_PING", 1.0),
+}
+CONNECT_TIMEOUT = _env_float("NESTJS_CONNECT_TIMEOUT", 2.0)
+
+
 class NestJSClient:
     """Client to interact with NestJS API"""
-    
-    def __init__(self):
-        self.base_url = NESTJS_API_URL
-        self.timeout = 10.0
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        timeouts: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Args:
+            base_url: NestJS API base URL (defaults to NESTJS_API_URL)
+            transport: Optional httpx transport (e.g. httpx.ASGITransport in tests)
+            timeouts: Per-endpoint timeout overrides in seconds
+        """
+        self.base_url = base_url or NESTJS_API_URL
+        self.timeouts = {**DEFAULT_TIMEOUTS, **(timeouts or {})}
+        self.limits = httpx.Limits(
+            max_connections=int(os.getenv("NESTJS_MAX_CONNECTIONS", "100")),
+            max_keepalive_connections=int(os.getenv("NESTJS_MAX_KEEPALIVE", "20")),
+            keepalive_expiry=_env_float("NESTJS_KEEPALIVE_EXPIRY", 30.0),
+        )
+        self.http2 = os.getenv("NESTJS_HTTP2", "false").lower() == "true"
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closing: set = set()
         logger.info(f"NestJS Client initialized with base URL: {self.base_url}")
-    
+
+    # ------------------------------------------------------------------
+    # Connection lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Open the shared connection pool (called from FastAPI lifespan)"""
+        self._get_client()
+
+    async def aclose(self) -> None:
+        """Close the shared connection pool"""
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
+            logger.info("NestJS Client connection pool closed")
+
+    def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._loop is not loop:
+            # Pooled connections belong to the loop that opened them
+            # (e.g. a worker that runs asyncio.run() per job); start fresh.
+            self._discard(self._client, self._loop, loop)
+            self._client = None
+
+        if self._client is None or self._client.is_closed:
+            http2 = self.http2
+            if http2:
+                try:
+                    import h2  # noqa: F401
+                except ImportError:
+                    logger.warning("NESTJS_HTTP2=true but 'h2' is not installed, using HTTP/1.1")
+                    http2 = False
+
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(max(self.timeouts.values()), connect=CONNECT_TIMEOUT),
+                limits=self.limits,
+                http2=http2,
+                transport=self._transport,
+            )
+            self._loop = loop
+            logger.debug(f"NestJS Client connection pool opened (http2={http2})")
+        return self._client
+
+    def _discard(
+        self,
+        client: httpx.AsyncClient,
+        owner: Optional[asyncio.AbstractEventLoop],
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        """
+        Close a client left behind by another event loop: on its own loop if
+        that one still runs, else here (its sockets died with their loop;
+        this releases the pool).
+        """
+        if client.is_closed:
+            return
+        if owner is not None and owner.is_running() and not owner.is_closed():
+            asyncio.run_coroutine_threadsafe(client.aclose(), owner)
+            return
+
+        async def close() -> None:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.debug(f"Closing stale NestJS client failed: {e}")
+
+        task = loop.create_task(close())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _get(self, endpoint: str, path: str, params: Optional[Dict] = None) -> httpx.Response:
+        """GET with the endpoint's timeout, recording latency per endpoint"""
+        client = self._get_client()
+        timeout = httpx.Timeout(self.timeouts.get(endpoint, 10.0), connect=CONNECT_TIMEOUT)
+        with span(f"nestjs.{endpoint}"):
+            response = await client.get(path, params=params, timeout=timeout)
+            response.raise_for_status()
+            return response
+
+    async def ping(self) -> bool:
+        """
+        Check that NestJS is reachable over the shared pool.
+
+        Returns:
+            True if NestJS answered (any HTTP status), False on network errors
+        """
+        try:
+            await self._get_client().get(
+                "/",
+                timeout=httpx.Timeout(self.timeouts["ping"], connect=CONNECT_TIMEOUT)
+            )
+            return True
+        except httpx.HTTPError as e:
+            logger.debug(f"NestJS ping failed: {e}")
+            return False
+
+    # ------------------------------------------------------------------
+    # Endpoints
+    # ------------------------------------------------------------------
+
     async def get_learner_profile(self, user_id: str) -> Dict:
         """
         Get learner profile from NestJS LearnerProfile service
-        
+
         Returns:
             {
                 "educationLevel": "MEDIO",
@@ -36,27 +184,25 @@ class NestJSClient:
                 ...
             }
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            url = f"{self.base_url}/profiles/{user_id}"
-            logger.debug(f"Fetching learner profile: {url}")
-            
-            try:
-                response = await client.get(url)
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                logger.error(f"Failed to fetch learner profile: {e}")
-                raise
-    
+        path = f"/profiles/{user_id}"
+        logger.debug(f"Fetching learner profile: {path}")
+
+        try:
+            response = await self._get("profile", path)
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Failed to fetch learner profile: {e}")
+            raise
+
     async def get_vocab_focus(
-        self, 
-        user_id: str, 
+        self,
+        user_id: str,
         limit: int = 50,
         due_only: bool = True
     ) -> Dict:
         """
         Get vocabulary focus (due words) for learner
-        
+
         Returns:
             {
                 "dueWords": [
@@ -66,34 +212,32 @@ class NestJSClient:
                 "totalDue": 10
             }
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            url = f"{self.base_url}/vocab"
-            params = {
-                "userId": user_id,
-                "limit": limit,
-                "dueOnly": str(due_only).lower()
+        path = "/vocab"
+        params = {
+            "userId": user_id,
+            "limit": limit,
+            "dueOnly": str(due_only).lower()
+        }
+        logger.debug(f"Fetching vocab focus: {path} with params {params}")
+
+        try:
+            response = await self._get("vocab", path, params=params)
+            vocab_data = response.json()
+
+            # Transform to focus format
+            return {
+                "dueWords": vocab_data[:limit] if isinstance(vocab_data, list) else [],
+                "totalDue": len(vocab_data) if isinstance(vocab_data, list) else 0
             }
-            logger.debug(f"Fetching vocab focus: {url} with params {params}")
-            
-            try:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                vocab_data = response.json()
-                
-                # Transform to focus format
-                return {
-                    "dueWords": vocab_data[:limit] if isinstance(vocab_data, list) else [],
-                    "totalDue": len(vocab_data) if isinstance(vocab_data, list) else 0
-                }
-            except httpx.HTTPStatusError as e:
-                logger.error(f"Failed to fetch vocab: {e}")
-                # Return empty if vocab not critical
-                return {"dueWords": [], "totalDue": 0}
-    
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Failed to fetch vocab: {e}")
+            # Return empty if vocab not critical
+            return {"dueWords": [], "totalDue": 0}
+
     async def get_session(self, session_id: str) -> Dict:
         """
         Get reading session data
-        
+
         Returns:
             {
                 "id": "rs_123",
@@ -104,22 +248,20 @@ class NestJSClient:
                 ...
             }
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            url = f"{self.base_url}/reading-sessions/{session_id}"
-            logger.debug(f"Fetching session: {url}")
-            
-            try:
-                response = await client.get(url)
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                logger.error(f"Failed to fetch session: {e}")
-                raise
-    
+        path = f"/reading-sessions/{session_id}"
+        logger.debug(f"Fetching session: {path}")
+
+        try:
+            response = await self._get("session", path)
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Failed to fetch session: {e}")
+            raise
+
     async def get_session_events(self, session_id: str) -> List[Dict]:
         """
         Get all events for a session
-        
+
         Returns:
             [
                 {
@@ -130,22 +272,20 @@ class NestJSClient:
                 ...
             ]
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            url = f"{self.base_url}/reading-sessions/{session_id}/events"
-            logger.debug(f"Fetching session events: {url}")
-            
-            try:
-                response = await client.get(url)
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                logger.error(f"Failed to fetch events: {e}")
-                return []  # Return empty if not critical
-    
+        path = f"/reading-sessions/{session_id}/events"
+        logger.debug(f"Fetching session events: {path}")
+
+        try:
+            response = await self._get("session_events", path)
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Failed to fetch events: {e}")
+            return []  # Return empty if not critical
+
     async def get_content_metadata(self, content_id: str) -> Dict:
         """
         Get content metadata (for retrieval context)
-        
+
         Returns:
             {
                 "id": "ct_001",
@@ -154,17 +294,15 @@ class NestJSClient:
                 "difficulty": "medium"
             }
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            url = f"{self.base_url}/contents/{content_id}"
-            logger.debug(f"Fetching content metadata: {url}")
-            
-            try:
-                response = await client.get(url)
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                logger.error(f"Failed to fetch content: {e}")
-                raise
+        path = f"/contents/{content_id}"
+        logger.debug(f"Fetching content metadata: {path}")
+
+        try:
+            response = await self._get("content", path)
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Failed to fetch content: {e}")
+            raise
 
 
 # Global client instance
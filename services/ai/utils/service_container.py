@@ -0,0 +1,138 @@
+"""
+Service Container - lazy singletons
+
+Module-level singletons (auto_grader, study_buddy, educator graph, ...) used
+to be built at import time, creating LLM clients and Redis connections
+before the app could even start. They are now registered here and built on
+first use, or ahead of time via POST /warmup (in parallel threads).
+
+Usage in a module:
+    auto_grader = services.lazy("auto_grader", AutoGrader)
+
+Importers keep `from grading.auto_grader import auto_grader`; the proxy
+builds the real instance on first attribute access.
+"""
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceContainer:
+    """Registry of named, lazily constructed singletons"""
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._instances: Dict[str, Any] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._init_ms: Dict[str, float] = {}
+        self._errors: Dict[str, str] = {}
+
+    def register(self, name: str, factory: Callable[[], Any]) -> None:
+        """Register a factory (idempotent; re-registering resets the instance)"""
+        self._factories[name] = factory
+        self._locks.setdefault(name, threading.Lock())
+        self._instances.pop(name, None)
+
+    def lazy(self, name: str, factory: Callable[[], Any]) -> "LazyService":
+        """Register a factory and return a proxy for module-level use"""
+        self.register(name, factory)
+        return LazyService(self, name)
+
+    def get(self, name: str) -> Any:
+        """
+        Return the instance, constructing it on first call.
+
+        Raises:
+            KeyError: Unknown service
+            Exception: Whatever the factory raises (not cached; next call retries)
+        """
+        if name in self._instances:
+            return self._instances[name]
+        if name not in self._factories:
+            raise KeyError(f"Unknown service: {name}")
+
+        with self._locks[name]:
+            if name not in self._instances:
+                start = time.perf_counter()
+                try:
+                    instance = self._factories[name]()
+                except Exception as e:
+                    self._errors[name] = str(e)
+                    logger.error(f"Failed to initialize service '{name}': {e}")
+                    raise
+                self._init_ms[name] = (time.perf_counter() - start) * 1000
+                self._errors.pop(name, None)
+                self._instances[name] = instance
+                logger.info(f"Initialized service '{name}' in {self._init_ms[name]:.0f}ms")
+        return self._instances[name]
+
+    def is_initialized(self, name: str) -> bool:
+        return name in self._instances
+
+    def names(self) -> List[str]:
+        return sorted(self._factories)
+
+    async def warmup(self, names: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Initialize services in parallel worker threads.
+
+        Args:
+            names: Services to warm (default: all registered)
+
+        Returns:
+            {name: {"status": "ready"|"error"|"unknown", "init_ms": ..., "error": ...}}
+        """
+        names = names or self.names()
+
+        async def warm(name: str) -> Dict[str, Any]:
+            if name not in self._factories:
+                return {"status": "unknown"}
+            try:
+                await asyncio.to_thread(self.get, name)
+                return {"status": "ready", "init_ms": round(self._init_ms.get(name, 0.0), 2)}
+            except Exception as e:
+                return {"status": "error", "error": str(e)}
+
+        results = await asyncio.gather(*(warm(n) for n in names))
+        return dict(zip(names, results))
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            name: {
+                "initialized": name in self._instances,
+                "init_ms": round(self._init_ms[name], 2) if name in self._init_ms else None,
+                "error": self._errors.get(name),
+            }
+            for name in self.names()
+        }
+
+
+class LazyService:
+    """Attribute-forwarding proxy that resolves its service on first use"""
+
+    __slots__ = ("_container", "_name")
+
+    def __init__(self, container: ServiceContainer, name: str):
+        object.__setattr__(self, "_container", container)
+        object.__setattr__(self, "_name", name)
+
+    def _resolve(self) -> Any:
+        return self._container.get(self._name)
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._resolve(), attr)
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        setattr(self._resolve(), attr, value)
+
+    def __repr__(self) -> str:
+        state = "ready" if self._container.is_initialized(self._name) else "lazy"
+        return f"<LazyService {self._name} ({state})>"
+
+
+# Global container
+services = ServiceContainer()
@@ -0,0 +1,187 @@
+"""
+Lightweight per-request tracing
+
+Answers "where did this slow turn spend its time?" without an external
+collector. A Trace is bound to the request via a contextvar (keyed by the
+correlation ID); code wraps stages in `span("name")`:
+
+    with span("context.build"):
+        context = await context_builder.build(...)
+
+Each span:
+- adds its duration to the current trace (repeated names are summed)
+- feeds a per-stage latency histogram (metrics.observe_latency), shown on /metrics
+
+The log_requests middleware turns the trace into a Server-Timing header.
+Recent traces are kept in-process (InProcessExporter) for GET /traces.
+"""
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from metrics import observe_latency
+
+_current_trace: ContextVar[Optional["Trace"]] = ContextVar("current_trace", default=None)
+
+
+class Trace:
+    """Stage durations for one request (thread-safe: nodes run in worker threads)"""
+
+    def __init__(self, trace_id: str):
+        self.trace_id = trace_id
+        self.started_at = time.perf_counter()
+        self.duration_ms: Optional[float] = None
+        self._stages: "OrderedDict[str, Dict[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, name: str, duration_ms: float) -> None:
+        with self._lock:
+            stage = self._stages.setdefault(name, {"duration_ms": 0.0, "count": 0})
+            stage["duration_ms"] += duration_ms
+            stage["count"] += 1
+
+    def finish(self) -> None:
+        self.duration_ms = (time.perf_counter() - self.started_at) * 1000
+
+    @property
+    def stages(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {name: dict(stage) for name, stage in self._stages.items()}
+
+    def server_timing(self) -> str:
+        """Server-Timing header value, e.g. 'nestjs.session;dur=12.1, graph;dur=840.2'"""
+        parts = [
+            f"{name};dur={stage['duration_ms']:.1f}"
+            for name, stage in self.stages.items()
+        ]
+        if self.duration_ms is not None:
+            parts.append(f"total;dur={self.duration_ms:.1f}")
+        return ", ".join(parts)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "duration_ms": round(self.duration_ms, 2) if self.duration_ms is not None else None,
+            "stages": {
+                name: {"duration_ms": round(s["duration_ms"], 2), "count": s["count"]}
+                for name, s in self.stages.items()
+            },
+        }
+
+
+class InProcessExporter:
+    """Keeps the last N finished traces, looked up by correlation ID"""
+
+    def __init__(self, max_traces: int = 200):
+        self.max_traces = max_traces
+        self._traces: "OrderedDict[str, Trace]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def export(self, trace: Trace) -> None:
+        with self._lock:
+            self._traces[trace.trace_id] = trace
+            self._traces.move_to_end(trace.trace_id)
+            while len(self._traces) > self.max_traces:
+                self._traces.popitem(last=False)
+
+    def get(self, trace_id: str) -> Optional[Trace]:
+        with self._lock:
+            return self._traces.get(trace_id)
+
+    def recent(self, limit: int = 20) -> List[Trace]:
+        with self._lock:
+            return list(self._traces.values())[-limit:][::-1]
+
+
+exporter = InProcessExporter()
+
+
+def start_trace(trace_id: str) -> Trace:
+    """Bind a new trace to the current context"""
+    trace = Trace(trace_id)
+    _current_trace.set(trace)
+    return trace
+
+
+def end_trace(trace: Trace) -> None:
+    """Finish and export a trace"""
+    trace.finish()
+    exporter.export(trace)
+
+
+def current_trace() -> Optional[Trace]:
+    return _current_trace.get()
+
+
+def record_span(name: str, duration_ms: float) -> None:
+    """Record an already-measured stage"""
+    observe_latency(name, duration_ms)
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add(name, duration_ms)
+
+
+@contextmanager
+def span(name: str):
+    """Time a block as a named stage (works in sync and async code)"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_span(name, (time.perf_counter() - start) * 1000)
+
+
+def traced(name: str) -> Callable:
+    """Decorator version of span() for sync or async functions"""
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class LLMTracingCallback(BaseCallbackHandler):
+    """LangChain callback recording each LLM call as an 'llm' span"""
+
+    def __init__(self, trace: Optional[Trace] = None):
+        # Hold the trace directly: callbacks may fire from worker threads
+        self.trace = trace
+        self._starts: Dict[UUID, float] = {}
+
+    def on_llm_start(self, serialized, prompts, *, run_id: UUID, **kwargs) -> None:
+        self._starts[run_id] = time.perf_counter()
+
+    def on_chat_model_start(self, serialized, messages, *, run_id: UUID, **kwargs) -> None:
+        self._starts[run_id] = time.perf_counter()
+
+    def _finish(self, run_id: UUID) -> None:
+        start = self._starts.pop(run_id, None)
+        if start is None:
+            return
+        duration_ms = (time.perf_counter() - start) * 1000
+        observe_latency("llm", duration_ms)
+        if self.trace is not None:
+            self.trace.add("llm", duration_ms)
+
+    def on_llm_end(self, response, *, run_id: UUID, **kwargs) -> None:
+        self._finish(run_id)
+
+    def on_llm_error(self, error, *, run_id: UUID, **kwargs) -> None:
+        self._finish(run_id)